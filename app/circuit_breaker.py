@@ -0,0 +1,134 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# 상태 확인 함수 (cluster_id → 연결 가능 여부)
+Probe = Callable[[str], Awaitable[bool]]
+
+
+class CircuitOpen(Exception):
+    """클러스터 회로가 열려 있어 API 서버를 호출하지 않음"""
+
+    def __init__(self, cluster_id: str, retry_at: Optional[float], last_error: Optional[str]):
+        self.cluster_id = cluster_id
+        self.retry_at = retry_at
+        self.last_error = last_error
+        super().__init__(f"클러스터 '{cluster_id}'에 연결할 수 없어 요청을 차단했습니다 (최근 오류: {last_error})")
+
+
+class CircuitBreaker:
+    """클러스터 하나의 회로 상태 (closed → open → half_open → closed/open)"""
+
+    def __init__(self):
+        self.state = "closed"
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self.opened_at: Optional[float] = None
+        self.retry_at: Optional[float] = None
+        self.recovery: Optional[asyncio.Task] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "opened_at": self.opened_at,
+            "retry_at": self.retry_at,
+        }
+
+
+class CircuitBreakers:
+    """클러스터별 회로 차단기
+
+    연속 실패(연결 실패/타임아웃/5xx 게이트웨이 오류)가 failure_threshold번을 넘으면 회로를 열고,
+    열려 있는 동안은 API 서버를 호출하지 않고 바로 실패합니다. open_seconds가 지나면 half_open 상태에서
+    probe로 연결을 확인해 성공하면 닫고, 실패하면 다시 open_seconds 동안 엽니다.
+    사용자 요청은 half_open 상태에서도 차단되므로 복구 확인은 probe 한 번으로만 이루어집니다.
+    """
+
+    def __init__(self, failure_threshold: int, open_seconds: float, probe: Probe):
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self._probe = probe
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.rejected = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+    def _get(self, cluster_id: str) -> CircuitBreaker:
+        breaker = self._breakers.get(cluster_id)
+        if breaker is None:
+            breaker = self._breakers[cluster_id] = CircuitBreaker()
+        return breaker
+
+    def check(self, cluster_id: str):
+        """회로가 열려 있으면 CircuitOpen"""
+        breaker = self._breakers.get(cluster_id)
+        if breaker is None or breaker.state == "closed":
+            return
+        self.rejected += 1
+        raise CircuitOpen(cluster_id, breaker.retry_at, breaker.last_error)
+
+    def success(self, cluster_id: str):
+        breaker = self._breakers.get(cluster_id)
+        if breaker is not None and breaker.state == "closed":
+            breaker.failures = 0
+
+    def failure(self, cluster_id: str, error: str):
+        """실패 기록 (임계값에 도달하면 회로를 열고 복구 확인 예약)"""
+        if not self.enabled:
+            return
+        breaker = self._get(cluster_id)
+        breaker.last_error = error
+        if breaker.state != "closed":
+            return
+        breaker.failures += 1
+        if breaker.failures >= self.failure_threshold:
+            self._open(breaker)
+            breaker.recovery = asyncio.create_task(self._recover(cluster_id, breaker))
+
+    def _open(self, breaker: CircuitBreaker):
+        breaker.state = "open"
+        breaker.opened_at = time.time()
+        breaker.retry_at = breaker.opened_at + self.open_seconds
+
+    async def _recover(self, cluster_id: str, breaker: CircuitBreaker):
+        while True:
+            await asyncio.sleep(self.open_seconds)
+            breaker.state = "half_open"
+            try:
+                ok = await self._probe(cluster_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                ok = False
+                breaker.last_error = repr(e)
+            if self._breakers.get(cluster_id) is not breaker:
+                return
+            if ok:
+                self._breakers[cluster_id] = CircuitBreaker()
+                return
+            self._open(breaker)
+
+    def reset(self, cluster_id: str):
+        """회로 초기화 (클러스터 설정이 바뀌었을 때)"""
+        breaker = self._breakers.pop(cluster_id, None)
+        if breaker is not None and breaker.recovery is not None:
+            breaker.recovery.cancel()
+
+    def status(self, cluster_id: str) -> Dict[str, Any]:
+        breaker = self._breakers.get(cluster_id)
+        return (breaker or CircuitBreaker()).to_dict()
+
+    def states(self) -> Dict[str, str]:
+        return {cluster_id: breaker.state for cluster_id, breaker in self._breakers.items()}
+
+    async def aclose(self):
+        """복구 확인 작업 종료 (애플리케이션 종료 시)"""
+        tasks = [breaker.recovery for breaker in self._breakers.values()
+                 if breaker.recovery is not None and not breaker.recovery.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,144 @@
+import zlib
+from typing import List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import zstandard
+except ImportError:  # zstandard가 없으면 gzip만 사용
+    zstandard = None
+
+# 이벤트 단위로 바로 전달되어야 하는 응답은 압축하지 않음
+_SKIP_CONTENT_TYPES = ("text/event-stream",)
+
+
+def supported_encodings() -> List[str]:
+    """서버가 지원하는 압축 방식 (우선순위 순)"""
+    return (["zstd"] if zstandard is not None else []) + ["gzip"]
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Accept-Encoding(q 값 포함)에 따라 응답 압축 방식 선택 (압축하지 않으면 None)"""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding.strip().lower()] = q
+
+    best: Tuple[float, Optional[str]] = (0.0, None)
+    for encoding in supported_encodings():
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best[0]:
+            best = (q, encoding)
+    return best[1]
+
+
+class _Compressor:
+    """스트리밍 압축기 (청크마다 flush하여 바로 전송 가능)"""
+
+    def __init__(self, encoding: str, level: int):
+        if encoding == "zstd":
+            self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+            self._flush_mode = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        else:
+            # wbits=31: gzip 헤더/트레일러 포함
+            self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+            self._flush_mode = zlib.Z_SYNC_FLUSH
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data) + self._obj.flush(self._flush_mode)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._obj.compress(data) + self._obj.flush()
+
+
+class CompressionMiddleware:
+    """클라이언트와 협상한 방식(zstd/gzip)으로 응답 압축 (스트리밍 응답은 청크 단위)"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, zstd_level: int = 3):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {"gzip": gzip_level, "zstd": zstd_level}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _CompressingSender(send, encoding, self.levels[encoding],
+                                                          self.minimum_size))
+
+
+class _CompressingSender:
+    def __init__(self, send: Send, encoding: str, level: int, minimum_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.level = level
+        self.minimum_size = minimum_size
+        self.start: Optional[Message] = None
+        self.passthrough = False
+        self.compressor: Optional[_Compressor] = None
+
+    def _headers(self, streaming: bool) -> MutableHeaders:
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if streaming:
+            del headers["Content-Length"]
+        self.start["headers"] = headers.raw
+        return headers
+
+    async def __call__(self, message: Message):
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.start = message
+            self.passthrough = (
+                "content-encoding" in headers
+                or headers.get("content-type", "").startswith(_SKIP_CONTENT_TYPES)
+            )
+            if self.passthrough:
+                await self.send(message)
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None and not more_body:
+            # 전체 본문이 한 번에 온 경우 - 작은 응답은 압축하지 않음
+            if len(body) < self.minimum_size:
+                await self.send(self.start)
+                await self.send(message)
+                return
+            compressed = _Compressor(self.encoding, self.level).finish(body)
+            headers = self._headers(streaming=False)
+            headers["Content-Length"] = str(len(compressed))
+            await self.send(self.start)
+            await self.send({"type": "http.response.body", "body": compressed})
+            return
+
+        if self.compressor is None:
+            self.compressor = _Compressor(self.encoding, self.level)
+            self._headers(streaming=True)
+            await self.send(self.start)
+
+        if more_body:
+            await self.send({"type": "http.response.body", "body": self.compressor.compress(body),
+                             "more_body": True})
+        else:
+            await self.send({"type": "http.response.body", "body": self.compressor.finish(body)})
@@ -0,0 +1,21 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """JSON 인코딩 (UTF-8 바이트, 공백 없는 형식)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """JSON 디코딩"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
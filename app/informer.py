@@ -0,0 +1,385 @@
+import asyncio
+import base64
+import bisect
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from app import fastjson
+from app.resources import ResourceKind, RESOURCE_KINDS, get_kind, resource_path
+from app.snapshots import SnapshotStore
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# cluster_id를 받아 해당 클러스터의 풀링 클라이언트를 돌려주는 함수
+ClientFactory = Callable[[str], Awaitable[httpx.AsyncClient]]
+
+# 저장소 변경 알림 (event_type, obj) - ADDED/MODIFIED/DELETED, 재목록 시 RESET(obj=None) 후 전체 ADDED
+Listener = Callable[[str, Optional[Dict[str, Any]]], None]
+
+
+class ResourceVersionExpired(Exception):
+    """WATCH 재개 시점의 resourceVersion이 만료됨 (410 Gone) - 재목록 필요"""
+
+
+def _encode_continue(key: Tuple[str, str]) -> str:
+    """인포머 저장소 페이지네이션용 continue 토큰 생성"""
+    return base64.urlsafe_b64encode(json.dumps({"informer": list(key)}).encode()).decode()
+
+
+def _decode_continue(token: str) -> Optional[Tuple[str, str]]:
+    """인포머가 발급한 continue 토큰이면 (namespace, name), 아니면 None"""
+    try:
+        namespace, name = json.loads(base64.urlsafe_b64decode(token.encode()))["informer"]
+        return namespace, name
+    except Exception:
+        return None
+
+
+class Informer:
+    """LIST + WATCH로 한 클러스터의 한 리소스 종류를 로컬 저장소에 유지
+
+    최초 1회 LIST로 저장소를 채운 뒤 마지막 resourceVersion부터 WATCH 스트림을 이어받습니다.
+    북마크 이벤트로 resourceVersion을 갱신하고, 410 Gone을 받으면 다시 LIST합니다.
+    저장소는 네임스페이스 → 이름 2단계 dict로 네임스페이스/이름 조회를 모두 O(1)로 처리합니다.
+    스냅샷 저장소가 있으면 LIST 대신 디스크 스냅샷으로 저장소를 채우고 저장된 resourceVersion부터 WATCH합니다.
+    """
+
+    def __init__(self, cluster_id: str, kind: ResourceKind, client_factory: ClientFactory,
+                 snapshots: Optional[SnapshotStore] = None):
+        self.cluster_id = cluster_id
+        self.kind = kind
+        self._client_factory = client_factory
+        self._snapshots = snapshots
+        self._by_namespace: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._count = 0
+        self.resource_version: Optional[str] = None
+        self.synced = asyncio.Event()
+        self.watching = False
+        self.last_list_at: Optional[float] = None
+        self.last_event_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.restored_from_snapshot = False
+        self._task: Optional[asyncio.Task] = None
+        self._listeners: List[Listener] = []
+
+    # ---------- 저장소 조회 ----------
+
+    def list(self, namespace: Optional[str] = None,
+             predicate: Optional[Callable[[Dict[str, Any]], bool]] = None) -> List[Dict[str, Any]]:
+        """저장소의 오브젝트 목록 (API 서버와 같은 namespace/name 순서, predicate로 필터링)"""
+        if namespace is not None:
+            objects = self._by_namespace.get(namespace, {})
+            items = [objects[name] for name in sorted(objects)]
+        else:
+            items = [
+                self._by_namespace[ns][name]
+                for ns in sorted(self._by_namespace)
+                for name in sorted(self._by_namespace[ns])
+            ]
+        if predicate is not None:
+            items = [obj for obj in items if predicate(obj)]
+        return items
+
+    def page(self, namespace: Optional[str], limit: Optional[int], continue_token: Optional[str],
+             predicate: Optional[Callable[[Dict[str, Any]], bool]] = None
+             ) -> Optional[Tuple[List[Dict[str, Any]], Optional[str]]]:
+        """저장소 목록의 한 페이지와 다음 continue 토큰
+
+        토큰은 마지막 항목의 (namespace, name)이므로 페이지 사이에 오브젝트가 추가/삭제되어도
+        항목이 중복되거나 빠지지 않습니다. 인포머가 발급하지 않은 토큰이면 None을 반환합니다.
+        """
+        items = self.list(namespace, predicate)
+        start = 0
+        if continue_token:
+            last_key = _decode_continue(continue_token)
+            if last_key is None:
+                return None
+            start = bisect.bisect_right([self._key(obj) for obj in items], last_key)
+
+        end = len(items) if limit is None else min(start + limit, len(items))
+        next_token = _encode_continue(self._key(items[end - 1])) if end < len(items) else None
+        return items[start:end], next_token
+
+    def get(self, namespace: Optional[str], name: str) -> Optional[Dict[str, Any]]:
+        """저장소에서 오브젝트 하나 조회"""
+        return self._by_namespace.get(namespace or "", {}).get(name)
+
+    def status(self) -> Dict[str, Any]:
+        """동기화 상태 (응답의 cache 필드로 사용)"""
+        now = time.time()
+        last_contact = max(filter(None, [self.last_list_at, self.last_event_at]), default=None)
+        return {
+            "source": "informer",
+            "cluster_id": self.cluster_id,
+            "kind": self.kind.name,
+            "synced": self.synced.is_set(),
+            "watching": self.watching,
+            "resource_version": self.resource_version,
+            "items": self._count,
+            "last_list_at": self.last_list_at,
+            "last_event_at": self.last_event_at,
+            # WATCH 스트림이 열려 있으면 최신 상태로 간주
+            "staleness_seconds": 0.0 if self.watching or last_contact is None else round(now - last_contact, 3),
+            "last_error": self.last_error,
+            "restored_from_snapshot": self.restored_from_snapshot,
+        }
+
+    # ---------- 변경 알림 ----------
+
+    def add_listener(self, listener: Listener):
+        """저장소 변경 구독 (현재 저장소 내용을 RESET + ADDED로 먼저 전달)"""
+        self._listeners.append(listener)
+        self._notify_one(listener, "RESET", None)
+        for obj in self.list():
+            self._notify_one(listener, "ADDED", obj)
+
+    def remove_listener(self, listener: Listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify_one(self, listener: Listener, event_type: str, obj: Optional[Dict[str, Any]]):
+        try:
+            listener(event_type, obj)
+        except Exception:
+            # 구독자 오류가 동기화를 멈추지 않도록 기록만 함
+            logger.exception("%s/%s 인포머 구독자 오류", self.cluster_id, self.kind.name)
+
+    def _notify(self, event_type: str, obj: Optional[Dict[str, Any]]):
+        for listener in self._listeners:
+            self._notify_one(listener, event_type, obj)
+
+    # ---------- 저장소 갱신 ----------
+
+    @staticmethod
+    def _key(obj: Dict[str, Any]) -> Tuple[str, str]:
+        metadata = obj.get("metadata", {})
+        return metadata.get("namespace", ""), metadata.get("name", "")
+
+    def _upsert(self, obj: Dict[str, Any]):
+        namespace, name = self._key(obj)
+        objects = self._by_namespace.setdefault(namespace, {})
+        added = name not in objects
+        if added:
+            self._count += 1
+        objects[name] = obj
+        if self._listeners:
+            self._notify("ADDED" if added else "MODIFIED", obj)
+
+    def _delete(self, obj: Dict[str, Any]):
+        namespace, name = self._key(obj)
+        objects = self._by_namespace.get(namespace)
+        if objects is not None and objects.pop(name, None) is not None:
+            self._count -= 1
+            if not objects:
+                del self._by_namespace[namespace]
+            if self._listeners:
+                self._notify("DELETED", obj)
+
+    def _replace(self, items: List[Dict[str, Any]], resource_version: str):
+        """LIST 결과로 저장소 전체 교체"""
+        by_namespace: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for obj in items:
+            namespace, name = self._key(obj)
+            by_namespace.setdefault(namespace, {})[name] = obj
+        self._by_namespace = by_namespace
+        self._count = len(items)
+        self.resource_version = resource_version
+        if self._listeners:
+            self._notify("RESET", None)
+            for obj in items:
+                self._notify("ADDED", obj)
+
+    # ---------- LIST / WATCH ----------
+
+    async def _list(self, client: httpx.AsyncClient):
+        """페이지 단위 LIST로 저장소 재구성"""
+        path = resource_path(self.kind)
+        items: List[Dict[str, Any]] = []
+        params: Dict[str, Any] = {"limit": settings.INFORMER_PAGE_SIZE}
+        while True:
+            r = await client.get(path, params=params)
+            if r.status_code == 410 and "continue" in params:
+                # continue 토큰 만료 - 처음부터 다시
+                items, params = [], {"limit": settings.INFORMER_PAGE_SIZE}
+                continue
+            r.raise_for_status()
+            body = fastjson.loads(r.content)
+            items.extend(body.get("items") or [])
+            metadata = body.get("metadata", {})
+            if not metadata.get("continue"):
+                break
+            params = {"limit": settings.INFORMER_PAGE_SIZE, "continue": metadata["continue"]}
+
+        self._replace(items, metadata.get("resourceVersion"))
+        self.last_list_at = time.time()
+        self.synced.set()
+
+    async def _watch(self, client: httpx.AsyncClient):
+        """마지막 resourceVersion부터 WATCH 스트림 처리"""
+        params = {
+            "watch": "true",
+            "resourceVersion": self.resource_version,
+            "allowWatchBookmarks": "true",
+            "timeoutSeconds": settings.INFORMER_WATCH_TIMEOUT,
+        }
+        # 서버가 timeoutSeconds 후 스트림을 닫으므로 읽기 타임아웃은 그보다 길게
+        timeout = httpx.Timeout(settings.INFORMER_WATCH_TIMEOUT + 30, connect=settings.K8S_CONNECT_TIMEOUT)
+        async with client.stream("GET", resource_path(self.kind), params=params, timeout=timeout) as r:
+            if r.status_code == 410:
+                raise ResourceVersionExpired()
+            if r.status_code != 200:
+                await r.aread()
+                r.raise_for_status()
+
+            self.watching = True
+            try:
+                async for line in r.aiter_lines():
+                    if line:
+                        self._apply(fastjson.loads(line))
+            finally:
+                self.watching = False
+
+    def _apply(self, event: Dict[str, Any]):
+        """WATCH 이벤트 하나를 저장소에 반영"""
+        event_type = event.get("type")
+        obj = event.get("object") or {}
+        self.last_event_at = time.time()
+
+        if event_type == "ERROR":
+            if obj.get("code") == 410:
+                raise ResourceVersionExpired()
+            raise RuntimeError(f"WATCH 오류: {obj.get('message', obj)}")
+
+        if event_type in ("ADDED", "MODIFIED"):
+            self._upsert(obj)
+        elif event_type == "DELETED":
+            self._delete(obj)
+
+        resource_version = obj.get("metadata", {}).get("resourceVersion")
+        if resource_version:
+            self.resource_version = resource_version
+
+    async def _restore(self):
+        """디스크 스냅샷으로 저장소 채우기 (API 서버 LIST 생략)"""
+        try:
+            snapshot = await self._snapshots.restore(self.cluster_id, self.kind.name)
+        except Exception as e:
+            logger.warning("%s/%s 스냅샷 복원 실패: %r", self.cluster_id, self.kind.name, e)
+            return
+        if snapshot is None:
+            return
+        self._replace(snapshot.items, snapshot.resource_version)
+        # WATCH가 열리기 전까지 staleness는 스냅샷 저장 시점 기준
+        self.last_list_at = snapshot.saved_at
+        self.restored_from_snapshot = True
+        self.synced.set()
+        logger.info("%s/%s 스냅샷 복원 (%d개, resourceVersion %s)", self.cluster_id, self.kind.name,
+                    len(snapshot.items), snapshot.resource_version)
+
+    async def _run(self):
+        """LIST → WATCH 반복 (오류 시 지수 백오프, 410이면 재목록)"""
+        if self._snapshots is not None and self.resource_version is None:
+            await self._restore()
+        failures = 0
+        while True:
+            try:
+                client = await self._client_factory(self.cluster_id)
+                if self.resource_version is None:
+                    await self._list(client)
+                await self._watch(client)
+                failures = 0
+                self.last_error = None
+            except asyncio.CancelledError:
+                raise
+            except ResourceVersionExpired:
+                logger.info("%s/%s resourceVersion 만료 - 재목록", self.cluster_id, self.kind.name)
+                self.resource_version = None
+            except Exception as e:
+                failures += 1
+                self.last_error = repr(e)
+                logger.warning("%s/%s 인포머 오류: %r", self.cluster_id, self.kind.name, e)
+                await asyncio.sleep(min(2 ** failures, settings.INFORMER_BACKOFF_MAX))
+
+    def start(self):
+        """백그라운드 동기화 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """백그라운드 동기화 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+class InformerManager:
+    """클러스터/리소스 종류별 인포머 관리 (opt-in)"""
+
+    def __init__(self, client_factory: ClientFactory, snapshots: Optional[SnapshotStore] = None):
+        self._client_factory = client_factory
+        self.snapshots = snapshots
+        self._informers: Dict[Tuple[str, str], Informer] = {}
+
+    def get(self, cluster_id: str, kind: str) -> Optional[Informer]:
+        """실행 중인 인포머 조회 (없으면 None)"""
+        return self._informers.get((cluster_id, kind))
+
+    def synced(self, cluster_id: str, kind: str) -> Optional[Informer]:
+        """동기화가 끝난 인포머만 반환 (조회 API에서 사용)"""
+        informer = self._informers.get((cluster_id, kind))
+        if informer is not None and informer.synced.is_set():
+            return informer
+        return None
+
+    def start(self, cluster_id: str, kind: str) -> Informer:
+        """인포머 시작 (이미 있으면 기존 인포머 반환)"""
+        key = (cluster_id, kind)
+        if key not in self._informers:
+            informer = Informer(cluster_id, get_kind(kind), self._client_factory, self.snapshots)
+            informer.start()
+            self._informers[key] = informer
+        return self._informers[key]
+
+    async def stop(self, cluster_id: str, kind: str) -> bool:
+        """인포머 중지 (없으면 False)"""
+        informer = self._informers.pop((cluster_id, kind), None)
+        if informer is None:
+            return False
+        await informer.stop()
+        return True
+
+    def status(self, cluster_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """인포머 상태 목록"""
+        return [
+            informer.status()
+            for (informer_cluster, _), informer in self._informers.items()
+            if cluster_id is None or informer_cluster == cluster_id
+        ]
+
+    def start_configured(self, spec: str):
+        """설정 문자열로 인포머 시작 (예: "prod=pods,deployments;staging=*")"""
+        for entry in filter(None, (part.strip() for part in spec.split(";"))):
+            cluster_id, _, kinds = entry.partition("=")
+            names = RESOURCE_KINDS.keys() if kinds.strip() in ("", "*") else kinds.split(",")
+            for kind in names:
+                self.start(cluster_id.strip(), kind.strip())
+
+    def snapshot_sources(self):
+        """스냅샷으로 저장할 동기화된 저장소 목록 (resourceVersion과 오브젝트 목록을 같은 시점에 읽음)"""
+        for (cluster_id, kind), informer in list(self._informers.items()):
+            if informer.synced.is_set():
+                yield cluster_id, kind, informer.resource_version, informer.list()
+
+    async def aclose(self):
+        """모든 인포머 중지"""
+        for cluster_id, kind in list(self._informers):
+            await self.stop(cluster_id, kind)
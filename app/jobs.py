@@ -0,0 +1,142 @@
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+# 더 이상 변하지 않는 작업 상태
+FINISHED_STATUSES = ("success", "failed", "timeout", "cancelled")
+
+
+class JobTableFull(Exception):
+    """실행 중인 작업이 너무 많아 새 작업을 등록할 수 없음"""
+
+
+class Job:
+    """백그라운드 작업 상태 (진행 상황을 구독자에게 전달)"""
+
+    def __init__(self, job_type: str, **info: Any):
+        self.id = uuid.uuid4().hex
+        self.type = job_type
+        self.info = info
+        self.status = "pending"
+        self.message: Optional[str] = None
+        self.progress: Dict[str, Any] = {}
+        self.result: Optional[Dict[str, Any]] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+        self._subscribers: List[asyncio.Queue] = []
+        self._done = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        """작업 상태 스냅샷"""
+        end = self.finished_at or time.time()
+        return {
+            "job_id": self.id,
+            "type": self.type,
+            **self.info,
+            "status": self.status,
+            "message": self.message,
+            "progress": self.progress,
+            "result": self.result,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "duration": round(end - self.started_at, 2) if self.started_at else None,
+        }
+
+    def _publish(self):
+        snapshot = self.to_dict()
+        for queue in self._subscribers:
+            if queue.full():
+                # 느린 구독자는 중간 상태를 건너뛰고 최신 상태만 받음
+                queue.get_nowait()
+            queue.put_nowait(snapshot)
+
+    def update(self, status: Optional[str] = None, message: Optional[str] = None, **progress: Any):
+        """진행 상황 갱신"""
+        if status is not None:
+            if status == "running" and self.started_at is None:
+                self.started_at = time.time()
+            self.status = status
+        if message is not None:
+            self.message = message
+        self.progress.update(progress)
+        self._publish()
+
+    def finish(self, status: str, message: Optional[str] = None, result: Optional[Dict[str, Any]] = None,
+               **progress: Any):
+        """작업 종료"""
+        if self.started_at is None:
+            self.started_at = time.time()
+        self.finished_at = time.time()
+        self.result = result
+        self.update(status, message, **progress)
+        self._done.set()
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """작업이 끝날 때까지 대기 (timeout 내에 끝나면 True)"""
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def events(self) -> AsyncIterator[Dict[str, Any]]:
+        """현재 상태와 이후 변경 사항을 작업이 끝날 때까지 전달"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=16)
+        self._subscribers.append(queue)
+        try:
+            snapshot = self.to_dict()
+            yield snapshot
+            while snapshot["status"] not in FINISHED_STATUSES:
+                snapshot = await queue.get()
+                yield snapshot
+        finally:
+            self._subscribers.remove(queue)
+
+
+class JobTable:
+    """크기가 제한된 작업 테이블 (가득 차면 오래된 완료 작업부터 제거)"""
+
+    def __init__(self, max_jobs: int):
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+
+    def add(self, job: Job) -> Job:
+        """작업 등록"""
+        if len(self._jobs) >= self.max_jobs:
+            self._evict()
+        self._jobs[job.id] = job
+        return job
+
+    def _evict(self):
+        for job_id, job in list(self._jobs.items()):
+            if job.finished:
+                del self._jobs[job_id]
+                if len(self._jobs) < self.max_jobs:
+                    return
+        raise JobTableFull(f"실행 중인 작업이 최대치({self.max_jobs})에 도달했습니다.")
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def list(self, job_type: Optional[str] = None) -> List[Job]:
+        return [job for job in self._jobs.values() if job_type is None or job.type == job_type]
+
+    def running(self, job_type: Optional[str] = None) -> int:
+        """실행 중인 작업 수"""
+        return sum(1 for job in self.list(job_type) if not job.finished)
+
+    async def aclose(self):
+        """실행 중인 작업 취소 (애플리케이션 종료 시)"""
+        tasks = [job.task for job in self._jobs.values() if job.task is not None and not job.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,126 @@
+import asyncio
+import importlib.util
+from typing import Dict, Any, List, Optional, Tuple
+
+import httpx
+
+from config.settings import settings
+
+
+def _timeouts(cluster_config: Dict[str, Any]) -> Tuple[float, float]:
+    """클러스터별 (연결, 읽기) 제한 시간"""
+    return (
+        cluster_config.get('connect_timeout') or settings.K8S_CONNECT_TIMEOUT,
+        cluster_config.get('read_timeout') or settings.K8S_READ_TIMEOUT,
+    )
+
+
+class ClusterClientRegistry:
+    """클러스터별 커넥션 풀(keep-alive) 비동기 HTTP 클라이언트 레지스트리
+
+    get_cluster_config()가 반환한 cluster_id를 키로 httpx.AsyncClient를 하나씩 유지합니다.
+    같은 클라이언트가 커넥션 풀과 SSL 컨텍스트를 공유하므로 요청마다 TCP/TLS 핸드셰이크를
+    반복하지 않습니다. API URL, 토큰, SSL 검증 설정이 바뀌면 클라이언트를 새로 만듭니다.
+    """
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._fingerprints: Dict[str, Tuple[str, str, bool, float, float]] = {}
+        self._retired: List[httpx.AsyncClient] = []
+        self._closing: List[asyncio.Task] = []
+        # 테스트 등에서 전송 계층을 주입할 때 사용
+        self.transport = transport
+
+    @staticmethod
+    def _fingerprint(cluster_config: Dict[str, Any]) -> Tuple[str, str, bool, float, float]:
+        """클라이언트 재생성 여부를 판단하기 위한 설정 지문"""
+        return (
+            cluster_config['api_url'],
+            cluster_config['headers'].get("Authorization", ""),
+            bool(cluster_config['verify_ssl']),
+            *_timeouts(cluster_config),
+        )
+
+    @staticmethod
+    def _http2_available() -> bool:
+        """HTTP/2 사용 가능 여부 (h2 패키지 필요)"""
+        return settings.K8S_HTTP2 and importlib.util.find_spec("h2") is not None
+
+    def _build_client(self, cluster_config: Dict[str, Any]) -> httpx.AsyncClient:
+        """클러스터용 풀링 클라이언트 생성"""
+        http2 = self._http2_available()
+        connect_timeout, read_timeout = _timeouts(cluster_config)
+        # 풀의 모든 커넥션이 하나의 SSL 컨텍스트를 공유 (세션 재사용)
+        ssl_context = httpx.create_ssl_context(verify=cluster_config['verify_ssl'], http2=http2)
+        return httpx.AsyncClient(
+            base_url=cluster_config['api_url'],
+            # API 서버는 gzip 압축만 지원 (큰 목록 응답 전송량 절감)
+            headers={"Accept-Encoding": "gzip", **cluster_config['headers']},
+            verify=ssl_context,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.K8S_POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.K8S_POOL_MAX_KEEPALIVE,
+                keepalive_expiry=settings.K8S_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            transport=self.transport,
+        )
+
+    async def get(self, cluster_config: Dict[str, Any]) -> httpx.AsyncClient:
+        """클러스터 설정에 해당하는 클라이언트 반환 (없거나 설정이 바뀌었으면 생성)"""
+        cluster_id = cluster_config['cluster_id']
+        fingerprint = self._fingerprint(cluster_config)
+        client = self._clients.get(cluster_id)
+
+        if client is not None and self._fingerprints.get(cluster_id) == fingerprint:
+            return client
+
+        if client is not None:
+            self._retire(client)
+
+        client = self._build_client(cluster_config)
+        self._clients[cluster_id] = client
+        self._fingerprints[cluster_id] = fingerprint
+        return client
+
+    def swap_token(self, cluster_id: str, token: str):
+        """토큰만 바뀐 경우 기존 클라이언트의 인증 헤더를 교체 (커넥션 풀 유지)
+
+        요청은 보낼 때 클라이언트 헤더를 복사하므로 진행 중인 요청은 이전 토큰을, 이후 요청은 새 토큰을 사용합니다.
+        """
+        client = self._clients.get(cluster_id)
+        fingerprint = self._fingerprints.get(cluster_id)
+        if client is None or fingerprint is None:
+            return
+        authorization = f"Bearer {token}"
+        client.headers["Authorization"] = authorization
+        self._fingerprints[cluster_id] = fingerprint[:1] + (authorization,) + fingerprint[2:]
+
+    def invalidate(self, cluster_id: str):
+        """클러스터 설정 변경 시 호출 - 다음 요청에서 클라이언트를 새로 생성"""
+        self._fingerprints.pop(cluster_id, None)
+
+    def _retire(self, client: httpx.AsyncClient):
+        """교체된 클라이언트는 진행 중인 요청이 끝날 시간을 준 뒤 종료"""
+        async def _close_later():
+            await asyncio.sleep(settings.K8S_READ_TIMEOUT)
+            self._retired.remove(client)
+            await client.aclose()
+
+        self._retired.append(client)
+        self._closing = [task for task in self._closing if not task.done()]
+        self._closing.append(asyncio.create_task(_close_later()))
+
+    async def aclose(self):
+        """모든 클라이언트 종료 (애플리케이션 종료 시)"""
+        for task in self._closing:
+            task.cancel()
+        self._closing = []
+
+        clients = list(self._clients.values()) + self._retired
+        self._clients.clear()
+        self._retired = []
+        self._fingerprints.clear()
+        for client in clients:
+            await client.aclose()
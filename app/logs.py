@@ -0,0 +1,123 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional
+
+import httpx
+
+# 줄바꿈 없이 이보다 길어지면 잘라서 전달 (한 줄이 메모리를 계속 차지하지 않도록)
+MAX_LINE_BYTES = 64 * 1024
+
+
+class LogTarget(NamedTuple):
+    """로그를 가져올 컨테이너"""
+    namespace: str
+    pod: str
+    container: Optional[str]
+
+    @property
+    def path(self) -> str:
+        return f"/api/v1/namespaces/{self.namespace}/pods/{self.pod}/log"
+
+    @property
+    def prefix(self) -> bytes:
+        label = f"{self.pod}/{self.container}" if self.container else self.pod
+        return f"[{label}] ".encode("utf-8")
+
+
+def log_params(container: Optional[str], tail_lines: Optional[int] = None, since_seconds: Optional[int] = None,
+               since_time: Optional[str] = None, follow: bool = False, timestamps: bool = False,
+               previous: bool = False, limit_bytes: Optional[int] = None) -> Dict[str, Any]:
+    """API 서버 pods/log 쿼리 파라미터"""
+    params: Dict[str, Any] = {}
+    if container:
+        params["container"] = container
+    if tail_lines is not None:
+        params["tailLines"] = tail_lines
+    if since_seconds is not None:
+        params["sinceSeconds"] = since_seconds
+    if since_time:
+        params["sinceTime"] = since_time
+    if follow:
+        params["follow"] = "true"
+    if timestamps:
+        params["timestamps"] = "true"
+    if previous:
+        params["previous"] = "true"
+    if limit_bytes is not None:
+        params["limitBytes"] = limit_bytes
+    return params
+
+
+def log_targets(pods: List[Dict[str, Any]], container: Optional[str] = None) -> List[LogTarget]:
+    """Pod 목록을 컨테이너 단위 대상으로 펼침 (container를 주면 그 컨테이너가 있는 Pod만)"""
+    targets = []
+    for pod in sorted(pods, key=lambda obj: obj.get("metadata", {}).get("name", "")):
+        metadata = pod.get("metadata", {})
+        names = [c.get("name") for c in pod.get("spec", {}).get("containers") or []]
+        if container is not None:
+            names = [container] if container in names else []
+        for name in names:
+            targets.append(LogTarget(metadata.get("namespace", ""), metadata.get("name", ""), name))
+    return targets
+
+
+async def prefixed_lines(chunks: AsyncIterator[bytes], prefix: bytes) -> AsyncIterator[bytes]:
+    """청크를 줄 단위로 나눠 줄마다 접두어를 붙임 (마지막 줄바꿈 없는 줄도 전달)"""
+    pending = b""
+    async for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        if len(pending) > MAX_LINE_BYTES:
+            lines.append(pending)
+            pending = b""
+        if lines:
+            yield b"".join(prefix + line + b"\n" for line in lines)
+    if pending:
+        yield prefix + pending + b"\n"
+
+
+async def response_stream(response: httpx.Response, prefix: Optional[bytes] = None) -> AsyncIterator[bytes]:
+    """API 서버 로그 응답 본문을 읽는 대로 전달하고 끝나면 연결 반환"""
+    try:
+        chunks = response.aiter_bytes()
+        async for chunk in (prefixed_lines(chunks, prefix) if prefix is not None else chunks):
+            yield chunk
+    except httpx.HTTPError as e:
+        yield (prefix or b"") + f"로그 스트림이 끊겼습니다: {e!r}\n".encode("utf-8")
+    finally:
+        await response.aclose()
+
+
+async def multiplex(streams: List[AsyncIterator[bytes]], queue_size: int) -> AsyncIterator[bytes]:
+    """여러 로그 스트림을 도착 순서대로 합침
+
+    큐가 가득 차면 각 스트림은 API 서버 응답 읽기를 멈추므로 느린 클라이언트 때문에 로그가 메모리에 쌓이지 않습니다.
+    클라이언트 연결이 끊기면 모든 스트림을 닫습니다.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    finished = object()
+
+    async def _pump(stream: AsyncIterator[bytes]):
+        try:
+            async for chunk in stream:
+                await queue.put(chunk)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put(f"로그 스트림 오류: {e!r}\n".encode("utf-8"))
+        finally:
+            await stream.aclose()
+        await queue.put(finished)
+
+    tasks = [asyncio.create_task(_pump(stream)) for stream in streams]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            chunk = await queue.get()
+            if chunk is finished:
+                remaining -= 1
+            else:
+                yield chunk
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,279 @@
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from starlette.datastructures import MutableHeaders, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Prometheus 기본 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """증가만 하는 값"""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class Gauge(_Metric):
+    """현재 값 (수집 시점에 채움)"""
+
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str):
+        self._values[self._key(labels)] = value
+
+    def render(self) -> List[str]:
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class Histogram(_Metric):
+    """구간별 관측 횟수 (누적 버킷 + 합계 + 횟수)"""
+
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블별 [버킷별 횟수..., +Inf 횟수], 합계
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str):
+        key = self._key(labels)
+        counts = self._counts.get(key)
+        if counts is None:
+            counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            self._sums[key] = 0.0
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+                break
+        else:
+            counts[-1] += 1
+        self._sums[key] += value
+
+    def count(self, **labels: str) -> int:
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        names = self.labelnames + ("le",)
+        for key in sorted(self._counts):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), self._counts[key]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                lines.append(f"{self.name}_bucket{_format_labels(names, key + (le,))} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(self._sums[key])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    """메트릭 모음 (수집 시점에 값을 채우는 collector 지원)"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Iterable[_Metric]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], Iterable[_Metric]]):
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (text/plain; version=0.0.4)"""
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for metric in collector():
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class RequestTiming:
+    """요청 하나의 처리 시간 분해 (API 서버 대기 시간 누적)"""
+
+    __slots__ = ("started", "upstream")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.upstream = 0.0
+
+    def total(self) -> float:
+        return time.perf_counter() - self.started
+
+
+_current_timing: contextvars.ContextVar[Optional[RequestTiming]] = contextvars.ContextVar("request_timing",
+                                                                                            default=None)
+
+
+@contextmanager
+def upstream_wait() -> Iterator[None]:
+    """현재 요청의 API 서버 대기 시간으로 기록 (병합된 요청을 기다린 시간 포함)"""
+    timing = _current_timing.get()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timing is not None:
+            timing.upstream += time.perf_counter() - started
+
+
+class MetricsMiddleware:
+    """경로(라우트)/클러스터별 요청 수, 처리 시간(API 서버 대기/로컬 처리), 응답 크기 기록"""
+
+    def __init__(self, app: ASGIApp, metrics: "DashboardMetrics", cluster_label: Callable[[Optional[str]], str],
+                 server_timing: bool = False):
+        self.app = app
+        self.metrics = metrics
+        self.cluster_label = cluster_label
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming()
+        token = _current_timing.set(timing)
+        state = {"status": 500, "bytes": 0}
+
+        async def _send(message: Message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                if self.server_timing:
+                    total = timing.total()
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", f"upstream;dur={timing.upstream * 1000:.1f}, "
+                                                    f"app;dur={(total - timing.upstream) * 1000:.1f}, "
+                                                    f"total;dur={total * 1000:.1f}")
+            elif message["type"] == "http.response.body":
+                state["bytes"] += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            _current_timing.reset(token)
+            total = timing.total()
+            route = self.metrics.route_label(scope)
+            cluster = self.cluster_label(QueryParams(scope.get("query_string", b"")).get("cluster_id"))
+            labels = {"route": route, "method": scope["method"], "cluster": cluster}
+            self.metrics.requests.inc(status=str(state["status"]), **labels)
+            self.metrics.request_seconds.observe(total, **labels)
+            self.metrics.request_upstream_seconds.observe(timing.upstream, **labels)
+            self.metrics.request_local_seconds.observe(max(total - timing.upstream, 0.0), **labels)
+            self.metrics.response_bytes.inc(state["bytes"], route=route, method=scope["method"])
+
+
+class DashboardMetrics:
+    """대시보드 API 메트릭"""
+
+    def __init__(self):
+        self.registry = Registry()
+        labels = ("route", "method", "cluster")
+        self.requests = self.registry.counter(
+            "dashboard_http_requests_total", "HTTP 요청 수", labels + ("status",))
+        self.request_seconds = self.registry.histogram(
+            "dashboard_http_request_duration_seconds", "HTTP 요청 전체 처리 시간", labels)
+        self.request_upstream_seconds = self.registry.histogram(
+            "dashboard_http_request_upstream_seconds", "HTTP 요청 중 API 서버 응답 대기 시간", labels)
+        self.request_local_seconds = self.registry.histogram(
+            "dashboard_http_request_local_seconds", "HTTP 요청 중 로컬 처리 시간 (전체 - API 서버 대기)", labels)
+        self.response_bytes = self.registry.counter(
+            "dashboard_http_response_bytes_total", "HTTP 응답 본문 크기 (압축 후)", ("route", "method"))
+        self.upstream_seconds = self.registry.histogram(
+            "dashboard_upstream_request_duration_seconds", "API 서버 요청 처리 시간", ("cluster", "method", "status"))
+        self._route_paths: Dict[object, str] = {}
+
+    def route_label(self, scope: Scope) -> str:
+        """라우트 경로 템플릿 (예: /pods/{namespace}) - 일치하는 라우트가 없으면 unmatched"""
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            app = scope.get("app")
+            for route in getattr(app, "routes", ()):
+                if getattr(route, "endpoint", None) is endpoint:
+                    path = route.path
+                    break
+            else:
+                path = getattr(endpoint, "__name__", "unknown")
+            self._route_paths[endpoint] = path
+        return path
@@ -0,0 +1,395 @@
+# Kubernetes protobuf 응답 디코더 (요약 뷰에 필요한 필드만)
+#
+# API 서버의 protobuf 응답은 b"k8s\x00" 뒤에 runtime.Unknown 메시지(typeMeta=1, raw=2)가 오고,
+# raw 안에 목록(ListMeta=1, items=2) 또는 오브젝트가 인코딩되어 있습니다.
+# 스키마에 없는 필드(spec.template, managedFields, annotations 등)는 길이만 보고 건너뛰므로
+# 전체 JSON을 디코딩하는 것보다 만드는 파이썬 객체가 훨씬 적습니다.
+# 디코딩 결과는 JSON과 같은 키 이름을 쓰므로 views.SUMMARIZERS를 그대로 적용할 수 있습니다.
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+MAGIC = b"k8s\x00"
+CONTENT_TYPE = "application/vnd.kubernetes.protobuf"
+# protobuf를 지원하지 않는 리소스면 API 서버가 JSON으로 응답하도록 함께 요청
+ACCEPT = f"{CONTENT_TYPE}, application/json"
+
+# 스키마: {필드 번호: (JSON 이름, 타입, 하위 스키마)}
+# 타입: str | int | bool | time | msg | list(반복 메시지) | map(map<string,string>)
+Schema = Dict[int, Tuple[str, str, Optional[dict]]]
+
+_TIME: Schema = {1: ("seconds", "int", None), 2: ("nanos", "int", None)}
+_MAP_ENTRY: Schema = {1: ("key", "str", None), 2: ("value", "str", None)}
+
+LIST_META: Schema = {
+    2: ("resourceVersion", "str", None),
+    3: ("continue", "str", None),
+    4: ("remainingItemCount", "int", None),
+}
+
+OBJECT_META: Schema = {
+    1: ("name", "str", None),
+    3: ("namespace", "str", None),
+    6: ("resourceVersion", "str", None),
+    7: ("generation", "int", None),
+    8: ("creationTimestamp", "time", None),
+    9: ("deletionTimestamp", "time", None),
+}
+
+_CONTAINER_STATE: Schema = {
+    1: ("waiting", "msg", {1: ("reason", "str", None)}),
+    3: ("terminated", "msg", {3: ("reason", "str", None)}),
+}
+
+POD: Schema = {
+    1: ("metadata", "msg", OBJECT_META),
+    2: ("spec", "msg", {
+        2: ("containers", "list", {1: ("name", "str", None)}),
+        10: ("nodeName", "str", None),
+    }),
+    3: ("status", "msg", {
+        1: ("phase", "str", None),
+        4: ("reason", "str", None),
+        6: ("podIP", "str", None),
+        8: ("containerStatuses", "list", {
+            1: ("name", "str", None),
+            2: ("state", "msg", _CONTAINER_STATE),
+            4: ("ready", "bool", None),
+            5: ("restartCount", "int", None),
+        }),
+    }),
+}
+
+DEPLOYMENT: Schema = {
+    1: ("metadata", "msg", OBJECT_META),
+    2: ("spec", "msg", {1: ("replicas", "int", None)}),
+    3: ("status", "msg", {
+        1: ("observedGeneration", "int", None),
+        2: ("replicas", "int", None),
+        3: ("updatedReplicas", "int", None),
+        4: ("availableReplicas", "int", None),
+        7: ("readyReplicas", "int", None),
+    }),
+}
+
+STATEFULSET: Schema = {
+    1: ("metadata", "msg", OBJECT_META),
+    2: ("spec", "msg", {1: ("replicas", "int", None)}),
+    3: ("status", "msg", {
+        1: ("observedGeneration", "int", None),
+        2: ("replicas", "int", None),
+        3: ("readyReplicas", "int", None),
+        4: ("currentReplicas", "int", None),
+        5: ("updatedReplicas", "int", None),
+    }),
+}
+
+DAEMONSET: Schema = {
+    1: ("metadata", "msg", OBJECT_META),
+    3: ("status", "msg", {
+        1: ("currentNumberScheduled", "int", None),
+        3: ("desiredNumberScheduled", "int", None),
+        4: ("numberReady", "int", None),
+        5: ("observedGeneration", "int", None),
+        6: ("updatedNumberScheduled", "int", None),
+        7: ("numberAvailable", "int", None),
+    }),
+}
+
+NAMESPACE: Schema = {
+    1: ("metadata", "msg", OBJECT_META),
+    3: ("status", "msg", {1: ("phase", "str", None)}),
+}
+
+# 오류 응답 (metav1.Status)
+STATUS: Schema = {
+    3: ("message", "str", None),
+    4: ("reason", "str", None),
+    6: ("code", "int", None),
+}
+
+# 리소스 종류별 요약 뷰용 스키마
+SUMMARY_SCHEMAS: Dict[str, Schema] = {
+    "namespaces": NAMESPACE,
+    "pods": POD,
+    "deployments": DEPLOYMENT,
+    "daemonsets": DAEMONSET,
+    "statefulsets": STATEFULSET,
+}
+
+
+def _varint(buf, pos: int) -> Tuple[int, int]:
+    byte = buf[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    result, shift = byte & 0x7F, 7
+    while True:
+        pos += 1
+        byte = buf[pos]
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos + 1
+        shift += 7
+
+
+# 같은 시각이 여러 오브젝트에 반복되므로 변환 결과를 보관 (크기 제한)
+_TIMESTAMPS: Dict[int, str] = {}
+_TIMESTAMPS_MAX = 65536
+
+
+def _rfc3339(seconds: int) -> str:
+    text = _TIMESTAMPS.get(seconds)
+    if text is None:
+        if len(_TIMESTAMPS) >= _TIMESTAMPS_MAX:
+            _TIMESTAMPS.clear()
+        text = _TIMESTAMPS[seconds] = datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return text
+
+
+def decode_message(buf, pos: int, end: int, schema: Schema) -> Dict[str, Any]:
+    """buf[pos:end]의 메시지에서 스키마에 있는 필드만 디코딩 (빈 문자열/0초 시각은 JSON처럼 생략)"""
+    obj: Dict[str, Any] = {}
+    while pos < end:
+        key = buf[pos]
+        if key < 0x80:
+            pos += 1
+        else:
+            key, pos = _varint(buf, pos)
+        wire = key & 7
+        if wire == 2:
+            length = buf[pos]
+            if length < 0x80:
+                pos += 1
+            else:
+                length, pos = _varint(buf, pos)
+            start, pos = pos, pos + length
+        elif wire == 0:
+            value, pos = _varint(buf, pos)
+        elif wire == 1:
+            pos += 8
+            continue
+        elif wire == 5:
+            pos += 4
+            continue
+        else:
+            raise ValueError(f"지원하지 않는 protobuf wire type: {wire}")
+
+        spec = schema.get(key >> 3)
+        if spec is None:
+            continue
+        name, kind, sub = spec
+        if kind == "str":
+            if length:
+                obj[name] = buf[start:pos].decode("utf-8")
+        elif kind == "int":
+            # int32/int64 음수는 64비트 2의 보수로 인코딩됨
+            obj[name] = value - (1 << 64) if value >= 1 << 63 else value
+        elif kind == "bool":
+            obj[name] = bool(value)
+        elif kind == "msg":
+            obj[name] = decode_message(buf, start, pos, sub)
+        elif kind == "list":
+            obj.setdefault(name, []).append(decode_message(buf, start, pos, sub))
+        elif kind == "time":
+            # Time 메시지는 seconds(필드 1)만 사용
+            if start < pos and buf[start] == 0x08:
+                seconds = _varint(buf, start + 1)[0]
+                if seconds:
+                    obj[name] = _rfc3339(seconds)
+        elif kind == "map":
+            entry = decode_message(buf, start, pos, _MAP_ENTRY)
+            obj.setdefault(name, {})[entry.get("key", "")] = entry.get("value", "")
+    return obj
+
+
+def _envelope(buf, pos: int = 0) -> Tuple[int, int]:
+    """runtime.Unknown의 raw(필드 2) 범위"""
+    if bytes(buf[pos:pos + 4]) != MAGIC:
+        raise ValueError("protobuf 응답이 아닙니다 (k8s 매직 바이트 없음)")
+    pos += 4
+    end = len(buf)
+    while pos < end:
+        key, pos = _varint(buf, pos)
+        if key & 7 != 2:
+            raise ValueError("잘못된 runtime.Unknown 메시지")
+        length, pos = _varint(buf, pos)
+        if key >> 3 == 2:
+            return pos, pos + length
+        pos += length
+    raise ValueError("protobuf 응답에 본문(raw)이 없습니다")
+
+
+def decode_object(data: bytes, schema: Schema) -> Dict[str, Any]:
+    """단건 응답 디코딩"""
+    start, end = _envelope(data)
+    return decode_message(data, start, end, schema)
+
+
+def error_message(data: bytes) -> str:
+    """protobuf 오류 응답(Status)의 메시지 (해석할 수 없으면 빈 문자열)"""
+    try:
+        return decode_object(data, STATUS).get("message", "")
+    except (ValueError, IndexError, UnicodeDecodeError):
+        return ""
+
+
+def iter_list(data: bytes, schema: Schema) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+    """목록 응답을 (ListMeta, 항목 이터레이터)로 디코딩 - 항목은 꺼낼 때 하나씩 디코딩"""
+    start, end = _envelope(data)
+    metadata: Dict[str, Any] = {}
+    spans: List[Tuple[int, int]] = []
+    pos = start
+    while pos < end:
+        key, pos = _varint(data, pos)
+        if key & 7 != 2:
+            raise ValueError("잘못된 목록 메시지")
+        length, pos = _varint(data, pos)
+        if key >> 3 == 1:
+            metadata = decode_message(data, pos, pos + length, LIST_META)
+        elif key >> 3 == 2:
+            spans.append((pos, pos + length))
+        pos += length
+    return metadata, (decode_message(data, s, e, schema) for s, e in spans)
+
+
+class ListStreamDecoder:
+    """청크 단위로 받은 목록 응답에서 완성된 항목부터 디코딩 (본문 전체를 모으지 않음)"""
+
+    def __init__(self, schema: Schema):
+        self.schema = schema
+        self.metadata: Dict[str, Any] = {}
+        self._buf = bytearray()
+        self._pos = 0
+        # raw(목록 메시지)가 끝나는 위치 (버퍼 기준, 앞부분을 버리면 함께 이동)
+        self._raw_end: Optional[int] = None
+        self._done = False
+
+    def _try_varint(self) -> Optional[Tuple[int, int]]:
+        buf, pos = self._buf, self._pos
+        for end in range(pos, min(pos + 10, len(buf))):
+            if buf[end] < 0x80:
+                return _varint(buf, pos)
+        return None
+
+    def _header(self) -> Optional[Tuple[int, int, int]]:
+        """(필드 번호, 길이, 다음 위치) - 헤더가 아직 다 오지 않았으면 None"""
+        saved = self._pos
+        tag = self._try_varint()
+        if tag is None:
+            return None
+        key, self._pos = tag
+        size = self._try_varint()
+        self._pos = saved
+        if size is None:
+            return None
+        if key & 7 != 2:
+            raise ValueError("잘못된 protobuf 목록 응답")
+        return key >> 3, size[0], size[1]
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        """청크 추가 후 새로 완성된 항목 반환"""
+        self._buf += chunk
+        items: List[Dict[str, Any]] = []
+        buf = self._buf
+        while not self._done:
+            if self._raw_end is None:
+                # runtime.Unknown 헤더: 매직 바이트와 typeMeta를 지나 raw 시작 위치까지
+                if self._pos == 0:
+                    if len(buf) < 4:
+                        break
+                    if bytes(buf[:4]) != MAGIC:
+                        raise ValueError("protobuf 응답이 아닙니다 (k8s 매직 바이트 없음)")
+                    self._pos = 4
+                header = self._header()
+                if header is None:
+                    break
+                field, length, start = header
+                if field == 2:
+                    self._pos, self._raw_end = start, start + length
+                    continue
+                if len(buf) < start + length:
+                    break
+                self._pos = start + length
+                continue
+
+            if self._pos >= self._raw_end:
+                self._done = True
+                break
+            header = self._header()
+            if header is None:
+                break
+            field, length, start = header
+            if len(buf) < start + length:
+                break
+            if field == 1:
+                self.metadata = decode_message(buf, start, start + length, LIST_META)
+            elif field == 2:
+                items.append(decode_message(buf, start, start + length, self.schema))
+            self._pos = start + length
+
+        # 처리한 앞부분은 버려서 버퍼가 항목 하나 크기 정도로 유지되도록
+        if self._pos > 65536:
+            del buf[:self._pos]
+            if self._raw_end is not None:
+                self._raw_end -= self._pos
+            self._pos = 0
+        return items
+
+    def close(self):
+        """본문이 끝났을 때 호출 - 잘린 응답이면 ValueError"""
+        if not self._done and (self._raw_end is None or self._pos < self._raw_end):
+            raise ValueError("protobuf 응답이 중간에 끊겼습니다")
+
+
+def encode_varint(value: int) -> bytes:
+    if value < 0:
+        value += 1 << 64
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def encode_field(number: int, payload: bytes) -> bytes:
+    return encode_varint(number << 3 | 2) + encode_varint(len(payload)) + payload
+
+
+def encode_message(obj: Dict[str, Any], schema: Schema) -> bytes:
+    """스키마에 있는 필드를 protobuf로 인코딩 (테스트/가짜 API 서버용)"""
+    out = bytearray()
+    for number, (name, kind, sub) in sorted(schema.items()):
+        if name not in obj or obj[name] is None:
+            continue
+        value = obj[name]
+        if kind == "str":
+            out += encode_field(number, value.encode("utf-8"))
+        elif kind in ("int", "bool"):
+            out += encode_varint(number << 3) + encode_varint(int(value))
+        elif kind == "msg":
+            out += encode_field(number, encode_message(value, sub))
+        elif kind == "list":
+            for item in value:
+                out += encode_field(number, encode_message(item, sub))
+        elif kind == "time":
+            seconds = int(datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc).timestamp())
+            out += encode_field(number, encode_message({"seconds": seconds}, _TIME))
+        elif kind == "map":
+            for key, item in value.items():
+                out += encode_field(number, encode_message({"key": key, "value": item}, _MAP_ENTRY))
+    return bytes(out)
+
+
+def encode_envelope(api_version: str, kind: str, raw: bytes) -> bytes:
+    """runtime.Unknown으로 감싼 응답 본문 (테스트/가짜 API 서버용)"""
+    type_meta = encode_field(1, api_version.encode()) + encode_field(2, kind.encode())
+    return MAGIC + encode_field(1, type_meta) + encode_field(2, raw)
+
+
+def encode_list(api_version: str, kind: str, metadata: Dict[str, Any], items: List[bytes]) -> bytes:
+    """인코딩된 항목들로 목록 응답 본문 생성 (테스트/가짜 API 서버용)"""
+    raw = encode_field(1, encode_message(metadata, LIST_META)) + b"".join(encode_field(2, item) for item in items)
+    return encode_envelope(api_version, kind, raw)
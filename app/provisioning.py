@@ -0,0 +1,102 @@
+import asyncio
+from typing import Any, Dict, List
+
+import anyio
+
+from app.jobs import Job, JobTable, JobTableFull
+from config.cluster_manager import ClusterManager
+
+# 작업 상태에 남기지 않는 요청 필드
+_SECRET_FIELDS = ("ssh_password",)
+
+
+class ProvisioningManager:
+    """SSH 토큰 프로비저닝을 백그라운드 작업으로 실행
+
+    SSH/kubectl/토큰 검증은 블로킹 호출이므로 스레드풀에서 실행하고, 요청 처리 스레드는 작업 ID만 받고 바로 반환합니다.
+    """
+
+    def __init__(self, cluster_manager: ClusterManager, jobs: JobTable):
+        self.cluster_manager = cluster_manager
+        self.jobs = jobs
+
+    def start(self, spec: Dict[str, Any]) -> Job:
+        """클러스터 하나 프로비저닝 작업 등록 (spec은 SSHTokenRequest 필드)"""
+        job = self.jobs.add(Job("ssh_provision", **{k: v for k, v in spec.items() if k not in _SECRET_FIELDS}))
+        job.task = asyncio.create_task(self._run(job, spec))
+        return job
+
+    def start_batch(self, specs: List[Dict[str, Any]], parallelism: int) -> Job:
+        """여러 클러스터 프로비저닝을 하나의 작업으로 등록 (동시 실행 수 제한)"""
+        job = self.jobs.add(Job("ssh_provision_batch", clusters=[spec["cluster_name"] for spec in specs],
+                                parallelism=parallelism))
+        job.task = asyncio.create_task(self._run_batch(job, specs))
+        return job
+
+    def _provision(self, spec: Dict[str, Any]) -> str:
+        """토큰 발급·검증 후 저장 (스레드에서 실행)"""
+        token = self.cluster_manager.get_token_via_ssh(
+            spec["ssh_host"], spec["ssh_port"], spec["ssh_username"], spec["ssh_password"],
+            spec["k8s_host"], spec["k8s_port"], spec["service_account"], spec["namespace"],
+        )
+        self.cluster_manager.save_ssh_provisioned(
+            spec["cluster_name"], spec["ssh_host"], spec["ssh_port"], spec["ssh_username"], spec["ssh_password"],
+            spec["k8s_host"], spec["k8s_port"], token, spec["service_account"], spec["namespace"], spec["verify_ssl"],
+        )
+        return token
+
+    async def _run(self, job: Job, spec: Dict[str, Any]):
+        job.update("running", f"SSH 접속 및 토큰 생성 중: {spec['ssh_username']}@{spec['ssh_host']}")
+        try:
+            # 종료 시 취소되면 스레드는 끝까지 기다리지 않음 (SSH 제한 시간만큼 종료가 늦어지지 않도록)
+            await anyio.to_thread.run_sync(self._provision, spec, cancellable=True)
+        except asyncio.CancelledError:
+            job.finish("cancelled", "작업이 취소되었습니다")
+            raise
+        except Exception as e:
+            job.finish("failed", str(e), result={"status": "error", "message": str(e)})
+            return
+        message = f"SSH를 통해 클러스터 '{spec['cluster_name']}' 토큰이 생성되고 저장되었습니다."
+        job.finish("success", message, result={
+            "status": "success",
+            "message": message,
+            "ssh_host": spec["ssh_host"],
+            "k8s_host": spec["k8s_host"],
+        })
+
+    async def _run_batch(self, job: Job, specs: List[Dict[str, Any]]):
+        states = {spec["cluster_name"]: {"status": "pending"} for spec in specs}
+        counts = {"total": len(specs), "pending": len(specs), "running": 0, "success": 0, "failed": 0}
+        job.update("running", f"{len(specs)}개 클러스터 프로비저닝 시작", counts=counts, clusters=states)
+        semaphore = asyncio.Semaphore(job.info["parallelism"])
+
+        def _transition(name: str, status: str, **fields: Any):
+            counts[states[name]["status"]] -= 1
+            counts[status] += 1
+            states[name] = {"status": status, **fields}
+            job.update(counts=counts, clusters=states)
+
+        async def _one(spec: Dict[str, Any]):
+            name = spec["cluster_name"]
+            async with semaphore:
+                try:
+                    child = self.start(spec)
+                except JobTableFull as e:
+                    _transition(name, "failed", message=str(e))
+                    return
+                _transition(name, "running", job_id=child.id)
+                await child.wait()
+                _transition(name, "success" if child.status == "success" else "failed",
+                            job_id=child.id, message=child.message)
+
+        try:
+            await asyncio.gather(*(_one(spec) for spec in specs))
+        except asyncio.CancelledError:
+            job.finish("cancelled", "작업이 취소되었습니다")
+            raise
+
+        ok = counts["success"] == counts["total"]
+        message = f"{counts['success']}/{counts['total']}개 클러스터 프로비저닝 완료"
+        job.finish("success" if ok else "failed", message,
+                   result={"status": "success" if ok else "error", "message": message, "counts": counts,
+                           "clusters": states})
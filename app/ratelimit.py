@@ -0,0 +1,28 @@
+import asyncio
+import time
+
+
+class RateLimiter:
+    """토큰 버킷 (초당 rate개, 최대 burst개까지 몰아서 허용)"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.waited = 0.0
+
+    async def acquire(self):
+        # 대기 순서를 지키도록 잠금을 잡은 채로 다음 토큰까지 기다림
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+                self.waited += delay
+                await asyncio.sleep(delay)
@@ -0,0 +1,37 @@
+from typing import Dict, NamedTuple, Optional
+
+
+class ResourceKind(NamedTuple):
+    """API 서버 리소스 종류 정의"""
+    name: str           # 복수형 리소스 이름 (URL 경로에 사용)
+    api_prefix: str     # /api/v1 또는 /apis/apps/v1
+    api_version: str    # 목록 응답의 apiVersion
+    list_kind: str      # 목록 응답의 kind
+    namespaced: bool
+
+
+RESOURCE_KINDS: Dict[str, ResourceKind] = {
+    "namespaces": ResourceKind("namespaces", "/api/v1", "v1", "NamespaceList", False),
+    "pods": ResourceKind("pods", "/api/v1", "v1", "PodList", True),
+    "deployments": ResourceKind("deployments", "/apis/apps/v1", "apps/v1", "DeploymentList", True),
+    "daemonsets": ResourceKind("daemonsets", "/apis/apps/v1", "apps/v1", "DaemonSetList", True),
+    "statefulsets": ResourceKind("statefulsets", "/apis/apps/v1", "apps/v1", "StatefulSetList", True),
+}
+
+
+def get_kind(name: str) -> ResourceKind:
+    """리소스 종류 조회 (지원하지 않으면 ValueError)"""
+    if name not in RESOURCE_KINDS:
+        raise ValueError(f"지원하지 않는 리소스 종류입니다: {name}")
+    return RESOURCE_KINDS[name]
+
+
+def resource_path(kind: ResourceKind, namespace: Optional[str] = None, name: Optional[str] = None) -> str:
+    """리소스 API 경로 생성"""
+    if kind.namespaced and namespace:
+        path = f"{kind.api_prefix}/namespaces/{namespace}/{kind.name}"
+    else:
+        path = f"{kind.api_prefix}/{kind.name}"
+    if name:
+        path = f"{path}/{name}"
+    return path
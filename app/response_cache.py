@@ -0,0 +1,107 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# 캐시 키 (cluster_id, kind, namespace, name, 표현 옵션)
+CacheKey = Tuple[Hashable, ...]
+
+
+class CachedResponse:
+    """인코딩이 끝난 응답 본문과 ETag"""
+
+    __slots__ = ("etag", "body", "expires_at")
+
+    def __init__(self, etag: str, body: bytes, expires_at: float):
+        self.etag = etag
+        self.body = body
+        self.expires_at = expires_at
+
+
+def representation_tag(key: CacheKey) -> str:
+    """같은 resourceVersion이라도 표현(클러스터/셀렉터/view 등)이 다르면 다른 ETag가 되도록 하는 접미사"""
+    return hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:12]
+
+
+def make_etag(resource_version: Optional[str], tag: str) -> Optional[str]:
+    """resourceVersion 기반 약한 ETag (요약의 age 등 시간에 따라 변하는 필드가 있어 약한 비교)"""
+    if not resource_version:
+        return None
+    return f'W/"{resource_version}-{tag}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교, * 지원)"""
+    if not if_none_match or not etag:
+        return False
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+class ResponseCache:
+    """조회 응답 캐시 (TTL + 항목 수/전체 크기 제한 LRU)"""
+
+    def __init__(self, ttl: float, max_entries: int, max_bytes: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def get(self, key: CacheKey, etag: Optional[str] = None) -> Optional[CachedResponse]:
+        """유효한 캐시 항목 조회 (etag를 주면 현재 ETag와 같은 항목만 사용)"""
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic() or (etag is not None and entry.etag != etag):
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: CacheKey, etag: str, body: bytes):
+        """응답 저장 (가장 오래 사용되지 않은 항목부터 제거)"""
+        if not self.enabled or len(body) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = CachedResponse(etag, body, time.monotonic() + self.ttl)
+        self._bytes += len(body)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: CacheKey):
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.body)
+
+    def invalidate(self, cluster_id: Optional[str] = None, kind: Optional[str] = None):
+        """클러스터(와 리소스 종류)의 캐시 항목 제거 (인자가 없으면 전체)"""
+        for key in list(self._entries):
+            if (cluster_id is None or key[0] == cluster_id) and (kind is None or key[1] == kind):
+                self._remove(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,356 @@
+import asyncio
+import json
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from app.jobs import Job, JobTable, JobTableFull
+from app.resources import RESOURCE_KINDS, resource_path
+from config.settings import settings
+
+ClientFactory = Callable[[str], Awaitable[httpx.AsyncClient]]
+
+# (종류, 네임스페이스, 이름)
+WorkloadKey = Tuple[str, str, str]
+
+# 롤아웃 가능한 워크로드 종류 (단수형 → 리소스 이름)
+WORKLOAD_KINDS = {
+    "deployment": "deployments",
+    "daemonset": "daemonsets",
+    "statefulset": "statefulsets",
+}
+
+
+class RolloutFailed(Exception):
+    """롤아웃을 더 진행할 수 없음 (요청 실패, 오브젝트 삭제, 진행 기한 초과 등)"""
+
+    def __init__(self, message: str, details: Any = None):
+        super().__init__(message)
+        self.details = details
+
+
+def _deployment_status(obj: Dict[str, Any]) -> Tuple[bool, str, Dict[str, int]]:
+    spec_replicas = obj.get("spec", {}).get("replicas", 1)
+    status = obj.get("status", {})
+    replicas = {
+        "spec": spec_replicas,
+        "updated": status.get("updatedReplicas", 0),
+        "ready": status.get("readyReplicas", 0),
+        "available": status.get("availableReplicas", 0),
+    }
+
+    for condition in status.get("conditions") or []:
+        if condition.get("type") == "Progressing" and condition.get("reason") == "ProgressDeadlineExceeded":
+            raise RolloutFailed("Deployment 진행 기한(progressDeadlineSeconds)을 초과했습니다", condition)
+
+    if replicas["updated"] < spec_replicas:
+        return False, f"{replicas['updated']}/{spec_replicas}개 레플리카 업데이트됨", replicas
+    if status.get("replicas", 0) > replicas["updated"]:
+        return False, f"이전 레플리카 {status['replicas'] - replicas['updated']}개 종료 대기 중", replicas
+    if replicas["available"] < replicas["updated"]:
+        return False, f"{replicas['available']}/{replicas['updated']}개 레플리카 사용 가능", replicas
+    return True, "모든 레플리카 업데이트 완료", replicas
+
+
+def _daemonset_status(obj: Dict[str, Any]) -> Tuple[bool, str, Dict[str, int]]:
+    status = obj.get("status", {})
+    desired = status.get("desiredNumberScheduled", 0)
+    replicas = {
+        "desired": desired,
+        "updated": status.get("updatedNumberScheduled", 0),
+        "ready": status.get("numberReady", 0),
+        "available": status.get("numberAvailable", 0),
+    }
+    if replicas["updated"] < desired:
+        return False, f"{replicas['updated']}/{desired}개 노드 업데이트됨", replicas
+    if replicas["available"] < desired:
+        return False, f"{replicas['available']}/{desired}개 노드 사용 가능", replicas
+    return True, "모든 노드 업데이트 완료", replicas
+
+
+def _statefulset_status(obj: Dict[str, Any]) -> Tuple[bool, str, Dict[str, int]]:
+    spec = obj.get("spec", {})
+    status = obj.get("status", {})
+    spec_replicas = spec.get("replicas", 1)
+    replicas = {
+        "spec": spec_replicas,
+        "updated": status.get("updatedReplicas", 0),
+        "ready": status.get("readyReplicas", 0),
+        "current": status.get("currentReplicas", 0),
+    }
+    strategy = spec.get("updateStrategy", {})
+    if strategy.get("type") == "OnDelete":
+        # OnDelete 전략은 Pod를 직접 삭제해야 업데이트되므로 관찰 완료 시점에 종료
+        return True, "OnDelete 전략 - 컨트롤러 반영 완료", replicas
+
+    if replicas["ready"] < spec_replicas:
+        return False, f"{replicas['ready']}/{spec_replicas}개 레플리카 준비됨", replicas
+
+    partition = (strategy.get("rollingUpdate") or {}).get("partition") or 0
+    if partition > 0:
+        target = spec_replicas - partition
+        if replicas["updated"] < target:
+            return False, f"파티션 롤아웃: {replicas['updated']}/{target}개 레플리카 업데이트됨", replicas
+        return True, f"파티션 롤아웃 완료 ({target}개 레플리카)", replicas
+
+    if status.get("updateRevision") != status.get("currentRevision"):
+        return False, f"{replicas['updated']}/{spec_replicas}개 레플리카 업데이트됨", replicas
+    return True, "모든 레플리카 업데이트 완료", replicas
+
+
+STATUS_CHECKS = {
+    "deployment": _deployment_status,
+    "daemonset": _daemonset_status,
+    "statefulset": _statefulset_status,
+}
+
+
+def rollout_status(workload_type: str, obj: Dict[str, Any], generation: int) -> Tuple[bool, str, Dict[str, int]]:
+    """롤아웃 완료 여부 판단 (kubectl rollout status와 같은 기준)
+
+    컨트롤러가 재시작 패치(generation)를 관찰하기 전의 상태는 완료로 보지 않습니다.
+    """
+    observed = obj.get("status", {}).get("observedGeneration", 0)
+    if observed < generation:
+        return False, "컨트롤러가 변경 사항을 반영하기를 기다리는 중", {}
+    return STATUS_CHECKS[workload_type](obj)
+
+
+class RolloutManager:
+    """워크로드 재시작을 백그라운드 작업으로 실행하고 WATCH로 진행 상황 추적"""
+
+    def __init__(self, client_factory: ClientFactory, jobs: JobTable,
+                 on_restarted: Optional[Callable[[str, str], None]] = None):
+        self._client_factory = client_factory
+        self.jobs = jobs
+        # 재시작 패치가 적용된 뒤 호출 (cluster_id, 워크로드 종류) - 응답 캐시 무효화용
+        self.on_restarted = on_restarted
+
+    def start(self, cluster_id: str, workload_type: str, namespace: str, name: str, timeout: int) -> Job:
+        """롤아웃 작업 등록 후 즉시 반환"""
+        job = self.jobs.add(Job(
+            "rollout",
+            cluster_id=cluster_id,
+            kind=workload_type,
+            namespace=namespace,
+            name=name,
+            timeout=timeout,
+        ))
+        job.task = asyncio.create_task(self._run(job))
+        return job
+
+    def start_bulk(self, cluster_id: str, timeout: int, parallelism: int,
+                   workloads: Optional[List[WorkloadKey]] = None, namespace: Optional[str] = None,
+                   label_selector: Optional[str] = None, kinds: Optional[List[str]] = None,
+                   max_failures: Optional[int] = None) -> Job:
+        """여러 워크로드 롤아웃을 하나의 작업으로 등록 (동시 실행 수 제한)"""
+        job = self.jobs.add(Job(
+            "bulk_rollout",
+            cluster_id=cluster_id,
+            namespace=namespace,
+            label_selector=label_selector,
+            kinds=kinds or list(WORKLOAD_KINDS),
+            parallelism=parallelism,
+            max_failures=max_failures,
+            timeout=timeout,
+        ))
+        job.task = asyncio.create_task(self._run_bulk(job, workloads))
+        return job
+
+    async def _discover(self, job: Job) -> List[WorkloadKey]:
+        """네임스페이스/라벨 셀렉터로 대상 워크로드 조회"""
+        client = await self._client_factory(job.info["cluster_id"])
+        params = {"labelSelector": job.info["label_selector"]} if job.info["label_selector"] else None
+        targets: List[WorkloadKey] = []
+        for workload_type in job.info["kinds"]:
+            kind = RESOURCE_KINDS[WORKLOAD_KINDS[workload_type]]
+            r = await client.get(resource_path(kind, job.info["namespace"]), params=params)
+            if r.status_code != 200:
+                raise RolloutFailed(f"{workload_type} 목록 조회 실패", _json_or_text(r))
+            for item in r.json().get("items") or []:
+                metadata = item.get("metadata", {})
+                targets.append((workload_type, metadata.get("namespace"), metadata.get("name")))
+        return targets
+
+    async def _run_bulk(self, job: Job, workloads: Optional[List[WorkloadKey]]):
+        job.update("running", "대상 워크로드 조회 중")
+        try:
+            # 같은 워크로드를 두 번 재시작하지 않도록 중복 제거 (순서 유지)
+            targets = list(dict.fromkeys(workloads if workloads else await self._discover(job)))
+        except asyncio.CancelledError:
+            job.finish("cancelled", "작업이 취소되었습니다")
+            raise
+        except Exception as e:
+            job.finish("failed", str(e), result={"status": "error", "message": str(e),
+                                                  "details": getattr(e, "details", None)})
+            return
+
+        states = {f"{kind}/{namespace}/{name}": {"status": "pending"} for kind, namespace, name in targets}
+        counts = {"total": len(targets), "pending": len(targets), "running": 0,
+                  "success": 0, "failed": 0, "timeout": 0, "cancelled": 0, "skipped": 0}
+        job.update(message=f"{len(targets)}개 워크로드 롤아웃 시작", counts=counts, workloads=states)
+
+        semaphore = asyncio.Semaphore(job.info["parallelism"])
+        max_failures = job.info["max_failures"]
+
+        def _transition(key: str, status: str, **fields: Any):
+            counts[states[key]["status"]] -= 1
+            counts[status] += 1
+            states[key] = {"status": status, **fields}
+            job.update(counts=counts, workloads=states)
+
+        async def _one(target: WorkloadKey):
+            key = "/".join(target)
+            async with semaphore:
+                # 실패 허용치를 넘으면 남은 워크로드는 건너뜀
+                if max_failures is not None and counts["failed"] + counts["timeout"] > max_failures:
+                    _transition(key, "skipped", message="실패 허용치 초과로 건너뜀")
+                    return
+                workload_type, namespace, name = target
+                try:
+                    child = self.start(job.info["cluster_id"], workload_type, namespace, name, job.info["timeout"])
+                except JobTableFull as e:
+                    _transition(key, "failed", message=str(e))
+                    return
+                _transition(key, "running", job_id=child.id)
+                await child.wait()
+                _transition(key, child.status, job_id=child.id, message=child.message)
+
+        try:
+            await asyncio.gather(*(_one(target) for target in targets))
+        except asyncio.CancelledError:
+            job.finish("cancelled", "작업이 취소되었습니다")
+            raise
+
+        ok = counts["success"] == counts["total"]
+        message = f"{counts['success']}/{counts['total']}개 워크로드 롤아웃 완료"
+        job.finish("success" if ok else "failed", message,
+                   result={"status": "success" if ok else "error", "message": message, "counts": counts})
+
+    async def _run(self, job: Job):
+        workload_type = job.info["kind"]
+        title = workload_type.title()
+        timeout = job.info["timeout"]
+        job.update("running", "재시작 요청 중")
+        try:
+            await asyncio.wait_for(self._rollout(job), timeout)
+            job.finish("success", f"{title} Rollout 완료", result={
+                "status": "success",
+                "message": f"{title} Rollout 완료",
+                "replicas": job.progress.get("replicas", {}),
+                "duration": job.to_dict()["duration"],
+            })
+        except asyncio.TimeoutError:
+            message = f"{title} Rollout이 {timeout}초 내에 완료되지 않았습니다"
+            job.finish("timeout", message, result={"status": "timeout", "message": message, "duration": timeout})
+        except asyncio.CancelledError:
+            job.finish("cancelled", "작업이 취소되었습니다")
+            raise
+        except RolloutFailed as e:
+            job.finish("failed", str(e), result={"status": "error", "message": str(e), "details": e.details})
+        except Exception as e:
+            job.finish("failed", repr(e), result={"status": "error", "message": "Rollout 실패", "details": repr(e)})
+
+    async def _rollout(self, job: Job):
+        workload_type = job.info["kind"]
+        namespace, name = job.info["namespace"], job.info["name"]
+        kind = RESOURCE_KINDS[WORKLOAD_KINDS[workload_type]]
+        client = await self._client_factory(job.info["cluster_id"])
+
+        # 1. 워크로드 재시작 요청 (kubectl rollout restart와 같은 어노테이션)
+        patch = {
+            "spec": {
+                "template": {
+                    "metadata": {
+                        "annotations": {
+                            "kubectl.kubernetes.io/restartedAt": datetime.utcnow().isoformat()
+                        }
+                    }
+                }
+            }
+        }
+        r = await client.patch(resource_path(kind, namespace, name), json=patch,
+                               headers={"Content-Type": "application/merge-patch+json"})
+        if r.status_code != 200:
+            raise RolloutFailed("Rollout 요청 실패", _json_or_text(r))
+        if self.on_restarted is not None:
+            self.on_restarted(job.info["cluster_id"], workload_type)
+
+        obj = r.json()
+        generation = obj.get("metadata", {}).get("generation", 0)
+        job.update(message="컨트롤러 반영 대기 중", generation=generation)
+        if self._check(job, obj, generation):
+            return
+
+        # 2. WATCH로 상태 변화 추적 (폴링 없음)
+        resource_version = obj.get("metadata", {}).get("resourceVersion")
+        while True:
+            resource_version = await self._watch(job, client, kind, generation, resource_version)
+            if resource_version is None:
+                return
+
+    async def _watch(self, job: Job, client: httpx.AsyncClient, kind, generation: int,
+                     resource_version: Optional[str]) -> Optional[str]:
+        """오브젝트 WATCH - 완료되면 None, 스트림이 끊기면 재개할 resourceVersion 반환"""
+        namespace, name = job.info["namespace"], job.info["name"]
+        params = {
+            "watch": "true",
+            "fieldSelector": f"metadata.name={name}",
+            "allowWatchBookmarks": "true",
+            "timeoutSeconds": settings.ROLLOUT_WATCH_TIMEOUT,
+        }
+        if resource_version:
+            params["resourceVersion"] = resource_version
+        timeout = httpx.Timeout(settings.ROLLOUT_WATCH_TIMEOUT + 30, connect=settings.K8S_CONNECT_TIMEOUT)
+
+        async with client.stream("GET", resource_path(kind, namespace), params=params, timeout=timeout) as r:
+            if r.status_code == 410:
+                return await self._resync(job, client, kind, generation)
+            if r.status_code != 200:
+                await r.aread()
+                raise RolloutFailed("상태 조회 실패", _json_or_text(r))
+
+            async for line in r.aiter_lines():
+                if not line:
+                    continue
+                event = json.loads(line)
+                event_type, obj = event.get("type"), event.get("object") or {}
+                if event_type == "ERROR":
+                    if obj.get("code") == 410:
+                        return await self._resync(job, client, kind, generation)
+                    raise RolloutFailed("WATCH 오류", obj)
+                if event_type == "DELETED":
+                    raise RolloutFailed("롤아웃 중 워크로드가 삭제되었습니다")
+
+                resource_version = obj.get("metadata", {}).get("resourceVersion", resource_version)
+                if event_type in ("ADDED", "MODIFIED") and self._check(job, obj, generation):
+                    return None
+        return resource_version
+
+    async def _resync(self, job: Job, client: httpx.AsyncClient, kind, generation: int) -> Optional[str]:
+        """resourceVersion 만료 시 현재 상태를 다시 조회"""
+        r = await client.get(resource_path(kind, job.info["namespace"], job.info["name"]))
+        if r.status_code != 200:
+            raise RolloutFailed("상태 조회 실패", _json_or_text(r))
+        obj = r.json()
+        if self._check(job, obj, generation):
+            return None
+        return obj.get("metadata", {}).get("resourceVersion")
+
+    @staticmethod
+    def _check(job: Job, obj: Dict[str, Any], generation: int) -> bool:
+        """오브젝트 상태로 진행 상황 갱신 - 완료되었으면 True"""
+        done, message, replicas = rollout_status(job.info["kind"], obj, generation)
+        if replicas:
+            job.update(message=message, replicas=replicas)
+        else:
+            job.update(message=message)
+        return done
+
+
+def _json_or_text(r: httpx.Response) -> Any:
+    try:
+        return r.json()
+    except ValueError:
+        return r.text
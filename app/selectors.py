@@ -0,0 +1,128 @@
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+# 오브젝트 필터 함수
+Predicate = Callable[[Dict[str, Any]], bool]
+
+_SET_REQUIREMENT = re.compile(r"^\s*([^\s!=]+)\s+(in|notin)\s+\(([^)]*)\)\s*$")
+_EQUALITY_REQUIREMENT = re.compile(r"^\s*([^\s!=]+)\s*(==|!=|=)\s*([^\s]*)\s*$")
+_EXISTS_REQUIREMENT = re.compile(r"^\s*(!?)([^\s!=(),]+)\s*$")
+
+
+def _split(selector: str) -> List[str]:
+    """쉼표로 요구 조건 분리 (괄호 안의 쉼표는 유지)"""
+    parts, depth, current = [], 0, ""
+    for char in selector:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        if char == "," and depth == 0:
+            parts.append(current)
+            current = ""
+        else:
+            current += char
+    parts.append(current)
+    return [part for part in parts if part.strip()]
+
+
+def parse_label_selector(selector: str) -> Predicate:
+    """라벨 셀렉터를 API 서버와 같은 의미의 필터 함수로 변환 (형식 오류 시 ValueError)"""
+    checks: List[Callable[[Dict[str, str]], bool]] = []
+    for requirement in _split(selector):
+        match = _SET_REQUIREMENT.match(requirement)
+        if match:
+            key, operator, values = match.group(1), match.group(2), {v.strip() for v in match.group(3).split(",")}
+            if operator == "in":
+                checks.append(lambda labels, k=key, vs=values: labels.get(k) in vs)
+            else:
+                checks.append(lambda labels, k=key, vs=values: labels.get(k) not in vs)
+            continue
+
+        match = _EQUALITY_REQUIREMENT.match(requirement)
+        if match:
+            key, operator, value = match.groups()
+            if operator == "!=":
+                checks.append(lambda labels, k=key, v=value: labels.get(k) != v)
+            else:
+                checks.append(lambda labels, k=key, v=value: labels.get(k) == v)
+            continue
+
+        match = _EXISTS_REQUIREMENT.match(requirement)
+        if match:
+            negate, key = match.groups()
+            if negate:
+                checks.append(lambda labels, k=key: k not in labels)
+            else:
+                checks.append(lambda labels, k=key: k in labels)
+            continue
+
+        raise ValueError(f"잘못된 라벨 셀렉터입니다: {requirement.strip()}")
+
+    def _matches(obj: Dict[str, Any]) -> bool:
+        labels = obj.get("metadata", {}).get("labels") or {}
+        return all(check(labels) for check in checks)
+
+    return _matches
+
+
+def _field_value(obj: Dict[str, Any], path: str) -> str:
+    value: Any = obj
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return ""
+        value = value.get(key)
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def parse_field_selector(selector: str) -> Predicate:
+    """필드 셀렉터 (예: status.phase=Failed,spec.nodeName!=node-a)를 필터 함수로 변환"""
+    checks: List[Predicate] = []
+    for requirement in _split(selector):
+        match = _EQUALITY_REQUIREMENT.match(requirement)
+        if not match:
+            raise ValueError(f"잘못된 필드 셀렉터입니다: {requirement.strip()}")
+        path, operator, value = match.groups()
+        if operator == "!=":
+            checks.append(lambda obj, p=path, v=value: _field_value(obj, p) != v)
+        else:
+            checks.append(lambda obj, p=path, v=value: _field_value(obj, p) == v)
+
+    return lambda obj: all(check(obj) for check in checks)
+
+
+def build_predicate(label_selector: Optional[str], field_selector: Optional[str]) -> Optional[Predicate]:
+    """라벨/필드 셀렉터를 합친 필터 함수 (셀렉터가 없으면 None)"""
+    predicates = []
+    if label_selector:
+        predicates.append(parse_label_selector(label_selector))
+    if field_selector:
+        predicates.append(parse_field_selector(field_selector))
+    if not predicates:
+        return None
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda obj: all(predicate(obj) for predicate in predicates)
+
+
+def selector_string(selector: Optional[Dict[str, Any]]) -> str:
+    """워크로드의 spec.selector (matchLabels/matchExpressions)를 labelSelector 쿼리 문자열로 변환"""
+    selector = selector or {}
+    requirements = [f"{key}={value}" for key, value in sorted((selector.get("matchLabels") or {}).items())]
+    for expression in selector.get("matchExpressions") or []:
+        key, operator = expression["key"], expression["operator"]
+        if operator == "In":
+            requirements.append(f"{key} in ({','.join(expression.get('values') or [])})")
+        elif operator == "NotIn":
+            requirements.append(f"{key} notin ({','.join(expression.get('values') or [])})")
+        elif operator == "Exists":
+            requirements.append(key)
+        elif operator == "DoesNotExist":
+            requirements.append(f"!{key}")
+        else:
+            raise ValueError(f"지원하지 않는 셀렉터 연산자입니다: {operator}")
+    return ",".join(requirements)
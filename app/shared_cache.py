@@ -0,0 +1,376 @@
+import asyncio
+import logging
+import os
+import struct
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+from app import fastjson
+
+try:
+    import fcntl
+except ImportError:  # Windows - 공유 캐시(flock, Unix 소켓) 사용 불가
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 프레임: 길이(u32) + 내용. 요청은 JSON 헤더 하나, 응답은 JSON 헤더 + 본문 두 개
+# 스트리밍 응답은 JSON 헤더 뒤에 본문 조각을 하나씩 보내고 빈 프레임으로 끝냄 (연결은 재사용하지 않음)
+_LENGTH = struct.Struct("<I")
+MAX_FRAME_BYTES = 256 * 1024 * 1024
+
+
+class SharedReply(NamedTuple):
+    """소유자 워커의 응답"""
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+class SharedStream(NamedTuple):
+    """소유자 워커의 스트리밍 응답 (SSE 구독, 로그)"""
+    status: int
+    headers: Dict[str, str]
+    chunks: AsyncIterator[bytes]
+
+
+# (op, args)를 받아 응답을 만드는 소유자 쪽 처리 함수
+Handler = Callable[[str, Dict[str, Any]], Awaitable[Union[SharedReply, SharedStream]]]
+
+
+def supported() -> bool:
+    """flock과 Unix 소켓을 쓸 수 있는 플랫폼인지"""
+    return fcntl is not None and hasattr(asyncio, "start_unix_server")
+
+
+class SharedCacheUnavailable(Exception):
+    """소유자 워커에 연결할 수 없음 (소유자가 재시작 중이면 잠시 뒤 다른 워커가 소유자가 됨)"""
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> bytes:
+    (length,) = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))
+    if length > MAX_FRAME_BYTES:
+        raise ValueError(f"프레임이 너무 큽니다: {length}")
+    return await reader.readexactly(length)
+
+
+def _frame(data: bytes) -> bytes:
+    return _LENGTH.pack(len(data)) + data
+
+
+class OwnerLock:
+    """호스트당 한 프로세스만 잡을 수 있는 flock (프로세스가 죽으면 커널이 풀어줌)"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        if self._fd is not None:
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self):
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+class SharedCacheServer:
+    """소유자 워커의 Unix 소켓 서버 (연결마다 요청을 순서대로 처리)"""
+
+    def __init__(self, path: Path, handler: Handler):
+        self.path = path
+        self.handler = handler
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Set[asyncio.StreamWriter] = set()
+        self.requests = 0
+        self.streams = 0
+
+    async def start(self):
+        # 이전 소유자가 남긴 소켓 파일 (잠금을 잡았으므로 사용 중인 소켓이 아님)
+        self.path.unlink(missing_ok=True)
+        self._server = await asyncio.start_unix_server(self._serve, path=str(self.path))
+        os.chmod(self.path, 0o600)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._connections.add(writer)
+        try:
+            while True:
+                try:
+                    request = fastjson.loads(await _read_frame(reader))
+                except asyncio.IncompleteReadError:
+                    return
+                self.requests += 1
+                try:
+                    reply = await self.handler(request["op"], request.get("args") or {})
+                except Exception as e:
+                    logger.exception("공유 캐시 요청 처리 실패: %s", request.get("op"))
+                    reply = SharedReply(500, {}, fastjson.dumps({"detail": f"공유 캐시 요청 처리 실패: {e!r}"}))
+                if isinstance(reply, SharedStream):
+                    writer.write(_frame(fastjson.dumps({"status": reply.status, "headers": reply.headers,
+                                                        "stream": True})))
+                    await self._send_stream(reader, writer, reply.chunks)
+                    return
+                writer.write(_frame(fastjson.dumps({"status": reply.status, "headers": reply.headers}))
+                             + _frame(reply.body))
+                await writer.drain()
+        except (ConnectionError, ValueError) as e:
+            logger.debug("공유 캐시 연결 종료: %r", e)
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _send_stream(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                           chunks: AsyncIterator[bytes]):
+        """본문 조각 전달 (요청한 워커가 연결을 끊으면 스트림을 닫아 구독/로그 연결을 정리)"""
+        async def _pump():
+            async for chunk in chunks:
+                if chunk:
+                    writer.write(_frame(chunk))
+                    await writer.drain()
+            writer.write(_frame(b""))
+            await writer.drain()
+
+        self.streams += 1
+        pumping = asyncio.create_task(_pump())
+        # 요청 뒤에는 보내는 내용이 없으므로 읽기가 끝나면 상대가 연결을 끊은 것
+        disconnected = asyncio.create_task(reader.read(1))
+        try:
+            await asyncio.wait({pumping, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self.streams -= 1
+            pumping.cancel()
+            disconnected.cancel()
+            await asyncio.gather(pumping, disconnected, return_exceptions=True)
+            aclose = getattr(chunks, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async def aclose(self):
+        if self._server is not None:
+            self._server.close()
+            # 다른 워커가 유지하던 연결도 끊어야 새 소유자로 다시 연결함
+            for writer in list(self._connections):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+            self.path.unlink(missing_ok=True)
+
+
+async def _single(body: bytes):
+    yield body
+
+
+class SharedCacheClient:
+    """다른 워커의 소유자 연결 (유휴 연결 재사용, 연결 하나에 요청 하나씩)"""
+
+    def __init__(self, path: Path, timeout: float, max_idle: int = 16):
+        self.path = path
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    async def _exchange(self, connection, payload: bytes) -> SharedReply:
+        reader, writer = connection
+        writer.write(payload)
+        await writer.drain()
+        header = fastjson.loads(await _read_frame(reader))
+        body = await _read_frame(reader)
+        return SharedReply(header["status"], header.get("headers") or {}, body)
+
+    async def call(self, op: str, args: Dict[str, Any]) -> SharedReply:
+        payload = _frame(fastjson.dumps({"op": op, "args": args}))
+        # 유휴 연결은 소유자가 바뀌면서 끊겼을 수 있으므로 실패하면 새 연결로 한 번 더 시도
+        while True:
+            pooled = bool(self._idle)
+            try:
+                connection = self._idle.pop() if pooled else await asyncio.wait_for(
+                    asyncio.open_unix_connection(str(self.path)), self.timeout)
+            except (OSError, asyncio.TimeoutError) as e:
+                raise SharedCacheUnavailable(f"공유 캐시 소유자에 연결할 수 없습니다: {e!r}") from e
+            try:
+                reply = await asyncio.wait_for(self._exchange(connection, payload), self.timeout)
+            except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError) as e:
+                connection[1].close()
+                if pooled:
+                    continue
+                raise SharedCacheUnavailable(f"공유 캐시 요청 실패: {e!r}") from e
+            except BaseException:
+                connection[1].close()
+                raise
+            if len(self._idle) < self.max_idle:
+                self._idle.append(connection)
+            else:
+                connection[1].close()
+            return reply
+
+    async def stream(self, op: str, args: Dict[str, Any]) -> SharedStream:
+        """스트리밍 요청 (전용 연결 - 본문을 끝까지 읽거나 도중에 닫으면 연결도 닫힘)
+
+        소유자가 스트리밍이 아닌 응답(오류 등)을 보내면 본문 하나짜리 스트림으로 반환합니다.
+        전달 도중 소유자가 종료되면 chunks에서 SharedCacheUnavailable이 발생합니다.
+        """
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_unix_connection(str(self.path)), self.timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            raise SharedCacheUnavailable(f"공유 캐시 소유자에 연결할 수 없습니다: {e!r}") from e
+        try:
+            writer.write(_frame(fastjson.dumps({"op": op, "args": args})))
+            await writer.drain()
+            header = fastjson.loads(await asyncio.wait_for(_read_frame(reader), self.timeout))
+            if not header.get("stream"):
+                body = await asyncio.wait_for(_read_frame(reader), self.timeout)
+                writer.close()
+                return SharedStream(header["status"], header.get("headers") or {}, _single(body))
+        except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError) as e:
+            writer.close()
+            raise SharedCacheUnavailable(f"공유 캐시 요청 실패: {e!r}") from e
+        except BaseException:
+            writer.close()
+            raise
+
+        async def _chunks():
+            try:
+                while True:
+                    chunk = await _read_frame(reader)
+                    if not chunk:
+                        return
+                    yield chunk
+            except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+                raise SharedCacheUnavailable(f"공유 캐시 소유자 연결이 끊어졌습니다: {e!r}") from e
+            finally:
+                writer.close()
+
+        return SharedStream(header["status"], header.get("headers") or {}, _chunks())
+
+    def close(self):
+        for _, writer in self._idle:
+            writer.close()
+        self._idle.clear()
+
+
+class SharedCache:
+    """여러 uvicorn 워커가 한 호스트에서 인포머/응답 캐시/API 서버 조회를 공유
+
+    flock을 잡은 워커 하나가 소유자가 되어 인포머 WATCH와 캐시를 가지고 Unix 소켓으로 조회를 처리하고,
+    나머지 워커는 조회를 소유자에게 전달합니다. 소유자가 죽으면 잠금이 풀리므로 다른 워커가
+    election_interval 안에 소유자가 되고 on_promote로 인포머를 시작합니다.
+    """
+
+    def __init__(self, directory: str, handler: Handler, timeout: float, election_interval: float,
+                 on_promote: Optional[Callable[[], None]] = None):
+        if not supported():
+            raise RuntimeError("이 플랫폼에서는 워커 간 공유 캐시를 사용할 수 없습니다 (fcntl/Unix 소켓 필요). "
+                               "SHARED_CACHE_DIR을 비워 두세요.")
+        self.directory = Path(directory)
+        self.lock = OwnerLock(self.directory / "owner.lock")
+        self.server = SharedCacheServer(self.directory / "cache.sock", handler)
+        self.client = SharedCacheClient(self.directory / "cache.sock", timeout)
+        self.election_interval = election_interval
+        self.on_promote = on_promote
+        self._election: Optional[asyncio.Task] = None
+        self._pending: Set[asyncio.Task] = set()
+        self.forwarded = 0
+        self.fallbacks = 0
+
+    @property
+    def is_owner(self) -> bool:
+        return self.lock.held
+
+    @property
+    def follower(self) -> bool:
+        return not self.lock.held
+
+    async def start(self):
+        if not await self._try_promote():
+            self._election = asyncio.create_task(self._elect())
+
+    async def _try_promote(self) -> bool:
+        if not self.lock.try_acquire():
+            return False
+        self.client.close()
+        await self.server.start()
+        logger.info("공유 캐시 소유자가 되었습니다 (pid %d)", os.getpid())
+        if self.on_promote is not None:
+            self.on_promote()
+        return True
+
+    async def _elect(self):
+        while True:
+            await asyncio.sleep(self.election_interval)
+            try:
+                if await self._try_promote():
+                    return
+            except Exception as e:
+                logger.warning("공유 캐시 소유자 전환 실패: %r", e)
+                self.lock.release()
+
+    async def call(self, op: str, args: Dict[str, Any]) -> SharedReply:
+        """소유자에게 요청 (연결할 수 없으면 SharedCacheUnavailable - 호출한 쪽에서 직접 처리)"""
+        try:
+            reply = await self.client.call(op, args)
+        except SharedCacheUnavailable:
+            self.fallbacks += 1
+            raise
+        self.forwarded += 1
+        return reply
+
+    async def stream(self, op: str, args: Dict[str, Any]) -> SharedStream:
+        """소유자에게 스트리밍 요청 (연결할 수 없으면 SharedCacheUnavailable)"""
+        try:
+            reply = await self.client.stream(op, args)
+        except SharedCacheUnavailable:
+            self.fallbacks += 1
+            raise
+        self.forwarded += 1
+        return reply
+
+    def notify(self, op: str, args: Dict[str, Any]):
+        """응답을 기다리지 않는 요청 (캐시 무효화 등, 실패는 무시)"""
+        if not self.follower:
+            return
+
+        async def _send():
+            try:
+                await self.call(op, args)
+            except SharedCacheUnavailable:
+                pass
+
+        task = asyncio.create_task(_send())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "role": "owner" if self.is_owner else "follower",
+            "pid": os.getpid(),
+            "socket": str(self.server.path),
+            "served": self.server.requests,
+            "streams": self.server.streams,
+            "forwarded": self.forwarded,
+            "fallbacks": self.fallbacks,
+        }
+
+    async def aclose(self):
+        if self._election is not None:
+            self._election.cancel()
+            await asyncio.gather(self._election, return_exceptions=True)
+            self._election = None
+        await asyncio.gather(*self._pending, return_exceptions=True)
+        self.client.close()
+        await self.server.aclose()
+        self.lock.release()
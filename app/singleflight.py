@@ -0,0 +1,40 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """같은 키의 동시 요청을 하나로 합침 (먼저 온 요청의 결과를 함께 사용)"""
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """키에 해당하는 요청이 진행 중이면 그 결과를 기다리고, 없으면 fn 실행
+
+        결과는 여러 호출자가 공유하므로 수정하면 안 됨. 요청은 별도 태스크에서 실행되어
+        먼저 호출한 클라이언트가 연결을 끊어도 나머지 호출자에게 영향이 없음.
+        """
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._done(key, done))
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task):
+        self._in_flight.pop(key, None)
+        if not task.cancelled():
+            # 모든 호출자가 취소된 경우에도 예외가 처리되지 않은 채로 남지 않도록 확인
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import quote
+
+import anyio
+
+from app import fastjson
+from app.resources import RESOURCE_KINDS
+
+logger = logging.getLogger(__name__)
+
+# 파일 형식: MAGIC | 헤더 길이(u32) | 헤더 JSON | 패딩(8바이트 정렬) | 오프셋 u64 × (count+1) | 오브젝트 JSON 연속
+# 오프셋 표가 있으므로 mmap한 파일에서 오브젝트 경계를 찾을 필요 없이 슬라이스만 디코딩합니다.
+MAGIC = b"K8SSNAP1"
+_HEADER_LEN = struct.Struct("<I")
+
+# 저장할 저장소 목록을 돌려주는 함수 - (cluster_id, 리소스 종류, resourceVersion, 오브젝트 목록)
+SnapshotSources = Callable[[], Iterable[Tuple[str, str, Optional[str], List[Dict[str, Any]]]]]
+
+
+class Snapshot(NamedTuple):
+    """디스크에서 읽은 인포머 저장소"""
+    resource_version: str
+    saved_at: float
+    items: List[Dict[str, Any]]
+
+
+def encode_snapshot(cluster_id: str, kind: str, resource_version: str, items: Iterable[Dict[str, Any]],
+                    saved_at: Optional[float] = None) -> bytes:
+    """스냅샷 파일 내용 생성"""
+    bodies = [fastjson.dumps(obj) for obj in items]
+    header = fastjson.dumps({"cluster_id": cluster_id, "kind": kind, "resource_version": resource_version,
+                             "saved_at": saved_at if saved_at is not None else time.time(), "count": len(bodies)})
+    head = MAGIC + _HEADER_LEN.pack(len(header)) + header
+    head += b"\0" * (-len(head) % 8)
+    offsets = array("Q", [0] * (len(bodies) + 1))
+    position = len(head) + offsets.itemsize * len(offsets)
+    for i, body in enumerate(bodies):
+        offsets[i] = position
+        position += len(body)
+    offsets[-1] = position
+    return b"".join([head, offsets.tobytes(), *bodies])
+
+
+def decode_snapshot(data: Any) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """스냅샷 파일 내용(bytes 또는 mmap) 디코딩 - 형식이 맞지 않으면 ValueError"""
+    if len(data) < len(MAGIC) + _HEADER_LEN.size or data[:len(MAGIC)] != MAGIC:
+        raise ValueError("스냅샷 파일 형식이 아닙니다")
+    start = len(MAGIC) + _HEADER_LEN.size
+    (header_len,) = _HEADER_LEN.unpack(data[len(MAGIC):start])
+    header = fastjson.loads(data[start:start + header_len])
+    index_start = start + header_len + (-(start + header_len) % 8)
+    offsets = array("Q")
+    offsets.frombytes(data[index_start:index_start + offsets.itemsize * (header["count"] + 1)])
+    if len(offsets) != header["count"] + 1 or offsets[-1] != len(data):
+        raise ValueError("스냅샷 파일이 잘렸습니다")
+    items = [fastjson.loads(data[offsets[i]:offsets[i + 1]]) for i in range(header["count"])]
+    return header, items
+
+
+class SnapshotStore:
+    """인포머 저장소의 디스크 스냅샷 (재시작 시 LIST 없이 저장된 resourceVersion부터 WATCH 재개)
+
+    interval마다 resourceVersion이 바뀐 인포머만 임시 파일에 쓴 뒤 rename으로 교체하므로
+    같은 디렉터리를 쓰는 다른 워커/복제본이 반쯤 쓰인 파일을 읽지 않습니다.
+    max_age보다 오래된 스냅샷은 어차피 WATCH가 410으로 끝날 가능성이 높으므로 사용하지 않습니다.
+    """
+
+    def __init__(self, directory: str, interval: float, max_age: float):
+        self.directory = Path(directory)
+        self.interval = interval
+        self.max_age = max_age
+        self._saved: Dict[Tuple[str, str], str] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.saves = 0
+        self.restores = 0
+
+    def path(self, cluster_id: str, kind: str) -> Path:
+        return self.directory / f"{quote(cluster_id, safe='')}.{kind}.snap"
+
+    # ---------- 읽기 ----------
+
+    def load(self, cluster_id: str, kind: str) -> Optional[Snapshot]:
+        """스냅샷 읽기 (없거나, 오래되었거나, 손상되었으면 None) - 블로킹이므로 스레드에서 호출"""
+        path = self.path(cluster_id, kind)
+        try:
+            with open(path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    header, items = decode_snapshot(data)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("스냅샷을 읽을 수 없습니다 (%s): %r", path, e)
+            return None
+        if header.get("cluster_id") != cluster_id or header.get("kind") != kind:
+            return None
+        if time.time() - header["saved_at"] > self.max_age:
+            logger.info("%s/%s 스냅샷이 오래되어 사용하지 않습니다", cluster_id, kind)
+            return None
+        self._saved[(cluster_id, kind)] = header["resource_version"]
+        self.restores += 1
+        return Snapshot(header["resource_version"], header["saved_at"], items)
+
+    async def restore(self, cluster_id: str, kind: str) -> Optional[Snapshot]:
+        return await anyio.to_thread.run_sync(self.load, cluster_id, kind)
+
+    # ---------- 쓰기 ----------
+
+    def _write(self, cluster_id: str, kind: str, resource_version: str, items: List[Dict[str, Any]]):
+        path = self.path(cluster_id, kind)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        data = encode_snapshot(cluster_id, kind, resource_version, items)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    async def save(self, cluster_id: str, kind: str, resource_version: Optional[str],
+                   items: List[Dict[str, Any]]) -> bool:
+        """저장소 내용 저장 (마지막 저장 이후 resourceVersion이 그대로면 건너뜀)"""
+        key = (cluster_id, kind)
+        if not resource_version or self._saved.get(key) == resource_version:
+            return False
+        # 오브젝트는 교체될 뿐 수정되지 않으므로 목록만 복사해 두면 스레드에서 인코딩해도 안전
+        await anyio.to_thread.run_sync(self._write, cluster_id, kind, resource_version, items)
+        self._saved[key] = resource_version
+        self.saves += 1
+        return True
+
+    def discard(self, cluster_id: str):
+        """클러스터 설정이 바뀌었을 때 이전 클러스터의 스냅샷 삭제"""
+        for kind in RESOURCE_KINDS:
+            self._saved.pop((cluster_id, kind), None)
+            self.path(cluster_id, kind).unlink(missing_ok=True)
+
+    # ---------- 주기적 저장 ----------
+
+    async def save_all(self, sources: SnapshotSources):
+        """저장소를 모두 저장 (하나가 실패해도 나머지는 계속)"""
+        for cluster_id, kind, resource_version, items in sources():
+            try:
+                await self.save(cluster_id, kind, resource_version, items)
+            except Exception as e:
+                logger.warning("%s/%s 스냅샷 저장 실패: %r", cluster_id, kind, e)
+
+    async def _run(self, sources: SnapshotSources):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.save_all(sources)
+
+    def start(self, sources: SnapshotSources):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(sources))
+
+    async def aclose(self, sources: Optional[SnapshotSources] = None):
+        """주기적 저장 중지 후 마지막으로 한 번 저장 (종료 직전 상태로 재시작)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if sources is not None:
+            await self.save_all(sources)
+
+    def status(self) -> Dict[str, Any]:
+        return {"directory": str(self.directory), "interval": self.interval, "saves": self.saves,
+                "restores": self.restores}
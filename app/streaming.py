@@ -0,0 +1,67 @@
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi import HTTPException
+
+from app import fastjson
+from app.resources import ResourceKind
+from app.views import Transform
+
+# 목록 페이지 (API 서버 List 응답 형태: metadata + items)
+Page = Dict[str, Any]
+
+
+_dumps = fastjson.dumps
+
+
+def _error(e: Exception) -> Dict[str, Any]:
+    """스트리밍 도중 발생한 오류 표현 (응답 상태 코드는 이미 전송됨)"""
+    if isinstance(e, HTTPException):
+        return {"status": e.status_code, "detail": e.detail}
+    return {"status": 500, "detail": repr(e)}
+
+
+async def ndjson_stream(first: Page, pages: AsyncIterator[Page],
+                        transform: Optional[Transform] = None) -> AsyncIterator[bytes]:
+    """목록 항목을 한 줄에 하나씩 JSON으로 전송 (메모리에는 한 페이지만 유지)"""
+    page: Optional[Page] = first
+    try:
+        while page is not None:
+            for item in page.get("items") or []:
+                yield _dumps(transform(item) if transform else item) + b"\n"
+            try:
+                page = await pages.__anext__()
+            except StopAsyncIteration:
+                page = None
+    except Exception as e:
+        yield _dumps({"error": _error(e)}) + b"\n"
+
+
+async def json_list_stream(kind: ResourceKind, first: Page, pages: AsyncIterator[Page],
+                           transform: Optional[Transform] = None) -> AsyncIterator[bytes]:
+    """기존 응답 형식({"status", "response": {..., "items": [...]}})을 항목 단위로 스트리밍"""
+    metadata = {"resourceVersion": first.get("metadata", {}).get("resourceVersion")}
+    yield (
+        b'{"status":200,"response":{"kind":' + _dumps(kind.list_kind)
+        + b',"apiVersion":' + _dumps(kind.api_version)
+        + b',"metadata":' + _dumps(metadata) + b',"items":['
+    )
+
+    page: Optional[Page] = first
+    separator = b""
+    error = None
+    try:
+        while page is not None:
+            for item in page.get("items") or []:
+                yield separator + _dumps(transform(item) if transform else item)
+                separator = b","
+            try:
+                page = await pages.__anext__()
+            except StopAsyncIteration:
+                page = None
+    except Exception as e:
+        error = _error(e)
+
+    if error is None:
+        yield b"]}}"
+    else:
+        yield b']},"error":' + _dumps(error) + b"}"
@@ -0,0 +1,294 @@
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from app import fastjson
+from app.informer import Informer, InformerManager
+from app.selectors import Predicate, build_predicate
+from app.views import Transform, build_transform
+
+# (cluster_id, 리소스 종류)
+TopicKey = Tuple[str, str]
+
+
+def sse_event(event: str, data: Dict[str, Any], event_id: Optional[str] = None) -> bytes:
+    """SSE 메시지 인코딩"""
+    head = f"id: {event_id}\n" if event_id else ""
+    return f"{head}event: {event}\n".encode() + b"data: " + fastjson.dumps(data) + b"\n\n"
+
+
+class Subscription:
+    """구독자 하나 - 제한된 큐에 인코딩된 이벤트를 쌓고, 넘치면 퇴출"""
+
+    def __init__(self, topic: "_Topic", namespace: Optional[str], predicate: Optional[Predicate],
+                 view_key: tuple, transform: Optional[Transform], max_queue: int):
+        self.topic = topic
+        self.namespace = namespace
+        self.predicate = predicate
+        self.view_key = view_key
+        self.transform = transform
+        self.max_queue = max_queue
+        self.queue: Deque[bytes] = deque()
+        self.evicted = False
+        self.closed = False
+        self.sent = 0
+        # 라벨 셀렉터가 있으면 클라이언트에 보낸 오브젝트 (셀렉터에서 벗어나거나 새로 맞게 된 변경을 DELETED/ADDED로 전달)
+        self.known: Optional[Set[Tuple[str, str]]] = set() if predicate is not None else None
+        self._wakeup = asyncio.Event()
+
+    def matches(self, obj: Dict[str, Any]) -> bool:
+        if self.namespace is not None and obj.get("metadata", {}).get("namespace", "") != self.namespace:
+            return False
+        return self.predicate is None or self.predicate(obj)
+
+    def event_type(self, event_type: str, obj: Dict[str, Any]) -> Optional[str]:
+        """이 구독자에게 보낼 이벤트 종류 (보낼 필요가 없으면 None)"""
+        if self.known is None:
+            return event_type if self.matches(obj) else None
+        metadata = obj.get("metadata", {})
+        key = (metadata.get("namespace", ""), metadata.get("name", ""))
+        sent = key in self.known
+        if event_type != "DELETED" and self.matches(obj):
+            self.known.add(key)
+            return "MODIFIED" if sent else "ADDED"
+        if sent:
+            self.known.discard(key)
+            return "DELETED"
+        return None
+
+    def push(self, data: bytes) -> bool:
+        """이벤트 추가 (큐가 가득 차면 쌓인 이벤트를 버리고 퇴출 - False)"""
+        if self.evicted or self.closed:
+            return False
+        if len(self.queue) >= self.max_queue:
+            self.evicted = True
+            self.queue.clear()
+            self._wakeup.set()
+            return False
+        self.queue.append(data)
+        self._wakeup.set()
+        return True
+
+    def close(self):
+        self.closed = True
+        self._wakeup.set()
+
+    async def next(self, timeout: float) -> Optional[bytes]:
+        """다음 이벤트 (timeout 동안 없으면 None)"""
+        if not self.queue and not self.evicted and not self.closed:
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self.queue.popleft() if self.queue else None
+
+
+class _Topic:
+    """클러스터/리소스 종류 하나의 인포머 구독 (구독자들이 하나의 WATCH를 공유)"""
+
+    def __init__(self, key: TopicKey, informer: Informer, owned: bool):
+        self.key = key
+        self.informer = informer
+        # 구독 때문에 시작한 인포머면 구독자가 없어졌을 때 중지
+        self.owned = owned
+        self.subscribers: Set[Subscription] = set()
+        self.refs = 0
+        self.listener: Optional[Callable[[str, Optional[Dict[str, Any]]], None]] = None
+        self.idle_stop: Optional[asyncio.Task] = None
+
+
+class SubscriptionHub:
+    """리소스 변경 구독 (초기 스냅샷 + ADDED/MODIFIED/DELETED 델타)
+
+    구독 키(클러스터, 리소스 종류)마다 인포머 하나와 리스너 하나만 두고, 네임스페이스/라벨 셀렉터 필터와
+    view/fields 변환은 구독자별로 적용합니다. 같은 변환을 쓰는 구독자들은 이벤트 인코딩 결과를 공유합니다.
+    구독자 큐가 queue_size를 넘으면 그 구독자만 퇴출(evicted 이벤트 후 종료)하여 느린 클라이언트가
+    메모리를 계속 차지하거나 다른 구독자를 늦추지 않도록 합니다.
+    """
+
+    def __init__(self, informers: InformerManager, queue_size: int, heartbeat: float, sync_timeout: float,
+                 idle_seconds: float):
+        self.informers = informers
+        self.queue_size = queue_size
+        self.heartbeat = heartbeat
+        self.sync_timeout = sync_timeout
+        self.idle_seconds = idle_seconds
+        self._topics: Dict[TopicKey, _Topic] = {}
+        self.evictions = 0
+        self.events = 0
+
+    # ---------- 구독 ----------
+
+    async def subscribe(self, cluster_id: str, kind: str, namespace: Optional[str] = None,
+                        label_selector: Optional[str] = None, view: Optional[str] = None,
+                        fields: Optional[List[str]] = None) -> Subscription:
+        """구독 등록 후 현재 목록 스냅샷을 첫 이벤트로 넣어 반환
+
+        인포머가 동기화되지 않으면 asyncio.TimeoutError, 셀렉터/리소스 종류가 잘못되면 ValueError.
+        """
+        predicate = build_predicate(label_selector, None)
+        transform = build_transform(kind, view, fields)
+        topic = self._acquire(cluster_id, kind)
+        try:
+            await asyncio.wait_for(topic.informer.synced.wait(), self.sync_timeout)
+        except BaseException:
+            self._release(topic)
+            raise
+
+        if topic.listener is None:
+            topic.listener = lambda event_type, obj: self._dispatch(topic, event_type, obj)
+            topic.informer.add_listener(topic.listener)
+
+        # 스냅샷과 구독 등록 사이에 await가 없으므로 이벤트가 빠지거나 중복되지 않음
+        subscription = Subscription(topic, namespace, predicate, (view, tuple(fields or ())), transform,
+                                    self.queue_size)
+        items = topic.informer.list(namespace, predicate)
+        if subscription.known is not None:
+            subscription.known.update(Informer._key(obj) for obj in items)
+        if transform is not None:
+            items = [transform(obj) for obj in items]
+        subscription.push(sse_event("SNAPSHOT", {
+            "type": "SNAPSHOT",
+            "kind": topic.informer.kind.list_kind,
+            "resourceVersion": topic.informer.resource_version,
+            "items": items,
+        }, topic.informer.resource_version))
+        topic.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        topic = subscription.topic
+        if subscription in topic.subscribers:
+            topic.subscribers.discard(subscription)
+            subscription.close()
+            self._release(topic)
+
+    async def stream(self, subscription: Subscription) -> AsyncIterator[bytes]:
+        """SSE 본문 (주기적으로 keepalive 주석, 퇴출되거나 인포머가 중지되면 종료)"""
+        try:
+            while True:
+                data = await subscription.next(self.heartbeat)
+                if data is not None:
+                    subscription.sent += 1
+                    yield data
+                    continue
+                if subscription.evicted:
+                    yield sse_event("EVICTED", {"type": "EVICTED", "message": "구독자가 이벤트를 제때 받지 못해 "
+                                                                            "구독이 해제되었습니다. 다시 구독하세요."})
+                    return
+                if subscription.closed:
+                    return
+                topic = subscription.topic
+                if self.informers.get(*topic.key) is not topic.informer:
+                    yield sse_event("ERROR", {"type": "ERROR", "message": "인포머가 중지되어 구독을 종료합니다."})
+                    return
+                yield b": keepalive\n\n"
+        finally:
+            self.unsubscribe(subscription)
+
+    # ---------- 이벤트 전달 ----------
+
+    def _dispatch(self, topic: _Topic, event_type: str, obj: Optional[Dict[str, Any]]):
+        """인포머 리스너 - 구독자별 필터 적용 후 큐에 추가 (변환/인코딩은 view별로 한 번)"""
+        if not topic.subscribers:
+            return
+        self.events += 1
+        if obj is None:
+            # 재목록 - 이어지는 ADDED로 전체 목록을 다시 받음
+            encoded_reset = sse_event(event_type, {"type": event_type}, topic.informer.resource_version)
+            for subscription in list(topic.subscribers):
+                if subscription.known is not None:
+                    subscription.known.clear()
+                self._push(subscription, encoded_reset)
+            return
+
+        resource_version = obj.get("metadata", {}).get("resourceVersion")
+        encoded: Dict[tuple, bytes] = {}
+        for subscription in list(topic.subscribers):
+            sent_type = subscription.event_type(event_type, obj)
+            if sent_type is None:
+                continue
+            data = encoded.get((subscription.view_key, sent_type))
+            if data is None:
+                body = subscription.transform(obj) if subscription.transform is not None else obj
+                data = encoded[(subscription.view_key, sent_type)] = sse_event(sent_type, {
+                    "type": sent_type, "resourceVersion": resource_version, "object": body,
+                }, resource_version)
+            self._push(subscription, data)
+
+    def _push(self, subscription: Subscription, data: bytes):
+        if not subscription.push(data) and subscription.evicted and subscription in subscription.topic.subscribers:
+            # 더 이상 이벤트를 받지 않도록 바로 분리 (스트림은 evicted 이벤트를 보내고 종료)
+            self.evictions += 1
+            subscription.topic.subscribers.discard(subscription)
+            self._release(subscription.topic)
+
+    # ---------- 인포머 수명 ----------
+
+    def _acquire(self, cluster_id: str, kind: str) -> _Topic:
+        key = (cluster_id, kind)
+        topic = self._topics.get(key)
+        informer = self.informers.get(cluster_id, kind)
+        if topic is None or topic.informer is not informer:
+            owned = informer is None
+            topic = self._topics[key] = _Topic(key, self.informers.start(cluster_id, kind), owned)
+        if topic.idle_stop is not None:
+            topic.idle_stop.cancel()
+            topic.idle_stop = None
+        topic.refs += 1
+        return topic
+
+    def _release(self, topic: _Topic):
+        topic.refs -= 1
+        if topic.refs > 0:
+            return
+        if topic.owned:
+            # 페이지 새로고침 등으로 바로 다시 구독하는 경우 인포머를 다시 만들지 않도록 잠시 유지
+            topic.idle_stop = asyncio.create_task(self._stop_idle(topic))
+        else:
+            self._detach(topic)
+
+    async def _stop_idle(self, topic: _Topic):
+        await asyncio.sleep(self.idle_seconds)
+        if topic.refs > 0:
+            return
+        self._detach(topic)
+        if self.informers.get(*topic.key) is topic.informer:
+            await self.informers.stop(*topic.key)
+
+    def _detach(self, topic: _Topic):
+        if self._topics.get(topic.key) is topic:
+            del self._topics[topic.key]
+        if topic.listener is not None:
+            topic.informer.remove_listener(topic.listener)
+            topic.listener = None
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "topics": [{
+                "cluster_id": topic.key[0],
+                "kind": topic.key[1],
+                "subscribers": len(topic.subscribers),
+                "owned_informer": topic.owned,
+                "queued": sum(len(s.queue) for s in topic.subscribers),
+            } for topic in self._topics.values()],
+            "subscribers": self.subscribers,
+            "events": self.events,
+            "evictions": self.evictions,
+        }
+
+    @property
+    def subscribers(self) -> int:
+        return sum(len(topic.subscribers) for topic in self._topics.values())
+
+    async def aclose(self):
+        """구독 종료 (애플리케이션 종료 시)"""
+        tasks = []
+        for topic in list(self._topics.values()):
+            for subscription in list(topic.subscribers):
+                subscription.close()
+            if topic.idle_stop is not None:
+                topic.idle_stop.cancel()
+                tasks.append(topic.idle_stop)
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,249 @@
+import itertools
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.informer import Informer, InformerManager
+from app.views import SUMMARIZERS
+
+# 요약에 포함하는 워크로드 종류
+WORKLOAD_RESOURCES = ("deployments", "daemonsets", "statefulsets")
+
+# 요약마다 고유한 버전 (ETag용 - 요약이 새로 만들어져도 이전 값과 겹치지 않음)
+_versions = itertools.count(1)
+
+# (namespace, name)
+Key = Tuple[str, str]
+
+
+def _key(obj: Dict[str, Any]) -> Key:
+    metadata = obj.get("metadata", {})
+    return metadata.get("namespace", ""), metadata.get("name", "")
+
+
+def _pod_stat(obj: Dict[str, Any]) -> Dict[str, Any]:
+    """Pod 하나가 집계에 기여하는 값"""
+    summary = SUMMARIZERS["pods"](obj)
+    phase = summary["phase"] or "Unknown"
+    ready = phase == "Succeeded" or (phase == "Running" and summary["ready_containers"] >= summary["containers"])
+    return {
+        "namespace": summary.get("namespace", ""),
+        "name": summary["name"],
+        "phase": phase,
+        "reason": summary["reason"],
+        "restarts": summary["restarts"],
+        "ready": ready,
+    }
+
+
+def _workload_stat(resource: str, obj: Dict[str, Any]) -> Dict[str, Any]:
+    """워크로드 하나의 준비 상태 (원하는 수 대비 ready 수)"""
+    summary = SUMMARIZERS[resource](obj)
+    desired = summary["desired"] if resource == "daemonsets" else summary["replicas"]
+    return {
+        "kind": resource,
+        "namespace": summary.get("namespace", ""),
+        "name": summary["name"],
+        "desired": desired or 0,
+        "ready": summary["ready"] or 0,
+    }
+
+
+def _empty_namespace() -> Dict[str, Any]:
+    return {
+        "pods": 0,
+        "phases": {},
+        "restarts": 0,
+        "not_ready_pods": 0,
+        "workloads": {resource: {"total": 0, "not_ready": 0} for resource in WORKLOAD_RESOURCES},
+    }
+
+
+class ClusterSummary:
+    """클러스터 요약 집계 (Pod phase별 수, 재시작 합계, 준비되지 않은 Pod/워크로드, 네임스페이스별 합계)
+
+    오브젝트별 기여분을 기억해 두고 변경 이벤트마다 이전 기여분을 빼고 새 값을 더하므로,
+    조회 시 전체 목록을 다시 계산하지 않습니다.
+    """
+
+    def __init__(self, cluster_id: str):
+        self.cluster_id = cluster_id
+        self.version = next(_versions)
+        self._pods: Dict[Key, Dict[str, Any]] = {}
+        self._workloads: Dict[str, Dict[Key, Dict[str, Any]]] = {resource: {} for resource in WORKLOAD_RESOURCES}
+        self._namespaces: Dict[str, Dict[str, Any]] = {}
+        # 준비되지 않은 항목 (조회 시 전체를 훑지 않도록 따로 유지)
+        self._not_ready_pods: Dict[Key, Dict[str, Any]] = {}
+        self._not_ready_workloads: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+
+    # ---------- 증분 갱신 ----------
+
+    def _namespace(self, namespace: str) -> Dict[str, Any]:
+        totals = self._namespaces.get(namespace)
+        if totals is None:
+            totals = self._namespaces[namespace] = _empty_namespace()
+        return totals
+
+    def _apply_pod(self, stat: Dict[str, Any], sign: int):
+        totals = self._namespace(stat["namespace"])
+        totals["pods"] += sign
+        phases = totals["phases"]
+        phases[stat["phase"]] = phases.get(stat["phase"], 0) + sign
+        if not phases[stat["phase"]]:
+            del phases[stat["phase"]]
+        totals["restarts"] += sign * stat["restarts"]
+        if not stat["ready"]:
+            totals["not_ready_pods"] += sign
+            key = (stat["namespace"], stat["name"])
+            if sign > 0:
+                self._not_ready_pods[key] = stat
+            else:
+                self._not_ready_pods.pop(key, None)
+        self._drop_if_empty(stat["namespace"])
+
+    def _apply_workload(self, stat: Dict[str, Any], sign: int):
+        counts = self._namespace(stat["namespace"])["workloads"][stat["kind"]]
+        counts["total"] += sign
+        if stat["ready"] < stat["desired"]:
+            counts["not_ready"] += sign
+            key = (stat["kind"], stat["namespace"], stat["name"])
+            if sign > 0:
+                self._not_ready_workloads[key] = stat
+            else:
+                self._not_ready_workloads.pop(key, None)
+        self._drop_if_empty(stat["namespace"])
+
+    def _drop_if_empty(self, namespace: str):
+        totals = self._namespaces[namespace]
+        if not totals["pods"] and not any(counts["total"] for counts in totals["workloads"].values()):
+            del self._namespaces[namespace]
+
+    def pod_event(self, event_type: str, obj: Optional[Dict[str, Any]]):
+        """Pod 인포머 변경 반영"""
+        if event_type == "RESET":
+            for stat in self._pods.values():
+                self._apply_pod(stat, -1)
+            self._pods = {}
+        else:
+            key = _key(obj)
+            previous = self._pods.pop(key, None)
+            if previous is not None:
+                self._apply_pod(previous, -1)
+            if event_type != "DELETED":
+                stat = _pod_stat(obj)
+                self._pods[key] = stat
+                self._apply_pod(stat, +1)
+        self.version = next(_versions)
+
+    def workload_event(self, resource: str) -> Callable[[str, Optional[Dict[str, Any]]], None]:
+        """워크로드 인포머 변경 반영 함수"""
+        workloads = self._workloads[resource]
+
+        def _listener(event_type: str, obj: Optional[Dict[str, Any]]):
+            if event_type == "RESET":
+                for stat in workloads.values():
+                    self._apply_workload(stat, -1)
+                workloads.clear()
+            else:
+                key = _key(obj)
+                previous = workloads.pop(key, None)
+                if previous is not None:
+                    self._apply_workload(previous, -1)
+                if event_type != "DELETED":
+                    stat = _workload_stat(resource, obj)
+                    workloads[key] = stat
+                    self._apply_workload(stat, +1)
+            self.version = next(_versions)
+
+        return _listener
+
+    # ---------- 조회 ----------
+
+    def to_dict(self, namespace: Optional[str] = None, max_items: int = 100) -> Dict[str, Any]:
+        """요약 응답 (namespace를 주면 해당 네임스페이스만)"""
+        if namespace is not None:
+            namespaces = {namespace: self._namespaces.get(namespace) or _empty_namespace()}
+        else:
+            namespaces = self._namespaces
+
+        totals = _empty_namespace()
+        for counts in namespaces.values():
+            totals["pods"] += counts["pods"]
+            totals["restarts"] += counts["restarts"]
+            totals["not_ready_pods"] += counts["not_ready_pods"]
+            for phase, count in counts["phases"].items():
+                totals["phases"][phase] = totals["phases"].get(phase, 0) + count
+            for resource, workload_counts in counts["workloads"].items():
+                totals["workloads"][resource]["total"] += workload_counts["total"]
+                totals["workloads"][resource]["not_ready"] += workload_counts["not_ready"]
+
+        not_ready_pods = sorted(
+            (stat for stat in self._not_ready_pods.values() if namespace is None or stat["namespace"] == namespace),
+            key=lambda stat: (stat["namespace"], stat["name"]),
+        )
+        not_ready_workloads = sorted(
+            (stat for stat in self._not_ready_workloads.values()
+             if namespace is None or stat["namespace"] == namespace),
+            key=lambda stat: (stat["namespace"], stat["kind"], stat["name"]),
+        )
+        return {
+            "cluster_id": self.cluster_id,
+            "totals": totals,
+            "namespaces": {ns: namespaces[ns] for ns in sorted(namespaces)},
+            "not_ready_pods": not_ready_pods[:max_items],
+            "not_ready_workloads": not_ready_workloads[:max_items],
+            "truncated": len(not_ready_pods) > max_items or len(not_ready_workloads) > max_items,
+        }
+
+
+def summarize(cluster_id: str, pods: List[Dict[str, Any]],
+              workloads: Dict[str, List[Dict[str, Any]]]) -> ClusterSummary:
+    """목록 조회 결과로 요약을 한 번에 계산 (인포머가 없을 때)"""
+    summary = ClusterSummary(cluster_id)
+    for obj in pods:
+        summary.pod_event("ADDED", obj)
+    for resource, items in workloads.items():
+        listener = summary.workload_event(resource)
+        for obj in items:
+            listener("ADDED", obj)
+    return summary
+
+
+class SummaryManager:
+    """인포머 변경 이벤트로 클러스터 요약을 유지"""
+
+    def __init__(self, informers: InformerManager):
+        self.informers = informers
+        self._summaries: Dict[str, ClusterSummary] = {}
+        # 클러스터별로 구독 중인 (리소스 종류 → 인포머, 구독 함수)
+        self._attached: Dict[str, Dict[str, Tuple[Informer, Callable]]] = {}
+
+    def get(self, cluster_id: str) -> Optional[ClusterSummary]:
+        """Pod 인포머가 동기화된 클러스터의 요약 (없으면 None)"""
+        if self.informers.synced(cluster_id, "pods") is None:
+            self.detach(cluster_id)
+            return None
+
+        summary = self._summaries.get(cluster_id)
+        if summary is None:
+            summary = self._summaries[cluster_id] = ClusterSummary(cluster_id)
+        attached = self._attached.setdefault(cluster_id, {})
+        for resource in ("pods",) + WORKLOAD_RESOURCES:
+            informer = self.informers.synced(cluster_id, resource)
+            current = attached.get(resource)
+            if current is not None and current[0] is informer:
+                continue
+            if current is not None:
+                # 인포머가 중지/재시작됨 - 이전 구독을 해제하고 해당 종류 집계 초기화
+                current[0].remove_listener(current[1])
+                current[1]("RESET", None)
+                del attached[resource]
+            if informer is not None:
+                listener = summary.pod_event if resource == "pods" else summary.workload_event(resource)
+                informer.add_listener(listener)
+                attached[resource] = (informer, listener)
+        return summary
+
+    def detach(self, cluster_id: str):
+        """클러스터 요약 구독 해제"""
+        for informer, listener in self._attached.pop(cluster_id, {}).values():
+            informer.remove_listener(listener)
+        self._summaries.pop(cluster_id, None)
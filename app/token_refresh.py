@@ -0,0 +1,171 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import anyio
+import httpx
+
+from config.cluster_manager import ClusterManager, token_claims, token_service_account
+
+ClientFactory = Callable[[str], Awaitable[httpx.AsyncClient]]
+
+
+class TokenRefreshFailed(Exception):
+    """토큰을 재발급할 수 없음"""
+
+
+class TokenRefresher:
+    """만료가 가까운 클러스터 토큰을 백그라운드에서 재발급
+
+    현재 토큰이 아직 유효하면 그 토큰으로 TokenRequest API(serviceaccounts/token)를 호출하고,
+    실패하거나 이미 만료되었으면 저장된 SSH 프로비저닝 정보로 다시 발급합니다.
+    새 토큰은 ClusterManager.update_token()으로 저장되어 커넥션 풀 클라이언트의 헤더만 교체됩니다.
+    """
+
+    def __init__(self, cluster_manager: ClusterManager, client_factory: ClientFactory, refresh_before: float,
+                 duration: int, check_interval: float, retry_interval: float):
+        self.cluster_manager = cluster_manager
+        self._client_factory = client_factory
+        self.refresh_before = refresh_before
+        self.duration = duration
+        self.check_interval = check_interval
+        self.retry_interval = retry_interval
+        self._status: Dict[str, Dict[str, Any]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._loop: Optional[asyncio.Task] = None
+        self.refreshed = 0
+        self.failed = 0
+
+    def refresh_at(self, token: str) -> Optional[float]:
+        """재발급을 시작할 시각 (만료 refresh_before초 전, 수명이 짧은 토큰은 수명의 1/3 남았을 때)"""
+        claims = token_claims(token)
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)):
+            return None
+        margin = self.refresh_before
+        issued = claims.get("iat") or claims.get("nbf")
+        if isinstance(issued, (int, float)) and exp > issued:
+            margin = min(margin, (exp - issued) / 3)
+        return exp - margin
+
+    def due(self, now: Optional[float] = None) -> List[str]:
+        """지금 재발급해야 하는 클러스터 (실패 후 재시도 대기 중이거나 진행 중인 클러스터 제외)"""
+        now = time.time() if now is None else now
+        result = []
+        for cluster_id, config in self.cluster_manager.store.clusters().items():
+            at = self.refresh_at(config.get("token", ""))
+            retry_after = self._status.get(cluster_id, {}).get("retry_after") or 0
+            if at is not None and now >= at and now >= retry_after and cluster_id not in self._tasks:
+                result.append(cluster_id)
+        return result
+
+    def request(self, cluster_id: str) -> Optional[asyncio.Task]:
+        """재발급 예약 (이미 진행 중이면 같은 작업 반환, 실패 후 재시도 대기 중이면 None)"""
+        task = self._tasks.get(cluster_id)
+        if task is None:
+            retry_after = self._status.get(cluster_id, {}).get("retry_after") or 0
+            if time.time() < retry_after:
+                return None
+            task = self._tasks[cluster_id] = asyncio.create_task(self._refresh_task(cluster_id))
+            task.add_done_callback(lambda _: self._tasks.pop(cluster_id, None))
+        return task
+
+    async def _refresh_task(self, cluster_id: str):
+        try:
+            await self.refresh(cluster_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # 결과는 status()에 기록됨
+            pass
+
+    async def refresh(self, cluster_id: str) -> str:
+        """토큰 재발급 후 교체 - 새 토큰 반환"""
+        config = self.cluster_manager.store.get(cluster_id)
+        if config is None:
+            raise TokenRefreshFailed(f"클러스터 '{cluster_id}'를 찾을 수 없습니다.")
+        token = config.get("token", "")
+        exp = token_claims(token).get("exp")
+        errors = []
+        new_token, method = None, None
+
+        service_account = token_service_account(token)
+        if service_account is not None and (not isinstance(exp, (int, float)) or exp > time.time()):
+            try:
+                new_token, method = await self._token_request(cluster_id, *service_account), "token_request"
+            except (TokenRefreshFailed, httpx.HTTPError, ValueError, KeyError) as e:
+                errors.append(f"TokenRequest: {e}")
+
+        if new_token is None and (config.get("provisioning") or {}).get("method") == "ssh":
+            try:
+                new_token = await anyio.to_thread.run_sync(self.cluster_manager.reprovision_via_ssh, cluster_id,
+                                                           cancellable=True)
+                method = "ssh"
+            except Exception as e:
+                errors.append(f"SSH: {e}")
+
+        status = self._status.setdefault(cluster_id, {})
+        status["last_attempt"] = time.time()
+        if new_token is None:
+            self.failed += 1
+            status["error"] = "; ".join(errors) or "재발급 방법이 없습니다 (ServiceAccount 토큰이 아니고 SSH 정보도 없음)"
+            status["retry_after"] = time.time() + self.retry_interval
+            raise TokenRefreshFailed(status["error"])
+
+        # 저장과 헤더 교체 사이에 await가 없으므로 다른 요청은 둘 중 한 상태만 봄
+        self.cluster_manager.update_token(cluster_id, new_token)
+        self.refreshed += 1
+        status.update({"last_refresh": time.time(), "method": method, "error": None, "retry_after": None})
+        return new_token
+
+    async def _token_request(self, cluster_id: str, namespace: str, name: str) -> str:
+        """현재 토큰으로 같은 ServiceAccount의 새 토큰 요청 (TokenRequest API)"""
+        client = await self._client_factory(cluster_id)
+        body = {
+            "apiVersion": "authentication.k8s.io/v1",
+            "kind": "TokenRequest",
+            "spec": {"expirationSeconds": self.duration},
+        }
+        r = await client.post(f"/api/v1/namespaces/{namespace}/serviceaccounts/{name}/token", json=body)
+        if r.status_code not in (200, 201):
+            raise TokenRefreshFailed(f"{r.status_code} {r.text[:200]}")
+        token = r.json()["status"]["token"]
+        if not token:
+            raise TokenRefreshFailed("토큰이 비어있습니다.")
+        return token
+
+    def reset(self, cluster_id: str):
+        """클러스터 설정이 새로 저장되면 실패 기록 초기화"""
+        self._status.pop(cluster_id, None)
+
+    def status(self, cluster_id: str) -> Dict[str, Any]:
+        """클러스터 토큰 재발급 상태"""
+        config = self.cluster_manager.store.get(cluster_id) or {}
+        status = self._status.get(cluster_id, {})
+        return {
+            "refresh_at": self.refresh_at(config.get("token", "")),
+            "refreshing": cluster_id in self._tasks,
+            "last_refresh": status.get("last_refresh"),
+            "method": status.get("method"),
+            "error": status.get("error"),
+            "retry_after": status.get("retry_after"),
+        }
+
+    async def _run(self):
+        while True:
+            for cluster_id in self.due():
+                self.request(cluster_id)
+            await asyncio.sleep(self.check_interval)
+
+    def start(self):
+        """주기적 만료 확인 시작"""
+        if self._loop is None or self._loop.done():
+            self._loop = asyncio.create_task(self._run())
+
+    async def aclose(self):
+        """백그라운드 작업 종료 (애플리케이션 종료 시)"""
+        tasks = list(self._tasks.values()) + ([self._loop] if self._loop is not None else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop = None
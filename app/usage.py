@@ -0,0 +1,410 @@
+import asyncio
+import heapq
+import logging
+import time
+from array import array
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from app import fastjson
+
+logger = logging.getLogger(__name__)
+
+# cluster_id를 받아 해당 클러스터의 풀링 클라이언트를 돌려주는 함수
+ClientFactory = Callable[[str], Awaitable[httpx.AsyncClient]]
+
+# metrics.k8s.io 리소스 종류 → API 경로
+USAGE_PATHS = {
+    "pods": "/apis/metrics.k8s.io/v1beta1/pods",
+    "nodes": "/apis/metrics.k8s.io/v1beta1/nodes",
+}
+
+# (namespace, name) - 노드는 namespace가 ""
+UsageKey = Tuple[str, str]
+
+_CPU_SUFFIXES = {"n": 1e-9, "u": 1e-6, "m": 1e-3}
+_MEMORY_SUFFIXES = {
+    "Ki": 2 ** 10, "Mi": 2 ** 20, "Gi": 2 ** 30, "Ti": 2 ** 40, "Pi": 2 ** 50, "Ei": 2 ** 60,
+    "k": 1e3, "M": 1e6, "G": 1e9, "T": 1e12, "P": 1e15, "E": 1e18,
+}
+
+
+def parse_cpu(quantity: str) -> float:
+    """CPU 수량 → 코어 수 (예: "250m" → 0.25, "12345n" → 0.000012345)"""
+    factor = _CPU_SUFFIXES.get(quantity[-1:])
+    if factor is not None:
+        return float(quantity[:-1]) * factor
+    return float(quantity)
+
+
+def parse_memory(quantity: str) -> float:
+    """메모리 수량 → 바이트 (예: "128Mi", "1G", "1e6")"""
+    for length in (2, 1):
+        factor = _MEMORY_SUFFIXES.get(quantity[-length:])
+        if factor is not None and len(quantity) > length:
+            return float(quantity[:-length]) * factor
+    return float(quantity)
+
+
+def _timestamp(value: Optional[str], cache: Dict[str, float], default: float) -> float:
+    """RFC3339 → epoch 초 (한 번의 수집에서 같은 값이 반복되므로 캐시)"""
+    if not value:
+        return default
+    parsed = cache.get(value)
+    if parsed is None:
+        try:
+            parsed = cache[value] = datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            parsed = cache[value] = default
+    return parsed
+
+
+def parse_usage(kind: str, body: Dict[str, Any], scraped_at: float) -> List[Tuple[UsageKey, float, float, float]]:
+    """metrics.k8s.io 목록 → (키, 측정 시각, CPU 코어, 메모리 바이트) 목록 (Pod는 컨테이너 합계)"""
+    timestamps: Dict[str, float] = {}
+    samples = []
+    for item in body.get("items") or []:
+        metadata = item.get("metadata", {})
+        if kind == "pods":
+            usages = [container.get("usage") or {} for container in item.get("containers") or []]
+        else:
+            usages = [item.get("usage") or {}]
+        cpu = sum(parse_cpu(usage["cpu"]) for usage in usages if "cpu" in usage)
+        memory = sum(parse_memory(usage["memory"]) for usage in usages if "memory" in usage)
+        samples.append(((metadata.get("namespace", ""), metadata.get("name", "")),
+                        _timestamp(item.get("timestamp"), timestamps, scraped_at), cpu, memory))
+    return samples
+
+
+class Ring:
+    """고정 크기 시계열 링 버퍼 (가득 차기 전에는 들어온 만큼만 메모리 사용)
+
+    시각은 float64, 값은 float32 배열로 보관합니다 (샘플당 16바이트).
+    """
+
+    __slots__ = ("capacity", "ts", "cpu", "memory", "head")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.ts = array("d")
+        self.cpu = array("f")
+        self.memory = array("f")
+        # 가득 찬 뒤 다음에 덮어쓸 위치 (= 가장 오래된 샘플)
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def append(self, ts: float, cpu: float, memory: float):
+        if len(self.ts) < self.capacity:
+            self.ts.append(ts)
+            self.cpu.append(cpu)
+            self.memory.append(memory)
+            return
+        self.ts[self.head] = ts
+        self.cpu[self.head] = cpu
+        self.memory[self.head] = memory
+        self.head = (self.head + 1) % self.capacity
+
+    def grow(self, capacity: int):
+        """용량 늘리기 (보관 중인 샘플은 오래된 순으로 유지)"""
+        if capacity <= self.capacity:
+            return
+        if self.head:
+            self.ts = self.ts[self.head:] + self.ts[:self.head]
+            self.cpu = self.cpu[self.head:] + self.cpu[:self.head]
+            self.memory = self.memory[self.head:] + self.memory[:self.head]
+            self.head = 0
+        self.capacity = capacity
+
+    def points(self, since: float = 0.0) -> List[Tuple[float, float, float]]:
+        """since 이후 샘플 (오래된 순)"""
+        order = list(range(self.head, len(self.ts))) + list(range(self.head))
+        return [(self.ts[i], self.cpu[i], self.memory[i]) for i in order if self.ts[i] >= since]
+
+    @property
+    def last_ts(self) -> float:
+        if not self.ts:
+            return 0.0
+        return self.ts[(self.head - 1) % len(self.ts)]
+
+
+class Series:
+    """오브젝트 하나의 사용량 (원본 링 + 일정 간격 평균 링)"""
+
+    __slots__ = ("raw", "rollup", "bucket", "cpu_sum", "memory_sum", "samples")
+
+    def __init__(self, raw_capacity: int, rollup_capacity: int):
+        self.raw = Ring(raw_capacity)
+        self.rollup = Ring(rollup_capacity)
+        self.bucket: Optional[float] = None
+        self.cpu_sum = 0.0
+        self.memory_sum = 0.0
+        self.samples = 0
+
+    def add(self, ts: float, cpu: float, memory: float, rollup_seconds: float) -> bool:
+        """샘플 추가 (metrics-server가 아직 갱신하지 않아 이전과 같은 시각이면 무시 - False)"""
+        if len(self.raw) and ts <= self.raw.last_ts:
+            return False
+        self.raw.append(ts, cpu, memory)
+        bucket = ts - ts % rollup_seconds
+        if self.bucket is not None and bucket != self.bucket:
+            self._flush()
+        self.bucket = bucket
+        self.cpu_sum += cpu
+        self.memory_sum += memory
+        self.samples += 1
+        return True
+
+    def _flush(self):
+        if self.samples:
+            self.rollup.append(self.bucket, self.cpu_sum / self.samples, self.memory_sum / self.samples)
+        self.cpu_sum = self.memory_sum = 0.0
+        self.samples = 0
+
+    def points(self, since: float, rollup: bool) -> List[Tuple[float, float, float]]:
+        if not rollup:
+            return self.raw.points(since)
+        points = self.rollup.points(since)
+        if self.samples and self.bucket >= since:
+            # 진행 중인 구간도 지금까지의 평균으로 포함
+            points.append((self.bucket, self.cpu_sum / self.samples, self.memory_sum / self.samples))
+        return points
+
+    @property
+    def last_ts(self) -> float:
+        return self.raw.last_ts
+
+
+class UsageTable:
+    """클러스터 하나의 Pod 또는 노드 사용량
+
+    오브젝트별 시계열과 별도로, 마지막 수집 결과를 네임스페이스/이름 순으로 정렬한 열(array) 형태로 유지합니다.
+    네임스페이스가 연속 구간이 되므로 네임스페이스별 합계는 구간 슬라이스 sum으로, top-N은 열에 대한
+    heapq.nlargest로 계산해 오브젝트 dict를 순회하지 않습니다.
+    """
+
+    def __init__(self, raw_seconds: float, rollup_seconds: float, rollup_retention: float, interval: float):
+        self.raw_seconds = raw_seconds
+        self.rollup_seconds = rollup_seconds
+        self.rollup_retention = rollup_retention
+        self.rollup_capacity = max(1, int(rollup_retention // rollup_seconds) + 1)
+        self.series: Dict[UsageKey, Series] = {}
+        self.raw_capacity = 1
+        self.set_interval(interval)
+        self.keys: List[UsageKey] = []
+        # 최신 값 열은 float64 (메모리 바이트 수를 그대로 합산 - 기록용 링 버퍼만 float32)
+        self.cpu = array("d")
+        self.memory = array("d")
+        self.namespaces: Dict[str, Tuple[int, int]] = {}
+        self.scraped_at: Optional[float] = None
+
+    def set_interval(self, interval: float):
+        """수집 주기 반영 - 주기가 짧아지면 원본 링을 늘려 raw_seconds 동안의 샘플을 계속 보관
+
+        주기가 길어질 때는 줄이지 않습니다 (조회는 시각으로 거르므로 남는 용량만큼 메모리만 더 씀).
+        """
+        capacity = max(1, int(self.raw_seconds // interval) + 1)
+        if capacity <= self.raw_capacity:
+            return
+        self.raw_capacity = capacity
+        for series in self.series.values():
+            series.raw.grow(capacity)
+
+    def record(self, samples: Iterable[Tuple[UsageKey, float, float, float]], scraped_at: float):
+        """수집 결과 반영 (보관 기간 동안 샘플이 없는 오브젝트는 제거)"""
+        samples = sorted(samples)
+        for key, ts, cpu, memory in samples:
+            series = self.series.get(key)
+            if series is None:
+                series = self.series[key] = Series(self.raw_capacity, self.rollup_capacity)
+            series.add(ts, cpu, memory, self.rollup_seconds)
+
+        self.keys = [key for key, _, _, _ in samples]
+        self.cpu = array("d", (cpu for _, _, cpu, _ in samples))
+        self.memory = array("d", (memory for _, _, _, memory in samples))
+        namespaces: Dict[str, Tuple[int, int]] = {}
+        for index, (namespace, _) in enumerate(self.keys):
+            start, _ = namespaces.get(namespace, (index, index))
+            namespaces[namespace] = (start, index + 1)
+        self.namespaces = namespaces
+        self.scraped_at = scraped_at
+
+        expired = scraped_at - self.rollup_retention
+        for key in [key for key, series in self.series.items() if series.last_ts < expired]:
+            del self.series[key]
+
+    def _column(self, by: str) -> array:
+        if by not in ("cpu", "memory"):
+            raise ValueError(f"지원하지 않는 정렬 기준입니다: {by}")
+        return self.cpu if by == "cpu" else self.memory
+
+    def top(self, n: int, by: str = "cpu", namespace: Optional[str] = None) -> List[Dict[str, Any]]:
+        """마지막 수집 기준 사용량 상위 n개"""
+        column = self._column(by)
+        if namespace is not None:
+            start, end = self.namespaces.get(namespace, (0, 0))
+        else:
+            start, end = 0, len(self.keys)
+        indexes = heapq.nlargest(n, range(start, end), key=column.__getitem__)
+        return [self._entry(index) for index in indexes]
+
+    def _entry(self, index: int) -> Dict[str, Any]:
+        namespace, name = self.keys[index]
+        entry = {"name": name, "cpu_cores": round(self.cpu[index], 6), "memory_bytes": int(self.memory[index])}
+        if namespace:
+            entry["namespace"] = namespace
+        return entry
+
+    def by_namespace(self) -> List[Dict[str, Any]]:
+        """마지막 수집 기준 네임스페이스별 합계/최댓값 (CPU 합계 내림차순)"""
+        rows = []
+        for namespace, (start, end) in self.namespaces.items():
+            cpu, memory = self.cpu[start:end], self.memory[start:end]
+            rows.append({
+                "namespace": namespace,
+                "pods": end - start,
+                "cpu_cores": round(sum(cpu), 6),
+                "memory_bytes": int(sum(memory)),
+                "max_cpu_cores": round(max(cpu), 6),
+                "max_memory_bytes": int(max(memory)),
+            })
+        rows.sort(key=lambda row: row["cpu_cores"], reverse=True)
+        return rows
+
+    def history(self, key: UsageKey, window: float, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """window초 동안의 시계열 (원본 보관 기간 안이면 원본, 아니면 평균 구간)"""
+        series = self.series.get(key)
+        if series is None:
+            return None
+        now = now if now is not None else time.time()
+        rollup = window > self.raw_seconds
+        points = series.points(now - window, rollup)
+        return {
+            "resolution_seconds": self.rollup_seconds if rollup else None,
+            "points": [{"ts": ts, "cpu_cores": round(cpu, 6), "memory_bytes": int(memory)}
+                       for ts, cpu, memory in points],
+        }
+
+    def totals(self) -> Dict[str, Any]:
+        return {"objects": len(self.keys), "cpu_cores": round(sum(self.cpu), 6),
+                "memory_bytes": int(sum(self.memory))}
+
+
+class _Scraper:
+    """클러스터 하나의 주기적 수집 상태"""
+
+    def __init__(self, tables: Dict[str, UsageTable]):
+        self.tables = tables
+        self.task: Optional[asyncio.Task] = None
+        self.interval: Optional[float] = None
+        self.scrapes = 0
+        self.last_scrape_at: Optional[float] = None
+        self.last_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+
+class UsageCollector:
+    """metrics.k8s.io(Pod/노드) 주기적 수집 (클러스터별 opt-in)
+
+    원본 샘플은 raw_seconds 동안, rollup_seconds 간격 평균은 rollup_retention 동안 오브젝트별 링 버퍼에 보관합니다.
+    수집 주기는 클러스터마다 interval_for(cluster_id)로 매 수집마다 다시 읽으므로 클러스터 옵션 변경이 바로 반영됩니다.
+    """
+
+    def __init__(self, client_factory: ClientFactory, interval_for: Callable[[str], float], raw_seconds: float,
+                 rollup_seconds: float, rollup_retention: float):
+        self._client_factory = client_factory
+        self.interval_for = interval_for
+        self.raw_seconds = raw_seconds
+        self.rollup_seconds = rollup_seconds
+        self.rollup_retention = rollup_retention
+        self._scrapers: Dict[str, _Scraper] = {}
+
+    def start(self, cluster_id: str):
+        """수집 시작 (이미 실행 중이면 그대로)"""
+        scraper = self._scrapers.get(cluster_id)
+        if scraper is None:
+            interval = self.interval_for(cluster_id)
+            scraper = self._scrapers[cluster_id] = _Scraper({
+                kind: UsageTable(self.raw_seconds, self.rollup_seconds, self.rollup_retention, interval)
+                for kind in USAGE_PATHS
+            })
+        if scraper.task is None or scraper.task.done():
+            scraper.task = asyncio.create_task(self._run(cluster_id, scraper))
+
+    async def stop(self, cluster_id: str) -> bool:
+        """수집 중지 후 보관 데이터 삭제 (없으면 False)"""
+        scraper = self._scrapers.pop(cluster_id, None)
+        if scraper is None:
+            return False
+        if scraper.task is not None:
+            scraper.task.cancel()
+            await asyncio.gather(scraper.task, return_exceptions=True)
+        return True
+
+    def start_configured(self, spec: str, cluster_ids: Callable[[], Iterable[str]]):
+        """설정 문자열로 수집 시작 (예: "prod,staging", "*"이면 등록된 모든 클러스터)"""
+        names = [name.strip() for name in spec.split(",") if name.strip()]
+        if names == ["*"]:
+            names = list(cluster_ids())
+        for cluster_id in names:
+            try:
+                self.start(cluster_id)
+            except ValueError as e:
+                logger.warning("사용량 수집을 시작할 수 없습니다: %s", e)
+
+    def table(self, cluster_id: str, kind: str) -> Optional[UsageTable]:
+        """수집 중인 클러스터의 사용량 (수집 중이 아니면 None)"""
+        scraper = self._scrapers.get(cluster_id)
+        return scraper.tables[kind] if scraper is not None else None
+
+    async def _run(self, cluster_id: str, scraper: _Scraper):
+        while True:
+            started = time.monotonic()
+            try:
+                await self.scrape(cluster_id, scraper)
+                scraper.last_error = None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                scraper.last_error = repr(e)
+                logger.warning("%s 사용량 수집 실패: %r", cluster_id, e)
+            scraper.last_duration = round(time.monotonic() - started, 3)
+            try:
+                scraper.interval = self.interval_for(cluster_id)
+            except ValueError:
+                # 클러스터가 삭제됨
+                return
+            for table in scraper.tables.values():
+                table.set_interval(scraper.interval)
+            await asyncio.sleep(max(0.0, scraper.interval - (time.monotonic() - started)))
+
+    async def scrape(self, cluster_id: str, scraper: _Scraper):
+        """Pod/노드 사용량 한 번 수집"""
+        client = await self._client_factory(cluster_id)
+        responses = await asyncio.gather(*(client.get(path) for path in USAGE_PATHS.values()))
+        scraped_at = time.time()
+        for (kind, path), response in zip(USAGE_PATHS.items(), responses):
+            if response.status_code != 200:
+                raise RuntimeError(f"{path} 조회 실패 ({response.status_code}) - metrics-server가 설치되어 있는지 확인하세요")
+            scraper.tables[kind].record(parse_usage(kind, fastjson.loads(response.content), scraped_at), scraped_at)
+        scraper.scrapes += 1
+        scraper.last_scrape_at = scraped_at
+
+    def status(self, cluster_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        return [{
+            "cluster_id": scraper_cluster,
+            "running": scraper.task is not None and not scraper.task.done(),
+            "interval": scraper.interval,
+            "scrapes": scraper.scrapes,
+            "last_scrape_at": scraper.last_scrape_at,
+            "last_duration": scraper.last_duration,
+            "last_error": scraper.last_error,
+            "series": {kind: len(table.series) for kind, table in scraper.tables.items()},
+        } for scraper_cluster, scraper in self._scrapers.items() if cluster_id is None or scraper_cluster == cluster_id]
+
+    async def aclose(self):
+        for cluster_id in list(self._scrapers):
+            await self.stop(cluster_id)
@@ -0,0 +1,168 @@
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+# 오브젝트 하나를 응답용으로 변환하는 함수
+Transform = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+# API 서버 응답 형식 협상 (meta.k8s.io/v1)
+PARTIAL_METADATA_LIST = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1"
+PARTIAL_METADATA = "application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1"
+TABLE = "application/json;as=Table;g=meta.k8s.io;v=v1"
+
+
+def _age_seconds(timestamp: Optional[str]) -> Optional[int]:
+    """creationTimestamp(RFC3339)로부터 경과 시간(초)"""
+    if not timestamp:
+        return None
+    try:
+        created = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    return int((datetime.now(timezone.utc) - created).total_seconds())
+
+
+def _common(obj: Dict[str, Any]) -> Dict[str, Any]:
+    metadata = obj.get("metadata", {})
+    summary = {"name": metadata.get("name")}
+    if metadata.get("namespace"):
+        summary["namespace"] = metadata["namespace"]
+    summary["created"] = metadata.get("creationTimestamp")
+    summary["age_seconds"] = _age_seconds(metadata.get("creationTimestamp"))
+    return summary
+
+
+def _pod_summary(obj: Dict[str, Any]) -> Dict[str, Any]:
+    spec = obj.get("spec", {})
+    status = obj.get("status", {})
+    container_statuses = status.get("containerStatuses") or []
+
+    # kubectl get pods의 STATUS처럼 대기/종료 사유가 있으면 phase 대신 표시
+    reason = status.get("reason")
+    for container in container_statuses:
+        state = container.get("state", {})
+        waiting = state.get("waiting") or {}
+        terminated = state.get("terminated") or {}
+        if waiting.get("reason") or terminated.get("reason"):
+            reason = waiting.get("reason") or terminated.get("reason")
+            break
+    if obj.get("metadata", {}).get("deletionTimestamp"):
+        reason = "Terminating"
+
+    return {
+        **_common(obj),
+        "phase": status.get("phase"),
+        "reason": reason,
+        "node": spec.get("nodeName"),
+        "pod_ip": status.get("podIP"),
+        "restarts": sum(c.get("restartCount", 0) for c in container_statuses),
+        "ready_containers": sum(1 for c in container_statuses if c.get("ready")),
+        "containers": len(spec.get("containers") or container_statuses),
+    }
+
+
+def _deployment_summary(obj: Dict[str, Any]) -> Dict[str, Any]:
+    status = obj.get("status", {})
+    return {
+        **_common(obj),
+        "replicas": obj.get("spec", {}).get("replicas", 0),
+        "ready": status.get("readyReplicas", 0),
+        "updated": status.get("updatedReplicas", 0),
+        "available": status.get("availableReplicas", 0),
+    }
+
+
+def _statefulset_summary(obj: Dict[str, Any]) -> Dict[str, Any]:
+    status = obj.get("status", {})
+    return {
+        **_common(obj),
+        "replicas": obj.get("spec", {}).get("replicas", 0),
+        "ready": status.get("readyReplicas", 0),
+        "updated": status.get("updatedReplicas", 0),
+        "current": status.get("currentReplicas", 0),
+    }
+
+
+def _daemonset_summary(obj: Dict[str, Any]) -> Dict[str, Any]:
+    status = obj.get("status", {})
+    return {
+        **_common(obj),
+        "desired": status.get("desiredNumberScheduled", 0),
+        "current": status.get("currentNumberScheduled", 0),
+        "ready": status.get("numberReady", 0),
+        "updated": status.get("updatedNumberScheduled", 0),
+        "available": status.get("numberAvailable", 0),
+    }
+
+
+def _namespace_summary(obj: Dict[str, Any]) -> Dict[str, Any]:
+    return {**_common(obj), "phase": obj.get("status", {}).get("phase")}
+
+
+SUMMARIZERS: Dict[str, Transform] = {
+    "namespaces": _namespace_summary,
+    "pods": _pod_summary,
+    "deployments": _deployment_summary,
+    "daemonsets": _daemonset_summary,
+    "statefulsets": _statefulset_summary,
+}
+
+
+def metadata_only(obj: Dict[str, Any]) -> Dict[str, Any]:
+    """metadata만 남김 (managedFields 제외)"""
+    metadata = {k: v for k, v in obj.get("metadata", {}).items() if k != "managedFields"}
+    return {"metadata": metadata}
+
+
+def project(fields: List[str]) -> Transform:
+    """점(.)으로 구분한 필드 경로만 남기는 변환 함수 생성"""
+    paths = [field.split(".") for field in fields]
+
+    def _project(obj: Dict[str, Any]) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        for path in paths:
+            value: Any = obj
+            for key in path:
+                if not isinstance(value, dict) or key not in value:
+                    break
+                value = value[key]
+            else:
+                target = result
+                for key in path[:-1]:
+                    target = target.setdefault(key, {})
+                target[path[-1]] = value
+        return result
+
+    return _project
+
+
+def build_transform(kind: str, view: Optional[str], fields: Optional[List[str]]) -> Optional[Transform]:
+    """view/fields 옵션에 해당하는 오브젝트 변환 함수 (변환이 없으면 None)"""
+    steps: List[Transform] = []
+    if view == "summary":
+        steps.append(SUMMARIZERS[kind])
+    elif view == "metadata":
+        steps.append(metadata_only)
+    if fields:
+        steps.append(project(fields))
+
+    if not steps:
+        return None
+    if len(steps) == 1:
+        return steps[0]
+
+    def _chain(obj: Dict[str, Any]) -> Dict[str, Any]:
+        for step in steps:
+            obj = step(obj)
+        return obj
+
+    return _chain
+
+
+def accept_header(view: Optional[str], fields: Optional[List[str]], is_list: bool) -> Optional[str]:
+    """API 서버에 요청할 응답 형식 (전체 오브젝트가 필요 없을 때 전송량 절감)"""
+    if view == "table":
+        return TABLE
+    metadata_fields = bool(fields) and all(field == "metadata" or field.startswith("metadata.") for field in fields)
+    if view == "metadata" or (view in (None, "full") and metadata_fields):
+        return PARTIAL_METADATA_LIST if is_list else PARTIAL_METADATA
+    return None
@@ -0,0 +1,465 @@
+"""벤치마크용 가짜 kube-apiserver
+
+지정한 규모의 네임스페이스/Pod/Deployment를 생성해 실제 API 서버와 같은 경로로 응답합니다.
+limit/continue 페이지네이션, labelSelector/fieldSelector, PartialObjectMetadata/protobuf 협상,
+WATCH 스트림(북마크 포함), Deployment PATCH(롤아웃 진행), Pod DELETE를 지원합니다.
+
+단독 실행: python -m benchmarks.fake_apiserver --port 8001 --namespaces 20 --pods 100
+"""
+import argparse
+import asyncio
+import base64
+import json
+import random
+import struct
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from app import protobuf
+from app.resources import RESOURCE_KINDS, ResourceKind
+from app.selectors import build_predicate
+
+Key = Tuple[str, str]
+
+_PHASES = ["Running"] * 17 + ["Pending", "Failed", "Succeeded"]
+
+
+def _dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _filler(number: int, key: str, value: Any) -> bytes:
+    """요약 스키마에 없는 필드 - 디코더가 건너뛰는 크기만 맞추면 되므로 JSON 구조를 그대로 protobuf 필드로 옮김"""
+    if isinstance(value, bool) or isinstance(value, int):
+        return protobuf.encode_varint(number << 3) + protobuf.encode_varint(int(value))
+    if isinstance(value, float):
+        return protobuf.encode_varint(number << 3 | 1) + struct.pack("<d", value)
+    if isinstance(value, str):
+        return protobuf.encode_field(number, value.encode("utf-8"))
+    if isinstance(value, list):
+        return b"".join(_filler(number, key, item) for item in value)
+    if key == "fieldsV1":
+        # managedFields의 fieldsV1은 protobuf에서도 JSON 바이트
+        return protobuf.encode_field(number, _dumps(value))
+    return protobuf.encode_field(number, encode_protobuf(value, {}))
+
+
+def encode_protobuf(obj: Dict[str, Any], schema: protobuf.Schema) -> bytes:
+    """오브젝트를 protobuf로 인코딩 (스키마에 있는 필드는 실제 필드 번호, 나머지는 100번 이후 번호)"""
+    by_name = {name: (number, kind, sub) for number, (name, kind, sub) in schema.items()}
+    out = bytearray()
+    extra = 100
+    for key, value in obj.items():
+        if value is None:
+            continue
+        spec = by_name.get(key)
+        if spec is None:
+            extra += 1
+            out += _filler(extra, key, value)
+            continue
+        number, kind, sub = spec
+        if kind == "msg":
+            out += protobuf.encode_field(number, encode_protobuf(value, sub))
+        elif kind == "list":
+            for item in value:
+                out += protobuf.encode_field(number, encode_protobuf(item, sub))
+        else:
+            out += protobuf.encode_message({key: value}, {number: (key, kind, sub)})
+    return bytes(out)
+
+
+def _wants_protobuf(request: Request, kind: ResourceKind) -> bool:
+    """Accept 헤더가 protobuf를 먼저 요청하고 해당 리소스를 protobuf로 인코딩할 수 있는지"""
+    return (request.headers.get("accept", "").startswith(protobuf.CONTENT_TYPE)
+            and kind.name in protobuf.SUMMARY_SCHEMAS)
+
+
+class FakeClusterConfig:
+    """가짜 클러스터 규모/지연 설정"""
+
+    def __init__(self, namespaces: int = 10, pods_per_namespace: int = 50, deployments_per_namespace: int = 5,
+                 latency_ms: float = 0.0, padding_bytes: int = 256, watch_events_per_second: float = 0.0,
+                 bookmark_interval: float = 5.0, rollout_seconds: float = 0.5, seed: int = 1):
+        self.namespaces = namespaces
+        self.pods_per_namespace = pods_per_namespace
+        self.deployments_per_namespace = deployments_per_namespace
+        # 일반 요청마다 추가되는 응답 지연 (WATCH 제외)
+        self.latency_ms = latency_ms
+        # 오브젝트마다 추가하는 annotation 크기 (응답 크기 조절)
+        self.padding_bytes = padding_bytes
+        # 초당 Pod 변경 이벤트 수 (0이면 변경 없음)
+        self.watch_events_per_second = watch_events_per_second
+        self.bookmark_interval = bookmark_interval
+        # Deployment PATCH 후 롤아웃이 끝나기까지 걸리는 시간
+        self.rollout_seconds = rollout_seconds
+        self.seed = seed
+
+
+class FakeCluster:
+    """가짜 클러스터 상태 (리소스 종류별 오브젝트와 인코딩된 본문)"""
+
+    def __init__(self, config: FakeClusterConfig):
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.resource_version = 1
+        self.objects: Dict[str, Dict[Key, Dict[str, Any]]] = {name: {} for name in RESOURCE_KINDS}
+        self._encoded: Dict[str, Dict[Key, bytes]] = {name: {} for name in RESOURCE_KINDS}
+        # protobuf 본문은 요청받았을 때 인코딩해서 보관
+        self._proto: Dict[str, Dict[Key, bytes]] = {name: {} for name in RESOURCE_KINDS}
+        self._sorted: Dict[str, Optional[List[Key]]] = {name: None for name in RESOURCE_KINDS}
+        self._watchers: Dict[str, List[asyncio.Queue]] = {name: [] for name in RESOURCE_KINDS}
+        self._generate()
+
+    # ---------- 데이터 생성 ----------
+
+    def _next_version(self) -> str:
+        self.resource_version += 1
+        return str(self.resource_version)
+
+    def _metadata(self, name: str, namespace: Optional[str] = None, labels: Optional[Dict[str, str]] = None):
+        metadata = {
+            "name": name,
+            "uid": f"{self.random.getrandbits(128):032x}",
+            "resourceVersion": self._next_version(),
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+            "labels": labels or {},
+            "annotations": {"bench/padding": "x" * self.config.padding_bytes},
+        }
+        if namespace:
+            metadata["namespace"] = namespace
+        return metadata
+
+    def _generate(self):
+        config = self.config
+        for n in range(config.namespaces):
+            namespace = f"ns-{n:03d}"
+            self._store("namespaces", {"metadata": self._metadata(namespace), "status": {"phase": "Active"}})
+            for d in range(config.deployments_per_namespace):
+                app = f"app-{d:02d}"
+                replicas = max(1, config.pods_per_namespace // max(1, config.deployments_per_namespace))
+                self._store("deployments", {
+                    "metadata": {**self._metadata(app, namespace, {"app": app}), "generation": 1},
+                    "spec": {"replicas": replicas, "selector": {"matchLabels": {"app": app}},
+                             "template": {"metadata": {"labels": {"app": app}}}},
+                    "status": {"observedGeneration": 1, "replicas": replicas, "updatedReplicas": replicas,
+                               "readyReplicas": replicas, "availableReplicas": replicas},
+                })
+            for p in range(config.pods_per_namespace):
+                app = f"app-{p % max(1, config.deployments_per_namespace):02d}"
+                self._store("pods", self._pod(namespace, f"{app}-{p:05d}", app))
+
+    def _pod(self, namespace: str, name: str, app: str) -> Dict[str, Any]:
+        phase = self.random.choice(_PHASES)
+        return {
+            "metadata": self._metadata(name, namespace, {"app": app}),
+            "spec": {"nodeName": f"node-{self.random.randrange(50):02d}",
+                     "containers": [{"name": "main", "image": f"registry.local/{app}:1.0"}]},
+            "status": {
+                "phase": phase,
+                "podIP": f"10.{self.random.randrange(256)}.{self.random.randrange(256)}.{self.random.randrange(256)}",
+                "containerStatuses": [{"name": "main", "ready": phase == "Running",
+                                       "restartCount": self.random.randrange(3), "state": {}}],
+            },
+        }
+
+    # ---------- 저장소 ----------
+
+    def _store(self, kind: str, obj: Dict[str, Any]):
+        metadata = obj["metadata"]
+        key = (metadata.get("namespace", ""), metadata["name"])
+        if key not in self.objects[kind]:
+            self._sorted[kind] = None
+        self.objects[kind][key] = obj
+        self._encoded[kind][key] = _dumps(obj)
+        self._proto[kind].pop(key, None)
+
+    def _remove(self, kind: str, key: Key) -> Optional[Dict[str, Any]]:
+        obj = self.objects[kind].pop(key, None)
+        if obj is not None:
+            del self._encoded[kind][key]
+            self._proto[kind].pop(key, None)
+            self._sorted[kind] = None
+        return obj
+
+    def keys(self, kind: str) -> List[Key]:
+        if self._sorted[kind] is None:
+            self._sorted[kind] = sorted(self.objects[kind])
+        return self._sorted[kind]
+
+    def encoded(self, kind: str, key: Key) -> bytes:
+        return self._encoded[kind][key]
+
+    def encoded_protobuf(self, kind: str, key: Key) -> bytes:
+        """오브젝트의 protobuf 인코딩 (runtime.Unknown으로 감싸기 전)"""
+        encoded = self._proto[kind].get(key)
+        if encoded is None:
+            encoded = self._proto[kind][key] = encode_protobuf(self.objects[kind][key], protobuf.SUMMARY_SCHEMAS[kind])
+        return encoded
+
+    # ---------- 변경 / WATCH ----------
+
+    def subscribe(self, kind: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=10000)
+        self._watchers[kind].append(queue)
+        return queue
+
+    def unsubscribe(self, kind: str, queue: asyncio.Queue):
+        self._watchers[kind].remove(queue)
+
+    def _publish(self, kind: str, event_type: str, obj: Dict[str, Any]):
+        event = {"type": event_type, "object": obj}
+        for queue in self._watchers[kind]:
+            if not queue.full():
+                queue.put_nowait(event)
+
+    def modify(self, kind: str, obj: Dict[str, Any]):
+        obj["metadata"]["resourceVersion"] = self._next_version()
+        self._store(kind, obj)
+        self._publish(kind, "MODIFIED", obj)
+
+    def delete(self, kind: str, key: Key) -> Optional[Dict[str, Any]]:
+        obj = self._remove(kind, key)
+        if obj is not None:
+            obj["metadata"]["resourceVersion"] = self._next_version()
+            self._publish(kind, "DELETED", obj)
+        return obj
+
+    def churn(self):
+        """임의의 Pod 하나 변경 (재시작 횟수 증가)"""
+        keys = self.keys("pods")
+        if not keys:
+            return
+        obj = json.loads(self.encoded("pods", self.random.choice(keys)))
+        obj["status"]["containerStatuses"][0]["restartCount"] += 1
+        self.modify("pods", obj)
+
+    async def run_churn(self):
+        interval = 1.0 / self.config.watch_events_per_second
+        while True:
+            await asyncio.sleep(interval)
+            self.churn()
+
+    async def finish_rollout(self, key: Key):
+        """PATCH 후 일정 시간이 지나면 롤아웃 완료 상태로 변경"""
+        await asyncio.sleep(self.config.rollout_seconds)
+        obj = self.objects["deployments"].get(key)
+        if obj is None:
+            return
+        obj = json.loads(self.encoded("deployments", key))
+        replicas = obj["spec"]["replicas"]
+        obj["status"] = {"observedGeneration": obj["metadata"]["generation"], "replicas": replicas,
+                         "updatedReplicas": replicas, "readyReplicas": replicas, "availableReplicas": replicas}
+        self.modify("deployments", obj)
+
+
+def _parse_path(path: str) -> Optional[Tuple[ResourceKind, Optional[str], Optional[str]]]:
+    """API 경로를 (리소스 종류, 네임스페이스, 이름)으로 분해"""
+    for prefix in ("/api/v1/", "/apis/apps/v1/"):
+        if path.startswith(prefix):
+            parts = path[len(prefix):].strip("/").split("/")
+            break
+    else:
+        return None
+
+    namespace = None
+    if len(parts) >= 3 and parts[0] == "namespaces":
+        namespace, parts = parts[1], parts[2:]
+    kind = RESOURCE_KINDS.get(parts[0])
+    if kind is None or len(parts) > 2 or not path.startswith(kind.api_prefix + "/"):
+        return None
+    return kind, namespace, parts[1] if len(parts) == 2 else None
+
+
+def _status(code: int, message: str) -> JSONResponse:
+    return JSONResponse({"kind": "Status", "apiVersion": "v1", "status": "Failure", "message": message,
+                         "code": code}, status_code=code)
+
+
+def _partial(obj: Dict[str, Any]) -> Dict[str, Any]:
+    return {"kind": "PartialObjectMetadata", "apiVersion": "meta.k8s.io/v1", "metadata": obj["metadata"]}
+
+
+def _encode_continue(offset: int) -> str:
+    return base64.urlsafe_b64encode(str(offset).encode()).decode()
+
+
+def _decode_continue(token: str) -> int:
+    return int(base64.urlsafe_b64decode(token.encode()).decode())
+
+
+def create_app(config: Optional[FakeClusterConfig] = None) -> Starlette:
+    """가짜 API 서버 ASGI 앱 생성"""
+    cluster = FakeCluster(config or FakeClusterConfig())
+
+    async def handle(request: Request) -> Response:
+        parsed = _parse_path(request.url.path)
+        if parsed is None:
+            return _status(404, f"the server could not find the requested resource: {request.url.path}")
+        kind, namespace, name = parsed
+        params = request.query_params
+
+        if request.method == "GET" and params.get("watch") in ("1", "true"):
+            return _watch(kind, namespace, request)
+
+        if cluster.config.latency_ms:
+            await asyncio.sleep(cluster.config.latency_ms / 1000)
+
+        if request.method == "GET" and name is None:
+            return _list(kind, namespace, request)
+
+        key = (namespace or "", name or "")
+        if key not in cluster.objects[kind.name]:
+            return _status(404, f'{kind.name} "{name}" not found')
+
+        if request.method == "GET":
+            if "as=PartialObjectMetadata" in request.headers.get("accept", ""):
+                return JSONResponse(_partial(cluster.objects[kind.name][key]))
+            if _wants_protobuf(request, kind):
+                body = protobuf.encode_envelope(kind.api_version, kind.list_kind[:-len("List")],
+                                                cluster.encoded_protobuf(kind.name, key))
+                return Response(body, media_type=protobuf.CONTENT_TYPE)
+            return Response(cluster.encoded(kind.name, key), media_type="application/json")
+
+        if request.method == "DELETE" and kind.name == "pods":
+            return JSONResponse(cluster.delete("pods", key))
+
+        if request.method == "PATCH" and kind.name == "deployments":
+            patch = await request.json()
+            obj = json.loads(cluster.encoded("deployments", key))
+            annotations = (patch.get("spec", {}).get("template", {}).get("metadata", {}).get("annotations") or {})
+            template = obj["spec"]["template"].setdefault("metadata", {})
+            template["annotations"] = {**template.get("annotations", {}), **annotations}
+            obj["metadata"]["generation"] += 1
+            obj["status"]["updatedReplicas"] = 0
+            cluster.modify("deployments", obj)
+            asyncio.get_running_loop().create_task(cluster.finish_rollout(key))
+            return JSONResponse(obj)
+
+        return _status(405, f"{request.method} is not supported for {kind.name}")
+
+    def _list(kind: ResourceKind, namespace: Optional[str], request: Request) -> Response:
+        params = request.query_params
+        try:
+            predicate = build_predicate(params.get("labelSelector"), params.get("fieldSelector"))
+        except ValueError as e:
+            return _status(400, str(e))
+
+        keys = cluster.keys(kind.name)
+        if namespace:
+            keys = [key for key in keys if key[0] == namespace]
+        if predicate is not None:
+            keys = [key for key in keys if predicate(cluster.objects[kind.name][key])]
+
+        offset = _decode_continue(params["continue"]) if params.get("continue") else 0
+        limit = int(params.get("limit") or 0)
+        page = keys[offset:offset + limit] if limit else keys[offset:]
+        metadata: Dict[str, Any] = {"resourceVersion": str(cluster.resource_version)}
+        if limit and offset + limit < len(keys):
+            metadata["continue"] = _encode_continue(offset + limit)
+
+        if _wants_protobuf(request, kind):
+            body = protobuf.encode_list(kind.api_version, kind.list_kind, metadata,
+                                        [cluster.encoded_protobuf(kind.name, key) for key in page])
+            return Response(body, media_type=protobuf.CONTENT_TYPE)
+        if "as=PartialObjectMetadataList" in request.headers.get("accept", ""):
+            items = b",".join(_dumps(_partial(cluster.objects[kind.name][key])) for key in page)
+            list_kind, api_version = b'"PartialObjectMetadataList"', b'"meta.k8s.io/v1"'
+        else:
+            items = b",".join(cluster.encoded(kind.name, key) for key in page)
+            list_kind, api_version = _dumps(kind.list_kind), _dumps(kind.api_version)
+        body = (b'{"kind":' + list_kind + b',"apiVersion":' + api_version + b',"metadata":' + _dumps(metadata)
+                + b',"items":[' + items + b"]}")
+        return Response(body, media_type="application/json")
+
+    def _watch(kind: ResourceKind, namespace: Optional[str], request: Request) -> Response:
+        params = request.query_params
+        timeout = float(params.get("timeoutSeconds") or 300)
+        bookmarks = params.get("allowWatchBookmarks") in ("1", "true")
+        try:
+            predicate = build_predicate(params.get("labelSelector"), params.get("fieldSelector"))
+        except ValueError as e:
+            return _status(400, str(e))
+
+        async def events():
+            queue = cluster.subscribe(kind.name)
+            deadline = time.monotonic() + timeout
+            try:
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return
+                    try:
+                        event = await asyncio.wait_for(queue.get(),
+                                                       min(remaining, cluster.config.bookmark_interval))
+                    except asyncio.TimeoutError:
+                        if bookmarks:
+                            yield _dumps({"type": "BOOKMARK", "object": {
+                                "kind": kind.list_kind[:-4], "apiVersion": kind.api_version,
+                                "metadata": {"resourceVersion": str(cluster.resource_version)}}}) + b"\n"
+                        continue
+                    obj = event["object"]
+                    if namespace and obj["metadata"].get("namespace") != namespace:
+                        continue
+                    if predicate is not None and not predicate(obj):
+                        continue
+                    yield _dumps(event) + b"\n"
+            finally:
+                cluster.unsubscribe(kind.name, queue)
+
+        return StreamingResponse(events(), media_type="application/json")
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette):
+        task = None
+        if cluster.config.watch_events_per_second > 0:
+            task = asyncio.get_running_loop().create_task(cluster.run_churn())
+        yield
+        if task is not None:
+            task.cancel()
+
+    app = Starlette(routes=[Route("/{path:path}", handle, methods=["GET", "PATCH", "DELETE"])], lifespan=lifespan)
+    app.state.cluster = cluster
+    return app
+
+
+def add_scale_arguments(parser: argparse.ArgumentParser):
+    """가짜 클러스터 규모 옵션 (run.py와 공용)"""
+    parser.add_argument("--namespaces", type=int, default=10)
+    parser.add_argument("--pods", type=int, default=50, help="네임스페이스당 Pod 수")
+    parser.add_argument("--deployments", type=int, default=5, help="네임스페이스당 Deployment 수")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="API 서버 응답 지연 (ms)")
+    parser.add_argument("--padding", type=int, default=256, help="오브젝트당 추가 annotation 크기 (바이트)")
+    parser.add_argument("--watch-rate", type=float, default=0.0, help="초당 Pod 변경 이벤트 수")
+
+
+def config_from_args(args: argparse.Namespace) -> FakeClusterConfig:
+    return FakeClusterConfig(
+        namespaces=args.namespaces,
+        pods_per_namespace=args.pods,
+        deployments_per_namespace=args.deployments,
+        latency_ms=args.latency_ms,
+        padding_bytes=args.padding,
+        watch_events_per_second=args.watch_rate,
+    )
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="벤치마크용 가짜 kube-apiserver")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    add_scale_arguments(parser)
+    args = parser.parse_args()
+    uvicorn.run(create_app(config_from_args(args)), host=args.host, port=args.port, log_level="warning",
+                ws="none")
+
+
+if __name__ == "__main__":
+    main()
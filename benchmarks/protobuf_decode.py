@@ -0,0 +1,184 @@
+"""JSON / protobuf 요약 디코딩 비교 벤치마크
+
+실제 Pod처럼 managedFields/env/volumes/conditions가 있는 목록 응답을 만들어
+JSON 경로(본문 전체 디코딩 후 요약)와 protobuf 경로(요약에 필요한 필드만 디코딩 후 요약)의
+디코딩 시간, 본문 크기, 최대 메모리(tracemalloc)를 비교합니다.
+
+  python -m benchmarks.protobuf_decode --pods 5000 --repeat 5
+  python -m benchmarks.protobuf_decode --pods 5000 --simple   # 가짜 API 서버와 같은 단순한 Pod
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from app import fastjson, protobuf
+from app.views import SUMMARIZERS
+from benchmarks.fake_apiserver import FakeCluster, FakeClusterConfig, _dumps, encode_protobuf
+
+
+def realistic_pod(index: int) -> Dict[str, Any]:
+    """Deployment가 만든 일반적인 Pod와 비슷한 구조/크기 (JSON 약 6KB)"""
+    app = f"app-{index % 50:02d}"
+    name = f"{app}-7d9f8c6b5-{index:05d}"
+    container_fields = {f"f:{field}": {} for field in ("image", "imagePullPolicy", "name", "resources",
+                                                         "terminationMessagePath", "terminationMessagePolicy")}
+    container_fields["f:env"] = {f'k:{{"name":"ENV_{i}"}}': {".": {}, "f:name": {}, "f:value": {}} for i in range(10)}
+    return {
+        "metadata": {
+            "name": name,
+            "generateName": f"{app}-7d9f8c6b5-",
+            "namespace": f"ns-{index % 20:03d}",
+            "uid": f"{index:08x}-1c2d-4e5f-8a9b-0c1d2e3f4a5b",
+            "resourceVersion": str(100000 + index),
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+            "labels": {"app": app, "pod-template-hash": "7d9f8c6b5", "tier": "backend", "team": "platform"},
+            "annotations": {"kubectl.kubernetes.io/restartedAt": "2024-01-01T00:00:00Z",
+                            "prometheus.io/scrape": "true", "prometheus.io/port": "9090"},
+            "ownerReferences": [{"apiVersion": "apps/v1", "kind": "ReplicaSet", "name": f"{app}-7d9f8c6b5",
+                                 "uid": "0a1b2c3d-1c2d-4e5f-8a9b-0c1d2e3f4a5b", "controller": True,
+                                 "blockOwnerDeletion": True}],
+            "managedFields": [
+                {"manager": "kube-controller-manager", "operation": "Update", "apiVersion": "v1",
+                 "time": "2024-01-01T00:00:00Z", "fieldsType": "FieldsV1",
+                 "fieldsV1": {"f:metadata": {"f:generateName": {}, "f:labels": {".": {}, "f:app": {}},
+                                             "f:ownerReferences": {}},
+                              "f:spec": {'f:containers': {'k:{"name":"main"}': container_fields}}}},
+                {"manager": "kubelet", "operation": "Update", "apiVersion": "v1",
+                 "time": "2024-01-01T00:00:10Z", "fieldsType": "FieldsV1", "subresource": "status",
+                 "fieldsV1": {"f:status": {f"f:{field}": {} for field in ("conditions", "containerStatuses",
+                                                                           "hostIP", "phase", "podIP", "podIPs",
+                                                                           "startTime")}}},
+            ],
+        },
+        "spec": {
+            "containers": [{
+                "name": "main",
+                "image": f"registry.local/{app}:1.4.2",
+                "imagePullPolicy": "IfNotPresent",
+                "env": [{"name": f"ENV_{i}", "value": f"value-{i}"} for i in range(10)],
+                "ports": [{"containerPort": 8080, "name": "http", "protocol": "TCP"}],
+                "resources": {"limits": {"cpu": "500m", "memory": "512Mi"},
+                              "requests": {"cpu": "100m", "memory": "128Mi"}},
+                "volumeMounts": [{"mountPath": "/etc/config", "name": "config"},
+                                 {"mountPath": "/var/run/secrets/kubernetes.io/serviceaccount",
+                                  "name": "kube-api-access", "readOnly": True}],
+                "terminationMessagePath": "/dev/termination-log",
+                "terminationMessagePolicy": "File",
+            }],
+            "volumes": [{"name": "config", "configMap": {"name": f"{app}-config", "defaultMode": 420}},
+                        {"name": "kube-api-access", "projected": {"defaultMode": 420, "sources": [
+                            {"serviceAccountToken": {"expirationSeconds": 3607, "path": "token"}},
+                            {"configMap": {"name": "kube-root-ca.crt",
+                                           "items": [{"key": "ca.crt", "path": "ca.crt"}]}}]}}],
+            "nodeName": f"node-{index % 50:02d}",
+            "restartPolicy": "Always",
+            "dnsPolicy": "ClusterFirst",
+            "serviceAccountName": "default",
+            "schedulerName": "default-scheduler",
+            "terminationGracePeriodSeconds": 30,
+            "tolerations": [{"key": "node.kubernetes.io/not-ready", "operator": "Exists", "effect": "NoExecute",
+                             "tolerationSeconds": 300},
+                            {"key": "node.kubernetes.io/unreachable", "operator": "Exists", "effect": "NoExecute",
+                             "tolerationSeconds": 300}],
+        },
+        "status": {
+            "phase": "Running",
+            "conditions": [{"type": kind, "status": "True", "lastTransitionTime": "2024-01-01T00:00:05Z"}
+                           for kind in ("Initialized", "Ready", "ContainersReady", "PodScheduled")],
+            "hostIP": "192.168.0.10",
+            "podIP": f"10.0.{index // 256 % 256}.{index % 256}",
+            "podIPs": [{"ip": f"10.0.{index // 256 % 256}.{index % 256}"}],
+            "startTime": "2024-01-01T00:00:01Z",
+            "containerStatuses": [{
+                "name": "main",
+                "state": {"running": {"startedAt": "2024-01-01T00:00:04Z"}},
+                "ready": True,
+                "restartCount": index % 3,
+                "image": f"registry.local/{app}:1.4.2",
+                "imageID": "registry.local/app@sha256:" + "ab" * 32,
+                "containerID": "containerd://" + "cd" * 32,
+                "started": True,
+            }],
+            "qosClass": "Burstable",
+        },
+    }
+
+
+def _bodies(pods: List[Dict[str, Any]]):
+    metadata = {"resourceVersion": "200000"}
+    json_body = (b'{"kind":"PodList","apiVersion":"v1","metadata":' + _dumps(metadata) + b',"items":['
+                 + b",".join(_dumps(pod) for pod in pods) + b"]}")
+    proto_body = protobuf.encode_list("v1", "PodList", metadata,
+                                      [encode_protobuf(pod, protobuf.SUMMARY_SCHEMAS["pods"]) for pod in pods])
+    return json_body, proto_body
+
+
+def decode_json(body: bytes) -> List[Dict[str, Any]]:
+    return [SUMMARIZERS["pods"](item) for item in fastjson.loads(body).get("items") or []]
+
+
+def decode_protobuf(body: bytes, chunk_size: int = 65536) -> List[Dict[str, Any]]:
+    """HTTP 본문을 청크로 받는 경우와 같게 스트림 디코더로 처리"""
+    decoder = protobuf.ListStreamDecoder(protobuf.SUMMARY_SCHEMAS["pods"])
+    summaries = []
+    for offset in range(0, len(body), chunk_size):
+        summaries.extend(map(SUMMARIZERS["pods"], decoder.feed(body[offset:offset + chunk_size])))
+    decoder.close()
+    return summaries
+
+
+def measure(decode: Callable[[bytes], List[Dict[str, Any]]], body: bytes, repeat: int) -> Dict[str, Any]:
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        decode(body)
+        timings.append(time.perf_counter() - started)
+    gc.collect()
+    tracemalloc.start()
+    decode(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"bytes": len(body), "best_ms": round(min(timings) * 1000, 1),
+            "median_ms": round(sorted(timings)[len(timings) // 2] * 1000, 1), "peak_mib": round(peak / 2 ** 20, 1)}
+
+
+def run(pods: int, repeat: int, simple: bool = False) -> Dict[str, Dict[str, Any]]:
+    if simple:
+        cluster = FakeCluster(FakeClusterConfig(namespaces=1, pods_per_namespace=pods, deployments_per_namespace=1))
+        objects = [cluster.objects["pods"][key] for key in cluster.keys("pods")]
+    else:
+        objects = [realistic_pod(i) for i in range(pods)]
+    json_body, proto_body = _bodies(objects)
+    # age_seconds는 현재 시각 기준이라 두 번 디코딩하는 사이에 달라질 수 있음
+    json_result = [{**item, "age_seconds": None} for item in decode_json(json_body)]
+    proto_result = [{**item, "age_seconds": None} for item in decode_protobuf(proto_body)]
+    if json_result != proto_result:
+        raise AssertionError("JSON과 protobuf 요약 결과가 다릅니다")
+    return {"json": measure(decode_json, json_body, repeat), "protobuf": measure(decode_protobuf, proto_body, repeat)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="JSON / protobuf 요약 디코딩 비교")
+    parser.add_argument("--pods", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--simple", action="store_true", help="가짜 API 서버의 단순한 Pod 사용")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+
+    results = run(args.pods, args.repeat, args.simple)
+    print(f"{'format':10} {'bytes':>12} {'best_ms':>9} {'median_ms':>10} {'peak_mib':>9}")
+    for name, result in results.items():
+        print(f"{name:10} {result['bytes']:>12} {result['best_ms']:>9} {result['median_ms']:>10} "
+              f"{result['peak_mib']:>9}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,253 @@
+"""대시보드 API 벤치마크
+
+가짜 kube-apiserver(benchmarks/fake_apiserver.py)를 로컬 포트에 띄우고, 대시보드 앱에 엔드포인트별로
+동시 요청을 보내 처리량(req/s), p50/p99 지연 시간, 최대 메모리 사용량을 측정합니다.
+
+  python -m benchmarks.run --namespaces 20 --pods 200 --concurrency 20 --requests 200
+  python -m benchmarks.run --json result.json
+  python -m benchmarks.run --baseline result.json --tolerance 0.15   # 회귀 시 종료 코드 1
+  python -m benchmarks.run --protobuf --endpoints "/pods?view=summary"   # 요약 조회를 protobuf로
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from benchmarks.fake_apiserver import add_scale_arguments, config_from_args, create_app
+
+DEFAULT_ENDPOINTS = [
+    "/namespaces",
+    "/pods",
+    "/pods?view=summary",
+    "/pods?view=metadata",
+    "/pods?limit=100",
+    "/pods?stream=ndjson",
+    "/pods/ns-000",
+    "/pods?label_selector=app%3Dapp-00",
+    "/deployments?view=summary",
+]
+
+CLUSTER_ID = "bench"
+
+
+class FakeApiServer:
+    """가짜 API 서버를 별도 스레드의 uvicorn으로 실행"""
+
+    def __init__(self, app):
+        import uvicorn
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+        self.server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=self.port, log_level="warning",
+                                                   ws="none"))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self):
+        self.thread.start()
+        deadline = time.monotonic() + 10
+        while not self.server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("가짜 API 서버가 시작되지 않았습니다.")
+            time.sleep(0.01)
+
+    def stop(self):
+        self.server.should_exit = True
+        self.thread.join(timeout=5)
+
+
+def _load_dashboard(api_url: str, with_cache: bool, use_protobuf: bool = False):
+    """임시 clusters.json으로 대시보드 앱을 불러오고 가짜 클러스터 등록"""
+    os.environ.setdefault("CLUSTERS_CONFIG_PATH", os.path.join(tempfile.mkdtemp(), "clusters.json"))
+    if not with_cache:
+        # 같은 URL을 반복 호출하므로 캐시를 끄지 않으면 대부분 캐시 적중만 측정됨
+        os.environ["RESPONSE_CACHE_TTL"] = "0"
+    import main
+
+    main.settings.K8S_PROTOBUF = use_protobuf
+    main.cluster_manager.store.update(CLUSTER_ID, {
+        "api_url": api_url, "token": "bench-token", "verify_ssl": False, "host": "127.0.0.1", "port": 0,
+    })
+    main.clients.invalidate(CLUSTER_ID)
+    return main
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, int(round(q * (len(values) - 1)))))
+    return values[index]
+
+
+async def _drive(client: httpx.AsyncClient, url: str, requests: int, concurrency: int) -> Dict[str, Any]:
+    """requests개의 요청을 concurrency개씩 동시에 보내고 지연 시간 수집"""
+    latencies: List[float] = []
+    errors = 0
+    received = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining, errors, received
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await client.get(url)
+            latencies.append(time.perf_counter() - started)
+            received += len(response.content)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    return {"latencies": sorted(latencies), "errors": errors, "bytes": received,
+            "wall": time.perf_counter() - started}
+
+
+async def bench_endpoint(client: httpx.AsyncClient, endpoint: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """엔드포인트 하나 측정 (워밍업 → 지연 시간 측정 → tracemalloc으로 최대 메모리 측정)"""
+    url = endpoint + ("&" if "?" in endpoint else "?") + f"cluster_id={CLUSTER_ID}"
+    await _drive(client, url, args.warmup, args.concurrency)
+    run = await _drive(client, url, args.requests, args.concurrency)
+
+    # tracemalloc은 실행 속도를 떨어뜨리므로 지연 시간 측정과 분리
+    peak = None
+    if args.memory_requests:
+        tracemalloc.start()
+        try:
+            await _drive(client, url, args.memory_requests, args.concurrency)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    latencies = run["latencies"]
+    return {
+        "endpoint": endpoint,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "errors": run["errors"],
+        "throughput": round(args.requests / run["wall"], 1),
+        "p50_ms": round(_percentile(latencies, 0.50) * 1000, 2),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 2),
+        "avg_bytes": run["bytes"] // max(1, args.requests),
+        "peak_mib": round(peak / (1 << 20), 2) if peak is not None else None,
+    }
+
+
+async def run_benchmarks(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    apiserver = FakeApiServer(create_app(config_from_args(args)))
+    apiserver.start()
+    main = _load_dashboard(apiserver.url, args.with_cache, args.protobuf)
+    results = []
+    try:
+        if args.informers:
+            for kind in args.informers.split(","):
+                informer = main.informers.start(CLUSTER_ID, kind)
+                await asyncio.wait_for(informer.synced.wait(), 60)
+
+        transport = httpx.ASGITransport(app=main.app)
+        headers = {"Accept-Encoding": args.accept_encoding}
+        async with httpx.AsyncClient(transport=transport, base_url="http://dashboard", headers=headers,
+                                     timeout=120) as client:
+            for endpoint in args.endpoints.split(","):
+                result = await bench_endpoint(client, endpoint, args)
+                results.append(result)
+                if not args.quiet:
+                    print(_format_row(result), flush=True)
+    finally:
+        await main.informers.aclose()
+        await main.clients.aclose()
+        apiserver.stop()
+    return results
+
+
+_COLUMNS = [("endpoint", 36), ("throughput", 10), ("p50_ms", 9), ("p99_ms", 9), ("avg_bytes", 11),
+            ("peak_mib", 9), ("errors", 6)]
+
+
+def _format_row(result: Dict[str, Any]) -> str:
+    cells = []
+    for name, width in _COLUMNS:
+        value = result[name]
+        cell = "-" if value is None else str(value)
+        cells.append(cell.ljust(width) if name == "endpoint" else cell.rjust(width))
+    return " ".join(cells)
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float) -> List[str]:
+    """기준 결과 대비 처리량 감소/p99 증가가 허용치를 넘는 엔드포인트"""
+    previous = {entry["endpoint"]: entry for entry in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get(result["endpoint"])
+        if before is None:
+            continue
+        if result["throughput"] < before["throughput"] * (1 - tolerance):
+            regressions.append(f"{result['endpoint']}: throughput {before['throughput']} -> {result['throughput']}")
+        if result["p99_ms"] > before["p99_ms"] * (1 + tolerance):
+            regressions.append(f"{result['endpoint']}: p99 {before['p99_ms']}ms -> {result['p99_ms']}ms")
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="대시보드 API 벤치마크 (가짜 kube-apiserver 사용)")
+    add_scale_arguments(parser)
+    parser.add_argument("--endpoints", default=",".join(DEFAULT_ENDPOINTS), help="쉼표로 구분한 측정 경로")
+    parser.add_argument("--requests", type=int, default=200, help="엔드포인트당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--memory-requests", type=int, default=50,
+                        help="최대 메모리 측정(tracemalloc) 요청 수 (0이면 측정 안 함)")
+    parser.add_argument("--informers", default="", help="미리 시작할 인포머 (예: pods,deployments)")
+    parser.add_argument("--with-cache", action="store_true", help="응답 캐시 사용 (기본은 끔)")
+    parser.add_argument("--protobuf", action="store_true", help="view=summary/요약 API에서 protobuf 응답 요청")
+    parser.add_argument("--accept-encoding", default="gzip", help="클라이언트 Accept-Encoding (identity면 압축 안 함)")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="회귀로 판단할 변화율")
+    parser.add_argument("--quiet", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if not args.quiet:
+        print(" ".join(name.ljust(width) if name == "endpoint" else name.rjust(width) for name, width in _COLUMNS))
+    results = asyncio.run(run_benchmarks(args))
+    # 리눅스에서 ru_maxrss 단위는 KiB
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource is not None else None
+    if not args.quiet and max_rss is not None:
+        print(f"process max RSS: {max_rss / 1024:.1f} MiB")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "max_rss_kib": max_rss, "results": results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f)["results"], args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
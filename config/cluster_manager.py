@@ -1,17 +1,118 @@
+import base64
 import json
+import shlex
 import requests
 import paramiko
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from pathlib import Path
-from config.settings import settings
+from config.settings import settings, cluster_store
+from config.ssh_pool import SSHConnectionPool
+
+# 원격 프로비저닝 스크립트가 단계마다 stderr에 남기는 표시
+_STEP_MARKER = "##step "
+
+_STEP_NAMES = {
+    "serviceaccount": "ServiceAccount 생성",
+    "clusterrolebinding": "ClusterRoleBinding 생성",
+    "token": "토큰 생성",
+}
+
+# 토큰과 별도로 설정하는 클러스터별 옵션
+CLUSTER_OPTIONS = ("connect_timeout", "read_timeout", "usage_interval")
+
+def token_claims(token: str) -> Dict[str, Any]:
+    """JWT 페이로드 (서명은 검증하지 않음 - 만료 시각/ServiceAccount 확인용, JWT가 아니면 빈 dict)"""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return {}
+    try:
+        payload = base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4))
+        claims = json.loads(payload)
+    except ValueError:
+        return {}
+    return claims if isinstance(claims, dict) else {}
+
+def token_expiry(token: str) -> Optional[float]:
+    """토큰 만료 시각 (epoch 초, 만료가 없는 토큰이면 None)"""
+    exp = token_claims(token).get("exp")
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+def token_service_account(token: str) -> Optional[Tuple[str, str]]:
+    """ServiceAccount 토큰의 (네임스페이스, 이름)"""
+    subject = token_claims(token).get("sub") or ""
+    parts = subject.split(":")
+    if len(parts) == 4 and parts[:2] == ["system", "serviceaccount"]:
+        return parts[2], parts[3]
+    return None
+
+def provision_script(service_account: str, namespace: str, binding_name: str = "dashboard-admin") -> str:
+    """ServiceAccount/ClusterRoleBinding 확인·생성 후 토큰을 출력하는 원격 스크립트 (한 번의 exec로 실행)
+
+    이미 있으면 생성하지 않고, 동시에 다른 곳에서 만든 경우에도 다시 조회해 성공으로 처리합니다.
+    """
+    sa, ns, binding = shlex.quote(service_account), shlex.quote(namespace), shlex.quote(binding_name)
+    subject = shlex.quote(f"{namespace}:{service_account}")
+    return "\n".join([
+        "set -e",
+        f"echo '{_STEP_MARKER}serviceaccount' >&2",
+        f"kubectl get serviceaccount {sa} -n {ns} >/dev/null 2>&1"
+        f" || kubectl create serviceaccount {sa} -n {ns} >&2"
+        f" || kubectl get serviceaccount {sa} -n {ns} >/dev/null",
+        f"echo '{_STEP_MARKER}clusterrolebinding' >&2",
+        f"kubectl get clusterrolebinding {binding} >/dev/null 2>&1"
+        f" || kubectl create clusterrolebinding {binding} --clusterrole=cluster-admin --serviceaccount={subject} >&2"
+        f" || kubectl get clusterrolebinding {binding} >/dev/null",
+        f"echo '{_STEP_MARKER}token' >&2",
+        f"kubectl create token {sa} -n {ns}",
+    ])
+
+def _failed_step(stderr: str) -> Tuple[str, str]:
+    """원격 스크립트 stderr에서 실패한 단계와 오류 메시지 추출"""
+    step, lines = "원격 명령", []
+    for line in stderr.splitlines():
+        if line.startswith(_STEP_MARKER):
+            step, lines = _STEP_NAMES.get(line[len(_STEP_MARKER):], step), []
+        elif line.strip():
+            lines.append(line)
+    return step, "\n".join(lines) or "알 수 없는 오류"
 
 class ClusterManager:
     """클러스터 토큰 생성 및 관리 클래스"""
     
     def __init__(self):
         self.clusters_file = Path(settings.CLUSTERS_CONFIG_PATH)
+        self.store = cluster_store
+        self._change_listeners: List[Callable[[str], None]] = []
+        self._endpoint_listeners: List[Callable[[str], None]] = []
+        self._options_listeners: List[Callable[[str], None]] = []
+        self._token_listeners: List[Callable[[str, str], None]] = []
+        # SSH로 프로비저닝한 클러스터의 접속 비밀번호 (토큰 재발급용, 파일에 저장하지 않음)
+        self._ssh_passwords: Dict[str, str] = {}
+        # 프로비저닝/토큰 갱신에 쓰는 호스트별 SSH 연결
+        self.ssh_pool = SSHConnectionPool(settings.SSH_CONNECT_TIMEOUT, settings.SSH_IDLE_TIMEOUT)
         self._ensure_clusters_config_exists()
     
+    def add_change_listener(self, listener: Callable[[str], None]):
+        """클러스터 설정 변경 시 호출될 콜백 등록 (cluster_id를 인자로 받음)"""
+        self._change_listeners.append(listener)
+    
+    def _notify_change(self, cluster_id: str):
+        """등록된 콜백에 클러스터 설정 변경 알림"""
+        for listener in self._change_listeners:
+            listener(cluster_id)
+    
+    def add_endpoint_listener(self, listener: Callable[[str], None]):
+        """API 서버 주소가 바뀌었을 때(다른 클러스터일 수 있음) 호출될 콜백 등록 (cluster_id를 인자로 받음)"""
+        self._endpoint_listeners.append(listener)
+    
+    def add_options_listener(self, listener: Callable[[str], None]):
+        """클러스터별 옵션만 바뀌었을 때 호출될 콜백 등록 (cluster_id를 인자로 받음)"""
+        self._options_listeners.append(listener)
+    
+    def add_token_listener(self, listener: Callable[[str, str], None]):
+        """토큰만 갱신되었을 때 호출될 콜백 등록 (cluster_id, 새 토큰을 인자로 받음)"""
+        self._token_listeners.append(listener)
+    
     def _ensure_clusters_config_exists(self):
         """클러스터 설정 파일이 없으면 생성"""
         if not self.clusters_file.exists():
@@ -33,136 +134,120 @@ class ClusterManager:
     
     def get_token_via_ssh(self, ssh_host: str, ssh_port: int, ssh_username: str, ssh_password: str, 
                          k8s_host: str, k8s_port: int, service_account: str = "dashboard-admin", 
-                         namespace: str = "default") -> str:
-        """SSH를 통해 클러스터 VM에 접속하여 토큰 획득"""
+                         namespace: str = "default", validate: bool = True) -> str:
+        """SSH를 통해 클러스터 VM에 접속하여 토큰 획득
+
+        ServiceAccount/ClusterRoleBinding 확인·생성과 토큰 발급을 원격 스크립트 한 번으로 실행하고,
+        같은 호스트에 대한 SSH 연결은 재사용합니다.
+        """
         try:
-            print(f"SSH 연결 시도: {ssh_username}@{ssh_host}:{ssh_port}")
-            
-            # SSH 클라이언트 생성
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
-            # SSH 연결
-            ssh.connect(
-                hostname=ssh_host,
-                port=ssh_port,
-                username=ssh_username,
-                password=ssh_password,
-                timeout=30
+            status, stdout, stderr = self.ssh_pool.run(
+                ssh_host, ssh_port, ssh_username, ssh_password,
+                provision_script(service_account, namespace), timeout=settings.SSH_COMMAND_TIMEOUT,
             )
-            
-            print(f"SSH 연결 성공")
-            
-            # 1. ServiceAccount가 존재하는지 확인
-            check_sa_cmd = f"kubectl get serviceaccount {service_account} -n {namespace} --no-headers"
-            stdin, stdout, stderr = ssh.exec_command(check_sa_cmd)
-            sa_exists = stdout.channel.recv_exit_status() == 0
-            
-            if not sa_exists:
-                print(f"ServiceAccount 생성 중: {service_account}")
-                # ServiceAccount 생성
-                create_sa_cmd = f"kubectl create serviceaccount {service_account} -n {namespace}"
-                stdin, stdout, stderr = ssh.exec_command(create_sa_cmd)
-                exit_status = stdout.channel.recv_exit_status()
-                
-                if exit_status != 0:
-                    error_output = stderr.read().decode()
-                    if "already exists" not in error_output:
-                        raise Exception(f"ServiceAccount 생성 실패: {error_output}")
-                else:
-                    print(f"ServiceAccount 생성 완료")
-            
-            # 2. ClusterRoleBinding 확인 및 생성
-            binding_name = "dashboard-admin"
-            check_binding_cmd = f"kubectl get clusterrolebinding {binding_name} --no-headers"
-            stdin, stdout, stderr = ssh.exec_command(check_binding_cmd)
-            binding_exists = stdout.channel.recv_exit_status() == 0
-            
-            if not binding_exists:
-                print(f"ClusterRoleBinding 생성 중: {binding_name}")
-                create_binding_cmd = f"""kubectl create clusterrolebinding {binding_name} \\
-                    --clusterrole=cluster-admin \\
-                    --serviceaccount={namespace}:{service_account}"""
-                stdin, stdout, stderr = ssh.exec_command(create_binding_cmd)
-                exit_status = stdout.channel.recv_exit_status()
-                
-                if exit_status != 0:
-                    error_output = stderr.read().decode()
-                    if "already exists" not in error_output:
-                        raise Exception(f"ClusterRoleBinding 생성 실패: {error_output}")
-                else:
-                    print(f"ClusterRoleBinding 생성 완료")
-            
-            # 3. 토큰 생성
-            print(f"토큰 생성 중...")
-            token_cmd = f"kubectl create token {service_account} -n {namespace}"
-            stdin, stdout, stderr = ssh.exec_command(token_cmd)
-            exit_status = stdout.channel.recv_exit_status()
-            
-            if exit_status != 0:
-                error_output = stderr.read().decode()
-                raise Exception(f"토큰 생성 실패: {error_output}")
-            
-            token = stdout.read().decode().strip()
-            if not token:
-                raise Exception("토큰이 비어있습니다.")
-            
-            print(f"토큰 생성 완료")
-            
-            # 4. 토큰 유효성 검증
-            if self.validate_token(k8s_host, k8s_port, token):
-                print(f"토큰 유효성 검증 완료")
-                return token
-            else:
-                raise Exception("생성된 토큰이 유효하지 않습니다.")
-                
         except paramiko.AuthenticationException:
             raise Exception("SSH 인증 실패: 사용자명 또는 비밀번호가 올바르지 않습니다.")
-        except paramiko.SSHException as e:
+        except (paramiko.SSHException, OSError) as e:
             raise Exception(f"SSH 연결 오류: {str(e)}")
-        except Exception as e:
-            raise Exception(f"SSH를 통한 토큰 획득 실패: {str(e)}")
-        finally:
-            try:
-                ssh.close()
-            except:
-                pass
+
+        if status != 0:
+            step, message = _failed_step(stderr)
+            raise Exception(f"SSH를 통한 토큰 획득 실패: {step} 실패: {message}")
+
+        token = stdout.strip()
+        if not token:
+            raise Exception("SSH를 통한 토큰 획득 실패: 토큰이 비어있습니다.")
+
+        # 토큰 유효성 검증
+        if validate and not self.validate_token(k8s_host, k8s_port, token):
+            raise Exception("SSH를 통한 토큰 획득 실패: 생성된 토큰이 유효하지 않습니다.")
+        return token
     
     
-    def save_cluster_config(self, cluster_name: str, host: str, port: int, token: str, verify_ssl: bool = False):
-        """클러스터 설정을 파일에 저장"""
+    def save_cluster_config(self, cluster_name: str, host: str, port: int, token: str, verify_ssl: bool = False,
+                            provisioning: Optional[Dict[str, Any]] = None):
+        """클러스터 설정을 파일에 저장 (provisioning: 토큰 재발급에 쓸 프로비저닝 정보)"""
+        config = {
+            "api_url": f"https://{host}:{port}",
+            "token": token,
+            "verify_ssl": verify_ssl,
+            "host": host,
+            "port": port,
+            "token_expires_at": token_expiry(token),
+        }
+        if provisioning is not None:
+            config["provisioning"] = provisioning
+        # 토큰을 다시 설정해도 클러스터별 옵션은 유지
+        previous = self.store.get(cluster_name) or {}
+        for key in CLUSTER_OPTIONS:
+            if previous.get(key) is not None:
+                config[key] = previous[key]
         try:
-            # 기존 클러스터 설정 로드
-            if self.clusters_file.exists():
-                with open(self.clusters_file, 'r', encoding='utf-8') as f:
-                    clusters = json.load(f)
-            else:
-                clusters = {}
-            
-            # 새 클러스터 설정 추가
-            clusters[cluster_name] = {
-                "api_url": f"https://{host}:{port}",
-                "token": token,
-                "verify_ssl": verify_ssl,
-                "host": host,
-                "port": port
-            }
-            
-            # 파일에 저장
-            with open(self.clusters_file, 'w', encoding='utf-8') as f:
-                json.dump(clusters, f, indent=2, ensure_ascii=False)
-                
+            self.store.update(cluster_name, config)
         except Exception as e:
             raise Exception(f"클러스터 설정 저장 실패: {str(e)}")
+        
+        self._notify_change(cluster_name)
+        if previous.get("api_url") != config["api_url"]:
+            for listener in self._endpoint_listeners:
+                listener(cluster_name)
+    
+    def save_ssh_provisioned(self, cluster_name: str, ssh_host: str, ssh_port: int, ssh_username: str,
+                             ssh_password: str, k8s_host: str, k8s_port: int, token: str,
+                             service_account: str, namespace: str, verify_ssl: bool = False):
+        """SSH로 발급한 토큰 저장 (만료 전 재발급할 수 있도록 프로비저닝 정보도 기록)"""
+        self._ssh_passwords[cluster_name] = ssh_password
+        self.save_cluster_config(cluster_name, k8s_host, k8s_port, token, verify_ssl, provisioning={
+            "method": "ssh",
+            "ssh_host": ssh_host,
+            "ssh_port": ssh_port,
+            "ssh_username": ssh_username,
+            "service_account": service_account,
+            "namespace": namespace,
+        })
+    
+    def reprovision_via_ssh(self, cluster_id: str) -> str:
+        """저장된 SSH 프로비저닝 정보로 토큰 재발급 (스레드에서 호출)"""
+        config = self.store.get(cluster_id) or {}
+        provisioning = config.get("provisioning") or {}
+        password = self._ssh_passwords.get(cluster_id)
+        if provisioning.get("method") != "ssh" or password is None:
+            raise Exception(f"클러스터 '{cluster_id}'의 SSH 접속 정보가 없어 토큰을 재발급할 수 없습니다.")
+        return self.get_token_via_ssh(
+            provisioning["ssh_host"], provisioning["ssh_port"], provisioning["ssh_username"], password,
+            config["host"], config["port"], provisioning["service_account"], provisioning["namespace"],
+        )
+    
+    def update_cluster_options(self, cluster_id: str, **options: Any):
+        """클러스터별 옵션 변경 (None이면 전역 기본값 사용)"""
+        config = self.store.get(cluster_id)
+        if config is None:
+            raise ValueError(f"클러스터 '{cluster_id}'를 찾을 수 없습니다.")
+        config = dict(config)
+        for key, value in options.items():
+            if key not in CLUSTER_OPTIONS:
+                raise ValueError(f"지원하지 않는 클러스터 옵션입니다: {key}")
+            if value is None:
+                config.pop(key, None)
+            else:
+                config[key] = value
+        self.store.update(cluster_id, config)
+        for listener in self._options_listeners:
+            listener(cluster_id)
+    
+    def update_token(self, cluster_id: str, token: str):
+        """토큰만 교체 (다른 설정은 유지, 커넥션 풀 클라이언트는 재생성하지 않고 헤더만 교체)"""
+        config = self.store.get(cluster_id)
+        if config is None:
+            raise ValueError(f"클러스터 '{cluster_id}'를 찾을 수 없습니다.")
+        self.store.update(cluster_id, {**config, "token": token, "token_expires_at": token_expiry(token)})
+        for listener in self._token_listeners:
+            listener(cluster_id, token)
     
     def list_clusters(self) -> List[Dict[str, Any]]:
         """저장된 클러스터 목록 반환"""
         try:
-            if not self.clusters_file.exists():
-                return []
-            
-            with open(self.clusters_file, 'r', encoding='utf-8') as f:
-                clusters = json.load(f)
+            clusters = self.store.clusters()
             
             result = []
             for cluster_id, config in clusters.items():
@@ -171,7 +256,11 @@ class ClusterManager:
                     "api_url": config["api_url"],
                     "host": config["host"],
                     "port": config["port"],
-                    "verify_ssl": config.get("verify_ssl", False)
+                    "verify_ssl": config.get("verify_ssl", False),
+                    "token_expires_at": config.get("token_expires_at") or token_expiry(config.get("token", "")),
+                    "connect_timeout": config.get("connect_timeout"),
+                    "read_timeout": config.get("read_timeout"),
+                    "usage_interval": config.get("usage_interval")
                 })
             
             return result
@@ -182,11 +271,7 @@ class ClusterManager:
     def get_cluster_info(self, cluster_id: str) -> Dict[str, Any]:
         """특정 클러스터 정보 반환"""
         try:
-            if not self.clusters_file.exists():
-                raise Exception("클러스터 설정 파일이 없습니다.")
-            
-            with open(self.clusters_file, 'r', encoding='utf-8') as f:
-                clusters = json.load(f)
+            clusters = self.store.clusters()
             
             if cluster_id not in clusters:
                 raise Exception(f"클러스터 '{cluster_id}'를 찾을 수 없습니다.")
@@ -197,7 +282,11 @@ class ClusterManager:
                 "api_url": config["api_url"],
                 "host": config["host"],
                 "port": config["port"],
-                "verify_ssl": config.get("verify_ssl", False)
+                "verify_ssl": config.get("verify_ssl", False),
+                "token_expires_at": config.get("token_expires_at") or token_expiry(config.get("token", "")),
+                "connect_timeout": config.get("connect_timeout"),
+                "read_timeout": config.get("read_timeout"),
+                "usage_interval": config.get("usage_interval")
             }
             
         except Exception as e:
@@ -216,7 +305,7 @@ class ClusterManager:
                 test_url, 
                 headers=cluster_config['headers'], 
                 verify=cluster_config['verify_ssl'],
-                timeout=10
+                timeout=(cluster_config['connect_timeout'], cluster_config['read_timeout'])
             )
             
             return response.status_code == 200
@@ -0,0 +1,125 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows - 프로세스 간 파일 잠금 없이 스레드 잠금만 사용
+    fcntl = None
+
+
+class ClusterStore:
+    """clusters.json 메모리 캐시
+
+    파일을 한 번 읽어 메모리에서 조회하고, mtime/inode/크기가 바뀌었을 때만 다시 읽습니다.
+    저장은 임시 파일에 쓴 뒤 rename하는 방식으로 원자적으로 수행하므로 다른 워커가
+    쓰다 만 파일을 읽는 일이 없습니다.
+    """
+
+    def __init__(self, path: str, check_interval: float = 1.0):
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._lock = threading.RLock()
+        self._clusters: Dict[str, Dict[str, Any]] = {}
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._checked_at = 0.0
+        # 파일 I/O 통계 (메트릭용) - {"read"|"write": [횟수, 누적 초]}
+        self.io_stats: Dict[str, list] = {"read": [0, 0.0], "write": [0, 0.0]}
+
+    def _record_io(self, op: str, started: float):
+        stats = self.io_stats[op]
+        stats[0] += 1
+        stats[1] += time.perf_counter() - started
+
+    def _file_stamp(self) -> Optional[Tuple[int, int, int]]:
+        """파일 변경 감지용 (mtime, inode, 크기)"""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_ino, st.st_size)
+
+    def _read_file(self) -> Dict[str, Dict[str, Any]]:
+        """파일에서 클러스터 설정 읽기"""
+        started = time.perf_counter()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        finally:
+            self._record_io("read", started)
+
+    def clusters(self) -> Dict[str, Dict[str, Any]]:
+        """전체 클러스터 설정 (읽기 전용 스냅샷 - 수정하지 말 것)"""
+        now = time.monotonic()
+        if self._stamp is not None and now - self._checked_at < self.check_interval:
+            return self._clusters
+
+        with self._lock:
+            stamp = self._file_stamp()
+            if stamp is None or stamp != self._stamp:
+                self._clusters = self._read_file() if stamp is not None else {}
+                self._stamp = stamp
+            self._checked_at = now
+            return self._clusters
+
+    def get(self, cluster_id: str) -> Optional[Dict[str, Any]]:
+        """특정 클러스터 설정 조회"""
+        return self.clusters().get(cluster_id)
+
+    def invalidate(self):
+        """다음 조회 시 파일을 다시 읽도록 캐시 무효화"""
+        with self._lock:
+            self._stamp = None
+
+    @contextmanager
+    def _file_lock(self):
+        """다른 프로세스(워커)와의 동시 저장 방지용 잠금"""
+        if fcntl is None:
+            yield
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(f"{self.path}.lock", 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write_atomic(self, clusters: Dict[str, Dict[str, Any]]):
+        """임시 파일에 쓴 뒤 rename하여 원자적으로 교체"""
+        started = time.perf_counter()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(clusters, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        finally:
+            self._record_io("write", started)
+
+    def update(self, cluster_id: str, config: Dict[str, Any]):
+        """클러스터 설정 추가/갱신 후 저장"""
+        with self._lock, self._file_lock():
+            # 다른 워커가 저장한 내용을 덮어쓰지 않도록 잠금 안에서 최신 파일을 다시 읽음
+            clusters = dict(self._read_file())
+            clusters[cluster_id] = config
+            self._write_atomic(clusters)
+            # 기존 스냅샷을 들고 있는 호출자를 위해 새 dict로 교체
+            self._clusters = clusters
+            self._stamp = self._file_stamp()
+            self._checked_at = time.monotonic()
@@ -2,6 +2,7 @@ import os
 import json
 from typing import Optional, Dict, Any
 from pathlib import Path
+from config.cluster_store import ClusterStore
 
 class Settings:
     """애플리케이션 설정 클래스"""
@@ -14,10 +15,114 @@ class Settings:
     # 서버 설정
     HOST: str = os.getenv("HOST", "127.0.0.1")
     PORT: int = int(os.getenv("PORT", "8000"))
+    # uvicorn 워커 프로세스 수 (2 이상이면 SHARED_CACHE_DIR로 API 서버 조회/캐시 공유 권장)
+    WORKERS: int = int(os.getenv("WORKERS", "1"))
     
     # 클러스터 설정 파일 경로
     CLUSTERS_CONFIG_PATH: str = os.getenv("CLUSTERS_CONFIG_PATH", "config/clusters.json")
-    
+    # 클러스터 설정 파일 변경 확인 주기 (초)
+    CLUSTERS_CONFIG_CHECK_INTERVAL: float = float(os.getenv("CLUSTERS_CONFIG_CHECK_INTERVAL", "1"))
+
+    # Kubernetes API 클라이언트 설정 (클러스터별 커넥션 풀)
+    K8S_POOL_MAX_CONNECTIONS: int = int(os.getenv("K8S_POOL_MAX_CONNECTIONS", "20"))
+    K8S_POOL_MAX_KEEPALIVE: int = int(os.getenv("K8S_POOL_MAX_KEEPALIVE", "10"))
+    K8S_KEEPALIVE_EXPIRY: float = float(os.getenv("K8S_KEEPALIVE_EXPIRY", "60"))
+    K8S_CONNECT_TIMEOUT: float = float(os.getenv("K8S_CONNECT_TIMEOUT", "5"))
+    K8S_READ_TIMEOUT: float = float(os.getenv("K8S_READ_TIMEOUT", "30"))
+    K8S_HTTP2: bool = os.getenv("K8S_HTTP2", "true").lower() == "true"
+
+    # 조회 응답 캐시 (TTL 초, 0이면 사용 안 함) - 항목 수/전체 크기(바이트) 제한
+    RESPONSE_CACHE_TTL: float = float(os.getenv("RESPONSE_CACHE_TTL", "2"))
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "256"))
+    RESPONSE_CACHE_MAX_BYTES: int = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+    # 응답 압축 (Accept-Encoding 협상, zstandard 패키지가 있으면 zstd도 지원) - 최소 크기(바이트) 미만은 압축 안 함
+    RESPONSE_COMPRESSION: bool = os.getenv("RESPONSE_COMPRESSION", "true").lower() == "true"
+    RESPONSE_COMPRESSION_MIN_SIZE: int = int(os.getenv("RESPONSE_COMPRESSION_MIN_SIZE", "1024"))
+
+    # 응답에 Server-Timing 헤더(API 서버 대기/로컬 처리/전체 시간) 추가 - 프로파일링용
+    SERVER_TIMING: bool = os.getenv("SERVER_TIMING", "false").lower() == "true"
+
+    # 요약 API의 준비되지 않은 Pod/워크로드 목록 최대 길이
+    SUMMARY_MAX_ITEMS: int = int(os.getenv("SUMMARY_MAX_ITEMS", "100"))
+
+    # 멀티 클러스터 조회 (cluster_id=* 또는 a,b) 시 클러스터별 기본 제한 시간 (초)
+    FANOUT_CLUSTER_TIMEOUT: float = float(os.getenv("FANOUT_CLUSTER_TIMEOUT", "10"))
+
+    # 일괄 조회 (POST /batch) 최대 항목 수와 동시 실행 수
+    BATCH_MAX_QUERIES: int = int(os.getenv("BATCH_MAX_QUERIES", "50"))
+    BATCH_CONCURRENCY: int = int(os.getenv("BATCH_CONCURRENCY", "10"))
+
+    # 목록 스트리밍 시 API 서버에 요청할 페이지 크기
+    LIST_PAGE_SIZE: int = int(os.getenv("LIST_PAGE_SIZE", "500"))
+
+    # view=summary 조회 시 API 서버에 protobuf 응답 요청 (요약에 필요한 필드만 디코딩)
+    K8S_PROTOBUF: bool = os.getenv("K8S_PROTOBUF", "false").lower() == "true"
+
+    # 로그 스트리밍 (한 요청에서 동시에 여는 최대 컨테이너 수, 여러 컨테이너를 합칠 때 대기할 수 있는 청크 수)
+    LOG_MAX_STREAMS: int = int(os.getenv("LOG_MAX_STREAMS", "20"))
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "64"))
+
+    # 롤아웃 작업 설정
+    ROLLOUT_MAX_JOBS: int = int(os.getenv("ROLLOUT_MAX_JOBS", "1000"))
+    ROLLOUT_WATCH_TIMEOUT: int = int(os.getenv("ROLLOUT_WATCH_TIMEOUT", "60"))
+    BULK_ROLLOUT_PARALLELISM: int = int(os.getenv("BULK_ROLLOUT_PARALLELISM", "10"))
+
+    # Pod 일괄 삭제 (Pod별 삭제 시 기본 동시 요청 수/초당 요청 수, 한 번에 삭제할 수 있는 최대 Pod 수 기본값)
+    BULK_DELETE_CONCURRENCY: int = int(os.getenv("BULK_DELETE_CONCURRENCY", "10"))
+    BULK_DELETE_RATE: float = float(os.getenv("BULK_DELETE_RATE", "20"))
+    BULK_DELETE_MAX_PODS: int = int(os.getenv("BULK_DELETE_MAX_PODS", "500"))
+
+    # 클러스터 회로 차단기 (연속 실패 횟수 - 0이면 사용 안 함, 차단 후 연결 확인까지 대기 시간 초)
+    CIRCUIT_BREAKER_FAILURES: int = int(os.getenv("CIRCUIT_BREAKER_FAILURES", "5"))
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = float(os.getenv("CIRCUIT_BREAKER_OPEN_SECONDS", "30"))
+
+    # SSH 토큰 프로비저닝 (연결/원격 명령 제한 시간, 유휴 연결 유지 시간, 일괄 프로비저닝 동시 실행 수)
+    SSH_CONNECT_TIMEOUT: float = float(os.getenv("SSH_CONNECT_TIMEOUT", "10"))
+    SSH_COMMAND_TIMEOUT: float = float(os.getenv("SSH_COMMAND_TIMEOUT", "60"))
+    SSH_IDLE_TIMEOUT: float = float(os.getenv("SSH_IDLE_TIMEOUT", "300"))
+    PROVISIONING_PARALLELISM: int = int(os.getenv("PROVISIONING_PARALLELISM", "10"))
+    PROVISIONING_MAX_JOBS: int = int(os.getenv("PROVISIONING_MAX_JOBS", "200"))
+
+    # 토큰 만료 전 백그라운드 재발급 (만료 몇 초 전에 재발급할지, 요청할 토큰 수명, 확인 주기, 실패 후 재시도 간격)
+    TOKEN_REFRESH_ENABLED: bool = os.getenv("TOKEN_REFRESH_ENABLED", "true").lower() == "true"
+    TOKEN_REFRESH_BEFORE: float = float(os.getenv("TOKEN_REFRESH_BEFORE", "600"))
+    TOKEN_REFRESH_DURATION: int = int(os.getenv("TOKEN_REFRESH_DURATION", "3600"))
+    TOKEN_REFRESH_CHECK_INTERVAL: float = float(os.getenv("TOKEN_REFRESH_CHECK_INTERVAL", "30"))
+    TOKEN_REFRESH_RETRY_INTERVAL: float = float(os.getenv("TOKEN_REFRESH_RETRY_INTERVAL", "60"))
+
+    # 인포머 (LIST + WATCH 로컬 캐시) 설정
+    # 형식: "클러스터=리소스,리소스;클러스터=*" (예: "prod=pods,deployments;staging=*")
+    INFORMERS: str = os.getenv("INFORMERS", "")
+    INFORMER_PAGE_SIZE: int = int(os.getenv("INFORMER_PAGE_SIZE", "500"))
+    INFORMER_WATCH_TIMEOUT: int = int(os.getenv("INFORMER_WATCH_TIMEOUT", "300"))
+    INFORMER_BACKOFF_MAX: float = float(os.getenv("INFORMER_BACKOFF_MAX", "30"))
+
+    # 인포머 저장소 디스크 스냅샷 (빈 값이면 사용 안 함, 저장 주기, 이보다 오래된 스냅샷은 무시 - 초)
+    SNAPSHOT_DIR: str = os.getenv("SNAPSHOT_DIR", "")
+    SNAPSHOT_INTERVAL: float = float(os.getenv("SNAPSHOT_INTERVAL", "60"))
+    SNAPSHOT_MAX_AGE: float = float(os.getenv("SNAPSHOT_MAX_AGE", "3600"))
+
+    # 워커 간 공유 캐시 (소유자 잠금/Unix 소켓 디렉터리 - 빈 값이면 사용 안 함, 소유자 응답 대기, 소유자 재선출 주기 초)
+    SHARED_CACHE_DIR: str = os.getenv("SHARED_CACHE_DIR", "")
+    SHARED_CACHE_TIMEOUT: float = float(os.getenv("SHARED_CACHE_TIMEOUT", "60"))
+    SHARED_CACHE_ELECTION_INTERVAL: float = float(os.getenv("SHARED_CACHE_ELECTION_INTERVAL", "2"))
+
+    # Pod/노드 사용량 수집 (metrics.k8s.io)
+    # 시작 시 수집할 클러스터 (쉼표 구분, "*"이면 등록된 모든 클러스터), 기본 수집 주기 (클러스터 옵션 usage_interval로 변경)
+    USAGE_CLUSTERS: str = os.getenv("USAGE_CLUSTERS", "")
+    USAGE_SCRAPE_INTERVAL: float = float(os.getenv("USAGE_SCRAPE_INTERVAL", "15"))
+    # 원본 샘플 보관 기간, 평균 구간 길이, 평균 구간 보관 기간 (초)
+    USAGE_RAW_SECONDS: float = float(os.getenv("USAGE_RAW_SECONDS", "3600"))
+    USAGE_ROLLUP_SECONDS: float = float(os.getenv("USAGE_ROLLUP_SECONDS", "60"))
+    USAGE_ROLLUP_RETENTION: float = float(os.getenv("USAGE_ROLLUP_RETENTION", "86400"))
+
+    # 리소스 변경 구독 (구독자별 최대 대기 이벤트 수, keepalive 주기, 인포머 동기화 대기, 구독자가 없을 때 인포머 유지 시간 초)
+    SUBSCRIPTION_QUEUE_SIZE: int = int(os.getenv("SUBSCRIPTION_QUEUE_SIZE", "1000"))
+    SUBSCRIPTION_HEARTBEAT: float = float(os.getenv("SUBSCRIPTION_HEARTBEAT", "15"))
+    SUBSCRIPTION_SYNC_TIMEOUT: float = float(os.getenv("SUBSCRIPTION_SYNC_TIMEOUT", "30"))
+    SUBSCRIPTION_IDLE_SECONDS: float = float(os.getenv("SUBSCRIPTION_IDLE_SECONDS", "60"))
+
     def __init__(self):
         """설정 초기화"""
         # 클러스터 설정 파일이 없으면 생성
@@ -34,15 +139,12 @@ class Settings:
 # 전역 설정 인스턴스
 settings = Settings()
 
+# 클러스터 설정 메모리 캐시 (clusters.json)
+cluster_store = ClusterStore(settings.CLUSTERS_CONFIG_PATH, settings.CLUSTERS_CONFIG_CHECK_INTERVAL)
+
 def get_default_cluster_id() -> str:
     """기본 클러스터 ID를 가져오는 함수 (가장 최근에 설정된 클러스터)"""
-    clusters_file = Path(settings.CLUSTERS_CONFIG_PATH)
-    
-    if not clusters_file.exists():
-        return "default"
-    
-    with open(clusters_file, 'r', encoding='utf-8') as f:
-        clusters = json.load(f)
+    clusters = cluster_store.clusters()
     
     # 클러스터가 없으면 default 반환
     if not clusters:
@@ -57,21 +159,18 @@ def get_cluster_config(cluster_id: Optional[str] = None) -> Dict[str, Any]:
     if cluster_id is None:
         cluster_id = get_default_cluster_id()
     
-    clusters_file = Path(settings.CLUSTERS_CONFIG_PATH)
+    cluster_config = cluster_store.get(cluster_id)
     
-    if not clusters_file.exists():
-        raise ValueError(f"클러스터 설정 파일이 없습니다: {settings.CLUSTERS_CONFIG_PATH}")
-    
-    with open(clusters_file, 'r', encoding='utf-8') as f:
-        clusters = json.load(f)
-    
-    if cluster_id not in clusters:
+    if cluster_config is None:
         raise ValueError(f"클러스터 '{cluster_id}'를 찾을 수 없습니다.")
     
-    cluster_config = clusters[cluster_id]
-    
     return {
+        'cluster_id': cluster_id,
         'api_url': cluster_config['api_url'],
         'headers': {"Authorization": f"Bearer {cluster_config['token']}"},
-        'verify_ssl': cluster_config.get('verify_ssl', False)
+        'verify_ssl': cluster_config.get('verify_ssl', False),
+        # 클러스터별 제한 시간 (설정하지 않으면 전역 기본값)
+        'connect_timeout': cluster_config.get('connect_timeout') or settings.K8S_CONNECT_TIMEOUT,
+        'read_timeout': cluster_config.get('read_timeout') or settings.K8S_READ_TIMEOUT,
+        'usage_interval': cluster_config.get('usage_interval') or settings.USAGE_SCRAPE_INTERVAL,
     }
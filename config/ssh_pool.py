@@ -0,0 +1,145 @@
+import hashlib
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import paramiko
+
+# (호스트, 포트, 사용자명)
+SSHKey = Tuple[str, int, str]
+
+
+class _Connection:
+    __slots__ = ("client", "secret", "last_used", "lock")
+
+    def __init__(self, secret: str):
+        self.client: Optional[paramiko.SSHClient] = None
+        self.secret = secret
+        self.last_used = time.monotonic()
+        # 같은 호스트로 동시에 접속을 여러 번 맺지 않도록 연결 단위 잠금
+        self.lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        transport = self.client.get_transport()
+        return transport is not None and transport.is_active()
+
+
+class SSHConnectionPool:
+    """호스트별 SSH 연결 재사용 (스레드에서 호출)
+
+    같은 호스트에 대한 프로비저닝/토큰 갱신이 연결과 인증을 반복하지 않도록 연결을 유지하고,
+    idle_timeout 동안 사용되지 않은 연결은 닫습니다. 비밀번호가 바뀌면 새로 접속합니다.
+    """
+
+    def __init__(self, connect_timeout: float, idle_timeout: float,
+                 client_factory: Callable[[], paramiko.SSHClient] = paramiko.SSHClient):
+        self.connect_timeout = connect_timeout
+        self.idle_timeout = idle_timeout
+        # 테스트 등에서 SSH 클라이언트를 주입할 때 사용
+        self.client_factory = client_factory
+        self._connections: Dict[SSHKey, _Connection] = {}
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.reuses = 0
+
+    @staticmethod
+    def _secret(password: str) -> str:
+        return hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+    def _connect(self, key: SSHKey, password: str) -> paramiko.SSHClient:
+        host, port, username = key
+        client = self.client_factory()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client.connect(hostname=host, port=port, username=username, password=password,
+                       timeout=self.connect_timeout, banner_timeout=self.connect_timeout,
+                       auth_timeout=self.connect_timeout)
+        self.connects += 1
+        return client
+
+    def _entry(self, key: SSHKey, password: str) -> _Connection:
+        secret = self._secret(password)
+        with self._lock:
+            self._close_idle()
+            entry = self._connections.get(key)
+            if entry is None or entry.secret != secret:
+                if entry is not None:
+                    self._discard(key, entry)
+                entry = self._connections[key] = _Connection(secret)
+        return entry
+
+    def client(self, host: str, port: int, username: str, password: str) -> paramiko.SSHClient:
+        """연결된 SSH 클라이언트 반환 (살아있는 연결이 있으면 재사용)"""
+        return self._acquire((host, port, username), password)[0]
+
+    def _acquire(self, key: SSHKey, password: str) -> Tuple[paramiko.SSHClient, bool]:
+        entry = self._entry(key, password)
+        with entry.lock:
+            reused = entry.client is not None and entry.active
+            if reused:
+                self.reuses += 1
+            else:
+                if entry.client is not None:
+                    entry.client.close()
+                entry.client = None
+                try:
+                    entry.client = self._connect(key, password)
+                except Exception:
+                    with self._lock:
+                        if self._connections.get(key) is entry:
+                            del self._connections[key]
+                    raise
+            entry.last_used = time.monotonic()
+            return entry.client, reused
+
+    def run(self, host: str, port: int, username: str, password: str, command: str,
+            timeout: Optional[float] = None) -> Tuple[int, str, str]:
+        """원격 명령 한 번 실행 - (종료 코드, stdout, stderr)
+
+        재사용한 연결이 그 사이 끊겼으면 한 번 새로 접속해서 다시 실행합니다.
+        """
+        key = (host, port, username)
+        while True:
+            client, reused = self._acquire(key, password)
+            try:
+                stdin, stdout, stderr = client.exec_command(command, timeout=timeout)
+                stdin.close()
+                out = stdout.read().decode()
+                err = stderr.read().decode()
+                return stdout.channel.recv_exit_status(), out, err
+            except (paramiko.SSHException, EOFError, OSError):
+                self.invalidate(host, port, username)
+                if not reused:
+                    raise
+
+    def invalidate(self, host: str, port: int, username: str):
+        """연결 제거 (오류 발생 시)"""
+        key = (host, port, username)
+        with self._lock:
+            entry = self._connections.pop(key, None)
+        if entry is not None and entry.client is not None:
+            entry.client.close()
+
+    def _discard(self, key: SSHKey, entry: _Connection):
+        del self._connections[key]
+        if entry.client is not None:
+            entry.client.close()
+
+    def _close_idle(self):
+        now = time.monotonic()
+        for key, entry in list(self._connections.items()):
+            if now - entry.last_used > self.idle_timeout and not entry.lock.locked():
+                self._discard(key, entry)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"connections": len(self._connections), "connects": self.connects, "reuses": self.reuses}
+
+    def close(self):
+        """모든 연결 종료 (애플리케이션 종료 시)"""
+        with self._lock:
+            entries = list(self._connections.items())
+            self._connections.clear()
+        for key, entry in entries:
+            if entry.client is not None:
+                entry.client.close()
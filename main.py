@@ -1,11 +1,42 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Depends, Query, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse, Response
+import anyio
+import asyncio
+import hashlib
+import httpx
+import re
 import requests
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional, Dict, Any
-from pydantic import BaseModel
+from typing import Optional, Dict, Any, List, Tuple, Union
+from pydantic import BaseModel, Field
 from config.settings import settings, get_cluster_config
 from config.cluster_manager import ClusterManager
+from app.k8s_client import ClusterClientRegistry
+from app.informer import InformerManager
+from app.snapshots import SnapshotStore
+from app.shared_cache import SharedCache, SharedCacheUnavailable, SharedReply, SharedStream
+from app.jobs import Job, JobTable, JobTableFull
+from app.rollout import RolloutManager, WORKLOAD_KINDS
+from app.provisioning import ProvisioningManager
+from app.token_refresh import TokenRefresher
+from app.circuit_breaker import CircuitBreakers, CircuitOpen
+from app.resources import RESOURCE_KINDS, ResourceKind, resource_path
+from app.streaming import ndjson_stream, json_list_stream
+from app.views import Transform, build_transform, accept_header
+from app.selectors import Predicate, build_predicate, selector_string
+from app.logs import LogTarget, log_params, log_targets, multiplex, response_stream
+from app.response_cache import ResponseCache, representation_tag, make_etag, etag_matches
+from app.compression import CompressionMiddleware
+from app.singleflight import SingleFlight
+from app.summary import SummaryManager, WORKLOAD_RESOURCES, summarize
+from app.usage import UsageCollector
+from app.ratelimit import RateLimiter
+from app.subscriptions import Subscription, SubscriptionHub, sse_event
+from app.metrics import DashboardMetrics, MetricsMiddleware, Counter, Gauge, upstream_wait
+from app import fastjson, protobuf
 
 # Pydantic 모델 정의
 
@@ -28,10 +59,192 @@ class SSHTokenRequest(BaseModel):
     namespace: str = "default"
     verify_ssl: bool = False
 
+class ClusterOptionsRequest(BaseModel):
+    # API 서버 연결/읽기 제한 시간 (초, null이면 전역 기본값)
+    connect_timeout: Optional[float] = Field(None, gt=0)
+    read_timeout: Optional[float] = Field(None, gt=0)
+    # metrics.k8s.io 사용량 수집 주기 (초, null이면 전역 기본값)
+    usage_interval: Optional[float] = Field(None, ge=1)
+
+class BatchSSHTokenRequest(BaseModel):
+    clusters: List[SSHTokenRequest] = Field(min_length=1)
+    # 동시에 프로비저닝할 클러스터 수
+    parallelism: int = Field(settings.PROVISIONING_PARALLELISM, ge=1)
+
+class BatchQuery(BaseModel):
+    # 결과를 구분할 ID (생략하면 요청 순서 번호)
+    id: Optional[str] = None
+    kind: str
+    cluster_id: Optional[str] = None
+    namespace: Optional[str] = None
+    name: Optional[str] = None
+    view: Optional[str] = Field(None, pattern="^(full|summary|metadata|table)$")
+    fields: Optional[str] = None
+    label_selector: Optional[str] = None
+    field_selector: Optional[str] = None
+    limit: Optional[int] = Field(None, ge=1)
+    continue_token: Optional[str] = Field(None, alias="continue")
+    cluster_timeout: Optional[float] = Field(None, gt=0)
+    # 이전 응답의 ETag - 변경이 없으면 해당 항목만 304
+    if_none_match: Optional[str] = None
+
+class BatchQueryRequest(BaseModel):
+    queries: List[BatchQuery] = Field(min_length=1, max_length=settings.BATCH_MAX_QUERIES)
+
+class WorkloadRef(BaseModel):
+    kind: str = Field(pattern="^(deployment|daemonset|statefulset)$")
+    namespace: str
+    name: str
+
+class BulkRolloutRequest(BaseModel):
+    cluster_id: Optional[str] = None
+    # workloads를 지정하지 않으면 namespace/label_selector/kinds로 대상 조회 (namespace가 없으면 전체)
+    workloads: List[WorkloadRef] = []
+    namespace: Optional[str] = None
+    label_selector: Optional[str] = None
+    kinds: List[str] = ["deployment", "daemonset", "statefulset"]
+    # 동시에 진행(비가용 상태)될 수 있는 워크로드 수
+    parallelism: int = Field(settings.BULK_ROLLOUT_PARALLELISM, ge=1)
+    # 실패/타임아웃이 이 수를 넘으면 남은 워크로드는 건너뜀
+    max_failures: Optional[int] = Field(None, ge=0)
+    timeout: int = 300
+
+class BulkPodDeleteRequest(BaseModel):
+    cluster_id: Optional[str] = None
+    # pods를 지정하면 해당 Pod만 (namespace 필요), 아니면 namespace/셀렉터/reason으로 대상 조회 (namespace가 없으면 전체)
+    namespace: Optional[str] = None
+    pods: List[str] = []
+    label_selector: Optional[str] = None
+    field_selector: Optional[str] = None
+    # Pod status.reason(Evicted 등) 또는 컨테이너 대기/종료 사유(CrashLoopBackOff 등) - 셀렉터로 고를 수 없어 직접 비교
+    reason: Optional[str] = None
+    dry_run: bool = False
+    grace_period_seconds: Optional[int] = Field(None, ge=0)
+    # Pod별로 삭제할 때 동시 요청 수와 초당 요청 수
+    concurrency: int = Field(settings.BULK_DELETE_CONCURRENCY, ge=1)
+    rate: float = Field(settings.BULK_DELETE_RATE, gt=0)
+    # 대상이 이 수보다 많으면 삭제하지 않음 (셀렉터 실수로 전체 삭제 방지)
+    # null이면 제한 없이 셀렉터에 맞는 Pod를 모두 삭제 - 이때만 deletecollection 사용
+    max_pods: Optional[int] = Field(settings.BULK_DELETE_MAX_PODS, ge=1)
+
+# 클러스터 매니저 인스턴스
+cluster_manager = ClusterManager()
+
+# 클러스터별 커넥션 풀 클라이언트 (설정 변경 시 재생성)
+clients = ClusterClientRegistry()
+cluster_manager.add_change_listener(clients.invalidate)
+cluster_manager.add_options_listener(clients.invalidate)
+
+# 조회 응답 캐시 (ETag/If-None-Match 조건부 조회)
+response_cache = ResponseCache(settings.RESPONSE_CACHE_TTL, settings.RESPONSE_CACHE_MAX_ENTRIES,
+                               settings.RESPONSE_CACHE_MAX_BYTES)
+cluster_manager.add_change_listener(response_cache.invalidate)
+
+# 같은 API 서버 조회가 동시에 들어오면 한 번만 요청
+upstream_flights = SingleFlight()
+
+# Prometheus 메트릭
+metrics = DashboardMetrics()
+
+def _cluster_label(cluster_id: Optional[str]) -> str:
+    """메트릭 cluster 레이블 (등록되지 않은 값으로 레이블이 무한히 늘어나지 않도록 제한)"""
+    if cluster_id is None:
+        return "default"
+    if cluster_id == "*" or "," in cluster_id:
+        return "*"
+    return cluster_id if cluster_id in cluster_manager.store.clusters() else "unknown"
+
+async def _cluster_client(cluster_id: str) -> httpx.AsyncClient:
+    """cluster_id로 풀링 클라이언트 조회 (백그라운드 작업용)"""
+    return await clients.get(get_cluster_config(cluster_id))
+
+# 만료 전 토큰 재발급 (새 토큰은 커넥션 풀 클라이언트 헤더만 교체)
+token_refresher = TokenRefresher(cluster_manager, _cluster_client, settings.TOKEN_REFRESH_BEFORE,
+                                 settings.TOKEN_REFRESH_DURATION, settings.TOKEN_REFRESH_CHECK_INTERVAL,
+                                 settings.TOKEN_REFRESH_RETRY_INTERVAL)
+cluster_manager.add_token_listener(clients.swap_token)
+cluster_manager.add_change_listener(token_refresher.reset)
+
+async def _probe_cluster(cluster_id: str) -> bool:
+    """회로 차단 후 복구 확인 (연결 테스트는 블로킹 호출이므로 스레드에서)"""
+    return await anyio.to_thread.run_sync(cluster_manager.test_cluster_connection, cluster_id, cancellable=True)
+
+# 클러스터별 회로 차단기 (연결할 수 없는 클러스터는 요청을 보내지 않고 바로 503)
+breakers = CircuitBreakers(settings.CIRCUIT_BREAKER_FAILURES, settings.CIRCUIT_BREAKER_OPEN_SECONDS, _probe_cluster)
+cluster_manager.add_change_listener(breakers.reset)
+
+# 인포머 저장소 디스크 스냅샷 (재시작 시 LIST 없이 저장된 resourceVersion부터 WATCH)
+snapshots = (SnapshotStore(settings.SNAPSHOT_DIR, settings.SNAPSHOT_INTERVAL, settings.SNAPSHOT_MAX_AGE)
+             if settings.SNAPSHOT_DIR else None)
+if snapshots is not None:
+    # 토큰만 다시 설정했거나 옵션만 바꾼 경우는 같은 클러스터이므로 스냅샷 유지
+    cluster_manager.add_endpoint_listener(snapshots.discard)
+
+# LIST + WATCH 로컬 캐시 (클러스터/리소스 종류별 opt-in)
+informers = InformerManager(_cluster_client, snapshots)
+
+# 인포머 변경 이벤트로 유지되는 클러스터 요약
+summaries = SummaryManager(informers)
+
+# Pod/노드 사용량 수집 (metrics.k8s.io, 클러스터별 opt-in)
+usage = UsageCollector(_cluster_client, lambda cluster_id: get_cluster_config(cluster_id)['usage_interval'],
+                       settings.USAGE_RAW_SECONDS, settings.USAGE_ROLLUP_SECONDS, settings.USAGE_ROLLUP_RETENTION)
+
+# 리소스 변경 구독 (구독 키마다 인포머 WATCH 하나를 공유)
+subscriptions = SubscriptionHub(informers, settings.SUBSCRIPTION_QUEUE_SIZE, settings.SUBSCRIPTION_HEARTBEAT,
+                                settings.SUBSCRIPTION_SYNC_TIMEOUT, settings.SUBSCRIPTION_IDLE_SECONDS)
+
+# 백그라운드 롤아웃 작업
+rollout_jobs = JobTable(settings.ROLLOUT_MAX_JOBS)
+
+def _rollout_restarted(cluster_id: str, workload_type: str):
+    """재시작 패치가 적용된 뒤 캐시 무효화 (패치 전에 비우면 그 사이 조회가 이전 상태를 다시 캐시함)"""
+    _invalidate(cluster_id, WORKLOAD_KINDS[workload_type])
+    _invalidate(cluster_id, "summary")
+
+rollouts = RolloutManager(_cluster_client, rollout_jobs, on_restarted=_rollout_restarted)
+
+# 백그라운드 SSH 토큰 프로비저닝 작업
+provisioning_jobs = JobTable(settings.PROVISIONING_MAX_JOBS)
+provisioning = ProvisioningManager(cluster_manager, provisioning_jobs)
+
+def _start_background_sync():
+    """인포머/스냅샷/사용량 수집/토큰 재발급 시작 (공유 캐시를 쓰면 소유자 워커에서만)"""
+    informers.start_configured(settings.INFORMERS)
+    usage.start_configured(settings.USAGE_CLUSTERS, cluster_manager.store.clusters)
+    if snapshots is not None:
+        snapshots.start(informers.snapshot_sources)
+    if settings.TOKEN_REFRESH_ENABLED:
+        token_refresher.start()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if shared_cache is None:
+        _start_background_sync()
+    else:
+        # 소유자가 되면(지금 또는 기존 소유자가 종료된 뒤) on_promote로 시작
+        await shared_cache.start()
+    yield
+    # 종료 시 백그라운드 작업, 인포머, 커넥션 풀 정리
+    if shared_cache is not None:
+        await shared_cache.aclose()
+    await rollout_jobs.aclose()
+    await provisioning_jobs.aclose()
+    await usage.aclose()
+    await token_refresher.aclose()
+    await breakers.aclose()
+    await subscriptions.aclose()
+    if snapshots is not None:
+        await snapshots.aclose(informers.snapshot_sources)
+    await informers.aclose()
+    await clients.aclose()
+    cluster_manager.ssh_pool.close()
+
 app = FastAPI(
     title=settings.APP_NAME,
     description="쿠버네티스 클러스터 관리를 위한 REST API",
-    version=settings.APP_VERSION
+    version=settings.APP_VERSION,
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -41,10 +254,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
-# 클러스터 매니저 인스턴스
-cluster_manager = ClusterManager()
+# 응답 압축 (Accept-Encoding에 따라 zstd/gzip)
+if settings.RESPONSE_COMPRESSION:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.RESPONSE_COMPRESSION_MIN_SIZE)
+
+# 요청 메트릭 (가장 바깥에서 압축 후 응답 크기까지 기록)
+app.add_middleware(MetricsMiddleware, metrics=metrics, cluster_label=_cluster_label,
+                   server_timing=settings.SERVER_TIMING)
 
 @app.get("/")
 def root():
@@ -54,257 +273,1407 @@ def root():
 def health_check():
     return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
 
+@app.get("/stats")
+def get_stats():
+    """응답 캐시/동시 요청 병합 통계"""
+    stats = {"response_cache": response_cache.stats(), "upstream_coalescing": upstream_flights.stats()}
+    if shared_cache is not None:
+        stats["shared_cache"] = shared_cache.status()
+    return stats
+
+def _collect_runtime_metrics():
+    """수집 시점의 캐시/병합/작업/스레드풀/인포머/설정 파일 상태"""
+    cache = response_cache.stats()
+    for name, documentation in (("hits", "응답 캐시 적중 수"), ("misses", "응답 캐시 미적중 수"),
+                                ("evictions", "응답 캐시에서 밀려난 항목 수")):
+        counter = Counter(f"dashboard_response_cache_{name}_total", documentation)
+        counter.inc(cache[name])
+        yield counter
+    gauge = Gauge("dashboard_response_cache_bytes", "응답 캐시 크기 (바이트)")
+    gauge.set(cache["bytes"])
+    yield gauge
+
+    flights = upstream_flights.stats()
+    counter = Counter("dashboard_upstream_coalesced_total", "진행 중인 동일 요청에 병합된 API 서버 조회 수")
+    counter.inc(flights["coalesced"])
+    yield counter
+    counter = Counter("dashboard_upstream_flight_calls_total", "병합 계층을 거친 API 서버 조회 수")
+    counter.inc(flights["calls"])
+    yield counter
+
+    gauge = Gauge("dashboard_rollout_jobs_running", "실행 중인 롤아웃 작업 수", ("type",))
+    for job_type in ("rollout", "bulk_rollout"):
+        gauge.set(rollout_jobs.running(job_type), type=job_type)
+    yield gauge
+    gauge = Gauge("dashboard_provisioning_jobs_running", "실행 중인 SSH 토큰 프로비저닝 작업 수", ("type",))
+    for job_type in ("ssh_provision", "ssh_provision_batch"):
+        gauge.set(provisioning_jobs.running(job_type), type=job_type)
+    yield gauge
+    ssh = cluster_manager.ssh_pool.stats()
+    gauge = Gauge("dashboard_ssh_connections", "유지 중인 SSH 연결 수")
+    gauge.set(ssh["connections"])
+    yield gauge
+    counter = Counter("dashboard_ssh_connects_total", "SSH 접속 횟수 (재사용하지 못한 경우)")
+    counter.inc(ssh["connects"])
+    yield counter
+
+    # 동기 라우트/SSH/requests 호출이 사용하는 anyio 스레드풀
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    gauge = Gauge("dashboard_threadpool_threads", "스레드풀 크기와 사용 중인 스레드 수", ("state",))
+    gauge.set(limiter.total_tokens, state="total")
+    gauge.set(limiter.borrowed_tokens, state="busy")
+    yield gauge
+    gauge = Gauge("dashboard_threadpool_waiting", "스레드풀 빈자리를 기다리는 작업 수")
+    gauge.set(limiter.statistics().tasks_waiting)
+    yield gauge
+
+    items = Gauge("dashboard_informer_items", "인포머 저장소 항목 수", ("cluster", "kind"))
+    staleness = Gauge("dashboard_informer_staleness_seconds", "인포머 마지막 동기화 이후 경과 시간", ("cluster", "kind"))
+    for status in informers.status():
+        items.set(status["items"], cluster=status["cluster_id"], kind=status["kind"])
+        staleness.set(status["staleness_seconds"], cluster=status["cluster_id"], kind=status["kind"])
+    yield items
+    yield staleness
+
+    operations = Counter("dashboard_clusters_config_io_total", "clusters.json 읽기/쓰기 횟수", ("op",))
+    seconds = Counter("dashboard_clusters_config_io_seconds_total", "clusters.json 읽기/쓰기 누적 시간", ("op",))
+    for op, (count, elapsed) in cluster_manager.store.io_stats.items():
+        operations.inc(count, op=op)
+        seconds.inc(elapsed, op=op)
+    yield operations
+    yield seconds
+
+    remaining = Gauge("dashboard_token_expiry_seconds", "클러스터 토큰 만료까지 남은 시간", ("cluster",))
+    now = time.time()
+    for cluster in cluster_manager.list_clusters():
+        if cluster["token_expires_at"] is not None:
+            remaining.set(cluster["token_expires_at"] - now, cluster=cluster["cluster_id"])
+    yield remaining
+    circuit = Gauge("dashboard_circuit_open", "회로가 열려 있는(요청 차단 중인) 클러스터", ("cluster", "state"))
+    for cluster_id, state in breakers.states().items():
+        circuit.set(0 if state == "closed" else 1, cluster=cluster_id, state=state)
+    yield circuit
+    rejected = Counter("dashboard_circuit_rejected_total", "회로 차단으로 API 서버를 호출하지 않은 요청 수")
+    rejected.inc(breakers.rejected)
+    yield rejected
+    refreshes = Counter("dashboard_token_refresh_total", "토큰 재발급 시도 수", ("result",))
+    refreshes.inc(token_refresher.refreshed, result="success")
+    refreshes.inc(token_refresher.failed, result="error")
+    yield refreshes
+    subscribers = Gauge("dashboard_subscribers", "리소스 변경 구독자 수")
+    subscribers.set(subscriptions.subscribers)
+    yield subscribers
+    evictions = Counter("dashboard_subscription_evictions_total", "큐가 넘쳐 퇴출된 구독자 수")
+    evictions.inc(subscriptions.evictions)
+    yield evictions
+
+metrics.registry.add_collector(_collect_runtime_metrics)
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus 형식 메트릭"""
+    return Response(content=metrics.registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 # ==================== 조회 API ====================
 
+async def _k8s_request(method: str, cluster_config: Dict[str, Any], path: str, stream: bool = False,
+                       **kwargs) -> httpx.Response:
+    """클러스터의 풀링 클라이언트로 API 서버 요청 (연결 실패/타임아웃은 502/504, 회로가 열려 있으면 503)
+
+    stream=True면 헤더까지만 받고 반환하므로 호출한 쪽에서 본문을 읽은 뒤 aclose()해야 합니다.
+    """
+    cluster_id = cluster_config['cluster_id']
+    try:
+        breakers.check(cluster_id)
+    except CircuitOpen as e:
+        headers = {"Retry-After": str(max(1, int(e.retry_at - time.time())))} if e.retry_at else None
+        raise HTTPException(status_code=503, detail=str(e), headers=headers)
+    client = await clients.get(cluster_config)
+    started = time.perf_counter()
+    status = "error"
+    try:
+        if stream:
+            r = await client.send(client.build_request(method, path, **kwargs), stream=True)
+        else:
+            r = await client.request(method, path, **kwargs)
+        status = str(r.status_code)
+        if r.status_code == 401 and settings.TOKEN_REFRESH_ENABLED:
+            # 만료 확인 주기 전에 토큰이 거부됨 - 이번 요청은 그대로 실패시키고 재발급은 백그라운드에서
+            _request_token_refresh(cluster_id)
+        if r.status_code in (502, 503, 504):
+            breakers.failure(cluster_id, f"API 서버 {r.status_code} 응답")
+        else:
+            breakers.success(cluster_id)
+        return r
+    except httpx.TimeoutException as e:
+        status = "timeout"
+        breakers.failure(cluster_id, f"응답 시간 초과: {e!r}")
+        raise HTTPException(status_code=504, detail=f"API 서버 응답 시간 초과: {e!r}")
+    except httpx.TransportError as e:
+        breakers.failure(cluster_id, f"연결 실패: {e!r}")
+        raise HTTPException(status_code=502, detail=f"API 서버 연결 실패: {e!r}")
+    finally:
+        metrics.upstream_seconds.observe(time.perf_counter() - started, cluster=cluster_id,
+                                         method=method, status=status)
+
+def _flight_key(form: str, cluster_config: Dict[str, Any], path: str, params: Optional[Dict[str, Any]],
+                headers: Optional[Dict[str, str]]) -> tuple:
+    """동시 요청 병합 키 (클러스터, 경로, 쿼리, 헤더, 결과 형태)"""
+    return (form, cluster_config['cluster_id'], cluster_config['api_url'], path,
+            tuple(sorted((params or {}).items())), tuple(sorted((headers or {}).items())))
+
+async def _k8s_get(cluster_config: Dict[str, Any], path: str, params: Optional[Dict[str, Any]] = None,
+                   headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """API 서버 GET 공통 함수 (같은 요청이 진행 중이면 디코딩된 결과를 공유 - 수정 금지)"""
+    async def fetch():
+        r = await _k8s_request("GET", cluster_config, path, params=params, headers=headers)
+        if r.status_code != 200:
+            raise HTTPException(status_code=r.status_code, detail=r.text)
+        return {"status": r.status_code, "response": fastjson.loads(r.content)}
+
+    with upstream_wait():
+        return await upstream_flights.do(_flight_key("json", cluster_config, path, params, headers), fetch)
+
+async def _k8s_get_raw(cluster_config: Dict[str, Any], path: str, params: Optional[Dict[str, Any]] = None,
+                       headers: Optional[Dict[str, str]] = None) -> bytes:
+    """API 서버 GET 응답 본문을 디코딩하지 않고 반환 (같은 요청이 진행 중이면 결과 공유)"""
+    async def fetch():
+        r = await _k8s_request("GET", cluster_config, path, params=params, headers=headers)
+        if r.status_code != 200:
+            raise HTTPException(status_code=r.status_code, detail=r.text)
+        return r.content
+
+    with upstream_wait():
+        return await upstream_flights.do(_flight_key("raw", cluster_config, path, params, headers), fetch)
+
+async def _k8s_get_protobuf(cluster_config: Dict[str, Any], kind: str, path: str,
+                            params: Optional[Dict[str, Any]], is_list: bool,
+                            transform: Optional[Transform] = None, view_key: tuple = ()) -> Dict[str, Any]:
+    """protobuf로 조회해 요약에 필요한 필드만 디코딩 (목록 항목은 본문 청크를 받는 대로 디코딩·변환)
+
+    protobuf를 지원하지 않는 리소스면 API 서버가 JSON으로 응답하므로 JSON으로 디코딩합니다.
+    """
+    schema = protobuf.SUMMARY_SCHEMAS[kind]
+
+    async def fetch():
+        r = await _k8s_request("GET", cluster_config, path, stream=True, params=params,
+                               headers={"Accept": protobuf.ACCEPT})
+        try:
+            content_type = r.headers.get("content-type", "")
+            if r.status_code != 200:
+                body = await r.aread()
+                detail = protobuf.error_message(body) if content_type.startswith(protobuf.CONTENT_TYPE) else r.text
+                raise HTTPException(status_code=r.status_code, detail=detail or r.reason_phrase)
+            if not content_type.startswith(protobuf.CONTENT_TYPE):
+                response = {"status": 200, "response": fastjson.loads(await r.aread())}
+                return _apply_transform(response, transform, is_list)
+            if not is_list:
+                obj = protobuf.decode_object(await r.aread(), schema)
+                return {"status": 200, "response": transform(obj) if transform is not None else obj}
+
+            decoder = protobuf.ListStreamDecoder(schema)
+            items: List[Dict[str, Any]] = []
+            async for chunk in r.aiter_bytes():
+                decoded = decoder.feed(chunk)
+                items.extend(map(transform, decoded) if transform is not None else decoded)
+            decoder.close()
+        except (ValueError, IndexError, UnicodeDecodeError) as e:
+            raise HTTPException(status_code=502, detail=f"API 서버 protobuf 응답을 해석할 수 없습니다: {e}")
+        except httpx.HTTPError as e:
+            raise HTTPException(status_code=502, detail=f"API 서버 응답 수신 실패: {e!r}")
+        finally:
+            await r.aclose()
+
+        resource_kind = RESOURCE_KINDS[kind]
+        return {
+            "status": 200,
+            "response": {"kind": resource_kind.list_kind, "apiVersion": resource_kind.api_version,
+                         "metadata": decoder.metadata, "items": items},
+        }
+
+    with upstream_wait():
+        key = _flight_key("protobuf", cluster_config, path, params, None) + view_key
+        return await upstream_flights.do(key, fetch)
+
+class ListQuery:
+    """목록 조회 공통 쿼리 파라미터 (셀렉터/페이지네이션/스트리밍/멀티 클러스터)"""
+
+    def __init__(
+        self,
+        label_selector: Optional[str] = Query(None, description="라벨 셀렉터 (예: app=web,tier in (a,b))"),
+        field_selector: Optional[str] = Query(None, description="필드 셀렉터 (예: status.phase=Failed)"),
+        limit: Optional[int] = Query(None, ge=1, description="페이지 크기 (API 서버 limit)"),
+        continue_token: Optional[str] = Query(None, alias="continue", description="이전 응답의 metadata.continue"),
+        stream: Optional[str] = Query(None, pattern="^(ndjson|json)$",
+                                      description="continue 토큰을 따라가며 전체 목록을 스트리밍 (ndjson 또는 json)"),
+        cluster_timeout: Optional[float] = Query(None, gt=0,
+                                                 description="멀티 클러스터 조회 시 클러스터별 제한 시간 (초)"),
+    ):
+        self.label_selector = label_selector
+        self.field_selector = field_selector
+        self.limit = limit
+        self.continue_token = continue_token
+        self.stream = stream
+        self.cluster_timeout = cluster_timeout
+
+    def params(self) -> Dict[str, Any]:
+        """API 서버로 전달할 쿼리 파라미터"""
+        params: Dict[str, Any] = {}
+        if self.label_selector:
+            params["labelSelector"] = self.label_selector
+        if self.field_selector:
+            params["fieldSelector"] = self.field_selector
+        if self.limit:
+            params["limit"] = self.limit
+        if self.continue_token:
+            params["continue"] = self.continue_token
+        return params
+
+    def cache_key(self) -> tuple:
+        """응답 캐시 키에 포함할 값 (API 서버 파라미터 기준)"""
+        return tuple(sorted(self.params().items()))
+
+    def predicate(self) -> Optional[Predicate]:
+        """인포머 저장소 조회 시 적용할 셀렉터 필터"""
+        try:
+            return build_predicate(self.label_selector, self.field_selector)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+class ViewQuery:
+    """조회 응답 형태 옵션 (요약/필드 선택)"""
+
+    def __init__(
+        self,
+        view: Optional[str] = Query(None, pattern="^(full|summary|metadata|table)$",
+                                    description="full(기본) | summary(대시보드용 요약) | metadata(metadata만) | table(API 서버 Table 형식)"),
+        fields: Optional[str] = Query(None, description="쉼표로 구분한 필드 경로 (예: metadata.name,status.phase)"),
+    ):
+        self.view = view
+        self.fields = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+
+    def transform(self, kind: str) -> Optional[Transform]:
+        """오브젝트별 변환 함수 (Table 형식은 API 서버 응답 그대로 사용)"""
+        if self.view == "table":
+            return None
+        return build_transform(kind, self.view, self.fields)
+
+    def cache_key(self) -> tuple:
+        """응답 캐시 키에 포함할 값"""
+        return (self.view, tuple(self.fields or ()))
+
+    def protobuf(self, kind: str) -> bool:
+        """API 서버에 protobuf 응답을 요청할지 (요약 뷰는 필요한 필드만 디코딩하면 됨)"""
+        return settings.K8S_PROTOBUF and self.view == "summary" and kind in protobuf.SUMMARY_SCHEMAS
+
+    def headers(self, is_list: bool) -> Optional[Dict[str, str]]:
+        """API 서버에 요청할 Accept 헤더 (Table/PartialObjectMetadata 협상)"""
+        accept = accept_header(self.view, self.fields, is_list)
+        return {"Accept": accept} if accept else None
+
+class Conditional:
+    """조건부 조회 요청 헤더"""
+
+    def __init__(self, if_none_match: Optional[str] = Header(None)):
+        self.if_none_match = if_none_match
+
+    def matches(self, etag: Optional[str]) -> bool:
+        return etag_matches(self.if_none_match, etag)
+
+def _apply_transform(response: Dict[str, Any], transform: Optional[Transform], is_list: bool) -> Dict[str, Any]:
+    """응답의 오브젝트(목록이면 각 항목)에 변환 적용"""
+    if transform is None:
+        return response
+    body = response["response"]
+    if is_list:
+        body = {**body, "items": [transform(item) for item in body.get("items") or []]}
+    else:
+        body = transform(body)
+    return {**response, "response": body}
+
+def _informer_response(informer, namespace: Optional[str] = None, name: Optional[str] = None,
+                       query: Optional[ListQuery] = None) -> Optional[Dict[str, Any]]:
+    """인포머 로컬 저장소에서 응답 생성 (단건 조회 시 캐시에 없으면 None)"""
+    if name is not None:
+        obj = informer.get(namespace, name)
+        if obj is None:
+            return None
+        return {"status": 200, "response": obj, "cache": informer.status()}
+
+    metadata: Dict[str, Any] = {"resourceVersion": informer.resource_version}
+    predicate = query.predicate() if query is not None else None
+    if query is not None and (query.limit or query.continue_token):
+        page = informer.page(namespace, query.limit, query.continue_token, predicate)
+        if page is None:
+            # API 서버가 발급한 continue 토큰 - API 서버에서 이어서 조회
+            return None
+        items, next_token = page
+        if next_token:
+            metadata["continue"] = next_token
+    else:
+        items = informer.list(namespace, predicate)
+
+    kind = informer.kind
+    return {
+        "status": 200,
+        "response": {
+            "kind": kind.list_kind,
+            "apiVersion": kind.api_version,
+            "metadata": metadata,
+            "items": items,
+        },
+        "cache": informer.status(),
+    }
+
+async def _list_pages(cluster_config: Dict[str, Any], path: str, params: Dict[str, Any],
+                      headers: Optional[Dict[str, str]] = None):
+    """continue 토큰을 따라가며 목록을 한 페이지씩 조회"""
+    params = {**params, "limit": params.get("limit") or settings.LIST_PAGE_SIZE}
+    while True:
+        page = (await _k8s_get(cluster_config, path, params, headers))["response"]
+        yield page
+        continue_token = page.get("metadata", {}).get("continue")
+        if not continue_token:
+            return
+        params["continue"] = continue_token
+
+async def _stream_list(cluster_config: Dict[str, Any], kind: ResourceKind, namespace: Optional[str],
+                       query: ListQuery, informer=None, transform: Optional[Transform] = None,
+                       headers: Optional[Dict[str, str]] = None) -> StreamingResponse:
+    """목록 스트리밍 응답 (한 번에 한 페이지만 메모리에 유지)"""
+    if informer is not None:
+        async def _informer_pages():
+            yield {"metadata": {"resourceVersion": informer.resource_version},
+                   "items": informer.list(namespace, query.predicate())}
+        pages = _informer_pages()
+    else:
+        pages = _list_pages(cluster_config, resource_path(kind, namespace), query.params(), headers)
+
+    # 첫 페이지를 미리 받아 API 서버 오류는 일반 오류 응답으로 반환
+    first = await pages.__anext__()
+    if query.stream == "ndjson":
+        return StreamingResponse(ndjson_stream(first, pages, transform), media_type="application/x-ndjson")
+    return StreamingResponse(json_list_stream(kind, first, pages, transform), media_type="application/json")
+
+def _fan_out_clusters(cluster_id: Optional[str]) -> Optional[List[str]]:
+    """멀티 클러스터 조회 대상 ("*" 또는 쉼표로 구분한 목록, 단일 클러스터면 None)"""
+    if cluster_id == "*":
+        return list(cluster_manager.store.clusters())
+    if cluster_id is not None and "," in cluster_id:
+        return [cid.strip() for cid in cluster_id.split(",") if cid.strip()]
+    return None
+
+def _item_sort_key(item: Dict[str, Any]):
+    """병합 결과 정렬 기준 (namespace, name, cluster_id) - 요약 형식도 지원"""
+    metadata = item.get("metadata") or {}
+    return (
+        metadata.get("namespace") or item.get("namespace") or "",
+        metadata.get("name") or item.get("name") or "",
+        item.get("cluster_id", ""),
+    )
+
+async def _fan_out(kind: str, cluster_ids: List[str], namespace: Optional[str], name: Optional[str],
+                   query: Optional[ListQuery], view: Optional[ViewQuery]) -> Dict[str, Any]:
+    """여러 클러스터를 동시에 조회하여 병합 (클러스터별 제한 시간, 실패한 클러스터는 오류 항목으로 표시)"""
+    if query is not None and (query.stream or query.continue_token):
+        raise HTTPException(status_code=400, detail="멀티 클러스터 조회는 stream/continue를 지원하지 않습니다.")
+    if view is not None and view.view == "table":
+        raise HTTPException(status_code=400, detail="멀티 클러스터 조회는 view=table을 지원하지 않습니다.")
+    timeout = (query.cluster_timeout if query is not None else None) or settings.FANOUT_CLUSTER_TIMEOUT
+
+    async def _one(cid: str):
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(_read_resource(kind, cid, namespace, name, query, view), timeout)
+        except asyncio.TimeoutError:
+            return cid, [], {"status": "error", "code": 504, "detail": f"{timeout}초 내에 응답하지 않았습니다"}
+        except HTTPException as e:
+            return cid, [], {"status": "error", "code": e.status_code, "detail": e.detail}
+        except ValueError as e:
+            return cid, [], {"status": "error", "code": 404, "detail": str(e)}
+        except Exception as e:
+            return cid, [], {"status": "error", "code": 500, "detail": repr(e)}
+
+        body = result["response"]
+        items = (body.get("items") or []) if name is None else [body]
+        info: Dict[str, Any] = {"status": "ok", "items": len(items),
+                                "duration": round(time.monotonic() - started, 3)}
+        if name is None and body.get("metadata", {}).get("continue"):
+            info["continue"] = body["metadata"]["continue"]
+        if "cache" in result:
+            info["cache"] = result["cache"]
+        return cid, [{**item, "cluster_id": cid} for item in items], info
+
+    results = await asyncio.gather(*(_one(cid) for cid in cluster_ids))
+    clusters = {cid: info for cid, _, info in results}
+    if results and not any(info["status"] == "ok" for info in clusters.values()):
+        raise HTTPException(status_code=502, detail={"message": "모든 클러스터 조회에 실패했습니다.", "clusters": clusters})
+
+    items = sorted((item for _, cluster_items, _ in results for item in cluster_items), key=_item_sort_key)
+    resource_kind = RESOURCE_KINDS[kind]
+    return {
+        "status": 200,
+        "response": {"kind": resource_kind.list_kind, "apiVersion": resource_kind.api_version, "items": items},
+        "clusters": clusters,
+    }
+
+async def _read_resource(kind: str, cluster_id: Optional[str], namespace: Optional[str] = None,
+                         name: Optional[str] = None, query: Optional[ListQuery] = None,
+                         view: Optional[ViewQuery] = None):
+    """조회 API 공통 함수 (인포머가 동기화되어 있으면 로컬 저장소에서 응답)"""
+    cluster_ids = _fan_out_clusters(cluster_id)
+    if cluster_ids is not None:
+        return await _fan_out(kind, cluster_ids, namespace, name, query, view)
+
+    cluster_config = get_cluster_config(cluster_id)
+    resource_kind = RESOURCE_KINDS[kind]
+    is_list = name is None
+    transform = view.transform(kind) if view is not None else None
+    headers = view.headers(is_list) if view is not None else None
+    table = view is not None and view.view == "table"
+
+    # Table 형식은 API 서버만 만들 수 있으므로 인포머를 사용하지 않음
+    informer = None if table else informers.synced(cluster_config['cluster_id'], kind)
+
+    if query is not None and query.stream:
+        if table:
+            raise HTTPException(status_code=400, detail="view=table은 스트리밍을 지원하지 않습니다.")
+        return await _stream_list(cluster_config, resource_kind, namespace, query, informer, transform, headers)
+
+    if informer is not None:
+        response = _informer_response(informer, namespace, name, query)
+        if response is not None:
+            return _apply_transform(response, transform, is_list)
+
+    # 인포머가 없거나 아직 반영되지 않은 오브젝트는 API 서버에서 직접 조회
+    params = query.params() if query is not None else None
+    path = resource_path(resource_kind, namespace, name)
+    if view is not None and view.protobuf(kind):
+        return await _k8s_get_protobuf(cluster_config, kind, path, params, is_list, transform, view.cache_key())
+    response = await _k8s_get(cluster_config, path, params, headers)
+    return _apply_transform(response, transform, is_list)
+
+# API 서버 응답 본문에서 첫 resourceVersion (목록/오브젝트 모두 metadata가 항목/본문보다 앞에 있음)
+_RESOURCE_VERSION = re.compile(rb'"resourceVersion"\s*:\s*"([^"]*)"')
+
+def _raw_resource_version(raw: bytes) -> Optional[str]:
+    match = _RESOURCE_VERSION.search(raw)
+    return match.group(1).decode() if match else None
+
+def _cached_response(body: Optional[bytes], etag: str, cond: Conditional) -> Response:
+    """ETag가 일치하면 본문 없이 304, 아니면 인코딩된 본문 반환"""
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if body is None or cond.matches(etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _informer_etag(informer, namespace: Optional[str], name: Optional[str], query: Optional[ListQuery],
+                   tag: str) -> Optional[str]:
+    """인포머 저장소의 resourceVersion으로 응답을 만들지 않고 ETag 계산"""
+    if name is not None:
+        obj = informer.get(namespace, name)
+        return make_etag(obj.get("metadata", {}).get("resourceVersion"), tag) if obj is not None else None
+    if query is not None and query.continue_token:
+        # API 서버가 발급한 토큰이면 API 서버에서 조회하므로 미리 계산하지 않음
+        return None
+    return make_etag(informer.resource_version, tag)
+
+async def _serve_resource(cond: Conditional, kind: str, cluster_id: Optional[str], namespace: Optional[str] = None,
+                          name: Optional[str] = None, query: Optional[ListQuery] = None,
+                          view: Optional[ViewQuery] = None):
+    """조회 API 응답 (resourceVersion 기반 ETag, If-None-Match 시 304, 인코딩된 응답 캐시)"""
+    if (query is not None and query.stream) or _fan_out_clusters(cluster_id) is not None:
+        return await _read_resource(kind, cluster_id, namespace, name, query, view)
+
+    cluster_config = get_cluster_config(cluster_id)
+    key = (cluster_config['cluster_id'], kind, namespace, name,
+           query.cache_key() if query is not None else (), view.cache_key() if view is not None else ())
+    tag = representation_tag(key)
+
+    if shared_cache is not None and shared_cache.follower:
+        try:
+            return await _serve_from_owner(cond, key, "resource", {
+                "kind": kind, "cluster_id": cluster_config['cluster_id'], "namespace": namespace, "name": name,
+                "query": vars(query) if query is not None else None,
+                "view": {"view": view.view, "fields": view.fields} if view is not None else None,
+            })
+        except SharedCacheUnavailable:
+            # 소유자 전환 중에는 이 워커가 직접 처리
+            pass
+
+    informer = None if view is not None and view.view == "table" else informers.synced(cluster_config['cluster_id'], kind)
+    etag = _informer_etag(informer, namespace, name, query, tag) if informer is not None else None
+    if etag is not None:
+        # 인포머 저장소가 바뀌지 않았으면 응답을 만들 필요 없음
+        if cond.matches(etag):
+            return _cached_response(None, etag, cond)
+        cached = response_cache.get(key, etag)
+    else:
+        cached = response_cache.get(key)
+    if cached is not None:
+        return _cached_response(cached.body, cached.etag, cond)
+
+    if informer is None and (view is None or view.transform(kind) is None):
+        # 변환할 필요가 없으면 API 서버 응답 본문을 디코딩하지 않고 그대로 감싸서 전달
+        raw = await _k8s_get_raw(cluster_config, resource_path(RESOURCE_KINDS[kind], namespace, name),
+                                 query.params() if query is not None else None,
+                                 view.headers(name is None) if view is not None else None)
+        body = b'{"status":200,"response":' + raw.strip() + b'}'
+        etag = make_etag(_raw_resource_version(raw), tag)
+    else:
+        result = await _read_resource(kind, cluster_config['cluster_id'], namespace, name, query, view)
+        body = fastjson.dumps(result)
+        if etag is None:
+            metadata = result["response"].get("metadata") or {}
+            etag = make_etag(metadata.get("resourceVersion"), tag)
+    if etag is None:
+        # 요약 등으로 resourceVersion이 없으면 본문 해시 사용
+        etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+    response_cache.put(key, etag, body)
+    return _cached_response(body, etag, cond)
+
 @app.get("/namespaces")
-def get_namespaces(cluster_id: Optional[str] = None):
+async def get_namespaces(cluster_id: Optional[str] = None, query: ListQuery = Depends(),
+                         view: ViewQuery = Depends(), cond: Conditional = Depends()):
     """모든 네임스페이스 조회"""
-    cluster_config = get_cluster_config(cluster_id)
-    url = f"{cluster_config['api_url']}/api/v1/namespaces"
-    r = requests.get(url, headers=cluster_config['headers'], verify=cluster_config['verify_ssl'])
-    if r.status_code != 200:
-        raise HTTPException(status_code=r.status_code, detail=r.text)
-    return {"status": r.status_code, "response": r.json()}
+    return await _serve_resource(cond, "namespaces", cluster_id, query=query, view=view)
 
 @app.get("/namespaces/{namespace}")
-def get_namespace(namespace: str, cluster_id: Optional[str] = None):
+async def get_namespace(namespace: str, cluster_id: Optional[str] = None, view: ViewQuery = Depends(),
+                        cond: Conditional = Depends()):
     """특정 네임스페이스 조회"""
-    cluster_config = get_cluster_config(cluster_id)
-    url = f"{cluster_config['api_url']}/api/v1/namespaces/{namespace}"
-    r = requests.get(url, headers=cluster_config['headers'], verify=cluster_config['verify_ssl'])
-    if r.status_code != 200:
-        raise HTTPException(status_code=r.status_code, detail=r.text)
-    return {"status": r.status_code, "response": r.json()}
+    return await _serve_resource(cond, "namespaces", cluster_id, name=namespace, view=view)
 
 @app.get("/pods")
-def get_all_pods(cluster_id: Optional[str] = None):
+async def get_all_pods(cluster_id: Optional[str] = None, query: ListQuery = Depends(),
+                       view: ViewQuery = Depends(), cond: Conditional = Depends()):
     """모든 Pod 조회"""
-    cluster_config = get_cluster_config(cluster_id)
-    url = f"{cluster_config['api_url']}/api/v1/pods"
-    r = requests.get(url, headers=cluster_config['headers'], verify=cluster_config['verify_ssl'])
-    if r.status_code != 200:
-        raise HTTPException(status_code=r.status_code, detail=r.text)
-    return {"status": r.status_code, "response": r.json()}
+    return await _serve_resource(cond, "pods", cluster_id, query=query, view=view)
 
 @app.get("/pods/{namespace}")
-def get_pods_in_namespace(namespace: str, cluster_id: Optional[str] = None):
+async def get_pods_in_namespace(namespace: str, cluster_id: Optional[str] = None, query: ListQuery = Depends(),
+                                view: ViewQuery = Depends(), cond: Conditional = Depends()):
     """특정 네임스페이스의 Pod 조회"""
-    cluster_config = get_cluster_config(cluster_id)
-    url = f"{cluster_config['api_url']}/api/v1/namespaces/{namespace}/pods"
-    r = requests.get(url, headers=cluster_config['headers'], verify=cluster_config['verify_ssl'])
-    if r.status_code != 200:
-        raise HTTPException(status_code=r.status_code, detail=r.text)
-    return {"status": r.status_code, "response": r.json()}
+    return await _serve_resource(cond, "pods", cluster_id, namespace, query=query, view=view)
 
 @app.get("/pods/{namespace}/{pod}")
-def get_pod(namespace: str, pod: str, cluster_id: Optional[str] = None):
+async def get_pod(namespace: str, pod: str, cluster_id: Optional[str] = None, view: ViewQuery = Depends(),
+                  cond: Conditional = Depends()):
     """특정 Pod 조회"""
-    cluster_config = get_cluster_config(cluster_id)
-    url = f"{cluster_config['api_url']}/api/v1/namespaces/{namespace}/pods/{pod}"
-    r = requests.get(url, headers=cluster_config['headers'], verify=cluster_config['verify_ssl'])
-    if r.status_code != 200:
-        raise HTTPException(status_code=r.status_code, detail=r.text)
-    return {"status": r.status_code, "response": r.json()}
+    return await _serve_resource(cond, "pods", cluster_id, namespace, pod, view=view)
 
 @app.get("/deployments")
-def get_all_deployments(cluster_id: Optional[str] = None):
+async def get_all_deployments(cluster_id: Optional[str] = None, query: ListQuery = Depends(),
+                              view: ViewQuery = Depends(), cond: Conditional = Depends()):
     """모든 Deployment 조회"""
-    cluster_config = get_cluster_config(cluster_id)
-    url = f"{cluster_config['api_url']}/apis/apps/v1/deployments"
-    r = requests.get(url, headers=cluster_config['headers'], verify=cluster_config['verify_ssl'])
-    if r.status_code != 200:
-        raise HTTPException(status_code=r.status_code, detail=r.text)
-    return {"status": r.status_code, "response": r.json()}
+    return await _serve_resource(cond, "deployments", cluster_id, query=query, view=view)
 
 @app.get("/deployments/{namespace}")
-def get_deployments_in_namespace(namespace: str, cluster_id: Optional[str] = None):
+async def get_deployments_in_namespace(namespace: str, cluster_id: Optional[str] = None, query: ListQuery = Depends(),
+                                       view: ViewQuery = Depends(), cond: Conditional = Depends()):
     """특정 네임스페이스의 Deployment 조회"""
-    cluster_config = get_cluster_config(cluster_id)
-    url = f"{cluster_config['api_url']}/apis/apps/v1/namespaces/{namespace}/deployments"
-    r = requests.get(url, headers=cluster_config['headers'], verify=cluster_config['verify_ssl'])
-    if r.status_code != 200:
-        raise HTTPException(status_code=r.status_code, detail=r.text)
-    return {"status": r.status_code, "response": r.json()}
+    return await _serve_resource(cond, "deployments", cluster_id, namespace, query=query, view=view)
 
 @app.get("/deployments/{namespace}/{deployment}")
-def get_deployment(namespace: str, deployment: str, cluster_id: Optional[str] = None):
+async def get_deployment(namespace: str, deployment: str, cluster_id: Optional[str] = None, view: ViewQuery = Depends(),
+                         cond: Conditional = Depends()):
     """특정 Deployment 조회"""
-    cluster_config = get_cluster_config(cluster_id)
-    url = f"{cluster_config['api_url']}/apis/apps/v1/namespaces/{namespace}/deployments/{deployment}"
-    r = requests.get(url, headers=cluster_config['headers'], verify=cluster_config['verify_ssl'])
-    if r.status_code != 200:
-        raise HTTPException(status_code=r.status_code, detail=r.text)
-    return {"status": r.status_code, "response": r.json()}
+    return await _serve_resource(cond, "deployments", cluster_id, namespace, deployment, view=view)
 
 @app.get("/daemonsets")
-def get_all_daemonsets(cluster_id: Optional[str] = None):
+async def get_all_daemonsets(cluster_id: Optional[str] = None, query: ListQuery = Depends(),
+                             view: ViewQuery = Depends(), cond: Conditional = Depends()):
     """모든 DaemonSet 조회"""
-    cluster_config = get_cluster_config(cluster_id)
-    url = f"{cluster_config['api_url']}/apis/apps/v1/daemonsets"
-    r = requests.get(url, headers=cluster_config['headers'], verify=cluster_config['verify_ssl'])
-    if r.status_code != 200:
-        raise HTTPException(status_code=r.status_code, detail=r.text)
-    return {"status": r.status_code, "response": r.json()}
+    return await _serve_resource(cond, "daemonsets", cluster_id, query=query, view=view)
 
 @app.get("/daemonsets/{namespace}")
-def get_daemonsets_in_namespace(namespace: str, cluster_id: Optional[str] = None):
+async def get_daemonsets_in_namespace(namespace: str, cluster_id: Optional[str] = None, query: ListQuery = Depends(),
+                                      view: ViewQuery = Depends(), cond: Conditional = Depends()):
     """특정 네임스페이스의 DaemonSet 조회"""
-    cluster_config = get_cluster_config(cluster_id)
-    url = f"{cluster_config['api_url']}/apis/apps/v1/namespaces/{namespace}/daemonsets"
-    r = requests.get(url, headers=cluster_config['headers'], verify=cluster_config['verify_ssl'])
-    if r.status_code != 200:
-        raise HTTPException(status_code=r.status_code, detail=r.text)
-    return {"status": r.status_code, "response": r.json()}
+    return await _serve_resource(cond, "daemonsets", cluster_id, namespace, query=query, view=view)
 
 @app.get("/daemonsets/{namespace}/{daemonset}")
-def get_daemonset(namespace: str, daemonset: str, cluster_id: Optional[str] = None):
+async def get_daemonset(namespace: str, daemonset: str, cluster_id: Optional[str] = None, view: ViewQuery = Depends(),
+                        cond: Conditional = Depends()):
     """특정 DaemonSet 조회"""
-    cluster_config = get_cluster_config(cluster_id)
-    url = f"{cluster_config['api_url']}/apis/apps/v1/namespaces/{namespace}/daemonsets/{daemonset}"
-    r = requests.get(url, headers=cluster_config['headers'], verify=cluster_config['verify_ssl'])
-    if r.status_code != 200:
-        raise HTTPException(status_code=r.status_code, detail=r.text)
-    return {"status": r.status_code, "response": r.json()}
+    return await _serve_resource(cond, "daemonsets", cluster_id, namespace, daemonset, view=view)
 
 @app.get("/statefulsets")
-def get_all_statefulsets(cluster_id: Optional[str] = None):
+async def get_all_statefulsets(cluster_id: Optional[str] = None, query: ListQuery = Depends(),
+                               view: ViewQuery = Depends(), cond: Conditional = Depends()):
     """모든 StatefulSet 조회"""
-    cluster_config = get_cluster_config(cluster_id)
-    url = f"{cluster_config['api_url']}/apis/apps/v1/statefulsets"
-    r = requests.get(url, headers=cluster_config['headers'], verify=cluster_config['verify_ssl'])
-    if r.status_code != 200:
-        raise HTTPException(status_code=r.status_code, detail=r.text)
-    return {"status": r.status_code, "response": r.json()}
+    return await _serve_resource(cond, "statefulsets", cluster_id, query=query, view=view)
 
 @app.get("/statefulsets/{namespace}")
-def get_statefulsets_in_namespace(namespace: str, cluster_id: Optional[str] = None):
+async def get_statefulsets_in_namespace(namespace: str, cluster_id: Optional[str] = None, query: ListQuery = Depends(),
+                                        view: ViewQuery = Depends(), cond: Conditional = Depends()):
     """특정 네임스페이스의 StatefulSet 조회"""
-    cluster_config = get_cluster_config(cluster_id)
-    url = f"{cluster_config['api_url']}/apis/apps/v1/namespaces/{namespace}/statefulsets"
-    r = requests.get(url, headers=cluster_config['headers'], verify=cluster_config['verify_ssl'])
-    if r.status_code != 200:
-        raise HTTPException(status_code=r.status_code, detail=r.text)
-    return {"status": r.status_code, "response": r.json()}
+    return await _serve_resource(cond, "statefulsets", cluster_id, namespace, query=query, view=view)
 
 @app.get("/statefulsets/{namespace}/{statefulset}")
-def get_statefulset(namespace: str, statefulset: str, cluster_id: Optional[str] = None):
+async def get_statefulset(namespace: str, statefulset: str, cluster_id: Optional[str] = None, view: ViewQuery = Depends(),
+                          cond: Conditional = Depends()):
     """특정 StatefulSet 조회"""
+    return await _serve_resource(cond, "statefulsets", cluster_id, namespace, statefulset, view=view)
+
+# ==================== 요약 API ====================
+
+async def _summary_from_apiserver(cluster_config: Dict[str, Any], namespace: Optional[str]):
+    """인포머가 없으면 Pod/워크로드 목록을 한 번 조회해 요약 계산"""
+    resources = ("pods",) + WORKLOAD_RESOURCES
+    if settings.K8S_PROTOBUF:
+        # 요약 계산에 필요한 필드만 디코딩
+        fetches = (_k8s_get_protobuf(cluster_config, resource, resource_path(RESOURCE_KINDS[resource], namespace),
+                                       None, True) for resource in resources)
+    else:
+        fetches = (_k8s_get(cluster_config, resource_path(RESOURCE_KINDS[resource], namespace))
+                     for resource in resources)
+    responses = await asyncio.gather(*fetches)
+    items = {resource: response["response"].get("items") or [] for resource, response in zip(resources, responses)}
+    pods = items.pop("pods")
+    return summarize(cluster_config['cluster_id'], pods, items)
+
+@app.get("/summary")
+async def get_summary(cluster_id: Optional[str] = None, namespace: Optional[str] = None,
+                      cond: Conditional = Depends()):
+    """클러스터 요약 (Pod phase별 수, 재시작 합계, 준비되지 않은 Pod/워크로드, 네임스페이스별 합계)
+
+    Pod 인포머가 있으면 변경 이벤트로 증분 갱신되는 집계를, 없으면 목록을 한 번 조회해 계산한 결과를 캐시해 사용합니다.
+    """
+    return await _serve_summary(cond, cluster_id, namespace)
+
+async def _serve_summary(cond: Conditional, cluster_id: Optional[str], namespace: Optional[str]):
+    """요약 응답 (요약 버전 기반 ETag, 인코딩된 응답 캐시)"""
     cluster_config = get_cluster_config(cluster_id)
-    url = f"{cluster_config['api_url']}/apis/apps/v1/namespaces/{namespace}/statefulsets/{statefulset}"
-    r = requests.get(url, headers=cluster_config['headers'], verify=cluster_config['verify_ssl'])
+    key = (cluster_config['cluster_id'], "summary", namespace)
+    tag = representation_tag(key)
+
+    if shared_cache is not None and shared_cache.follower:
+        try:
+            return await _serve_from_owner(cond, key, "summary",
+                                           {"cluster_id": cluster_config['cluster_id'], "namespace": namespace})
+        except SharedCacheUnavailable:
+            pass
+
+    summary = summaries.get(cluster_config['cluster_id'])
+    if summary is not None:
+        etag = make_etag(str(summary.version), tag)
+        if cond.matches(etag):
+            return _cached_response(None, etag, cond)
+        cached = response_cache.get(key, etag)
+        source = "informer"
+    else:
+        etag = None
+        cached = response_cache.get(key)
+        source = "apiserver"
+    if cached is not None:
+        return _cached_response(cached.body, cached.etag, cond)
+
+    if summary is None:
+        summary = await _summary_from_apiserver(cluster_config, namespace)
+    body = fastjson.dumps({"status": 200, "source": source,
+                           "response": summary.to_dict(namespace, settings.SUMMARY_MAX_ITEMS)})
+    etag = etag or f'W/"{hashlib.sha1(body).hexdigest()}"'
+    response_cache.put(key, etag, body)
+    return _cached_response(body, etag, cond)
+
+# ==================== 로그 API ====================
+
+class LogQuery:
+    """로그 조회 옵션 (API 서버 pods/log 파라미터)"""
+
+    def __init__(
+        self,
+        container: Optional[str] = Query(None, description="컨테이너 이름 (없으면 모든 컨테이너)"),
+        tail_lines: Optional[int] = Query(None, ge=0, description="컨테이너별 마지막 N줄부터"),
+        since_seconds: Optional[int] = Query(None, ge=1, description="최근 N초 동안의 로그"),
+        since_time: Optional[str] = Query(None, description="이 시각(RFC3339) 이후의 로그"),
+        follow: bool = Query(False, description="새 로그를 계속 전달"),
+        timestamps: bool = Query(False, description="줄마다 타임스탬프 포함"),
+        previous: bool = Query(False, description="재시작 전 컨테이너의 로그"),
+        limit_bytes: Optional[int] = Query(None, ge=1, description="컨테이너별 최대 바이트"),
+        prefix: Optional[bool] = Query(None, description="줄마다 [pod/container] 접두어 (여러 컨테이너면 기본 true)"),
+    ):
+        if since_seconds is not None and since_time:
+            raise HTTPException(status_code=400, detail="since_seconds와 since_time은 함께 사용할 수 없습니다.")
+        self.container = container
+        self.tail_lines = tail_lines
+        self.since_seconds = since_seconds
+        self.since_time = since_time
+        self.follow = follow
+        self.timestamps = timestamps
+        self.previous = previous
+        self.limit_bytes = limit_bytes
+        self.prefix = prefix
+
+    def params(self, container: Optional[str]) -> Dict[str, Any]:
+        return log_params(container, self.tail_lines, self.since_seconds, self.since_time, self.follow,
+                          self.timestamps, self.previous, self.limit_bytes)
+
+async def _open_log(cluster_config: Dict[str, Any], target: LogTarget, query: LogQuery) -> httpx.Response:
+    """컨테이너 로그 스트림 열기 (헤더까지만 받음, API 서버 오류는 HTTPException)"""
+    kwargs: Dict[str, Any] = {}
+    if query.follow:
+        # 새 로그가 없는 동안에도 연결을 유지해야 하므로 읽기 제한 시간 없음
+        kwargs["timeout"] = httpx.Timeout(cluster_config.get('connect_timeout') or settings.K8S_CONNECT_TIMEOUT,
+                                          read=None)
+    r = await _k8s_request("GET", cluster_config, target.path, stream=True, params=query.params(target.container),
+                           **kwargs)
     if r.status_code != 200:
-        raise HTTPException(status_code=r.status_code, detail=r.text)
-    return {"status": r.status_code, "response": r.json()}
+        await r.aread()
+        await r.aclose()
+        try:
+            detail = r.json().get("message") or r.text
+        except ValueError:
+            detail = r.text
+        raise HTTPException(status_code=r.status_code, detail=detail)
+    return r
+
+async def _single_chunk(chunk: bytes):
+    yield chunk
+
+async def _stream_logs(cluster_config: Dict[str, Any], targets: List[LogTarget], query: LogQuery) -> StreamingResponse:
+    """대상 컨테이너 로그를 모두 연 뒤 하나의 text/plain 스트림으로 전달
+
+    대상이 하나면 API 서버 응답을 그대로 흘려보내고, 여러 개면 제한된 큐로 합칩니다.
+    일부 컨테이너만 실패하면 해당 오류를 로그 줄로 표시하고, 모두 실패하면 오류 응답을 반환합니다.
+    """
+    if len(targets) > settings.LOG_MAX_STREAMS:
+        raise HTTPException(status_code=400, detail=f"로그 대상 컨테이너가 {len(targets)}개로 최대 "
+                                                    f"{settings.LOG_MAX_STREAMS}개를 넘습니다. container를 지정하세요.")
+    prefix = query.prefix if query.prefix is not None else len(targets) > 1
+    opened = await asyncio.gather(*(_open_log(cluster_config, target, query) for target in targets),
+                                  return_exceptions=True)
+    errors = [result for result in opened if isinstance(result, BaseException)]
+    unexpected = [error for error in errors if not isinstance(error, HTTPException)]
+    if unexpected or len(errors) == len(opened):
+        for result in opened:
+            if isinstance(result, httpx.Response):
+                await result.aclose()
+        raise (unexpected or errors)[0]
+
+    streams = []
+    for target, result in zip(targets, opened):
+        if isinstance(result, HTTPException):
+            line = f"로그를 가져올 수 없습니다 ({result.status_code}): {result.detail}\n".encode("utf-8")
+            streams.append(_single_chunk(target.prefix + line))
+        else:
+            streams.append(response_stream(result, target.prefix if prefix else None))
+    body = streams[0] if len(streams) == 1 else multiplex(streams, settings.LOG_QUEUE_SIZE)
+    return StreamingResponse(body, media_type="text/plain; charset=utf-8", headers={"Cache-Control": "no-cache"})
+
+async def _logs(kind: str, namespace: str, name: str, cluster_id: Optional[str], query: LogQuery) -> Response:
+    """로그 스트리밍 (다른 워커는 소유자 워커를 거쳐 전달, 소유자에 연결할 수 없으면 직접 조회)"""
+    if shared_cache is not None and shared_cache.follower:
+        args = {"kind": kind, "namespace": namespace, "name": name, "cluster_id": cluster_id, "query": vars(query)}
+        lost = "\n소유자 워커 연결이 끊어져 로그 전달을 종료합니다. 다시 요청하세요.\n".encode("utf-8")
+        try:
+            return await _stream_from_owner("logs", args, "text/plain; charset=utf-8", lost)
+        except SharedCacheUnavailable:
+            pass
+    if kind == "pods":
+        return await _pod_logs(namespace, name, cluster_id, query)
+    return await _workload_logs(kind, namespace, name, cluster_id, query)
+
+async def _pod_logs(namespace: str, pod: str, cluster_id: Optional[str], query: LogQuery) -> StreamingResponse:
+    """Pod 로그 (container가 없으면 Pod의 모든 컨테이너)"""
+    cluster_config = get_cluster_config(cluster_id)
+    if query.container:
+        targets = [LogTarget(namespace, pod, query.container)]
+    else:
+        obj = (await _k8s_get(cluster_config, resource_path(RESOURCE_KINDS["pods"], namespace, pod)))["response"]
+        targets = log_targets([obj])
+    return await _stream_logs(cluster_config, targets, query)
+
+@app.get("/pods/{namespace}/{pod}/logs")
+async def get_pod_logs(namespace: str, pod: str, cluster_id: Optional[str] = None, query: LogQuery = Depends()):
+    """Pod 로그 스트리밍 (container가 없으면 Pod의 모든 컨테이너)"""
+    return await _logs("pods", namespace, pod, cluster_id, query)
+
+async def _workload_logs(kind: str, namespace: str, name: str, cluster_id: Optional[str],
+                         query: LogQuery) -> StreamingResponse:
+    """워크로드 셀렉터에 해당하는 Pod들의 로그 (조회 시점의 Pod 기준)"""
+    cluster_config = get_cluster_config(cluster_id)
+    workload = (await _k8s_get(cluster_config, resource_path(RESOURCE_KINDS[kind], namespace, name)))["response"]
+    try:
+        selector = selector_string(workload.get("spec", {}).get("selector"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not selector:
+        raise HTTPException(status_code=400, detail=f"{name}에 Pod 셀렉터가 없습니다.")
+    pods = (await _k8s_get(cluster_config, resource_path(RESOURCE_KINDS["pods"], namespace),
+                           {"labelSelector": selector}))["response"].get("items") or []
+    targets = log_targets(pods, query.container)
+    if not targets:
+        raise HTTPException(status_code=404, detail=f"{name}의 로그를 가져올 Pod가 없습니다.")
+    return await _stream_logs(cluster_config, targets, query)
+
+@app.get("/deployments/{namespace}/{deployment}/logs")
+async def get_deployment_logs(namespace: str, deployment: str, cluster_id: Optional[str] = None,
+                              query: LogQuery = Depends()):
+    """Deployment의 모든 Pod 로그 스트리밍"""
+    return await _logs("deployments", namespace, deployment, cluster_id, query)
+
+@app.get("/daemonsets/{namespace}/{daemonset}/logs")
+async def get_daemonset_logs(namespace: str, daemonset: str, cluster_id: Optional[str] = None,
+                             query: LogQuery = Depends()):
+    """DaemonSet의 모든 Pod 로그 스트리밍"""
+    return await _logs("daemonsets", namespace, daemonset, cluster_id, query)
+
+@app.get("/statefulsets/{namespace}/{statefulset}/logs")
+async def get_statefulset_logs(namespace: str, statefulset: str, cluster_id: Optional[str] = None,
+                               query: LogQuery = Depends()):
+    """StatefulSet의 모든 Pod 로그 스트리밍"""
+    return await _logs("statefulsets", namespace, statefulset, cluster_id, query)
+
+# ==================== 일괄 조회 API ====================
+
+async def _batch_item(query: BatchQuery, item_id: str) -> bytes:
+    """일괄 조회 항목 하나 - 조회 API와 같은 경로(캐시/인포머/원본 전달)를 거친 본문에 id/etag를 붙여 반환"""
+    prefix = b'{"id":' + fastjson.dumps(item_id)
+    try:
+        if query.kind not in RESOURCE_KINDS:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 리소스 종류입니다: {query.kind}")
+        namespaced = RESOURCE_KINDS[query.kind].namespaced
+        if namespaced and query.name is not None and query.namespace is None:
+            raise HTTPException(status_code=400, detail="name을 지정하려면 namespace가 필요합니다.")
+        list_query = None
+        if query.name is None:
+            list_query = ListQuery(label_selector=query.label_selector, field_selector=query.field_selector,
+                                   limit=query.limit, continue_token=query.continue_token, stream=None,
+                                   cluster_timeout=query.cluster_timeout)
+        view = ViewQuery(view=query.view, fields=query.fields)
+        result = await _serve_resource(Conditional(query.if_none_match), query.kind, query.cluster_id,
+                                       query.namespace if namespaced else None, query.name, list_query, view)
+    except HTTPException as e:
+        return prefix + b',"status":' + str(e.status_code).encode() + b',"detail":' + fastjson.dumps(e.detail) + b'}'
+    except ValueError as e:
+        return prefix + b',"status":404,"detail":' + fastjson.dumps(str(e)) + b'}'
+
+    if not isinstance(result, Response):
+        # 멀티 클러스터 조회는 dict 결과
+        return prefix + b',' + fastjson.dumps(result)[1:]
+    etag = b',"etag":' + fastjson.dumps(result.headers["etag"])
+    if result.status_code == 304:
+        return prefix + b',"status":304' + etag + b'}'
+    # 본문은 {"status":200,"response":...} - 다시 인코딩하지 않고 앞에 필드만 추가
+    return prefix + etag + b',' + result.body[1:]
+
+@app.post("/batch")
+async def batch_query(request: BatchQueryRequest):
+    """여러 조회를 한 번에 동시 실행 (항목별 status, 실패한 항목이 있어도 전체는 200)"""
+    semaphore = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+
+    async def _one(index: int, query: BatchQuery) -> bytes:
+        async with semaphore:
+            return await _batch_item(query, query.id if query.id is not None else str(index))
+
+    items = await asyncio.gather(*(_one(index, query) for index, query in enumerate(request.queries)))
+    return Response(content=b'{"status":200,"results":[' + b",".join(items) + b']}', media_type="application/json")
 
 # ==================== 삭제 API ====================
 
 @app.delete("/pods/{namespace}/{pod}")
-def delete_pod(namespace: str, pod: str, cluster_id: Optional[str] = None):
+async def delete_pod(namespace: str, pod: str, cluster_id: Optional[str] = None):
     """Pod 삭제"""
     cluster_config = get_cluster_config(cluster_id)
-    url = f"{cluster_config['api_url']}/api/v1/namespaces/{namespace}/pods/{pod}"
-    r = requests.delete(url, headers=cluster_config['headers'], verify=cluster_config['verify_ssl'])
-    return {"status": r.status_code, "response": r.json()}
+    with upstream_wait():
+        r = await _k8s_request("DELETE", cluster_config, f"/api/v1/namespaces/{namespace}/pods/{pod}")
+    if r.status_code not in (200, 202):
+        raise HTTPException(status_code=r.status_code, detail=_status_message(r))
+    _invalidate(cluster_config['cluster_id'], "pods")
+    _invalidate(cluster_config['cluster_id'], "summary")
+    return {"status": r.status_code, "response": fastjson.loads(r.content)}
+
+def _status_message(r: httpx.Response) -> str:
+    """API 서버 오류 응답(Status)의 message (JSON이 아니면 본문 그대로)"""
+    try:
+        return fastjson.loads(r.content).get("message") or r.reason_phrase
+    except (ValueError, AttributeError):
+        return r.text or r.reason_phrase
+
+def _pod_reasons(pod: Dict[str, Any]) -> set:
+    """Pod status.reason과 컨테이너 대기/종료 사유"""
+    status = pod.get("status") or {}
+    reasons = {status.get("reason")}
+    for container in (status.get("initContainerStatuses") or []) + (status.get("containerStatuses") or []):
+        state = container.get("state") or {}
+        reasons.add((state.get("waiting") or {}).get("reason"))
+        reasons.add((state.get("terminated") or {}).get("reason"))
+    reasons.discard(None)
+    return reasons
+
+async def _bulk_delete_targets(cluster_config: Dict[str, Any], request: BulkPodDeleteRequest) -> List[Dict[str, Any]]:
+    """삭제 대상 Pod 조회 (namespace, name, uid)"""
+    if request.pods:
+        return [{"namespace": request.namespace, "name": name, "uid": None} for name in request.pods]
+    params = {"labelSelector": request.label_selector, "fieldSelector": request.field_selector}
+    targets = []
+    async for page in _list_pages(cluster_config, resource_path(RESOURCE_KINDS["pods"], request.namespace),
+                                  {key: value for key, value in params.items() if value}):
+        for pod in page.get("items") or []:
+            if request.reason is not None and request.reason not in _pod_reasons(pod):
+                continue
+            metadata = pod.get("metadata") or {}
+            targets.append({"namespace": metadata.get("namespace"), "name": metadata.get("name"),
+                            "uid": metadata.get("uid")})
+        if request.max_pods is not None and len(targets) > request.max_pods:
+            break
+    return targets
+
+def _delete_options(request: BulkPodDeleteRequest, uid: Optional[str] = None) -> Dict[str, Any]:
+    options: Dict[str, Any] = {"kind": "DeleteOptions", "apiVersion": "v1"}
+    if request.grace_period_seconds is not None:
+        options["gracePeriodSeconds"] = request.grace_period_seconds
+    if uid is not None:
+        # 조회 후 같은 이름으로 다시 만들어진 Pod(StatefulSet 등)는 지우지 않음
+        options["preconditions"] = {"uid": uid}
+    return options
+
+async def _delete_collection(cluster_config: Dict[str, Any], request: BulkPodDeleteRequest,
+                             targets: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """deletecollection 한 번으로 삭제 (권한이 없거나 지원하지 않으면 None - Pod별 삭제로 대체)
+
+    호출 시점에 셀렉터에 맞는 Pod를 모두 지우므로 조회 이후 새로 맞게 된 Pod도 삭제됩니다 (max_pods가 없을 때만 사용).
+    """
+    params = {"labelSelector": request.label_selector, "fieldSelector": request.field_selector,
+              "dryRun": "All" if request.dry_run else None}
+    with upstream_wait():
+        r = await _k8s_request("DELETE", cluster_config, f"/api/v1/namespaces/{request.namespace}/pods",
+                               params={key: value for key, value in params.items() if value},
+                               json=_delete_options(request))
+    if r.status_code in (403, 405):
+        return None
+    if r.status_code not in (200, 202):
+        raise HTTPException(status_code=r.status_code, detail=_status_message(r))
+    # 응답은 삭제된 Pod 목록 - 조회 이후 새로 조건에 맞게 된 Pod도 포함됨
+    deleted = {(item.get("metadata") or {}).get("name") for item in fastjson.loads(r.content).get("items") or []}
+    results = [{"namespace": target["namespace"], "name": target["name"],
+                "status": "deleted" if target["name"] in deleted else "not_found"} for target in targets]
+    listed = {target["name"] for target in targets}
+    results.extend({"namespace": request.namespace, "name": name, "status": "deleted"}
+                   for name in sorted(deleted - listed))
+    return results
+
+async def _delete_each(cluster_config: Dict[str, Any], request: BulkPodDeleteRequest,
+                       targets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Pod별 삭제 (동시 요청 수와 초당 요청 수 제한)"""
+    semaphore = asyncio.Semaphore(request.concurrency)
+    limiter = RateLimiter(request.rate, request.concurrency)
+    params = {"dryRun": "All"} if request.dry_run else None
+
+    async def _one(target: Dict[str, Any]) -> Dict[str, Any]:
+        result = {"namespace": target["namespace"], "name": target["name"]}
+        async with semaphore:
+            await limiter.acquire()
+            try:
+                with upstream_wait():
+                    r = await _k8s_request("DELETE", cluster_config,
+                                           f"/api/v1/namespaces/{target['namespace']}/pods/{target['name']}",
+                                           params=params, json=_delete_options(request, target["uid"]))
+            except HTTPException as e:
+                return {**result, "status": "failed", "code": e.status_code, "message": e.detail}
+        if r.status_code in (200, 202):
+            return {**result, "status": "deleted"}
+        if r.status_code == 404:
+            return {**result, "status": "not_found"}
+        if r.status_code == 409:
+            return {**result, "status": "conflict", "message": _status_message(r)}
+        return {**result, "status": "failed", "code": r.status_code, "message": _status_message(r)}
+
+    return list(await asyncio.gather(*(_one(target) for target in targets)))
+
+@app.post("/pods/delete")
+async def bulk_delete_pods(request: BulkPodDeleteRequest):
+    """여러 Pod 일괄 삭제 (Pod별 결과, 일부가 실패해도 전체는 200)
+
+    조회한 Pod를 uid 전제 조건과 함께 Pod별로 삭제합니다. max_pods가 null이고 namespace와 셀렉터만으로 고르면
+    deletecollection 한 번으로 삭제합니다 (권한이 없으면 Pod별 삭제). 컨트롤러가 있는 Pod는 다시 만들어지므로 재시작에도 씁니다.
+    """
+    if request.pods and request.namespace is None:
+        raise HTTPException(status_code=400, detail="pods를 지정하려면 namespace가 필요합니다.")
+    if request.pods and (request.label_selector or request.field_selector or request.reason):
+        raise HTTPException(status_code=400, detail="pods와 셀렉터/reason은 함께 지정할 수 없습니다.")
+    if not (request.pods or request.label_selector or request.field_selector or request.reason):
+        raise HTTPException(status_code=400, detail="pods, label_selector, field_selector, reason 중 하나는 지정해야 합니다.")
+    cluster_config = get_cluster_config(request.cluster_id)
+
+    targets = await _bulk_delete_targets(cluster_config, request)
+    if request.max_pods is not None and len(targets) > request.max_pods:
+        raise HTTPException(status_code=400, detail=f"삭제 대상 Pod가 max_pods({request.max_pods})보다 많습니다.")
+
+    results, method = None, "individual"
+    # deletecollection은 조회한 목록이 아니라 호출 시점에 맞는 Pod를 지우므로 max_pods 제한을 지킬 수 없음
+    if (targets and request.max_pods is None and request.namespace is not None and not request.pods
+            and request.reason is None):
+        results = await _delete_collection(cluster_config, request, targets)
+        method = "deletecollection" if results is not None else method
+    if results is None:
+        results = await _delete_each(cluster_config, request, targets)
+
+    if not request.dry_run:
+        _invalidate(cluster_config['cluster_id'], "pods")
+        _invalidate(cluster_config['cluster_id'], "summary")
+    counts = {"matched": len(targets), "deleted": 0, "not_found": 0, "conflict": 0, "failed": 0}
+    for result in results:
+        counts[result["status"]] += 1
+    return {"status": 200, "dry_run": request.dry_run, "method": method, "counts": counts, "pods": results}
 
 # ==================== 롤아웃 API ====================
 
+def _start_rollout(workload_type: str, namespace: str, name: str, cluster_id: Optional[str], timeout: int) -> Job:
+    """롤아웃 작업 등록"""
+    cluster_config = get_cluster_config(cluster_id)
+    try:
+        return rollouts.start(cluster_config['cluster_id'], workload_type, namespace, name, timeout)
+    except JobTableFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+async def _rollout_response(job: Job, wait: bool):
+    """작업 ID 즉시 반환 (wait=true면 완료까지 대기 후 결과 반환)"""
+    if wait:
+        await job.wait()
+        return job.result
+    return JSONResponse(status_code=202, content={
+        "status": "accepted",
+        "job_id": job.id,
+        "status_url": f"/rollouts/{job.id}",
+        "events_url": f"/rollouts/{job.id}/events",
+        "job": job.to_dict(),
+    })
+
+async def _rollout(workload_type: str, namespace: str, name: str, cluster_id: Optional[str], timeout: int,
+                   wait: bool):
+    """롤아웃 시작 (다른 워커는 소유자 워커에서 시작 - 작업 목록과 진행 상황은 소유자에만 있음)"""
+    if shared_cache is not None and shared_cache.follower:
+        args = {"workload_type": workload_type, "namespace": namespace, "name": name, "cluster_id": cluster_id,
+                "timeout": timeout}
+        response, job = await _start_on_owner("rollout", args, "rollouts", wait)
+        return response if job is None else job["result"]
+    job = _start_rollout(workload_type, namespace, name, cluster_id, timeout)
+    return await _rollout_response(job, wait)
+
 @app.post("/deployments/{namespace}/{deployment}/rollout")
-def rollout_deployment(namespace: str, deployment: str, cluster_id: Optional[str] = None, timeout: int = 30):
+async def rollout_deployment(namespace: str, deployment: str, cluster_id: Optional[str] = None, timeout: int = 30,
+                             wait: bool = False):
     """Deployment 롤아웃"""
-    cluster_config = get_cluster_config(cluster_id)
-    return _rollout_workload("deployment", namespace, deployment, cluster_config, timeout)
+    return await _rollout("deployment", namespace, deployment, cluster_id, timeout, wait)
 
 @app.post("/daemonsets/{namespace}/{daemonset}/rollout")
-def rollout_daemonset(namespace: str, daemonset: str, cluster_id: Optional[str] = None, timeout: int = 30):
+async def rollout_daemonset(namespace: str, daemonset: str, cluster_id: Optional[str] = None, timeout: int = 30,
+                            wait: bool = False):
     """DaemonSet 롤아웃"""
-    cluster_config = get_cluster_config(cluster_id)
-    return _rollout_workload("daemonset", namespace, daemonset, cluster_config, timeout)
+    return await _rollout("daemonset", namespace, daemonset, cluster_id, timeout, wait)
 
 @app.post("/statefulsets/{namespace}/{statefulset}/rollout")
-def rollout_statefulset(namespace: str, statefulset: str, cluster_id: Optional[str] = None, timeout: int = 30):
+async def rollout_statefulset(namespace: str, statefulset: str, cluster_id: Optional[str] = None, timeout: int = 30,
+                              wait: bool = False):
     """StatefulSet 롤아웃"""
-    cluster_config = get_cluster_config(cluster_id)
-    return _rollout_workload("statefulset", namespace, statefulset, cluster_config, timeout)
-
-def _rollout_workload(workload_type: str, namespace: str, name: str, cluster_config: dict, timeout: int = 30):
-    """워크로드 롤아웃 공통 함수"""
-    import time
-    
-    # 1. 워크로드 재시작 요청
-    url = f"{cluster_config['api_url']}/apis/apps/v1/namespaces/{namespace}/{workload_type}s/{name}"
-    patch = {
-        "spec": {
-            "template": {
-                "metadata": {
-                    "annotations": {
-                        "kubectl.kubernetes.io/restartedAt": datetime.utcnow().isoformat()
-                    }
-                }
-            }
-        }
-    }
-    
-    # 재시작 요청
-    r = requests.patch(url, headers={**cluster_config['headers'], "Content-Type": "application/merge-patch+json"},
-                       json=patch, verify=cluster_config['verify_ssl'])
-    
-    if r.status_code != 200:
-        return {"status": "error", "message": "Rollout 요청 실패", "details": r.json()}
-    
-    # 2. 상태 모니터링
-    start_time = time.time()
-    check_interval = 1  # 1초마다 체크
-    
-    while time.time() - start_time < timeout:
-        # 워크로드 상태 확인
-        status_url = f"{cluster_config['api_url']}/apis/apps/v1/namespaces/{namespace}/{workload_type}s/{name}"
-        status_r = requests.get(status_url, headers=cluster_config['headers'], verify=cluster_config['verify_ssl'])
-        
-        if status_r.status_code == 200:
-            workload_data = status_r.json()
-            spec_replicas = workload_data.get('spec', {}).get('replicas', 0)
-            ready_replicas = workload_data.get('status', {}).get('readyReplicas', 0)
-            available_replicas = workload_data.get('status', {}).get('availableReplicas', 0)
-            
-            # 모든 조건이 만족되면 성공
-            if (ready_replicas == spec_replicas and 
-                available_replicas == spec_replicas and 
-                spec_replicas > 0):
-                return {
-                    "status": "success",
-                    "message": f"{workload_type.title()} Rollout 완료",
-                    "replicas": {
-                        "spec": spec_replicas,
-                        "ready": ready_replicas,
-                        "available": available_replicas
-                    },
-                    "duration": round(time.time() - start_time, 2)
-                }
-        
-        time.sleep(check_interval)
-    
-    # 타임아웃
-    return {
-        "status": "timeout",
-        "message": f"{workload_type.title()} Rollout이 {timeout}초 내에 완료되지 않았습니다",
-        "duration": timeout
-    }
+    return await _rollout("statefulset", namespace, statefulset, cluster_id, timeout, wait)
+
+@app.post("/rollouts/bulk")
+async def bulk_rollout(request: BulkRolloutRequest):
+    """여러 워크로드 일괄 롤아웃 (동시 실행 수 제한, 작업 ID 즉시 반환)"""
+    invalid = [kind for kind in request.kinds if kind not in WORKLOAD_KINDS]
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 워크로드 종류입니다: {', '.join(invalid)}")
+    workloads = [(w.kind, w.namespace, w.name) for w in request.workloads]
+    duplicates = sorted({"/".join(w) for w in workloads if workloads.count(w) > 1})
+    if duplicates:
+        raise HTTPException(status_code=400, detail=f"중복된 워크로드입니다: {', '.join(duplicates)}")
+    if shared_cache is not None and shared_cache.follower:
+        return await _forward_to_owner("bulk_rollout", request.model_dump())
+    cluster_config = get_cluster_config(request.cluster_id)
+    try:
+        job = rollouts.start_bulk(
+            cluster_config['cluster_id'], request.timeout, request.parallelism,
+            workloads=workloads, namespace=request.namespace, label_selector=request.label_selector,
+            kinds=request.kinds, max_failures=request.max_failures,
+        )
+    except JobTableFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    return await _rollout_response(job, wait=False)
+
+@app.get("/rollouts")
+async def list_rollouts(status: Optional[str] = None, type: Optional[str] = None):
+    """롤아웃 작업 목록 조회 (type: rollout | bulk_rollout)"""
+    return await _list_jobs("rollouts", status, type)
+
+@app.get("/rollouts/{job_id}")
+async def get_rollout(job_id: str):
+    """롤아웃 작업 상태 조회"""
+    return await _job_status("rollouts", job_id)
+
+@app.get("/rollouts/{job_id}/events")
+async def stream_rollout_events(job_id: str):
+    """롤아웃 진행 상황 SSE 스트림 (작업이 끝나면 done 이벤트 후 종료)"""
+    return await _job_events("rollouts", job_id)
+
+# ==================== 백그라운드 작업 공통 ====================
+
+# 작업 종류별 작업 목록 (공유 캐시를 쓰면 작업은 소유자 워커에서만 실행)
+JOB_TABLES = {"rollouts": (rollout_jobs, "롤아웃"), "provisioning": (provisioning_jobs, "프로비저닝")}
+
+def _get_job(table: str, job_id: str) -> Job:
+    jobs, label = JOB_TABLES[table]
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"{label} 작업 '{job_id}'를 찾을 수 없습니다.")
+    return job
+
+async def _list_jobs(table: str, status: Optional[str], job_type: Optional[str]):
+    """작업 목록 (다른 워커는 소유자 워커에 조회)"""
+    if shared_cache is not None and shared_cache.follower:
+        return await _forward_to_owner("jobs", {"table": table, "status": status, "type": job_type})
+    jobs = [job.to_dict() for job in JOB_TABLES[table][0].list(job_type) if status is None or job.status == status]
+    return {"status": "success", "jobs": jobs}
+
+async def _job_status(table: str, job_id: str):
+    """작업 상태 (다른 워커는 소유자 워커에 조회)"""
+    if shared_cache is not None and shared_cache.follower:
+        return await _forward_to_owner("job", {"table": table, "job_id": job_id})
+    return _get_job(table, job_id).to_dict()
+
+async def _job_event_stream(job: Job):
+    async for snapshot in job.events():
+        yield sse_event("done" if snapshot["finished_at"] else "progress", snapshot)
+
+async def _job_events(table: str, job_id: str) -> Response:
+    """작업 진행 상황 SSE 스트림 (다른 워커는 소유자 워커의 스트림을 전달)"""
+    if shared_cache is not None and shared_cache.follower:
+        lost = sse_event("error", {"message": "소유자 워커 연결이 끊어져 진행 상황 전달을 종료합니다. "
+                                              "작업 상태를 다시 조회하세요."})
+        try:
+            return await _stream_from_owner("job_events", {"table": table, "job_id": job_id}, "text/event-stream",
+                                            lost)
+        except SharedCacheUnavailable as e:
+            raise HTTPException(status_code=503, detail=str(e))
+    job = _get_job(table, job_id)
+    return StreamingResponse(_job_event_stream(job), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache"})
+
+async def _job_result(job: Job):
+    await job.wait()
+    yield fastjson.dumps(job.to_dict())
+
+async def _start_on_owner(op: str, args: Dict[str, Any], table: str,
+                          wait: bool) -> Tuple[Response, Optional[Dict[str, Any]]]:
+    """소유자 워커에서 작업 시작 - (응답, wait=true면 끝난 작업 상태)
+
+    끝날 때까지 걸리는 시간이 공유 캐시 요청 제한 시간보다 길 수 있으므로 대기는 스트림으로 받습니다.
+    """
+    response = await _forward_to_owner(op, args)
+    if not wait or response.status_code != 202:
+        return response, None
+    job_id = fastjson.loads(response.body)["job_id"]
+    try:
+        reply = await shared_cache.stream("job_wait", {"table": table, "job_id": job_id})
+        body = b"".join([chunk async for chunk in reply.chunks])
+    except SharedCacheUnavailable as e:
+        raise HTTPException(status_code=503, detail=f"작업 '{job_id}' 완료를 기다리는 중 소유자 워커 연결이 끊어졌습니다: {e}")
+    if reply.status != 200:
+        return Response(content=body, status_code=reply.status, media_type="application/json"), None
+    return response, fastjson.loads(body)
+
+# ==================== 인포머 API ====================
+
+@app.get("/informers")
+async def list_informers(cluster_id: Optional[str] = None):
+    """인포머(로컬 캐시) 상태 조회"""
+    if shared_cache is not None and shared_cache.follower:
+        return await _forward_to_owner("informers", {"cluster_id": cluster_id})
+    return {"status": "success", "informers": informers.status(cluster_id)}
+
+@app.post("/informers/{cluster_id}/{kind}")
+async def start_informer(cluster_id: str, kind: str):
+    """인포머 시작 - 이후 해당 리소스 조회는 로컬 저장소에서 응답"""
+    if shared_cache is not None and shared_cache.follower:
+        return await _forward_to_owner("informer_start", {"cluster_id": cluster_id, "kind": kind})
+    if kind not in RESOURCE_KINDS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 리소스 종류입니다: {kind}")
+    try:
+        get_cluster_config(cluster_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    informer = informers.start(cluster_id, kind)
+    return {"status": "success", "informer": informer.status()}
+
+@app.delete("/informers/{cluster_id}/{kind}")
+async def stop_informer(cluster_id: str, kind: str):
+    """인포머 중지"""
+    if shared_cache is not None and shared_cache.follower:
+        return await _forward_to_owner("informer_stop", {"cluster_id": cluster_id, "kind": kind})
+    if not await informers.stop(cluster_id, kind):
+        raise HTTPException(status_code=404, detail=f"실행 중인 인포머가 없습니다: {cluster_id}/{kind}")
+    return {"status": "success", "message": f"인포머 '{cluster_id}/{kind}'가 중지되었습니다."}
+
+# ==================== 사용량 API ====================
+
+def _usage_table(cluster_id: str, kind: str):
+    table = usage.table(cluster_id, kind)
+    if table is None:
+        raise HTTPException(status_code=404, detail=f"사용량 수집이 실행 중이 아닙니다: {cluster_id} "
+                                                    f"(POST /usage/{cluster_id}로 시작)")
+    return table
+
+async def _usage_query(op: str, cluster_id: Optional[str] = None, kind: str = "pods", **args) -> Dict[str, Any]:
+    """사용량 조회/수집 관리 (공유 캐시를 쓰면 소유자 워커에서 처리)"""
+    if op == "status":
+        return {"status": "success", "scrapers": usage.status(cluster_id)}
+    if op == "start":
+        try:
+            get_cluster_config(cluster_id)
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        usage.start(cluster_id)
+        return {"status": "success", "scraper": usage.status(cluster_id)[0]}
+    if op == "stop":
+        if not await usage.stop(cluster_id):
+            raise HTTPException(status_code=404, detail=f"실행 중인 사용량 수집이 없습니다: {cluster_id}")
+        return {"status": "success", "message": f"'{cluster_id}' 사용량 수집이 중지되었습니다."}
+
+    table = _usage_table(cluster_id, kind)
+    result: Dict[str, Any] = {"status": "success", "cluster_id": cluster_id, "kind": kind,
+                              "scraped_at": table.scraped_at}
+    if op == "top":
+        try:
+            result["items"] = table.top(args["n"], args["by"], args.get("namespace"))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        result["totals"] = table.totals()
+    elif op == "namespaces":
+        result["namespaces"] = table.by_namespace()
+    elif op == "history":
+        history = table.history((args.get("namespace") or "", args["name"]), args["window"])
+        if history is None:
+            raise HTTPException(status_code=404, detail=f"사용량 기록이 없습니다: {args['name']}")
+        result.update(name=args["name"], namespace=args.get("namespace"), window=args["window"], **history)
+    else:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 사용량 조회입니다: {op}")
+    return result
+
+async def _usage(op: str, **args):
+    if shared_cache is not None and shared_cache.follower:
+        return await _forward_to_owner("usage", {"op": op, **args})
+    return await _usage_query(op, **args)
+
+@app.get("/usage")
+async def list_usage_scrapers(cluster_id: Optional[str] = None):
+    """사용량 수집 상태 조회"""
+    return await _usage("status", cluster_id=cluster_id)
+
+@app.post("/usage/{cluster_id}")
+async def start_usage_scraper(cluster_id: str):
+    """사용량 수집 시작 (metrics-server 필요)"""
+    return await _usage("start", cluster_id=cluster_id)
+
+@app.delete("/usage/{cluster_id}")
+async def stop_usage_scraper(cluster_id: str):
+    """사용량 수집 중지 (보관 중인 시계열도 삭제)"""
+    return await _usage("stop", cluster_id=cluster_id)
+
+@app.get("/usage/{cluster_id}/pods/top")
+async def top_pods(cluster_id: str, by: str = Query("cpu", pattern="^(cpu|memory)$"), n: int = Query(10, ge=1, le=1000),
+                   namespace: Optional[str] = None):
+    """CPU/메모리 사용량 상위 Pod (마지막 수집 기준)"""
+    return await _usage("top", cluster_id=cluster_id, kind="pods", by=by, n=n, namespace=namespace)
+
+@app.get("/usage/{cluster_id}/nodes/top")
+async def top_nodes(cluster_id: str, by: str = Query("cpu", pattern="^(cpu|memory)$"), n: int = Query(10, ge=1, le=1000)):
+    """CPU/메모리 사용량 상위 노드 (마지막 수집 기준)"""
+    return await _usage("top", cluster_id=cluster_id, kind="nodes", by=by, n=n)
+
+@app.get("/usage/{cluster_id}/namespaces")
+async def usage_by_namespace(cluster_id: str):
+    """네임스페이스별 Pod 사용량 합계/최댓값 (마지막 수집 기준)"""
+    return await _usage("namespaces", cluster_id=cluster_id, kind="pods")
+
+@app.get("/usage/{cluster_id}/pods/{namespace}/{pod}")
+async def pod_usage_history(cluster_id: str, namespace: str, pod: str,
+                            window: int = Query(3600, ge=1, description="조회 기간 (초)")):
+    """Pod 사용량 시계열 (원본 보관 기간보다 길면 평균 구간)"""
+    return await _usage("history", cluster_id=cluster_id, kind="pods", namespace=namespace, name=pod, window=window)
+
+@app.get("/usage/{cluster_id}/nodes/{node}")
+async def node_usage_history(cluster_id: str, node: str, window: int = Query(3600, ge=1, description="조회 기간 (초)")):
+    """노드 사용량 시계열 (원본 보관 기간보다 길면 평균 구간)"""
+    return await _usage("history", cluster_id=cluster_id, kind="nodes", name=node, window=window)
+
+# ==================== 구독 API ====================
+
+@app.get("/subscribe")
+async def subscribe(
+    cluster_id: str,
+    kind: str = Query("pods", description="리소스 종류 (pods, deployments, ...)"),
+    namespace: Optional[str] = None,
+    label_selector: Optional[str] = None,
+    view: Optional[str] = Query(None, pattern="^(full|summary|metadata)$"),
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 필드 경로"),
+):
+    """리소스 변경 구독 (SSE - 초기 SNAPSHOT 후 ADDED/MODIFIED/DELETED 델타)"""
+    field_list = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+    if shared_cache is not None and shared_cache.follower:
+        # 다른 워커는 인포머를 직접 시작하지 않고 소유자 워커의 구독 이벤트를 전달 (WATCH는 호스트당 하나)
+        args = {"cluster_id": cluster_id, "kind": kind, "namespace": namespace, "label_selector": label_selector,
+                "view": view, "fields": field_list}
+        lost = sse_event("ERROR", {"type": "ERROR", "message": "소유자 워커 연결이 끊어져 구독을 종료합니다. 다시 구독하세요."})
+        try:
+            return await _stream_from_owner("subscribe", args, "text/event-stream", lost)
+        except SharedCacheUnavailable as e:
+            raise HTTPException(status_code=503, detail=str(e),
+                                headers={"Retry-After": str(max(1, int(settings.SHARED_CACHE_ELECTION_INTERVAL)))})
+    subscription = await _open_subscription(cluster_id, kind, namespace, label_selector, view, field_list)
+    return StreamingResponse(subscriptions.stream(subscription), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+async def _open_subscription(cluster_id: str, kind: str, namespace: Optional[str], label_selector: Optional[str],
+                             view: Optional[str], fields: Optional[List[str]]) -> Subscription:
+    """이 워커의 인포머로 구독 등록 (요청 오류는 HTTPException)"""
+    if kind not in RESOURCE_KINDS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 리소스 종류입니다: {kind}")
+    try:
+        get_cluster_config(cluster_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    try:
+        return await subscriptions.subscribe(cluster_id, kind, namespace, label_selector, view, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail=f"인포머 동기화가 끝나지 않았습니다: {cluster_id}/{kind}")
+
+@app.get("/subscriptions")
+def list_subscriptions():
+    """구독 상태 조회 (구독 키별 구독자 수, 퇴출 수)"""
+    return {"status": "success", "subscriptions": subscriptions.status()}
 
 # ==================== 클러스터 토큰 관리 API ====================
 
 
 @app.get("/clusters")
 def list_clusters():
-    """저장된 클러스터 목록 조회"""
-    return cluster_manager.list_clusters()
+    """저장된 클러스터 목록 조회 (토큰 만료/재발급 상태, 회로 차단기 상태 포함)"""
+    return [{**cluster, "token_refresh": token_refresher.status(cluster["cluster_id"]),
+             "circuit": breakers.status(cluster["cluster_id"])}
+            for cluster in cluster_manager.list_clusters()]
 
 @app.get("/clusters/{cluster_id}")
 def get_cluster_info(cluster_id: str):
     """특정 클러스터 정보 조회"""
     try:
-        return cluster_manager.get_cluster_info(cluster_id)
+        info = cluster_manager.get_cluster_info(cluster_id)
     except Exception as e:
         raise HTTPException(status_code=404, detail=str(e))
+    return {**info, "token_refresh": token_refresher.status(cluster_id), "circuit": breakers.status(cluster_id)}
+
+@app.patch("/clusters/{cluster_id}")
+def update_cluster_options(cluster_id: str, request: ClusterOptionsRequest):
+    """클러스터별 옵션 변경 (API 서버 연결/읽기 제한 시간, 사용량 수집 주기) - 보낸 필드만 변경, null이면 기본값"""
+    try:
+        cluster_manager.update_cluster_options(cluster_id, **request.model_dump(exclude_unset=True))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return get_cluster_info(cluster_id)
 
 
 @app.post("/clusters/set-token")
@@ -326,26 +1695,193 @@ def set_cluster_token(request: SetTokenRequest):
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+def _provisioning_response(job: Job):
+    return JSONResponse(status_code=202, content={
+        "status": "accepted",
+        "job_id": job.id,
+        "status_url": f"/provisioning/{job.id}",
+        "events_url": f"/provisioning/{job.id}/events",
+        "job": job.to_dict(),
+    })
+
 @app.post("/clusters/ssh-token")
-def create_token_via_ssh(request: SSHTokenRequest):
-    """SSH를 통해 클러스터 VM에 접속하여 토큰 생성 및 저장"""
+async def create_token_via_ssh(request: SSHTokenRequest, wait: bool = False):
+    """SSH를 통해 클러스터 VM에 접속하여 토큰 생성 및 저장 (백그라운드 작업, wait=true면 완료까지 대기)
+
+    토큰 재발급에 쓰는 SSH 비밀번호가 재발급을 맡는 소유자 워커에 남도록 다른 워커는 소유자에게 전달합니다.
+    """
+    if shared_cache is not None and shared_cache.follower:
+        response, result = await _start_on_owner("ssh_token", request.model_dump(), "provisioning", wait)
+        if result is None:
+            return response
+    else:
+        try:
+            job = provisioning.start(request.model_dump())
+        except JobTableFull as e:
+            raise HTTPException(status_code=429, detail=str(e))
+        if not wait:
+            return _provisioning_response(job)
+        await job.wait()
+        result = job.to_dict()
+    if result["status"] != "success":
+        raise HTTPException(status_code=400, detail=result["message"])
+    return result["result"]
+
+@app.post("/clusters/ssh-token/batch")
+async def create_tokens_via_ssh(request: BatchSSHTokenRequest):
+    """여러 클러스터를 SSH로 동시에 프로비저닝 (클러스터별 상태는 작업 진행 상황의 clusters에 표시)"""
+    names = [cluster.cluster_name for cluster in request.clusters]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise HTTPException(status_code=400, detail=f"중복된 cluster_name입니다: {', '.join(duplicates)}")
+    if shared_cache is not None and shared_cache.follower:
+        return await _forward_to_owner("ssh_token_batch", request.model_dump())
     try:
-        token = cluster_manager.get_token_via_ssh(
-            request.ssh_host, request.ssh_port, request.ssh_username, request.ssh_password,
-            request.k8s_host, request.k8s_port, request.service_account, request.namespace
-        )
-        cluster_manager.save_cluster_config(request.cluster_name, request.k8s_host, request.k8s_port, token, request.verify_ssl)
-        return {
-            "status": "success", 
-            "message": f"SSH를 통해 클러스터 '{request.cluster_name}' 토큰이 생성되고 저장되었습니다.",
-            "ssh_host": request.ssh_host,
-            "k8s_host": request.k8s_host
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        job = provisioning.start_batch([cluster.model_dump() for cluster in request.clusters], request.parallelism)
+    except JobTableFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    return _provisioning_response(job)
+
+@app.get("/provisioning")
+async def list_provisioning(status: Optional[str] = None, type: Optional[str] = None):
+    """프로비저닝 작업 목록 조회 (type: ssh_provision | ssh_provision_batch)"""
+    return await _list_jobs("provisioning", status, type)
+
+@app.get("/provisioning/{job_id}")
+async def get_provisioning(job_id: str):
+    """프로비저닝 작업 상태 조회"""
+    return await _job_status("provisioning", job_id)
+
+@app.get("/provisioning/{job_id}/events")
+async def stream_provisioning_events(job_id: str):
+    """프로비저닝 진행 상황 SSE 스트림 (작업이 끝나면 done 이벤트 후 종료)"""
+    return await _job_events("provisioning", job_id)
+
+# ==================== 워커 간 공유 캐시 ====================
+
+def _invalidate(cluster_id: str, kind: str):
+    """응답 캐시 무효화 (공유 캐시를 쓰면 소유자 워커의 캐시도)"""
+    response_cache.invalidate(cluster_id, kind)
+    if shared_cache is not None:
+        shared_cache.notify("invalidate", {"cluster_id": cluster_id, "kind": kind})
+
+def _request_token_refresh(cluster_id: str):
+    """토큰 재발급 요청 (재발급과 SSH 비밀번호는 소유자 워커에만 있으므로 다른 워커는 소유자에게 알림)"""
+    if shared_cache is not None and shared_cache.follower:
+        shared_cache.notify("token_refresh", {"cluster_id": cluster_id})
+    else:
+        token_refresher.request(cluster_id)
+
+async def _serve_from_owner(cond: Conditional, key: tuple, op: str, args: Dict[str, Any]) -> Response:
+    """소유자 워커에 조회 전달 (이 워커에 캐시된 본문이 아직 최신이면 소유자는 본문 없이 304만 응답)"""
+    cached = response_cache.get(key)
+    candidates = ", ".join(filter(None, [cached.etag if cached is not None else None, cond.if_none_match]))
+    reply = await shared_cache.call(op, {**args, "if_none_match": candidates or None})
+    etag = reply.headers.get("etag")
+    if reply.status == 304:
+        if cached is not None and cached.etag == etag:
+            return _cached_response(cached.body, etag, cond)
+        return _cached_response(None, etag, cond)
+    if reply.status == 200 and etag:
+        response_cache.put(key, etag, reply.body)
+        return _cached_response(reply.body, etag, cond)
+    return Response(content=reply.body, status_code=reply.status, media_type="application/json")
+
+async def _forward_to_owner(op: str, args: Dict[str, Any]) -> Response:
+    """소유자 워커만 처리할 수 있는 요청 전달 (인포머 관리, 사용량, 롤아웃/프로비저닝 작업)"""
+    try:
+        reply = await shared_cache.call(op, args)
+    except SharedCacheUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return Response(content=reply.body, status_code=reply.status, media_type="application/json")
+
+async def _relay(chunks, lost: bytes):
+    """소유자 워커의 스트림 전달 (도중에 소유자가 종료되면 lost를 보내고 끝냄)"""
+    try:
+        async for chunk in chunks:
+            yield chunk
+    except SharedCacheUnavailable:
+        yield lost
+
+async def _stream_from_owner(op: str, args: Dict[str, Any], media_type: str, lost: bytes) -> Response:
+    """소유자 워커의 스트리밍 응답 전달 (연결할 수 없으면 SharedCacheUnavailable - 호출한 쪽에서 처리)"""
+    reply = await shared_cache.stream(op, args)
+    if reply.status != 200:
+        body = b"".join([chunk async for chunk in reply.chunks])
+        return Response(content=body, status_code=reply.status, media_type="application/json")
+    return StreamingResponse(_relay(reply.chunks, lost), media_type=media_type,
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+async def _handle_shared(op: str, args: Dict[str, Any]) -> Union[SharedReply, SharedStream]:
+    """소유자 워커에서 다른 워커의 요청 처리"""
+    try:
+        if op == "subscribe":
+            subscription = await _open_subscription(**args)
+            return SharedStream(200, {}, subscriptions.stream(subscription))
+        if op == "logs":
+            response = await _logs(args["kind"], args["namespace"], args["name"], args.get("cluster_id"),
+                                   LogQuery(**args["query"]))
+            return SharedStream(response.status_code, {}, response.body_iterator)
+        if op == "job_events":
+            return SharedStream(200, {}, _job_event_stream(_get_job(args["table"], args["job_id"])))
+        if op == "job_wait":
+            return SharedStream(200, {}, _job_result(_get_job(args["table"], args["job_id"])))
+        if op == "resource":
+            query = ListQuery(**args["query"]) if args.get("query") is not None else None
+            view = None
+            if args.get("view") is not None:
+                fields = args["view"].get("fields")
+                view = ViewQuery(view=args["view"].get("view"), fields=",".join(fields) if fields else None)
+            response = await _serve_resource(Conditional(args.get("if_none_match")), args["kind"], args["cluster_id"],
+                                             args.get("namespace"), args.get("name"), query, view)
+        elif op == "summary":
+            response = await _serve_summary(Conditional(args.get("if_none_match")), args["cluster_id"],
+                                            args.get("namespace"))
+        elif op == "informers":
+            response = JSONResponse(await list_informers(args.get("cluster_id")))
+        elif op == "informer_start":
+            response = JSONResponse(await start_informer(args["cluster_id"], args["kind"]))
+        elif op == "informer_stop":
+            response = JSONResponse(await stop_informer(args["cluster_id"], args["kind"]))
+        elif op == "usage":
+            response = JSONResponse(await _usage_query(**args))
+        elif op == "rollout":
+            response = await _rollout(**args, wait=False)
+        elif op == "bulk_rollout":
+            response = await bulk_rollout(BulkRolloutRequest(**args))
+        elif op == "ssh_token":
+            response = await create_token_via_ssh(SSHTokenRequest(**args))
+        elif op == "ssh_token_batch":
+            response = await create_tokens_via_ssh(BatchSSHTokenRequest(**args))
+        elif op == "jobs":
+            response = JSONResponse(await _list_jobs(args["table"], args.get("status"), args.get("type")))
+        elif op == "job":
+            response = JSONResponse(await _job_status(args["table"], args["job_id"]))
+        elif op == "token_refresh":
+            if settings.TOKEN_REFRESH_ENABLED:
+                token_refresher.request(args["cluster_id"])
+            response = Response(status_code=204)
+        elif op == "invalidate":
+            response_cache.invalidate(args.get("cluster_id"), args.get("kind"))
+            response = Response(status_code=204)
+        else:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 공유 캐시 요청입니다: {op}")
+    except HTTPException as e:
+        return SharedReply(e.status_code, {}, fastjson.dumps({"detail": e.detail}))
+    etag = response.headers.get("etag")
+    return SharedReply(response.status_code, {"etag": etag} if etag else {}, bytes(response.body))
+
+# 여러 워커로 실행할 때 호스트당 한 워커만 API 서버 WATCH/조회와 캐시를 가지고 나머지는 Unix 소켓으로 전달
+shared_cache = (SharedCache(settings.SHARED_CACHE_DIR, _handle_shared, settings.SHARED_CACHE_TIMEOUT,
+                            settings.SHARED_CACHE_ELECTION_INTERVAL, on_promote=_start_background_sync)
+                if settings.SHARED_CACHE_DIR else None)
 
 if __name__ == "__main__":
     import uvicorn
     print(f"서버 시작: http://{settings.HOST}:{settings.PORT}")
     print(f"API 문서: http://{settings.HOST}:{settings.PORT}/docs")
-    uvicorn.run(app, host=settings.HOST, port=settings.PORT)
+    if settings.WORKERS > 1:
+        # 워커 프로세스마다 앱을 다시 불러오므로 import 문자열로 전달
+        uvicorn.run("main:app", host=settings.HOST, port=settings.PORT, workers=settings.WORKERS)
+    else:
+        uvicorn.run(app, host=settings.HOST, port=settings.PORT)
@@ -0,0 +1,30 @@
+import os
+import tempfile
+
+import httpx
+import pytest
+
+# 테스트 중 저장소의 config/clusters.json을 건드리지 않도록 임시 경로 사용
+os.environ.setdefault("CLUSTERS_CONFIG_PATH", os.path.join(tempfile.mkdtemp(), "clusters.json"))
+
+
+@pytest.fixture
+def mock_apiserver(monkeypatch):
+    """API 서버 대역 설치 - install(handler, cluster_id="test", token=None)
+
+    handler(httpx.Request)가 응답하는 커넥션 풀로 main.clients를 바꾸고 cluster_id(여러 개면 튜플)를
+    k8s-<cluster_id> 호스트로 등록합니다 (토큰을 생략하면 <cluster_id>-token).
+    handler 대신 httpx 전송 계층도 받으며, 설치한 ClusterClientRegistry를 반환합니다.
+    """
+    import main
+    from app.k8s_client import ClusterClientRegistry
+
+    def install(handler, cluster_id="test", token=None):
+        transport = handler if isinstance(handler, httpx.AsyncBaseTransport) else httpx.MockTransport(handler)
+        registry = ClusterClientRegistry(transport=transport)
+        monkeypatch.setattr(main, "clients", registry)
+        for cluster in (cluster_id,) if isinstance(cluster_id, str) else cluster_id:
+            main.cluster_manager.save_cluster_config(cluster, f"k8s-{cluster}", 6443, token or f"{cluster}-token")
+        return registry
+
+    return install
@@ -0,0 +1,59 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.response_cache import ResponseCache
+
+
+@pytest.fixture
+def apiserver(mock_apiserver, monkeypatch):
+    seen = []
+
+    def handler(request: httpx.Request):
+        seen.append(request.url.path)
+        if request.url.path.endswith("/deployments/missing"):
+            return httpx.Response(404, json={"kind": "Status", "code": 404})
+        kind = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"kind": "List", "metadata": {"resourceVersion": "7"},
+                                         "items": [{"metadata": {"name": f"{kind}-1", "namespace": "team"}}]})
+
+    mock_apiserver(handler)
+    monkeypatch.setattr(main, "response_cache", ResponseCache(ttl=60, max_entries=64, max_bytes=1 << 20))
+    return seen
+
+
+def test_batch_runs_queries_concurrently_with_per_item_status(apiserver):
+    client = TestClient(main.app)
+    response = client.post("/batch", json={"queries": [
+        {"id": "ns", "kind": "namespaces", "cluster_id": "test"},
+        {"kind": "pods", "cluster_id": "test", "namespace": "team", "view": "summary"},
+        {"id": "missing", "kind": "deployments", "cluster_id": "test", "namespace": "team", "name": "missing"},
+        {"id": "bad", "kind": "secrets", "cluster_id": "test"},
+        {"id": "unknown", "kind": "pods", "cluster_id": "nope"},
+    ]})
+    assert response.status_code == 200
+    results = {item["id"]: item for item in response.json()["results"]}
+
+    assert results["ns"]["status"] == 200
+    assert results["ns"]["response"]["items"][0]["metadata"]["name"] == "namespaces-1"
+    assert results["ns"]["etag"].startswith('W/"7-')
+    assert results["1"]["response"]["items"][0]["name"] == "pods-1"
+    assert results["missing"]["status"] == 404
+    assert results["bad"]["status"] == 400
+    assert results["unknown"]["status"] == 404
+    assert sorted(apiserver) == ["/api/v1/namespaces", "/api/v1/namespaces/team/pods",
+                                 "/apis/apps/v1/namespaces/team/deployments/missing"]
+
+    # 같은 조회는 응답 캐시를 공유하고, ETag를 보내면 해당 항목만 304
+    again = client.post("/batch", json={"queries": [
+        {"id": "ns", "kind": "namespaces", "cluster_id": "test", "if_none_match": results["ns"]["etag"]},
+    ]}).json()["results"][0]
+    assert again == {"id": "ns", "status": 304, "etag": results["ns"]["etag"]}
+    assert client.get("/namespaces", params={"cluster_id": "test"}).headers["etag"] == results["ns"]["etag"]
+    assert len(apiserver) == 3
+
+
+def test_batch_validates_size():
+    client = TestClient(main.app)
+    assert client.post("/batch", json={"queries": []}).status_code == 422
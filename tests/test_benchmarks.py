@@ -0,0 +1,47 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from benchmarks import run
+from benchmarks.fake_apiserver import FakeClusterConfig, create_app
+
+
+@pytest.fixture
+def fake_apiserver():
+    return create_app(FakeClusterConfig(namespaces=2, pods_per_namespace=5, deployments_per_namespace=1))
+
+
+def test_fake_apiserver_pages_and_selectors(fake_apiserver):
+    async def fetch():
+        transport = httpx.ASGITransport(app=fake_apiserver)
+        async with httpx.AsyncClient(transport=transport, base_url="http://apiserver") as client:
+            first = (await client.get("/api/v1/pods", params={"limit": 4})).json()
+            second = (await client.get("/api/v1/pods", params={"limit": 4,
+                                                               "continue": first["metadata"]["continue"]})).json()
+            selected = (await client.get("/api/v1/namespaces/ns-001/pods",
+                                         params={"labelSelector": "app=app-00"})).json()
+            missing = await client.get("/apis/apps/v1/namespaces/ns-000/deployments/nope")
+            return first, second, selected, missing
+
+    first, second, selected, missing = asyncio.run(fetch())
+    assert len(first["items"]) == 4 and len(second["items"]) == 4
+    assert "continue" in second["metadata"]
+    assert {pod["metadata"]["namespace"] for pod in selected["items"]} == {"ns-001"}
+    assert missing.status_code == 404
+
+
+def test_benchmark_smoke(tmp_path):
+    output = tmp_path / "result.json"
+    argv = ["--namespaces", "1", "--pods", "5", "--requests", "4", "--warmup", "1", "--concurrency", "2",
+            "--memory-requests", "2", "--endpoints", "/pods,/pods?view=summary", "--with-cache", "--quiet",
+            "--json", str(output)]
+    assert run.main(argv) == 0
+    results = json.loads(output.read_text())["results"]
+    assert [r["endpoint"] for r in results] == ["/pods", "/pods?view=summary"]
+    assert all(r["errors"] == 0 and r["throughput"] > 0 for r in results)
+
+    # 이전 결과보다 크게 느려지면 회귀로 판단
+    slower = [{**r, "throughput": r["throughput"] / 2} for r in results]
+    assert run.compare(slower, results, tolerance=0.15)
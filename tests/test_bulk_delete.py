@@ -0,0 +1,134 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.ratelimit import RateLimiter
+
+
+def _pod(name, phase="Running", reason=None, waiting=None):
+    status = {"phase": phase, "containerStatuses": [{"name": "app", "state": {"waiting": {"reason": waiting}}
+                                                      if waiting else {"running": {}}}]}
+    if reason:
+        status["reason"] = reason
+    return {"metadata": {"namespace": "default", "name": name, "uid": f"uid-{name}"}, "status": status}
+
+
+PODS = [_pod("web-1"), _pod("web-2", waiting="CrashLoopBackOff"), _pod("batch-1", "Failed", reason="Evicted")]
+
+
+@pytest.fixture
+def apiserver(mock_apiserver):
+    state = {"deletecollection": 200, "collection_items": [PODS[2]], "requests": []}
+
+    def handler(request: httpx.Request):
+        state["requests"].append((request.method, request.url.path, dict(request.url.params),
+                                  json.loads(request.content) if request.content else None))
+        path = request.url.path
+        if request.method == "GET":
+            items = PODS
+            if request.url.params.get("fieldSelector") == "status.phase=Failed":
+                items = [pod for pod in PODS if pod["status"]["phase"] == "Failed"]
+            return httpx.Response(200, json={"kind": "PodList", "metadata": {"resourceVersion": "1"}, "items": items})
+        if path == "/api/v1/namespaces/default/pods":
+            if state["deletecollection"] != 200:
+                return httpx.Response(state["deletecollection"], json={"kind": "Status", "message": "forbidden"})
+            return httpx.Response(200, json={"kind": "PodList", "items": state["collection_items"]})
+        name = path.rsplit("/", 1)[-1]
+        if name == "gone":
+            return httpx.Response(404, json={"kind": "Status", "message": f'pods "{name}" not found'})
+        return httpx.Response(200, json={"kind": "Pod", "metadata": {"name": name}})
+
+    mock_apiserver(handler, cluster_id="bulk")
+    return state
+
+
+def _deletes(state):
+    return [request for request in state["requests"] if request[0] == "DELETE"]
+
+
+def test_delete_pod_reports_apiserver_errors(apiserver):
+    client = TestClient(main.app)
+    assert client.delete("/pods/default/web-1", params={"cluster_id": "bulk"}).json()["status"] == 200
+    missing = client.delete("/pods/default/gone", params={"cluster_id": "bulk"})
+    assert missing.status_code == 404 and "not found" in missing.json()["detail"]
+
+
+def test_selector_uses_deletecollection_only_without_limit(apiserver):
+    client = TestClient(main.app)
+    limited = client.post("/pods/delete", json={"cluster_id": "bulk", "namespace": "default",
+                                                "field_selector": "status.phase=Failed"}).json()
+    assert limited["method"] == "individual"
+    assert [path for _, path, _, _ in _deletes(apiserver)] == ["/api/v1/namespaces/default/pods/batch-1"]
+    apiserver["requests"].clear()
+
+    body = client.post("/pods/delete", json={"cluster_id": "bulk", "namespace": "default", "max_pods": None,
+                                             "field_selector": "status.phase=Failed", "dry_run": True}).json()
+    assert body["method"] == "deletecollection" and body["dry_run"] is True
+    assert body["counts"]["deleted"] == 1 and body["pods"] == [{"namespace": "default", "name": "batch-1",
+                                                                "status": "deleted"}]
+    [(_, path, params, _)] = _deletes(apiserver)
+    assert path == "/api/v1/namespaces/default/pods"
+    assert params == {"fieldSelector": "status.phase=Failed", "dryRun": "All"}
+
+
+def test_deletecollection_reports_pods_matching_after_list(apiserver):
+    # 조회 이후 새로 셀렉터에 맞게 된 web-new도 deletecollection으로 삭제됨
+    apiserver["collection_items"] = PODS + [_pod("web-new")]
+    client = TestClient(main.app)
+    body = client.post("/pods/delete", json={"cluster_id": "bulk", "namespace": "default", "max_pods": None,
+                                             "label_selector": "app=web"}).json()
+    assert body["method"] == "deletecollection"
+    assert [pod["name"] for pod in body["pods"]] == ["web-1", "web-2", "batch-1", "web-new"]
+    assert body["counts"] == {"matched": 3, "deleted": 4, "not_found": 0, "conflict": 0, "failed": 0}
+
+
+def test_forbidden_deletecollection_falls_back_to_each_pod(apiserver):
+    apiserver["deletecollection"] = 403
+    client = TestClient(main.app)
+    body = client.post("/pods/delete", json={"cluster_id": "bulk", "namespace": "default", "max_pods": None,
+                                             "label_selector": "app=web", "grace_period_seconds": 0}).json()
+    assert body["method"] == "individual" and body["counts"]["deleted"] == 3
+    options = {path: options for _, path, _, options in _deletes(apiserver)[1:]}
+    assert options["/api/v1/namespaces/default/pods/web-2"]["preconditions"] == {"uid": "uid-web-2"}
+    assert options["/api/v1/namespaces/default/pods/web-2"]["gracePeriodSeconds"] == 0
+
+
+def test_reason_and_explicit_pods_delete_each(apiserver):
+    client = TestClient(main.app)
+    body = client.post("/pods/delete", json={"cluster_id": "bulk", "reason": "CrashLoopBackOff"}).json()
+    assert body["method"] == "individual"
+    assert [pod["name"] for pod in body["pods"]] == ["web-2"]
+
+    body = client.post("/pods/delete", json={"cluster_id": "bulk", "namespace": "default",
+                                             "pods": ["web-1", "gone"]}).json()
+    assert [pod["status"] for pod in body["pods"]] == ["deleted", "not_found"]
+    assert body["counts"] == {"matched": 2, "deleted": 1, "not_found": 1, "conflict": 0, "failed": 0}
+
+
+def test_bulk_delete_validation(apiserver):
+    client = TestClient(main.app)
+    assert client.post("/pods/delete", json={"cluster_id": "bulk", "namespace": "default"}).status_code == 400
+    assert client.post("/pods/delete", json={"cluster_id": "bulk", "pods": ["web-1"]}).status_code == 400
+    assert client.post("/pods/delete", json={"cluster_id": "bulk", "namespace": "default", "pods": ["web-1"],
+                                             "label_selector": "app=web"}).status_code == 400
+    too_many = client.post("/pods/delete", json={"cluster_id": "bulk", "namespace": "default",
+                                                 "label_selector": "app=web", "max_pods": 2})
+    assert too_many.status_code == 400
+    assert _deletes(apiserver) == []
+
+
+def test_rate_limiter_spaces_requests():
+    async def scenario():
+        limiter = RateLimiter(rate=100, burst=2)
+        started = time.monotonic()
+        for _ in range(6):
+            await limiter.acquire()
+        return time.monotonic() - started
+
+    # 처음 2개는 바로, 나머지 4개는 10ms 간격
+    assert asyncio.run(scenario()) >= 0.035
@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.circuit_breaker import CircuitBreakers
+from app.k8s_client import ClusterClientRegistry
+from config.settings import get_cluster_config
+
+
+@pytest.fixture
+def unreachable(mock_apiserver, monkeypatch):
+    calls = []
+    healthy = {"probe": False}
+
+    def handler(request: httpx.Request):
+        calls.append(request)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    async def probe(cluster_id):
+        return healthy["probe"]
+
+    mock_apiserver(handler, cluster_id="down")
+    monkeypatch.setattr(main, "breakers", CircuitBreakers(2, 0.05, probe))
+    return calls, healthy
+
+
+def test_breaker_opens_fails_fast_and_recovers_after_probe(unreachable):
+    calls, healthy = unreachable
+    with TestClient(main.app) as client:
+        for _ in range(2):
+            assert client.get("/pods", params={"cluster_id": "down"}).status_code == 502
+        response = client.get("/pods", params={"cluster_id": "down"})
+        assert response.status_code == 503
+        assert "Retry-After" in response.headers
+        assert len(calls) == 2
+
+        clusters = {c["cluster_id"]: c for c in client.get("/clusters").json()}
+        assert clusters["down"]["circuit"]["state"] in ("open", "half_open")
+
+        healthy["probe"] = True
+        deadline = time.monotonic() + 2
+        while client.get("/clusters/down").json()["circuit"]["state"] != "closed":
+            assert time.monotonic() < deadline
+            time.sleep(0.02)
+        assert client.get("/pods", params={"cluster_id": "down"}).status_code == 502
+        assert len(calls) == 3
+
+
+def test_fan_out_reports_open_circuit_per_cluster(unreachable):
+    calls, _ = unreachable
+    main.breakers._get("down").state = "open"
+    client = TestClient(main.app)
+    response = client.get("/pods", params={"cluster_id": "down,missing"})
+    assert response.status_code == 502
+    assert response.json()["detail"]["clusters"]["down"]["code"] == 503
+    assert not calls
+
+
+def test_per_cluster_timeouts(monkeypatch):
+    main.cluster_manager.save_cluster_config("slow", "k8s-slow", 6443, "test-token")
+    client = TestClient(main.app)
+    response = client.patch("/clusters/slow", json={"connect_timeout": 1.5, "read_timeout": 120})
+    assert response.status_code == 200
+    assert response.json()["read_timeout"] == 120
+
+    # 토큰을 다시 설정해도 옵션은 유지
+    main.cluster_manager.save_cluster_config("slow", "k8s-slow", 6443, "other-token")
+
+    async def run():
+        registry = ClusterClientRegistry()
+        pooled = await registry.get(get_cluster_config("slow"))
+        assert (pooled.timeout.connect, pooled.timeout.read) == (1.5, 120)
+        await registry.aclose()
+
+    asyncio.run(run())
+    client.patch("/clusters/slow", json={"read_timeout": None})
+    assert get_cluster_config("slow")["read_timeout"] == main.settings.K8S_READ_TIMEOUT
+    assert client.patch("/clusters/nope", json={"read_timeout": 3}).status_code == 404
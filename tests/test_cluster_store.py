@@ -0,0 +1,41 @@
+import json
+
+from config.cluster_store import ClusterStore
+
+
+def test_store_serves_from_memory_until_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "clusters.json"
+    path.write_text(json.dumps({"a": {"api_url": "https://a:6443"}}), encoding="utf-8")
+    store = ClusterStore(str(path), check_interval=0)
+
+    reads = []
+    original_read = store._read_file
+    monkeypatch.setattr(store, "_read_file", lambda: reads.append(1) or original_read())
+
+    assert store.get("a")["api_url"] == "https://a:6443"
+    assert store.get("a")["api_url"] == "https://a:6443"
+    assert len(reads) == 1
+
+    # 다른 프로세스가 파일을 교체한 경우 (inode/크기 변경)
+    replacement = tmp_path / "replacement.json"
+    replacement.write_text(json.dumps({"b": {"api_url": "https://bb:6443"}}), encoding="utf-8")
+    replacement.replace(path)
+
+    assert store.get("a") is None
+    assert store.get("b")["api_url"] == "https://bb:6443"
+    assert len(reads) == 2
+
+
+def test_store_update_is_atomic_and_merges(tmp_path):
+    path = tmp_path / "clusters.json"
+    path.write_text(json.dumps({"a": {"api_url": "https://a:6443"}}), encoding="utf-8")
+    store = ClusterStore(str(path))
+    snapshot = store.clusters()
+
+    store.update("b", {"api_url": "https://b:6443"})
+
+    assert list(json.loads(path.read_text(encoding="utf-8"))) == ["a", "b"]
+    assert list(store.clusters()) == ["a", "b"]
+    # 이전 스냅샷은 변경되지 않음
+    assert list(snapshot) == ["a"]
+    assert not list(tmp_path.glob("*.tmp"))
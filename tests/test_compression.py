@@ -0,0 +1,60 @@
+import gzip
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.compression import choose_encoding, supported_encodings
+from app.response_cache import ResponseCache
+
+# 재인코딩하면 달라지는 형태 (\u 이스케이프) - 그대로 전달되는지 확인
+RAW = (b'{"kind":"PodList","apiVersion":"v1","metadata":{"resourceVersion":"7"},"items":['
+       + b",".join(b'{"metadata":{"name":"p%d","namespace":"caf\\u00e9"}}' % i for i in range(200))
+       + b"]}\n")
+
+
+@pytest.fixture
+def apiserver(mock_apiserver, monkeypatch):
+    seen = []
+
+    def handler(request: httpx.Request):
+        seen.append(request.headers.get("accept-encoding"))
+        return httpx.Response(200, content=RAW, headers={"Content-Type": "application/json"})
+
+    mock_apiserver(handler)
+    monkeypatch.setattr(main, "response_cache", ResponseCache(ttl=0, max_entries=0, max_bytes=0))
+    return seen
+
+
+def test_choose_encoding():
+    assert choose_encoding(None) is None
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0, br") is None
+    assert choose_encoding("*") == supported_encodings()[0]
+
+
+def test_upstream_body_is_passed_through(apiserver):
+    client = TestClient(main.app)
+    response = client.get("/pods", params={"cluster_id": "test"}, headers={"Accept-Encoding": "identity"})
+    assert response.content == b'{"status":200,"response":' + RAW.strip() + b"}"
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"].startswith('W/"7-')
+    assert apiserver == ["gzip"]
+
+
+def test_gzip_response(apiserver):
+    client = TestClient(main.app)
+    response = client.get("/pods", params={"cluster_id": "test"}, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert len(response.json()["response"]["items"]) == 200
+
+    # 스트리밍 응답은 청크 단위로 압축
+    with client.stream("GET", "/pods", params={"cluster_id": "test", "stream": "ndjson"},
+                       headers={"Accept-Encoding": "gzip"}) as streamed:
+        assert streamed.headers["content-encoding"] == "gzip"
+        assert "content-length" not in streamed.headers
+        lines = gzip.decompress(b"".join(streamed.iter_raw())).splitlines()
+    assert json.loads(lines[0])["metadata"]["namespace"] == "café"
@@ -0,0 +1,81 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.selectors import build_predicate
+
+
+def _pod(namespace, name, labels=None, phase="Running"):
+    return {"metadata": {"namespace": namespace, "name": name, "labels": labels or {}}, "status": {"phase": phase}}
+
+
+CLUSTER_PODS = {
+    "k8s-east": [_pod("b", "web-1", {"app": "web"}), _pod("a", "db-1", {"app": "db"})],
+    "k8s-west": [_pod("a", "web-2", {"app": "web"}, phase="Failed")],
+}
+
+
+@pytest.fixture
+def fleet(mock_apiserver):
+    seen = []
+
+    async def handler(request: httpx.Request):
+        host = request.url.host
+        seen.append((host, dict(request.url.params)))
+        if host == "k8s-slow":
+            await asyncio.sleep(5)
+        if host == "k8s-down":
+            return httpx.Response(500, json={"message": "boom"})
+        return httpx.Response(200, json={"kind": "PodList", "metadata": {"resourceVersion": "1"},
+                                         "items": CLUSTER_PODS[host]})
+
+    mock_apiserver(handler, cluster_id=("east", "west", "slow", "down"))
+    return seen
+
+
+def test_label_and_field_selector():
+    predicate = build_predicate("app in (web, api),!canary", "status.phase=Running")
+    assert predicate(_pod("a", "x", {"app": "web"}))
+    assert not predicate(_pod("a", "x", {"app": "web", "canary": "true"}))
+    assert not predicate(_pod("a", "x", {"app": "web"}, phase="Failed"))
+    assert not predicate(_pod("a", "x", {"app": "db"}))
+    assert build_predicate(None, None) is None
+    with pytest.raises(ValueError):
+        build_predicate("app in web", None)
+
+
+def test_selectors_forwarded_upstream(fleet):
+    client = TestClient(main.app)
+    response = client.get("/pods", params={"cluster_id": "east", "label_selector": "app=web",
+                                           "field_selector": "status.phase=Running"})
+    assert response.status_code == 200
+    assert fleet[-1] == ("k8s-east", {"labelSelector": "app=web", "fieldSelector": "status.phase=Running"})
+
+
+def test_fan_out_merges_and_reports_failures(fleet):
+    client = TestClient(main.app)
+    response = client.get("/pods", params={"cluster_id": "east,west,slow,down", "cluster_timeout": 0.5})
+    assert response.status_code == 200
+    body = response.json()
+
+    items = body["response"]["items"]
+    assert [(i["metadata"]["namespace"], i["metadata"]["name"], i["cluster_id"]) for i in items] == [
+        ("a", "db-1", "east"), ("a", "web-2", "west"), ("b", "web-1", "east"),
+    ]
+    clusters = body["clusters"]
+    assert clusters["east"]["status"] == "ok" and clusters["east"]["items"] == 2
+    assert clusters["slow"]["status"] == "error" and clusters["slow"]["code"] == 504
+    assert clusters["down"]["status"] == "error"
+
+
+def test_fan_out_all_failed(fleet):
+    client = TestClient(main.app)
+    response = client.get("/pods", params={"cluster_id": "down,missing", "view": "summary"})
+    assert response.status_code == 502
+    assert set(response.json()["detail"]["clusters"]) == {"down", "missing"}
+
+    response = client.get("/pods", params={"cluster_id": "*", "stream": "ndjson"})
+    assert response.status_code == 400
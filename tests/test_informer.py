@@ -0,0 +1,86 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+def _pod(namespace, name, resource_version):
+    return {"metadata": {"namespace": namespace, "name": name, "resourceVersion": resource_version}}
+
+
+class FakeApiServer:
+    """LIST는 2개 Pod, 첫 WATCH는 이벤트 3개, 이후 WATCH는 대기"""
+
+    def __init__(self):
+        self.lists = 0
+        self.watches = []
+
+    async def __call__(self, request: httpx.Request):
+        if request.url.params.get("watch") == "true":
+            self.watches.append(dict(request.url.params))
+            if len(self.watches) > 1:
+                await asyncio.sleep(3600)
+            events = [
+                {"type": "ADDED", "object": _pod("default", "web-3", "11")},
+                {"type": "DELETED", "object": _pod("kube-system", "dns", "12")},
+                {"type": "BOOKMARK", "object": {"metadata": {"resourceVersion": "15"}}},
+            ]
+            return httpx.Response(200, content="\n".join(json.dumps(e) for e in events) + "\n")
+
+        self.lists += 1
+        return httpx.Response(200, json={
+            "kind": "PodList",
+            "metadata": {"resourceVersion": "10"},
+            "items": [_pod("default", "web-1", "5"), _pod("kube-system", "dns", "6")],
+        })
+
+
+@pytest.fixture
+def apiserver(mock_apiserver):
+    fake = FakeApiServer()
+    mock_apiserver(fake)
+    return fake
+
+
+def _wait_for(predicate, timeout=2.0):
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.01)
+    return poll()
+
+
+def test_pods_served_from_informer_store(apiserver):
+    with TestClient(main.app) as client:
+        assert client.post("/informers/test/pods").status_code == 200
+        informer = main.informers.get("test", "pods")
+        client.portal.call(asyncio.wait_for, _wait_for(lambda: informer.resource_version == "15"), 2.0)
+
+        response = client.get("/pods", params={"cluster_id": "test"})
+        body = response.json()
+        names = [item["metadata"]["name"] for item in body["response"]["items"]]
+        assert names == ["web-1", "web-3"]
+        assert body["cache"]["synced"] is True
+        assert body["response"]["metadata"]["resourceVersion"] == "15"
+
+        pod = client.get("/pods/default/web-3", params={"cluster_id": "test"}).json()
+        assert pod["response"]["metadata"]["resourceVersion"] == "11"
+
+        # 첫 WATCH가 끝나면 북마크의 resourceVersion부터 이어받음
+        client.portal.call(asyncio.wait_for, _wait_for(lambda: len(apiserver.watches) > 1), 2.0)
+        assert apiserver.watches[1]["resourceVersion"] == "15"
+        assert apiserver.lists == 1
+
+        assert client.delete("/informers/test/pods").status_code == 200
+
+
+def test_informer_relists_on_gone():
+    from app.informer import Informer, ResourceVersionExpired
+    from app.resources import RESOURCE_KINDS
+
+    informer = Informer("test", RESOURCE_KINDS["pods"], client_factory=None)
+    with pytest.raises(ResourceVersionExpired):
+        informer._apply({"type": "ERROR", "object": {"code": 410}})
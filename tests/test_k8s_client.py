@@ -0,0 +1,61 @@
+import asyncio
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.k8s_client import ClusterClientRegistry
+
+
+def _config(token="token-a", api_url="https://k8s-a:6443"):
+    return {
+        "cluster_id": "a",
+        "api_url": api_url,
+        "headers": {"Authorization": f"Bearer {token}"},
+        "verify_ssl": False,
+    }
+
+
+def test_registry_reuses_client_per_cluster():
+    async def run():
+        registry = ClusterClientRegistry()
+        first = await registry.get(_config())
+        second = await registry.get(_config())
+        assert first is second
+        await registry.aclose()
+
+    asyncio.run(run())
+
+
+def test_registry_rebuilds_client_on_token_change():
+    async def run():
+        registry = ClusterClientRegistry()
+        first = await registry.get(_config())
+        second = await registry.get(_config(token="token-b"))
+        assert first is not second
+        assert second.headers["Authorization"] == "Bearer token-b"
+        await registry.aclose()
+        assert first.is_closed and second.is_closed
+
+    asyncio.run(run())
+
+
+@pytest.fixture
+def cluster(mock_apiserver):
+    seen = []
+
+    def handler(request: httpx.Request):
+        seen.append(request)
+        return httpx.Response(200, json={"kind": "PodList", "items": []})
+
+    mock_apiserver(handler)
+    return seen
+
+
+def test_get_pods_uses_pooled_client(cluster):
+    client = TestClient(main.app)
+    response = client.get("/pods", params={"cluster_id": "test"})
+    assert response.status_code == 200
+    assert response.json()["response"]["kind"] == "PodList"
+    assert str(cluster[0].url) == "https://k8s-test:6443/api/v1/pods"
+    assert cluster[0].headers["Authorization"] == "Bearer test-token"
@@ -0,0 +1,78 @@
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.informer import Informer
+from app.resources import RESOURCE_KINDS
+
+
+def _pod(namespace, name):
+    return {"metadata": {"namespace": namespace, "name": name}}
+
+
+PAGES = {
+    None: ([_pod("a", "p1"), _pod("a", "p2")], "t1"),
+    "t1": ([_pod("b", "p3"), _pod("b", "p4")], "t2"),
+    "t2": ([_pod("c", "p5")], None),
+}
+
+
+@pytest.fixture
+def requests_seen(mock_apiserver):
+    seen = []
+
+    def handler(request: httpx.Request):
+        seen.append(dict(request.url.params))
+        items, next_token = PAGES[request.url.params.get("continue")]
+        metadata = {"resourceVersion": "42"}
+        if next_token:
+            metadata["continue"] = next_token
+        return httpx.Response(200, json={"kind": "PodList", "metadata": metadata, "items": items})
+
+    mock_apiserver(handler)
+    return seen
+
+
+def test_limit_and_continue_are_passed_through(requests_seen):
+    client = TestClient(main.app)
+    body = client.get("/pods", params={"cluster_id": "test", "limit": 2, "continue": "t1"}).json()
+    assert requests_seen == [{"limit": "2", "continue": "t1"}]
+    assert body["response"]["metadata"]["continue"] == "t2"
+
+
+def test_ndjson_stream_walks_continue_tokens(requests_seen):
+    client = TestClient(main.app)
+    response = client.get("/pods", params={"cluster_id": "test", "stream": "ndjson", "limit": 2})
+    assert response.headers["content-type"] == "application/x-ndjson"
+    names = [json.loads(line)["metadata"]["name"] for line in response.text.splitlines()]
+    assert names == ["p1", "p2", "p3", "p4", "p5"]
+    assert [params.get("continue") for params in requests_seen] == [None, "t1", "t2"]
+
+
+def test_json_stream_keeps_envelope(requests_seen):
+    client = TestClient(main.app)
+    body = client.get("/pods", params={"cluster_id": "test", "stream": "json"}).json()
+    assert body["status"] == 200
+    assert body["response"]["kind"] == "PodList"
+    assert body["response"]["metadata"]["resourceVersion"] == "42"
+    assert len(body["response"]["items"]) == 5
+
+
+def test_informer_page_tokens():
+    informer = Informer("test", RESOURCE_KINDS["pods"], client_factory=None)
+    informer._replace([_pod("a", "p1"), _pod("a", "p2"), _pod("b", "p3")], "1")
+
+    items, token = informer.page(None, 2, None)
+    assert [i["metadata"]["name"] for i in items] == ["p1", "p2"]
+
+    # 페이지 사이에 앞쪽 항목이 삭제되어도 다음 페이지는 그대로 이어짐
+    informer._delete(_pod("a", "p1"))
+    items, token = informer.page(None, 2, token)
+    assert [i["metadata"]["name"] for i in items] == ["p3"]
+    assert token is None
+
+    # API 서버가 발급한 토큰은 인포머가 처리하지 않음
+    assert informer.page(None, 2, "opaque-apiserver-token") is None
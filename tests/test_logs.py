@@ -0,0 +1,114 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.logs import multiplex, prefixed_lines
+from app.selectors import selector_string
+
+
+def _pod(name, containers):
+    return {"metadata": {"namespace": "default", "name": name, "labels": {"app": "web"}},
+            "spec": {"containers": [{"name": c} for c in containers]}}
+
+
+PODS = {"web-1": _pod("web-1", ["app", "sidecar"]), "web-2": _pod("web-2", ["app"])}
+LOGS = {("web-1", "app"): b"one\ntwo\n", ("web-1", "sidecar"): b"side\n", ("web-2", "app"): b"three"}
+
+
+@pytest.fixture
+def log_requests(mock_apiserver):
+    seen = []
+
+    def handler(request: httpx.Request):
+        path, params = request.url.path, dict(request.url.params)
+        seen.append((path, params))
+        if path == "/apis/apps/v1/namespaces/default/deployments/web":
+            return httpx.Response(200, json={"spec": {"selector": {"matchLabels": {"app": "web"}}}})
+        if path == "/api/v1/namespaces/default/pods":
+            return httpx.Response(200, json={"items": list(PODS.values())})
+        if path.endswith("/log"):
+            pod = path.split("/")[-2]
+            body = LOGS.get((pod, params.get("container")))
+            if body is None:
+                return httpx.Response(400, json={"kind": "Status", "message": "container is waiting to start"})
+            return httpx.Response(200, content=body)
+        pod = PODS.get(path.rsplit("/", 1)[-1])
+        if pod is None:
+            return httpx.Response(404, json={"kind": "Status", "message": "not found"})
+        return httpx.Response(200, json=pod)
+
+    mock_apiserver(handler, cluster_id="logs")
+    return seen
+
+
+def test_single_container_log_passes_options(log_requests):
+    client = TestClient(main.app)
+    response = client.get("/pods/default/web-1/logs",
+                          params={"cluster_id": "logs", "container": "app", "tail_lines": 10, "timestamps": True})
+    assert response.status_code == 200
+    assert response.text == "one\ntwo\n"
+    assert log_requests == [("/api/v1/namespaces/default/pods/web-1/log",
+                             {"container": "app", "tailLines": "10", "timestamps": "true"})]
+
+
+def test_pod_without_container_streams_every_container_with_prefix(log_requests):
+    client = TestClient(main.app)
+    lines = client.get("/pods/default/web-1/logs", params={"cluster_id": "logs"}).text.splitlines()
+    assert sorted(lines) == ["[web-1/app] one", "[web-1/app] two", "[web-1/sidecar] side"]
+
+    assert client.get("/pods/default/web-1/logs",
+                      params={"cluster_id": "logs", "since_seconds": 5, "since_time": "2024-01-01T00:00:00Z"}
+                      ).status_code == 400
+    assert client.get("/pods/default/nope/logs", params={"cluster_id": "logs"}).status_code == 404
+
+
+def test_deployment_logs_cover_selected_pods(log_requests, monkeypatch):
+    client = TestClient(main.app)
+    lines = client.get("/deployments/default/web/logs", params={"cluster_id": "logs"}).text.splitlines()
+    assert sorted(lines) == ["[web-1/app] one", "[web-1/app] two", "[web-1/sidecar] side", "[web-2/app] three"]
+    assert ("/api/v1/namespaces/default/pods", {"labelSelector": "app=web"}) in log_requests
+
+    monkeypatch.delitem(LOGS, ("web-2", "app"))
+    text = client.get("/deployments/default/web/logs", params={"cluster_id": "logs", "container": "app"}).text
+    assert "[web-1/app] one" in text
+    assert "[web-2/app] 로그를 가져올 수 없습니다 (400): container is waiting to start" in text
+
+
+def test_prefixed_lines_and_backpressure():
+    async def chunks(*parts):
+        for part in parts:
+            yield part
+
+    async def collect(stream):
+        return [chunk async for chunk in stream]
+
+    out = asyncio.run(collect(prefixed_lines(chunks(b"a\nb", b"c\n", b"tail"), b"> ")))
+    assert b"".join(out) == b"> a\n> bc\n> tail\n"
+
+    produced = []
+
+    async def endless():
+        while True:
+            produced.append(1)
+            yield b"x\n"
+
+    async def read_one():
+        stream = multiplex([endless()], queue_size=2)
+        first = await stream.__anext__()
+        await asyncio.sleep(0.01)
+        await stream.aclose()
+        return first
+
+    assert asyncio.run(read_one()) == b"x\n"
+    # 소비하지 않는 동안 큐 크기 이상으로 읽지 않음
+    assert len(produced) <= 4
+
+
+def test_selector_string():
+    assert selector_string({"matchLabels": {"b": "2", "a": "1"},
+                            "matchExpressions": [{"key": "tier", "operator": "In", "values": ["x", "y"]},
+                                                 {"key": "canary", "operator": "DoesNotExist"}]}) \
+        == "a=1,b=2,tier in (x,y),!canary"
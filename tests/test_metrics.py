@@ -0,0 +1,55 @@
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import main
+from app.metrics import DashboardMetrics, Histogram, MetricsMiddleware, upstream_wait
+
+
+def test_histogram_render():
+    histogram = Histogram("latency_seconds", "test", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, route="/a")
+    histogram.observe(0.5, route="/a")
+    histogram.observe(5, route="/a")
+    lines = histogram.render()
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{route="/a"} 3' in lines
+
+
+def test_metrics_endpoint(mock_apiserver):
+    def handler(request: httpx.Request):
+        return httpx.Response(200, json={"kind": "PodList", "metadata": {"resourceVersion": "1"}, "items": []})
+
+    mock_apiserver(handler)
+    client = TestClient(main.app, raise_server_exceptions=False)
+    client.get("/pods/kube-system", params={"cluster_id": "test", "view": "summary"})
+    client.get("/pods/kube-system", params={"cluster_id": "no-such-cluster-label"})
+
+    response = client.get("/metrics")
+    assert response.headers["content-type"].startswith("text/plain")
+    text = response.text
+    assert ('dashboard_http_requests_total{route="/pods/{namespace}",method="GET",cluster="test",status="200"}'
+            in text)
+    assert 'cluster="unknown"' in text
+    assert 'dashboard_upstream_request_duration_seconds_count{cluster="test",method="GET",status="200"}' in text
+    assert 'dashboard_threadpool_threads{state="total"}' in text
+    assert "dashboard_response_cache_hits_total" in text
+
+
+def test_server_timing_header():
+    inner = FastAPI()
+
+    @inner.get("/slow")
+    async def slow():
+        with upstream_wait():
+            pass
+        return {}
+
+    metrics = DashboardMetrics()
+    app = MetricsMiddleware(inner, metrics, cluster_label=lambda cluster_id: cluster_id or "default",
+                            server_timing=True)
+    response = TestClient(app).get("/slow")
+    assert response.headers["server-timing"].startswith("upstream;dur=")
+    assert metrics.request_local_seconds.count(route="/slow", method="GET", cluster="default") == 1
@@ -0,0 +1,97 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app import protobuf
+from app.views import SUMMARIZERS
+from benchmarks.fake_apiserver import FakeCluster, FakeClusterConfig, create_app, encode_protobuf
+from benchmarks.protobuf_decode import realistic_pod
+
+
+def _without_age(items):
+    return [{**item, "age_seconds": None} for item in items]
+
+
+def test_summary_fields_match_json():
+    pods = [realistic_pod(i) for i in range(3)]
+    pods[1]["metadata"]["deletionTimestamp"] = "2024-01-02T00:00:00Z"
+    pods[2]["status"]["containerStatuses"][0]["state"] = {"waiting": {"reason": "CrashLoopBackOff"}}
+    body = protobuf.encode_list("v1", "PodList", {"resourceVersion": "7", "continue": "next"},
+                                [encode_protobuf(pod, protobuf.SUMMARY_SCHEMAS["pods"]) for pod in pods])
+
+    metadata, items = protobuf.iter_list(body, protobuf.SUMMARY_SCHEMAS["pods"])
+    summaries = [SUMMARIZERS["pods"](item) for item in items]
+    assert metadata == {"resourceVersion": "7", "continue": "next"}
+    assert _without_age(summaries) == _without_age(SUMMARIZERS["pods"](pod) for pod in pods)
+    assert [s["reason"] for s in summaries] == [None, "Terminating", "CrashLoopBackOff"]
+
+
+def test_stream_decoder_handles_any_chunking():
+    cluster = FakeCluster(FakeClusterConfig(namespaces=1, pods_per_namespace=4, deployments_per_namespace=2))
+    keys = cluster.keys("deployments")
+    body = protobuf.encode_list("apps/v1", "DeploymentList", {"resourceVersion": "9"},
+                                [cluster.encoded_protobuf("deployments", key) for key in keys])
+
+    decoder = protobuf.ListStreamDecoder(protobuf.SUMMARY_SCHEMAS["deployments"])
+    items = []
+    for i in range(len(body)):
+        items.extend(decoder.feed(body[i:i + 1]))
+    decoder.close()
+    assert decoder.metadata == {"resourceVersion": "9"}
+    assert [item["metadata"]["name"] for item in items] == [name for _, name in keys]
+    assert items[0]["spec"]["replicas"] == 2
+
+    truncated = protobuf.ListStreamDecoder(protobuf.SUMMARY_SCHEMAS["deployments"])
+    truncated.feed(body[:-3])
+    with pytest.raises(ValueError):
+        truncated.close()
+
+
+def test_rejects_non_protobuf_body():
+    with pytest.raises(ValueError):
+        protobuf.decode_object(b'{"kind":"Pod"}', protobuf.POD)
+    assert protobuf.error_message(b"not protobuf") == ""
+
+
+@pytest.fixture
+def protobuf_cluster(mock_apiserver, monkeypatch):
+    accepts = []
+    fake = create_app(FakeClusterConfig(namespaces=2, pods_per_namespace=3, deployments_per_namespace=1))
+
+    async def app(scope, receive, send):
+        if scope["type"] == "http":
+            accepts.append(dict(scope["headers"]).get(b"accept", b"").decode())
+        await fake(scope, receive, send)
+
+    mock_apiserver(httpx.ASGITransport(app=app), cluster_id="proto")
+    monkeypatch.setattr(main.settings, "K8S_PROTOBUF", True)
+    return accepts
+
+
+def test_summary_view_uses_protobuf(protobuf_cluster):
+    client = TestClient(main.app)
+    body = client.get("/pods", params={"cluster_id": "proto", "view": "summary"}).json()
+    assert protobuf_cluster[-1] == protobuf.ACCEPT
+    assert len(body["response"]["items"]) == 6
+    assert body["response"]["metadata"]["resourceVersion"]
+    assert {"name", "phase", "node", "restarts"} <= set(body["response"]["items"][0])
+
+    pod = client.get("/pods/ns-000/app-00-00000", params={"cluster_id": "proto", "view": "summary",
+                                                          "fields": "name,node"}).json()
+    assert set(pod["response"]) == {"name", "node"}
+
+    # 전체 오브젝트가 필요한 조회는 JSON 그대로
+    client.get("/pods", params={"cluster_id": "proto"})
+    assert protobuf.CONTENT_TYPE not in protobuf_cluster[-1]
+
+    missing = client.get("/pods/ns-000/nope", params={"cluster_id": "proto", "view": "summary"})
+    assert missing.status_code == 404
+
+
+def test_summary_endpoint_uses_protobuf(protobuf_cluster):
+    client = TestClient(main.app)
+    body = client.get("/summary", params={"cluster_id": "proto"}).json()
+    assert body["response"]["totals"]["pods"] == 6
+    assert body["response"]["totals"]["workloads"]["deployments"]["total"] == 2
+    assert protobuf_cluster and all(accept == protobuf.ACCEPT for accept in protobuf_cluster)
@@ -0,0 +1,115 @@
+import io
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from config.cluster_manager import provision_script
+from config.ssh_pool import SSHConnectionPool
+
+
+class _Channel:
+    def __init__(self, status):
+        self.status = status
+
+    def recv_exit_status(self):
+        return self.status
+
+
+class _Stream(io.BytesIO):
+    def __init__(self, data=b"", status=0):
+        super().__init__(data)
+        self.channel = _Channel(status)
+
+
+class _Transport:
+    def is_active(self):
+        return True
+
+
+class FakeSSHClient:
+    """원격 스크립트를 실행하지 않고 결과만 돌려주는 paramiko.SSHClient 대역"""
+
+    connects = []
+    commands = []
+    fail_hosts = set()
+
+    def set_missing_host_key_policy(self, policy):
+        pass
+
+    def connect(self, hostname, **kwargs):
+        self.hostname = hostname
+        FakeSSHClient.connects.append(hostname)
+
+    def get_transport(self):
+        return _Transport()
+
+    def exec_command(self, command, timeout=None):
+        FakeSSHClient.commands.append((self.hostname, command))
+        if self.hostname in FakeSSHClient.fail_hosts:
+            stderr = b"##step serviceaccount\n##step clusterrolebinding\nError: forbidden\n"
+            return _Stream(), _Stream(b"", 1), _Stream(stderr)
+        return _Stream(), _Stream(f"token-{self.hostname}\n".encode()), _Stream(b"##step token\n")
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def ssh(monkeypatch):
+    FakeSSHClient.connects, FakeSSHClient.commands, FakeSSHClient.fail_hosts = [], [], set()
+    monkeypatch.setattr(main.cluster_manager, "ssh_pool", SSHConnectionPool(5, 300, client_factory=FakeSSHClient))
+    monkeypatch.setattr(main.cluster_manager, "validate_token", lambda *args, **kwargs: True)
+    return FakeSSHClient
+
+
+def _spec(name, ssh_host):
+    return {"ssh_host": ssh_host, "ssh_password": "pw", "k8s_host": f"{name}-api", "cluster_name": name}
+
+
+def test_provision_script_is_single_idempotent_invocation():
+    script = provision_script("dash board", "kube-system")
+    assert script.count("kubectl create token") == 1
+    assert "'dash board'" in script
+    assert "kubectl get clusterrolebinding dashboard-admin >/dev/null 2>&1 ||" in script
+
+
+def test_ssh_token_runs_in_background_and_reuses_connection(ssh):
+    with TestClient(main.app) as client:
+        result = client.post("/clusters/ssh-token", params={"wait": "true"}, json=_spec("ssh-a", "vm-1"))
+        assert result.status_code == 200, result.text
+        assert main.cluster_manager.store.get("ssh-a")["token"] == "token-vm-1"
+
+        accepted = client.post("/clusters/ssh-token", json=_spec("ssh-b", "vm-1"))
+        assert accepted.status_code == 202
+        events = client.get(accepted.json()["events_url"]).text
+        assert "event: done" in events
+        assert "pw" not in client.get(accepted.json()["status_url"]).text
+
+    # 원격 명령은 클러스터당 한 번, 같은 호스트 연결은 재사용
+    assert len(ssh.commands) == 2
+    assert ssh.connects == ["vm-1"]
+
+
+def test_batch_provisioning_reports_per_cluster_status(ssh):
+    ssh.fail_hosts.add("vm-bad")
+    with TestClient(main.app) as client:
+        accepted = client.post("/clusters/ssh-token/batch", json={"clusters": [
+            _spec("batch-a", "vm-1"), _spec("batch-b", "vm-2"), _spec("batch-c", "vm-bad"),
+        ]})
+        assert accepted.status_code == 202
+        client.get(accepted.json()["events_url"])
+        job = client.get(accepted.json()["status_url"]).json()
+
+    assert job["status"] == "failed"
+    assert job["progress"]["counts"]["success"] == 2
+    clusters = job["result"]["clusters"]
+    assert clusters["batch-a"]["status"] == "success"
+    assert clusters["batch-c"]["status"] == "failed"
+    assert "ClusterRoleBinding 생성 실패: Error: forbidden" in clusters["batch-c"]["message"]
+
+
+def test_batch_rejects_duplicate_cluster_names(ssh):
+    client = TestClient(main.app)
+    response = client.post("/clusters/ssh-token/batch", json={"clusters": [_spec("dup", "vm-1"), _spec("dup", "vm-2")]})
+    assert response.status_code == 400
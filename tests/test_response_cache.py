@@ -0,0 +1,85 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.informer import Informer
+from app.resources import RESOURCE_KINDS
+from app.response_cache import ResponseCache, etag_matches
+
+
+def _pod(namespace, name, resource_version="1"):
+    return {"metadata": {"namespace": namespace, "name": name, "resourceVersion": resource_version}}
+
+
+@pytest.fixture
+def apiserver(mock_apiserver, monkeypatch):
+    state = {"calls": 0, "resourceVersion": "10"}
+
+    def handler(request: httpx.Request):
+        state["calls"] += 1
+        return httpx.Response(200, json={"kind": "PodList", "metadata": {"resourceVersion": state["resourceVersion"]},
+                                         "items": [_pod("a", "p1")]})
+
+    mock_apiserver(handler)
+    monkeypatch.setattr(main, "response_cache", ResponseCache(ttl=60, max_entries=16, max_bytes=1 << 20))
+    return state
+
+
+def test_cache_hit_and_not_modified(apiserver):
+    client = TestClient(main.app)
+    first = client.get("/pods", params={"cluster_id": "test"})
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"10-')
+
+    # TTL 안에서는 API 서버를 다시 호출하지 않음
+    again = client.get("/pods", params={"cluster_id": "test"}, headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.content == b""
+    assert client.get("/pods", params={"cluster_id": "test"}).json() == first.json()
+    assert apiserver["calls"] == 1
+
+    # 표현(view)이 다르면 ETag도 다름
+    summary = client.get("/pods", params={"cluster_id": "test", "view": "summary"})
+    assert summary.headers["etag"] != etag
+    assert apiserver["calls"] == 2
+
+    # 삭제하면 해당 클러스터의 Pod 캐시 무효화
+    main.response_cache.invalidate("test", "pods")
+    apiserver["resourceVersion"] = "11"
+    changed = client.get("/pods", params={"cluster_id": "test"}, headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+
+
+def test_informer_etag_short_circuits(apiserver, monkeypatch):
+    informer = Informer("test", RESOURCE_KINDS["pods"], client_factory=None)
+    informer._replace([_pod("a", "p1", "5")], "5")
+    monkeypatch.setattr(main.informers, "synced", lambda cluster_id, kind: informer)
+    client = TestClient(main.app)
+
+    etag = client.get("/pods", params={"cluster_id": "test"}).headers["etag"]
+    assert client.get("/pods", params={"cluster_id": "test"}, headers={"If-None-Match": etag}).status_code == 304
+
+    # 저장소가 바뀌면 같은 ETag로 304를 받지 않음
+    informer._upsert(_pod("a", "p2", "6"))
+    informer.resource_version = "6"
+    response = client.get("/pods", params={"cluster_id": "test"}, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.json()["response"]["items"]) == 2
+    assert apiserver["calls"] == 0
+
+
+def test_lru_eviction_by_size():
+    cache = ResponseCache(ttl=60, max_entries=10, max_bytes=10)
+    cache.put(("c", "pods", 1), 'W/"1"', b"12345")
+    cache.put(("c", "pods", 2), 'W/"2"', b"12345")
+    cache.get(("c", "pods", 1))
+    cache.put(("c", "pods", 3), 'W/"3"', b"12345")
+    assert cache.get(("c", "pods", 2)) is None
+    assert cache.get(("c", "pods", 1)) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_etag_matches():
+    assert etag_matches('"1-abc", W/"2-abc"', 'W/"2-abc"')
+    assert etag_matches("*", 'W/"2-abc"')
+    assert not etag_matches('W/"3-abc"', 'W/"2-abc"')
@@ -0,0 +1,178 @@
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.rollout import RolloutFailed, rollout_status
+
+
+def _deployment(generation, observed, updated, ready, available, replicas=3, total=None):
+    return {
+        "metadata": {"name": "web", "namespace": "default", "generation": generation, "resourceVersion": "100"},
+        "spec": {"replicas": replicas},
+        "status": {
+            "observedGeneration": observed,
+            "replicas": total if total is not None else updated,
+            "updatedReplicas": updated,
+            "readyReplicas": ready,
+            "availableReplicas": available,
+        },
+    }
+
+
+def test_deployment_readiness_requires_observed_generation_and_old_replicas_gone():
+    assert not rollout_status("deployment", _deployment(2, 1, 3, 3, 3), 2)[0]
+    assert not rollout_status("deployment", _deployment(2, 2, 3, 3, 3, total=4), 2)[0]
+    assert rollout_status("deployment", _deployment(2, 2, 3, 3, 3), 2)[0]
+
+
+def test_daemonset_and_statefulset_readiness():
+    daemonset = {"status": {"observedGeneration": 3, "desiredNumberScheduled": 4,
+                            "updatedNumberScheduled": 4, "numberReady": 4, "numberAvailable": 3}}
+    assert not rollout_status("daemonset", daemonset, 3)[0]
+    daemonset["status"]["numberAvailable"] = 4
+    assert rollout_status("daemonset", daemonset, 3)[0]
+
+    statefulset = {"spec": {"replicas": 2}, "status": {"observedGeneration": 5, "readyReplicas": 2,
+                                                        "currentRevision": "a", "updateRevision": "b"}}
+    assert not rollout_status("statefulset", statefulset, 5)[0]
+    statefulset["status"]["currentRevision"] = "b"
+    assert rollout_status("statefulset", statefulset, 5)[0]
+
+
+def test_progress_deadline_exceeded_fails():
+    deployment = _deployment(2, 2, 1, 1, 1)
+    deployment["status"]["conditions"] = [{"type": "Progressing", "reason": "ProgressDeadlineExceeded"}]
+    with pytest.raises(RolloutFailed):
+        rollout_status("deployment", deployment, 2)
+
+
+@pytest.fixture
+def apiserver(mock_apiserver):
+    requests = []
+
+    def handler(request: httpx.Request):
+        requests.append(request)
+        if request.method == "PATCH":
+            return httpx.Response(200, json=_deployment(2, 1, 0, 3, 3))
+        events = [
+            {"type": "MODIFIED", "object": _deployment(2, 2, 1, 3, 3, total=4)},
+            {"type": "MODIFIED", "object": _deployment(2, 2, 3, 3, 3)},
+        ]
+        return httpx.Response(200, content="\n".join(json.dumps(e) for e in events))
+
+    mock_apiserver(handler)
+    return requests
+
+
+def test_rollout_job_tracks_watch_until_ready(apiserver):
+    with TestClient(main.app) as client:
+        accepted = client.post("/deployments/default/web/rollout", params={"cluster_id": "test"})
+        assert accepted.status_code == 202
+        job_id = accepted.json()["job_id"]
+
+        events = client.get(f"/rollouts/{job_id}/events").text
+        assert "event: done" in events
+
+        job = client.get(f"/rollouts/{job_id}").json()
+        assert job["status"] == "success"
+        assert job["progress"]["replicas"]["updated"] == 3
+
+    watch = apiserver[1]
+    assert watch.url.params["fieldSelector"] == "metadata.name=web"
+    assert watch.url.params["resourceVersion"] == "100"
+
+
+def test_rollout_wait_returns_legacy_result(apiserver):
+    with TestClient(main.app) as client:
+        result = client.post("/deployments/default/web/rollout", params={"cluster_id": "test", "wait": True}).json()
+        assert result["status"] == "success"
+        assert result["message"] == "Deployment Rollout 완료"
+
+
+def test_bulk_rollout_respects_parallelism(mock_apiserver):
+    in_flight = {"now": 0, "max": 0}
+
+    async def handler(request: httpx.Request):
+        import asyncio
+        if request.method == "GET":
+            items = [{"metadata": {"namespace": "default", "name": f"web-{i}"}} for i in range(5)]
+            return httpx.Response(200, json={"items": items})
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.02)
+        in_flight["now"] -= 1
+        return httpx.Response(200, json=_deployment(2, 2, 3, 3, 3))
+
+    mock_apiserver(handler)
+
+    with TestClient(main.app) as client:
+        accepted = client.post("/rollouts/bulk", json={
+            "cluster_id": "test", "namespace": "default", "kinds": ["deployment"], "parallelism": 2,
+        })
+        assert accepted.status_code == 202
+        job_id = accepted.json()["job_id"]
+        client.get(f"/rollouts/{job_id}/events")
+        job = client.get(f"/rollouts/{job_id}").json()
+
+    assert job["status"] == "success"
+    assert job["progress"]["counts"]["success"] == 5
+    assert job["progress"]["workloads"]["deployment/default/web-3"]["status"] == "success"
+    assert in_flight["max"] == 2
+
+
+def test_bulk_rollout_rejects_duplicates_and_counts_cancelled(monkeypatch):
+    import asyncio
+
+    from app.jobs import Job, JobTable
+    from app.rollout import RolloutManager
+
+    main.cluster_manager.save_cluster_config("test", "k8s-test", 6443, "test-token")
+    workload = {"kind": "deployment", "namespace": "default", "name": "web"}
+    duplicated = TestClient(main.app).post("/rollouts/bulk", json={"cluster_id": "test",
+                                                                   "workloads": [workload, workload]})
+    assert duplicated.status_code == 400
+
+    async def scenario():
+        manager = RolloutManager(None, JobTable(10))
+
+        def cancelled_child(cluster_id, workload_type, namespace, name, timeout):
+            child = Job("rollout")
+            child.finish("cancelled", "작업이 취소되었습니다")
+            return child
+
+        monkeypatch.setattr(manager, "start", cancelled_child)
+        job = manager.start_bulk("test", 30, 2, workloads=[("deployment", "default", "web")] * 2)
+        await job.task
+        return job
+
+    job = asyncio.run(scenario())
+    assert job.status == "failed"
+    assert job.progress["counts"]["total"] == 1 and job.progress["counts"]["cancelled"] == 1
+
+
+def test_cache_is_invalidated_after_restart_patch(mock_apiserver, monkeypatch):
+    order = []
+    patch_status = {"code": 200}
+
+    def handler(request: httpx.Request):
+        order.append(request.method)
+        if request.method == "PATCH":
+            return httpx.Response(patch_status["code"], json=_deployment(2, 2, 3, 3, 3))
+        return httpx.Response(200, content="")
+
+    mock_apiserver(handler)
+    monkeypatch.setattr(main, "_invalidate", lambda cluster_id, kind: order.append(kind))
+
+    with TestClient(main.app) as client:
+        result = client.post("/deployments/default/web/rollout", params={"cluster_id": "test", "wait": True}).json()
+        assert result["status"] == "success"
+        assert order == ["PATCH", "deployments", "summary"]
+
+        order.clear()
+        patch_status["code"] = 409
+        result = client.post("/deployments/default/web/rollout", params={"cluster_id": "test", "wait": True}).json()
+        assert result["status"] == "error"
+        assert order == ["PATCH"]
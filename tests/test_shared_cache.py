@@ -0,0 +1,296 @@
+import asyncio
+
+import httpx
+import pytest
+
+import main
+from app import fastjson
+from app.shared_cache import OwnerLock, SharedCache, SharedCacheUnavailable, SharedReply, SharedStream
+
+
+def test_owner_lock_is_exclusive(tmp_path):
+    first, second = OwnerLock(tmp_path / "owner.lock"), OwnerLock(tmp_path / "owner.lock")
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    first.release()
+    assert second.try_acquire()
+    second.release()
+
+
+def test_app_loads_without_fcntl_unless_shared_cache_is_configured(tmp_path):
+    import os
+    import subprocess
+    import sys
+
+    # Windows처럼 fcntl이 없는 환경 흉내
+    code = "import sys; sys.modules['fcntl'] = None; import main; print(main.shared_cache)"
+    env = {**os.environ, "CLUSTERS_CONFIG_PATH": str(tmp_path / "clusters.json"), "SHARED_CACHE_DIR": ""}
+    cwd = os.path.dirname(main.__file__)
+    loaded = subprocess.run([sys.executable, "-c", code], env=env, cwd=cwd, capture_output=True, text=True)
+    assert loaded.returncode == 0 and loaded.stdout.strip() == "None"
+
+    rejected = subprocess.run([sys.executable, "-c", code], env={**env, "SHARED_CACHE_DIR": str(tmp_path)},
+                              cwd=cwd, capture_output=True, text=True)
+    assert rejected.returncode != 0 and "SHARED_CACHE_DIR" in rejected.stderr
+
+
+def test_followers_forward_to_owner_and_take_over(tmp_path):
+    async def scenario():
+        promoted = []
+
+        def worker(name):
+            async def handler(op, args):
+                return SharedReply(200, {"etag": f'"{name}"'}, f"{name}:{op}:{args['n']}".encode())
+            return SharedCache(str(tmp_path), handler, timeout=1.0, election_interval=0.02,
+                               on_promote=lambda: promoted.append(name))
+
+        owner, follower = worker("a"), worker("b")
+        await owner.start()
+        await follower.start()
+        assert owner.is_owner and follower.follower and promoted == ["a"]
+
+        replies = await asyncio.gather(*(follower.call("get", {"n": i}) for i in range(5)))
+        assert [reply.body for reply in replies] == [f"a:get:{i}".encode() for i in range(5)]
+        assert owner.server.requests == 5
+
+        # 소유자가 종료되면 잠금이 풀리고 다른 워커가 소유자가 됨
+        await owner.aclose()
+        with pytest.raises(SharedCacheUnavailable):
+            await follower.call("get", {"n": 0})
+        await asyncio.wait_for(_until(lambda: follower.is_owner), 1.0)
+        assert promoted == ["a", "b"]
+        await follower.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_streams_relay_chunks_and_close_on_disconnect(tmp_path):
+    async def scenario():
+        closed = asyncio.Event()
+
+        async def chunks():
+            try:
+                yield b"first"
+                yield b"second"
+                await asyncio.sleep(3600)
+            finally:
+                closed.set()
+
+        async def handler(op, args):
+            if op == "stream":
+                return SharedStream(200, {}, chunks())
+            return SharedReply(404, {}, b'{"detail":"nope"}')
+
+        owner = SharedCache(str(tmp_path), handler, timeout=1.0, election_interval=0.02)
+        follower = SharedCache(str(tmp_path), handler, timeout=1.0, election_interval=0.02)
+        await owner.start()
+        await follower.start()
+
+        reply = await follower.stream("stream", {})
+        received = [await reply.chunks.__anext__(), await reply.chunks.__anext__()]
+        assert received == [b"first", b"second"] and owner.server.streams == 1
+        # 받는 쪽이 연결을 끊으면 소유자 쪽 스트림도 정리됨
+        await reply.chunks.aclose()
+        await asyncio.wait_for(closed.wait(), 1.0)
+
+        error = await follower.stream("missing", {})
+        assert error.status == 404 and [chunk async for chunk in error.chunks] == [b'{"detail":"nope"}']
+        await follower.aclose()
+        await owner.aclose()
+
+    asyncio.run(scenario())
+
+
+async def _until(predicate):
+    while not predicate():
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def apiserver(mock_apiserver):
+    calls = []
+
+    def handler(request: httpx.Request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"kind": "PodList", "metadata": {"resourceVersion": "7"}, "items": []})
+
+    mock_apiserver(handler, cluster_id="shared")
+    main.response_cache.invalidate()
+    return calls
+
+
+def test_owner_handles_forwarded_reads(apiserver):
+    args = {"kind": "pods", "cluster_id": "shared", "namespace": None, "name": None,
+            "query": {"label_selector": "app=web", "field_selector": None, "limit": None, "continue_token": None,
+                      "stream": None, "cluster_timeout": None},
+            "view": None, "if_none_match": None}
+    reply = asyncio.run(main._handle_shared("resource", args))
+    assert reply.status == 200 and reply.headers["etag"]
+    assert fastjson.loads(reply.body)["response"]["metadata"]["resourceVersion"] == "7"
+
+    cached = asyncio.run(main._handle_shared("resource", {**args, "if_none_match": reply.headers["etag"]}))
+    assert cached.status == 304 and cached.body == b""
+    assert apiserver == ["/api/v1/pods"]
+
+    unknown = asyncio.run(main._handle_shared("nope", {}))
+    assert unknown.status == 400
+
+
+class _Owner:
+    """소유자 워커 대신 정해진 응답을 돌려주는 follower 쪽 공유 캐시"""
+
+    follower = True
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.requests = []
+
+    async def call(self, op, args):
+        self.requests.append((op, args))
+        return self.reply
+
+    async def stream(self, op, args):
+        self.requests.append((op, args))
+        if self.reply is None:
+            raise SharedCacheUnavailable("소유자 없음")
+        return self.reply
+
+
+def test_follower_reuses_local_body_when_owner_says_unchanged(apiserver, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    owner = _Owner(SharedReply(200, {"etag": '"v1"'}, b'{"status":200,"response":{"items":[]}}'))
+    monkeypatch.setattr(main, "shared_cache", owner)
+    client = TestClient(main.app)
+
+    first = client.get("/pods", params={"cluster_id": "shared"})
+    assert first.status_code == 200 and first.headers["etag"] == '"v1"'
+
+    owner.reply = SharedReply(304, {"etag": '"v1"'}, b"")
+    again = client.get("/pods", params={"cluster_id": "shared"})
+    assert again.status_code == 200 and again.json() == {"status": 200, "response": {"items": []}}
+    assert owner.requests[-1][1]["if_none_match"] == '"v1"'
+    assert client.get("/pods", params={"cluster_id": "shared"},
+                      headers={"If-None-Match": '"v1"'}).status_code == 304
+    assert apiserver == []
+
+
+def test_follower_subscriptions_never_start_local_informers(apiserver, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    async def events():
+        yield b"event: SNAPSHOT\ndata: {}\n\n"
+
+    owner = _Owner(SharedStream(200, {}, events()))
+    monkeypatch.setattr(main, "shared_cache", owner)
+    client = TestClient(main.app)
+
+    relayed = client.get("/subscribe", params={"cluster_id": "shared", "label_selector": "app=web"})
+    assert relayed.status_code == 200 and relayed.text == "event: SNAPSHOT\ndata: {}\n\n"
+    assert owner.requests[-1] == ("subscribe", {"cluster_id": "shared", "kind": "pods", "namespace": None,
+                                                "label_selector": "app=web", "view": None, "fields": None})
+
+    owner.reply = None
+    assert client.get("/subscribe", params={"cluster_id": "shared"}).status_code == 503
+    assert main.informers.get("shared", "pods") is None and apiserver == []
+
+
+class _Loopback:
+    """같은 프로세스의 _handle_shared로 전달하는 follower 쪽 공유 캐시 (처리하는 동안은 소유자로 동작)"""
+
+    follower = True
+
+    def __init__(self):
+        self.ops = []
+
+    async def _handle(self, op, args):
+        self.ops.append(op)
+        self.follower = False
+        try:
+            return await main._handle_shared(op, fastjson.loads(fastjson.dumps(args)))
+        finally:
+            self.follower = True
+
+    async def call(self, op, args):
+        reply = await self._handle(op, args)
+        assert isinstance(reply, SharedReply)
+        return reply
+
+    async def stream(self, op, args):
+        reply = await self._handle(op, args)
+        if isinstance(reply, SharedReply):
+            return SharedStream(reply.status, reply.headers, _chunks(reply.body))
+        return reply
+
+    def notify(self, op, args):
+        if self.follower:
+            self.ops.append(op)
+
+    async def start(self):
+        pass
+
+    async def aclose(self):
+        pass
+
+
+async def _chunks(body):
+    yield body
+
+
+def test_follower_provisions_on_owner_so_refresh_can_reuse_password(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setattr(main.cluster_manager, "get_token_via_ssh", lambda *args, **kwargs: "ssh-issued-token")
+    monkeypatch.setattr(main.cluster_manager, "_ssh_passwords", {})
+    owner = _Loopback()
+    monkeypatch.setattr(main, "shared_cache", owner)
+    spec = {"ssh_host": "vm-1", "ssh_password": "pw", "k8s_host": "k8s-follower", "cluster_name": "follower-ssh"}
+    with TestClient(main.app) as client:
+        result = client.post("/clusters/ssh-token", params={"wait": "true"}, json=spec)
+        assert result.status_code == 200, result.text
+        assert owner.ops == ["ssh_token", "job_wait"]
+        assert main.cluster_manager._ssh_passwords == {"follower-ssh": "pw"}
+
+        accepted = client.post("/clusters/ssh-token", json={**spec, "cluster_name": "follower-ssh-2"}).json()
+        assert "event: done" in client.get(accepted["events_url"]).text
+        assert client.get(accepted["status_url"]).json()["status"] == "success"
+        listed = client.get("/provisioning", params={"type": "ssh_provision"}).json()["jobs"]
+        assert accepted["job_id"] in [job["job_id"] for job in listed]
+        assert owner.ops[2:] == ["ssh_token", "job_events", "job", "jobs"]
+        assert client.get("/provisioning/missing").status_code == 404
+
+
+def test_follower_rollouts_run_on_owner(mock_apiserver, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    def handler(request: httpx.Request):
+        return httpx.Response(404, json={"kind": "Status", "message": "not found"})
+
+    mock_apiserver(handler, cluster_id="shared-rollout")
+    owner = _Loopback()
+    monkeypatch.setattr(main, "shared_cache", owner)
+    client = TestClient(main.app)
+
+    result = client.post("/deployments/default/web/rollout",
+                         params={"cluster_id": "shared-rollout", "wait": "true"})
+    assert result.status_code == 200 and result.json()["status"] == "error"
+    accepted = client.post("/rollouts/bulk", json={"cluster_id": "shared-rollout", "workloads": [
+        {"kind": "deployment", "namespace": "default", "name": "web"}]})
+    assert accepted.status_code == 202
+    assert client.get(f"/rollouts/{accepted.json()['job_id']}").status_code == 200
+    assert owner.ops == ["rollout", "job_wait", "bulk_rollout", "job"]
+
+
+def test_follower_asks_owner_to_refresh_rejected_tokens(mock_apiserver, monkeypatch):
+    mock_apiserver(lambda request: httpx.Response(401), cluster_id="shared-401")
+    monkeypatch.setattr(main.settings, "TOKEN_REFRESH_ENABLED", True)
+    owner = _Loopback()
+    monkeypatch.setattr(main, "shared_cache", owner)
+
+    async def run():
+        await main._k8s_request("GET", main.get_cluster_config("shared-401"), "/api/v1/pods")
+        await main.clients.aclose()
+
+    asyncio.run(run())
+    assert owner.ops == ["token_refresh"]
+    assert "shared-401" not in main.token_refresher._tasks
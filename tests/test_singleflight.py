@@ -0,0 +1,67 @@
+import asyncio
+
+import httpx
+import pytest
+
+import main
+from app.response_cache import ResponseCache
+from app.singleflight import SingleFlight
+
+
+def test_concurrent_reads_share_one_upstream_call(mock_apiserver, monkeypatch):
+    calls = []
+
+    async def handler(request: httpx.Request):
+        calls.append(str(request.url))
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"kind": "PodList", "metadata": {"resourceVersion": "1"}, "items": []})
+
+    mock_apiserver(handler)
+    monkeypatch.setattr(main, "response_cache", ResponseCache(ttl=0, max_entries=0, max_bytes=0))
+    monkeypatch.setattr(main, "upstream_flights", SingleFlight())
+
+    async def run():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://dashboard") as client:
+            return await asyncio.gather(
+                *(client.get("/pods", params={"cluster_id": "test"}) for _ in range(10)),
+                *(client.get("/pods", params={"cluster_id": "test", "view": "summary"}) for _ in range(5)),
+            )
+
+    responses = asyncio.run(run())
+    assert all(r.status_code == 200 for r in responses)
+    # 원본 그대로 전달하는 요청과 디코딩이 필요한 요청이 각각 한 번씩
+    assert len(calls) == 2
+    assert main.upstream_flights.stats() == {"calls": 15, "coalesced": 13, "in_flight": 0}
+
+
+def test_leader_cancellation_does_not_affect_followers():
+    flights = SingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    async def run():
+        leader = asyncio.ensure_future(flights.do("key", slow))
+        follower = asyncio.ensure_future(flights.do("key", slow))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(run()) == "ok"
+
+
+def test_errors_are_shared():
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def run():
+        return await asyncio.gather(flights.do("key", fail), flights.do("key", fail), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert flights.stats()["coalesced"] == 1
@@ -0,0 +1,147 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from app.informer import InformerManager
+from app.snapshots import SnapshotStore, decode_snapshot, encode_snapshot
+
+
+def _pod(namespace, name, resource_version):
+    return {"metadata": {"namespace": namespace, "name": name, "resourceVersion": resource_version}}
+
+
+def test_encode_decode_roundtrip():
+    items = [_pod("default", "web-1", "5"), _pod("kube-system", "dns", "6"), {"metadata": {"name": "한글"}}]
+    data = encode_snapshot("prod", "pods", "10", items, saved_at=123.0)
+    header, decoded = decode_snapshot(data)
+    assert header["resource_version"] == "10" and header["saved_at"] == 123.0
+    assert decoded == items
+
+    with pytest.raises(ValueError):
+        decode_snapshot(data[:-1])
+    with pytest.raises(ValueError):
+        decode_snapshot(b'{"kind":"PodList"}')
+
+
+def test_store_skips_unchanged_stale_and_discarded(tmp_path):
+    async def scenario():
+        store = SnapshotStore(str(tmp_path), interval=60, max_age=3600)
+        assert await store.save("prod", "pods", "10", [_pod("default", "web-1", "5")])
+        assert not await store.save("prod", "pods", "10", [])
+        assert not await store.save("prod", "pods", None, [])
+        return store
+
+    store = asyncio.run(scenario())
+    snapshot = store.load("prod", "pods")
+    assert snapshot.resource_version == "10" and len(snapshot.items) == 1
+    assert store.load("prod", "deployments") is None
+
+    stale = SnapshotStore(str(tmp_path), interval=60, max_age=0)
+    time.sleep(0.01)
+    assert stale.load("prod", "pods") is None
+
+    store.discard("prod")
+    assert store.load("prod", "pods") is None
+
+
+def test_snapshots_survive_token_and_option_updates(tmp_path):
+    from config.cluster_manager import ClusterManager
+
+    manager = ClusterManager()
+    store = SnapshotStore(str(tmp_path), interval=60, max_age=3600)
+    manager.add_endpoint_listener(store.discard)
+    manager.save_cluster_config("snap", "k8s-snap", 6443, "token-1")
+    asyncio.run(store.save("snap", "pods", "10", [_pod("default", "web-1", "5")]))
+
+    # 같은 API 서버의 토큰 교체나 옵션 변경은 같은 클러스터
+    manager.save_cluster_config("snap", "k8s-snap", 6443, "token-2")
+    manager.update_cluster_options("snap", read_timeout=5)
+    assert store.load("snap", "pods") is not None
+
+    manager.save_cluster_config("snap", "k8s-other", 6443, "token-2")
+    assert store.load("snap", "pods") is None
+
+
+class WatchOnlyApiServer:
+    """LIST 요청 수와 WATCH 시작 resourceVersion 기록 (expired_before보다 오래된 resourceVersion은 410)"""
+
+    def __init__(self, expired_before=0):
+        self.lists = 0
+        self.watches = []
+        self.expired_before = expired_before
+
+    async def __call__(self, request: httpx.Request):
+        params = dict(request.url.params)
+        if params.get("watch") == "true":
+            self.watches.append(params["resourceVersion"])
+            if int(params["resourceVersion"]) < self.expired_before:
+                return httpx.Response(410, json={"kind": "Status", "code": 410})
+            if len(self.watches) > 1:
+                await asyncio.sleep(3600)
+            event = {"type": "DELETED", "object": _pod("default", "web-1", "11")}
+            return httpx.Response(200, content=json.dumps(event) + "\n")
+        self.lists += 1
+        return httpx.Response(200, json={"kind": "PodList", "metadata": {"resourceVersion": "50"},
+                                         "items": [_pod("default", "web-2", "50")]})
+
+
+def _manager(apiserver, store):
+    client = httpx.AsyncClient(base_url="https://k8s-test", transport=httpx.MockTransport(apiserver))
+
+    async def client_factory(cluster_id):
+        return client
+
+    return InformerManager(client_factory, store), client
+
+
+async def _wait_for(predicate):
+    while not predicate():
+        await asyncio.sleep(0.01)
+
+
+def test_restart_resumes_watch_from_snapshot(tmp_path):
+    async def scenario():
+        store = SnapshotStore(str(tmp_path), interval=60, max_age=3600)
+        await store.save("test", "pods", "10", [_pod("default", "web-1", "5"), _pod("kube-system", "dns", "6")])
+
+        apiserver = WatchOnlyApiServer()
+        informers, client = _manager(apiserver, SnapshotStore(str(tmp_path), interval=60, max_age=3600))
+        informer = informers.start("test", "pods")
+        await asyncio.wait_for(_wait_for(lambda: len(apiserver.watches) > 1), 2.0)
+
+        assert apiserver.lists == 0
+        assert apiserver.watches[0] == "10"
+        assert informer.status()["restored_from_snapshot"] is True
+        assert [obj["metadata"]["name"] for obj in informer.list()] == ["dns"]
+
+        # 종료 시 마지막 상태 저장
+        await informers.snapshots.aclose(informers.snapshot_sources)
+        await informers.aclose()
+        await client.aclose()
+        return informers.snapshots.load("test", "pods")
+
+    snapshot = asyncio.run(scenario())
+    assert snapshot.resource_version == "11"
+    assert [obj["metadata"]["name"] for obj in snapshot.items] == ["dns"]
+
+
+def test_expired_snapshot_falls_back_to_list(tmp_path):
+    async def scenario():
+        store = SnapshotStore(str(tmp_path), interval=60, max_age=3600)
+        await store.save("test", "pods", "10", [_pod("default", "web-1", "5")])
+
+        apiserver = WatchOnlyApiServer(expired_before=50)
+        informers, client = _manager(apiserver, store)
+        informer = informers.start("test", "pods")
+        await asyncio.wait_for(_wait_for(lambda: len(apiserver.watches) > 1), 2.0)
+
+        assert apiserver.lists == 1
+        assert apiserver.watches[:2] == ["10", "50"]
+        assert [obj["metadata"]["name"] for obj in informer.list()] == ["web-2"]
+        await informers.aclose()
+        await client.aclose()
+
+    asyncio.run(scenario())
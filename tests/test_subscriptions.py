@@ -0,0 +1,171 @@
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+import main
+from app.informer import InformerManager
+from app.subscriptions import SubscriptionHub
+
+
+def _pod(namespace, name, resource_version, app="web"):
+    return {"metadata": {"namespace": namespace, "name": name, "resourceVersion": resource_version,
+                         "labels": {"app": app}},
+            "status": {"phase": "Running"}}
+
+
+async def _never_connects(cluster_id):
+    await asyncio.sleep(3600)
+
+
+def _hub(queue_size=100, idle_seconds=60.0):
+    """API 서버 대신 테스트가 직접 인포머 저장소를 갱신"""
+    informers = InformerManager(_never_connects)
+    hub = SubscriptionHub(informers, queue_size, heartbeat=0.05, sync_timeout=1.0, idle_seconds=idle_seconds)
+    return informers, hub
+
+
+def _synced(informers, items):
+    informer = informers.start("test", "pods")
+    informer._replace(items, "10")
+    informer.synced.set()
+    return informer
+
+
+def _events(subscription):
+    events = []
+    while subscription.queue:
+        event, data = subscription.queue.popleft().decode().split("\n")[-4:-2]
+        events.append((event.split(": ", 1)[1], json.loads(data.split(": ", 1)[1])))
+    return events
+
+
+def test_snapshot_then_filtered_deltas():
+    async def scenario():
+        informers, hub = _hub()
+        informer = _synced(informers, [_pod("default", "web-1", "5"), _pod("default", "db-1", "6", app="db"),
+                                       _pod("kube-system", "dns", "7")])
+        sub = await hub.subscribe("test", "pods", namespace="default", label_selector="app=web",
+                                  view="summary", fields=["name", "phase"])
+        [(event, snapshot)] = _events(sub)
+        assert event == "SNAPSHOT" and snapshot["resourceVersion"] == "10"
+        assert snapshot["items"] == [{"name": "web-1", "phase": "Running"}]
+
+        informer._upsert(_pod("default", "web-2", "11"))
+        informer._upsert(_pod("default", "web-1", "12"))
+        informer._upsert(_pod("kube-system", "web-9", "13"))
+        informer._upsert(_pod("default", "db-2", "14", app="db"))
+        informer._delete(_pod("default", "web-2", "15"))
+        assert [(event, data["object"]["name"]) for event, data in _events(sub)] == \
+            [("ADDED", "web-2"), ("MODIFIED", "web-1"), ("DELETED", "web-2")]
+
+        # 재목록 시 RESET 후 전체 목록이 다시 ADDED로 전달
+        informer._replace([_pod("default", "web-1", "20")], "20")
+        assert [event for event, _ in _events(sub)] == ["RESET", "ADDED"]
+        await hub.aclose()
+        await informers.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_objects_moving_across_label_selector():
+    async def scenario():
+        informers, hub = _hub()
+        informer = _synced(informers, [_pod("default", "web-1", "5"), _pod("default", "db-1", "6", app="db")])
+        sub = await hub.subscribe("test", "pods", label_selector="app=web")
+        _events(sub)
+
+        # 셀렉터에서 벗어나면 DELETED, 다시 맞게 되면 ADDED
+        informer._upsert(_pod("default", "web-1", "11", app="db"))
+        informer._upsert(_pod("default", "db-1", "12", app="web"))
+        informer._upsert(_pod("default", "db-1", "13", app="web"))
+        informer._upsert(_pod("default", "web-1", "14", app="db"))
+        informer._delete(_pod("default", "web-1", "15", app="db"))
+        informer._delete(_pod("default", "db-1", "16", app="web"))
+        assert [(event, data["object"]["metadata"]["name"]) for event, data in _events(sub)] == \
+            [("DELETED", "web-1"), ("ADDED", "db-1"), ("MODIFIED", "db-1"), ("DELETED", "db-1")]
+        await hub.aclose()
+        await informers.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_subscribers_share_one_informer_and_listener():
+    async def scenario():
+        informers, hub = _hub(idle_seconds=0.01)
+        informer = _synced(informers, [])
+        first = await hub.subscribe("test", "pods")
+        second = await hub.subscribe("test", "pods", view="summary")
+        assert informers.get("test", "pods") is informer
+        assert len(informer._listeners) == 1
+        assert hub.subscribers == 2
+
+        informer._upsert(_pod("default", "web-1", "11"))
+        assert _events(first)[-1][1]["object"]["metadata"]["name"] == "web-1"
+        assert _events(second)[-1][1]["object"]["name"] == "web-1"
+
+        hub.unsubscribe(first)
+        hub.unsubscribe(second)
+        # 미리 켜 둔 인포머는 리스너만 떼고 유지
+        assert informers.get("test", "pods") is informer
+        assert not informer._listeners
+
+        # 구독 때문에 시작한 인포머는 마지막 구독 종료 후 중지
+        await informers.stop("test", "pods")
+        pending = asyncio.create_task(hub.subscribe("test", "pods"))
+        await asyncio.sleep(0)
+        owned = informers.get("test", "pods")
+        owned.synced.set()
+        hub.unsubscribe(await pending)
+        await asyncio.sleep(0.05)
+        assert informers.get("test", "pods") is None
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscriber_is_evicted_without_affecting_others():
+    async def scenario():
+        informers, hub = _hub(queue_size=3)
+        informer = _synced(informers, [])
+        slow = await hub.subscribe("test", "pods")
+        fast = await hub.subscribe("test", "pods")
+
+        received = []
+        for i in range(5):
+            informer._upsert(_pod("default", f"web-{i}", str(11 + i)))
+            received.extend(_events(fast))
+        assert len(received) == 6  # 스냅샷 + ADDED 5개
+        assert slow.evicted and hub.evictions == 1
+        assert hub.subscribers == 1
+
+        chunks = [chunk async for chunk in hub.stream(slow)]
+        assert chunks[-1].startswith(b"event: EVICTED\n")
+        await hub.aclose()
+        await informers.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_stream_sends_keepalive():
+    async def scenario():
+        informers, hub = _hub()
+        _synced(informers, [])
+        sub = await hub.subscribe("test", "pods")
+        stream = hub.stream(sub)
+        assert (await stream.__anext__()).startswith(b"id: 10\nevent: SNAPSHOT\n")
+        assert await stream.__anext__() == b": keepalive\n\n"
+        await stream.aclose()
+        assert hub.subscribers == 0
+        await hub.aclose()
+        await informers.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_subscribe_validates_request():
+    main.cluster_manager.save_cluster_config("subs", "k8s-subs", 6443, "subs-token")
+    client = TestClient(main.app)
+    assert client.get("/subscribe", params={"cluster_id": "subs", "kind": "secrets"}).status_code == 400
+    assert client.get("/subscribe", params={"cluster_id": "nope", "kind": "pods"}).status_code == 404
+    assert client.get("/subscribe", params={"cluster_id": "subs", "view": "table"}).status_code == 422
+    assert client.get("/subscriptions").json()["subscriptions"]["subscribers"] == 0
@@ -0,0 +1,81 @@
+import httpx
+from fastapi.testclient import TestClient
+
+import main
+from app.informer import Informer, InformerManager
+from app.resources import RESOURCE_KINDS
+from app.response_cache import ResponseCache
+from app.summary import SummaryManager, summarize
+
+
+def _pod(namespace, name, phase="Running", ready=True, restarts=0):
+    return {
+        "metadata": {"namespace": namespace, "name": name},
+        "spec": {"containers": [{"name": "main"}]},
+        "status": {"phase": phase, "containerStatuses": [{"ready": ready, "restartCount": restarts}]},
+    }
+
+
+def _deployment(namespace, name, replicas, ready):
+    return {"metadata": {"namespace": namespace, "name": name}, "spec": {"replicas": replicas},
+            "status": {"readyReplicas": ready}}
+
+
+def _synced_informer(manager, kind, items):
+    informer = Informer("test", RESOURCE_KINDS[kind], client_factory=None)
+    informer._replace(items, "1")
+    informer.synced.set()
+    manager._informers[("test", kind)] = informer
+    return informer
+
+
+def test_incremental_summary_matches_full_recompute():
+    manager = InformerManager(client_factory=None)
+    pods = _synced_informer(manager, "pods", [_pod("a", "p1"), _pod("a", "p2", restarts=3), _pod("b", "p3")])
+    deployments = _synced_informer(manager, "deployments", [_deployment("a", "web", 2, 2)])
+    summaries = SummaryManager(manager)
+
+    summary = summaries.get("test")
+    version = summary.version
+    assert summary.to_dict()["totals"]["pods"] == 3
+
+    pods._upsert(_pod("a", "p2", phase="Pending", ready=False, restarts=4))
+    pods._delete(_pod("b", "p3"))
+    pods._upsert(_pod("c", "p4", phase="Failed", ready=False))
+    deployments._upsert(_deployment("a", "web", 2, 1))
+    assert summary.version > version
+
+    expected = summarize("test", pods.list(), {"deployments": deployments.list()}).to_dict()
+    result = summaries.get("test").to_dict()
+    assert result == expected
+    assert result["totals"]["phases"] == {"Running": 1, "Pending": 1, "Failed": 1}
+    assert result["totals"]["restarts"] == 4
+    assert list(result["namespaces"]) == ["a", "c"]
+    assert [p["name"] for p in result["not_ready_pods"]] == ["p2", "p4"]
+    assert [w["name"] for w in result["not_ready_workloads"]] == ["web"]
+    assert summaries.get("test").to_dict("c")["totals"]["pods"] == 1
+
+    # 인포머가 다시 목록을 받으면 해당 종류 집계를 처음부터 다시 채움
+    pods._replace([_pod("a", "p1")], "2")
+    assert summaries.get("test").to_dict()["totals"]["pods"] == 1
+
+
+def test_summary_route_without_informer(mock_apiserver, monkeypatch):
+    def handler(request: httpx.Request):
+        kind = request.url.path.rsplit("/", 1)[-1]
+        items = {"pods": [_pod("a", "p1"), _pod("a", "p2", phase="Failed", ready=False)],
+                 "deployments": [_deployment("a", "web", 3, 1)]}.get(kind, [])
+        return httpx.Response(200, json={"metadata": {"resourceVersion": "1"}, "items": items})
+
+    mock_apiserver(handler)
+    monkeypatch.setattr(main, "response_cache", ResponseCache(ttl=60, max_entries=16, max_bytes=1 << 20))
+    client = TestClient(main.app)
+
+    response = client.get("/summary", params={"cluster_id": "test"})
+    body = response.json()
+    assert body["source"] == "apiserver"
+    assert body["response"]["totals"]["phases"] == {"Running": 1, "Failed": 1}
+    assert body["response"]["totals"]["workloads"]["deployments"] == {"total": 1, "not_ready": 1}
+
+    again = client.get("/summary", params={"cluster_id": "test"}, headers={"If-None-Match": response.headers["etag"]})
+    assert again.status_code == 304
@@ -0,0 +1,120 @@
+import asyncio
+import base64
+import json
+import time
+
+import httpx
+
+import main
+from app.k8s_client import ClusterClientRegistry
+from app.token_refresh import TokenRefresher
+from config.cluster_manager import token_expiry, token_service_account
+from config.settings import get_cluster_config
+
+
+def _jwt(exp, iat=None, sub="system:serviceaccount:default:dashboard-admin"):
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+    claims = {"exp": exp, "iat": iat if iat is not None else exp - 3600, "sub": sub}
+    return f"{encode({'alg': 'RS256'})}.{encode(claims)}.signature"
+
+
+def _refresher(registry):
+    async def factory(cluster_id):
+        return await registry.get(get_cluster_config(cluster_id))
+    return TokenRefresher(main.cluster_manager, factory, refresh_before=600, duration=3600, check_interval=60,
+                          retry_interval=60)
+
+
+def test_token_claims_decoding():
+    token = _jwt(2000000000)
+    assert token_expiry(token) == 2000000000
+    assert token_service_account(token) == ("default", "dashboard-admin")
+    assert token_expiry("not-a-jwt") is None
+
+
+def test_refresh_uses_token_request_and_swaps_header_in_place(monkeypatch):
+    old_token, new_token = _jwt(time.time() + 300), _jwt(time.time() + 3600)
+    requests = []
+
+    def handler(request: httpx.Request):
+        requests.append(request)
+        if request.method == "POST":
+            return httpx.Response(201, json={"status": {"token": new_token}})
+        return httpx.Response(200, json={"items": []})
+
+    registry = ClusterClientRegistry(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(main.cluster_manager, "_token_listeners", [registry.swap_token])
+    main.cluster_manager.save_cluster_config("refresh", "k8s-refresh", 6443, old_token)
+    refresher = _refresher(registry)
+
+    async def run():
+        assert "refresh" in refresher.due()
+        client = await registry.get(get_cluster_config("refresh"))
+        await refresher.refresh("refresh")
+        # 같은 풀링 클라이언트가 새 토큰으로 요청
+        assert await registry.get(get_cluster_config("refresh")) is client
+        await client.get("/api/v1/pods")
+        await registry.aclose()
+
+    asyncio.run(run())
+    assert requests[0].url.path == "/api/v1/namespaces/default/serviceaccounts/dashboard-admin/token"
+    assert requests[0].headers["Authorization"] == f"Bearer {old_token}"
+    assert requests[1].headers["Authorization"] == f"Bearer {new_token}"
+    assert main.cluster_manager.get_cluster_info("refresh")["token_expires_at"] == token_expiry(new_token)
+    assert refresher.status("refresh")["method"] == "token_request"
+    assert "refresh" not in refresher.due()
+
+
+def test_expired_token_falls_back_to_ssh_reprovisioning(monkeypatch):
+    new_token = _jwt(time.time() + 3600)
+    monkeypatch.setattr(main.cluster_manager, "get_token_via_ssh", lambda *args, **kwargs: new_token)
+    main.cluster_manager.save_ssh_provisioned("expired", "vm-1", 22, "root", "pw", "k8s-expired", 6443,
+                                              _jwt(time.time() - 10), "dashboard-admin", "default")
+    registry = ClusterClientRegistry(transport=httpx.MockTransport(lambda request: httpx.Response(401)))
+    refresher = _refresher(registry)
+
+    asyncio.run(refresher.refresh("expired"))
+    assert main.cluster_manager.store.get("expired")["token"] == new_token
+    assert refresher.status("expired")["method"] == "ssh"
+
+
+def test_failed_refresh_backs_off(monkeypatch):
+    main.cluster_manager.save_cluster_config("manual", "k8s-manual", 6443, _jwt(time.time() - 10, sub="user"))
+    refresher = _refresher(ClusterClientRegistry())
+
+    async def run():
+        await refresher.request("manual")
+
+    asyncio.run(run())
+    status = refresher.status("manual")
+    assert status["error"] and status["retry_after"] > time.time()
+    assert "manual" not in refresher.due()
+
+
+def test_rejected_requests_respect_retry_interval(mock_apiserver, monkeypatch):
+    # SSH 정보도 없는 일반 사용자 토큰 - 재발급은 실패하고 retry_interval 동안 다시 시도하지 않음
+    registry = mock_apiserver(lambda request: httpx.Response(401, json={"kind": "Status", "code": 401}),
+                              cluster_id="rejected", token=_jwt(time.time() + 3600, sub="user"))
+    monkeypatch.setattr(main.settings, "TOKEN_REFRESH_ENABLED", True)
+    refresher = _refresher(registry)
+    monkeypatch.setattr(main, "token_refresher", refresher)
+    attempts = []
+    refresh = refresher.refresh
+
+    async def counting_refresh(cluster_id):
+        attempts.append(cluster_id)
+        return await refresh(cluster_id)
+
+    monkeypatch.setattr(refresher, "refresh", counting_refresh)
+
+    async def run():
+        for _ in range(2):
+            r = await main._k8s_request("GET", get_cluster_config("rejected"), "/api/v1/pods")
+            assert r.status_code == 401
+            await asyncio.gather(*refresher._tasks.values())
+        await main.clients.aclose()
+
+    asyncio.run(run())
+    assert attempts == ["rejected"]
+    assert refresher.status("rejected")["retry_after"] > time.time()
@@ -0,0 +1,139 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.usage import Ring, Series, UsageTable, parse_cpu, parse_memory, parse_usage
+
+
+def test_parse_quantities():
+    assert parse_cpu("250m") == 0.25
+    assert parse_cpu("2") == 2.0
+    assert parse_cpu("1500000n") == pytest.approx(0.0015)
+    assert parse_memory("128Mi") == 128 * 2 ** 20
+    assert parse_memory("1G") == 1e9
+    assert parse_memory("1024") == 1024.0
+
+
+def test_ring_wraps_and_series_rolls_up():
+    ring = Ring(3)
+    for i in range(5):
+        ring.append(float(i), i, i * 10)
+    assert [ts for ts, _, _ in ring.points()] == [2.0, 3.0, 4.0]
+    assert ring.last_ts == 4.0 and len(ring.ts) == 3
+
+    series = Series(raw_capacity=10, rollup_capacity=10)
+    for ts, cpu in ((0, 1.0), (30, 3.0), (60, 5.0), (90, 7.0), (120, 9.0)):
+        assert series.add(float(ts), cpu, 100.0, rollup_seconds=60)
+    # metrics-server가 갱신하지 않은 같은 시각 샘플은 무시
+    assert not series.add(120.0, 1.0, 1.0, rollup_seconds=60)
+    assert series.points(0, rollup=True) == [(0.0, 2.0, 100.0), (60.0, 6.0, 100.0), (120.0, 9.0, 100.0)]
+    assert [ts for ts, _, _ in series.points(60, rollup=False)] == [60.0, 90.0, 120.0]
+
+
+def test_shorter_interval_grows_raw_rings():
+    ring = Ring(3)
+    for i in range(4):
+        ring.append(float(i), i, i)
+    ring.grow(5)
+    ring.append(4.0, 4, 4)
+    assert [ts for ts, _, _ in ring.points()] == [1.0, 2.0, 3.0, 4.0]
+
+    table = UsageTable(raw_seconds=60, rollup_seconds=60, rollup_retention=86400, interval=15)
+    key = ("default", "web-1")
+    for ts in range(0, 60, 15):
+        table.record([(key, float(ts), 0.1, 1.0)], float(ts))
+    # 수집 주기가 5초로 줄어도 원본 60초 분량을 유지
+    table.set_interval(5)
+    for ts in range(60, 125, 5):
+        table.record([(key, float(ts), 0.1, 1.0)], float(ts))
+    history = table.history(key, window=60, now=120.0)
+    assert history["resolution_seconds"] is None
+    assert [point["ts"] for point in history["points"]] == [float(ts) for ts in range(60, 125, 5)]
+    assert table.series[key].raw.capacity == 13
+
+
+def _pod_metrics(namespace, name, cpu, memory, timestamp="2024-01-01T00:00:00Z"):
+    return {"metadata": {"namespace": namespace, "name": name}, "timestamp": timestamp, "window": "15s",
+            "containers": [{"name": "app", "usage": {"cpu": cpu, "memory": memory}},
+                           {"name": "sidecar", "usage": {"cpu": "10m", "memory": "1Mi"}}]}
+
+
+def test_table_top_and_namespace_aggregates():
+    table = UsageTable(raw_seconds=3600, rollup_seconds=60, rollup_retention=86400, interval=15)
+    body = {"items": [_pod_metrics("b", "api", "500m", "64Mi"), _pod_metrics("a", "web-1", "90m", "200Mi"),
+                      _pod_metrics("a", "web-2", "190m", "100Mi")]}
+    samples = parse_usage("pods", body, scraped_at=0)
+    table.record(samples, samples[0][1])
+
+    assert [item["name"] for item in table.top(2, "cpu")] == ["api", "web-2"]
+    assert [item["name"] for item in table.top(5, "memory", namespace="a")] == ["web-1", "web-2"]
+    assert table.top(3, "cpu", namespace="missing") == []
+    with pytest.raises(ValueError):
+        table.top(3, "disk")
+
+    rows = {row["namespace"]: row for row in table.by_namespace()}
+    assert rows["a"]["pods"] == 2
+    assert rows["a"]["cpu_cores"] == pytest.approx(0.3)
+    assert rows["a"]["memory_bytes"] == 302 * 2 ** 20
+    assert rows["b"]["max_cpu_cores"] == pytest.approx(0.51)
+
+
+@pytest.fixture
+def metrics_api(mock_apiserver):
+    # 보존 기간이 지난 기록은 지워지므로 현재 시각 기준으로 샘플 시각을 만듦
+    state = {"ts": int(time.time())}
+
+    def handler(request: httpx.Request):
+        state["ts"] += 1
+        timestamp = datetime.fromtimestamp(state["ts"], timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        if request.url.path.endswith("/nodes"):
+            return httpx.Response(200, json={"items": [
+                {"metadata": {"name": "node-1"}, "timestamp": timestamp, "usage": {"cpu": "1500m", "memory": "4Gi"}},
+                {"metadata": {"name": "node-2"}, "timestamp": timestamp, "usage": {"cpu": "250m", "memory": "8Gi"}},
+            ]})
+        return httpx.Response(200, json={"items": [_pod_metrics("default", "web-1", "100m", "10Mi", timestamp),
+                                                   _pod_metrics("default", "web-2", "300m", "20Mi", timestamp)]})
+
+    mock_apiserver(handler, cluster_id="usage")
+    main.cluster_manager.update_cluster_options("usage", usage_interval=1)
+    yield state
+    main.cluster_manager.update_cluster_options("usage", usage_interval=None)
+
+
+def test_usage_endpoints(metrics_api):
+    with TestClient(main.app) as client:
+        assert client.get("/usage/usage/pods/top").status_code == 404
+        assert client.get("/clusters/usage").json()["usage_interval"] == 1
+        intervals = {cluster["cluster_id"]: cluster["usage_interval"] for cluster in client.get("/clusters").json()}
+        assert intervals["usage"] == 1
+        assert client.post("/usage/usage").status_code == 200
+
+        async def scraped():
+            while not main.usage.status("usage")[0]["scrapes"]:
+                await asyncio.sleep(0.01)
+        client.portal.call(asyncio.wait_for, scraped(), 2.0)
+
+        top = client.get("/usage/usage/pods/top", params={"n": 1}).json()
+        assert [item["name"] for item in top["items"]] == ["web-2"]
+        assert top["totals"]["objects"] == 2
+
+        nodes = client.get("/usage/usage/nodes/top", params={"by": "memory"}).json()
+        assert [item["name"] for item in nodes["items"]] == ["node-2", "node-1"]
+        assert "namespace" not in nodes["items"][0]
+
+        namespaces = client.get("/usage/usage/namespaces").json()["namespaces"]
+        assert namespaces[0]["namespace"] == "default" and namespaces[0]["pods"] == 2
+
+        history = client.get("/usage/usage/pods/default/web-1", params={"window": 10 ** 9}).json()
+        assert history["resolution_seconds"] == 60
+        assert history["points"][0]["memory_bytes"] == 11 * 2 ** 20
+        assert client.get("/usage/usage/nodes/nope").status_code == 404
+        assert client.get("/usage", params={"cluster_id": "usage"}).json()["scrapers"][0]["interval"] == 1
+
+        assert client.delete("/usage/usage").status_code == 200
+        assert client.delete("/usage/usage").status_code == 404
@@ -0,0 +1,60 @@
+import httpx
+from fastapi.testclient import TestClient
+
+import main
+from app.views import PARTIAL_METADATA_LIST, accept_header, build_transform
+
+POD = {
+    "metadata": {
+        "name": "web-1",
+        "namespace": "default",
+        "creationTimestamp": "2024-01-01T00:00:00Z",
+        "managedFields": [{"manager": "kubectl"}],
+    },
+    "spec": {"nodeName": "node-a", "containers": [{"name": "app"}, {"name": "sidecar"}]},
+    "status": {
+        "phase": "Running",
+        "podIP": "10.0.0.5",
+        "containerStatuses": [
+            {"name": "app", "ready": True, "restartCount": 2, "state": {"running": {}}},
+            {"name": "sidecar", "ready": False, "restartCount": 5,
+             "state": {"waiting": {"reason": "CrashLoopBackOff"}}},
+        ],
+    },
+}
+
+
+def test_pod_summary():
+    summary = build_transform("pods", "summary", None)(POD)
+    assert summary["name"] == "web-1"
+    assert summary["node"] == "node-a"
+    assert summary["reason"] == "CrashLoopBackOff"
+    assert summary["restarts"] == 7
+    assert (summary["ready_containers"], summary["containers"]) == (1, 2)
+    assert summary["age_seconds"] > 0
+
+
+def test_fields_projection_and_metadata_negotiation():
+    projected = build_transform("pods", None, ["metadata.name", "status.phase", "spec.missing"])(POD)
+    assert projected == {"metadata": {"name": "web-1"}, "status": {"phase": "Running"}}
+
+    assert accept_header(None, ["metadata.name", "metadata.labels"], True) == PARTIAL_METADATA_LIST
+    assert accept_header(None, ["metadata.name", "status.phase"], True) is None
+    assert "managedFields" not in build_transform("pods", "metadata", None)(POD)["metadata"]
+
+
+def test_summary_view_route(mock_apiserver):
+    seen = []
+
+    def handler(request: httpx.Request):
+        seen.append(request)
+        return httpx.Response(200, json={"kind": "PodList", "metadata": {}, "items": [POD]})
+
+    mock_apiserver(handler)
+    client = TestClient(main.app)
+
+    body = client.get("/pods/default", params={"cluster_id": "test", "view": "summary", "fields": "name,restarts"}).json()
+    assert body["response"]["items"] == [{"name": "web-1", "restarts": 7}]
+
+    client.get("/pods/default", params={"cluster_id": "test", "view": "metadata"})
+    assert seen[-1].headers["Accept"] == PARTIAL_METADATA_LIST